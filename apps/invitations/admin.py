@@ -9,6 +9,9 @@ class InvitationAdmin(admin.ModelAdmin):
     list_filter = ["status", "plan_type", "is_public", "created_at"]
     search_fields = ["title", "groom_name", "bride_name", "user__email"]
     readonly_fields = ["url_slug", "view_count", "created_at", "updated_at", "published_at"]
+    list_select_related = ["user"]
+    # 필터가 없을 때 전체 건수 COUNT를 한 번 더 실행하지 않음
+    show_full_result_count = False
     fieldsets = (
         ("기본 정보", {"fields": ("user", "template", "title", "url_slug", "status")}),
         ("신랑 정보", {"fields": ("groom_name", "groom_father_name", "groom_mother_name", "groom_phone")}),
@@ -0,0 +1,21 @@
+"""
+Invitations 앱 시스템 체크
+"""
+
+from django.core.checks import Error, register
+
+from apps.invitations.services.slug_allocator import get_allocator_settings
+
+
+@register()
+def check_slug_allocator_key(app_configs, **kwargs):
+    """url_slug 순열 키가 없으면 시작 시점에 알림 (SECRET_KEY로 대신하지 않음)"""
+    if get_allocator_settings()["KEY"]:
+        return []
+    return [
+        Error(
+            "SLUG_ALLOCATOR['KEY']가 설정되지 않았습니다.",
+            hint="SLUG_ALLOCATOR_KEY 환경 변수를 지정하세요. 운영 중에는 바꾸지 않아야 합니다.",
+            id="invitations.E001",
+        )
+    ]
@@ -0,0 +1,43 @@
+"""
+Invitations 앱 필터
+"""
+
+from django_filters import rest_framework as filters
+
+from apps.invitations.models import RSVP, Guestbook
+from common.filters import DateRangeFilter
+
+
+class ExportDateRangeFilter(DateRangeFilter):
+    """
+    내보내기용 날짜 범위 필터
+
+    created_at(datetime)을 현지 날짜 기준으로 비교하여 end_date 당일 항목도 포함
+    """
+
+    start_date = filters.DateFilter(field_name="created_at", lookup_expr="date__gte")
+    end_date = filters.DateFilter(field_name="created_at", lookup_expr="date__lte")
+
+
+class RSVPExportFilter(ExportDateRangeFilter):
+    """RSVP 내보내기 필터 (참석 여부, 날짜 범위)"""
+
+    attendance_status = filters.ChoiceFilter(choices=RSVP._meta.get_field("attendance_status").choices)
+
+    class Meta:
+        model = RSVP
+        fields = ["attendance_status", "start_date", "end_date"]
+
+
+class GuestbookExportFilter(ExportDateRangeFilter):
+    """방명록 내보내기 필터 (날짜 범위)"""
+
+    class Meta:
+        model = Guestbook
+        fields = ["start_date", "end_date"]
+
+
+EXPORT_FILTERS = {
+    "rsvps": RSVPExportFilter,
+    "guestbooks": GuestbookExportFilter,
+}
@@ -0,0 +1,73 @@
+"""
+RSVP/방명록 접수 대기열 반영 커맨드
+
+python manage.py drain_intake_queue            # 대기열이 빌 때까지 한 번 반영
+python manage.py drain_intake_queue --loop     # 워커로 계속 실행
+python manage.py drain_intake_queue --stats    # 대기열 지표만 출력
+"""
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.invitations.services.intake_service import IntakeService, get_intake_settings
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "접수 대기열에 쌓인 RSVP/방명록 제출을 배치로 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true", help="대기열을 계속 확인하며 반영합니다.")
+        parser.add_argument(
+            "--interval", type=float, default=1.0, help="--loop 사용 시 대기열이 비었을 때 대기 시간(초)"
+        )
+        parser.add_argument("--batch-size", type=int, default=None, help="한 번에 반영할 제출 수")
+        parser.add_argument("--stats", action="store_true", help="반영하지 않고 대기열 지표만 출력합니다.")
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            self.write_metrics()
+            return
+
+        batch_size = options["batch_size"] or get_intake_settings()["BATCH_SIZE"]
+        try:
+            while True:
+                total = self.drain(batch_size)
+                if total:
+                    metrics = IntakeService.get_metrics()
+                    logger.info(
+                        "접수 대기열 %d건 반영 (대기 %d건, 지연 %.1f초, 실패 %d건)",
+                        total,
+                        metrics["depth"],
+                        metrics["lag_seconds"],
+                        metrics["failed"],
+                    )
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+
+        if not options["loop"]:
+            self.stdout.write(self.style.SUCCESS(f"제출 {total}건을 반영했습니다."))
+            self.write_metrics()
+
+    def drain(self, batch_size: int) -> int:
+        """대기열이 빌 때까지 배치 반영 후 보관 기간이 지난 행 정리"""
+        total = 0
+        while True:
+            processed = IntakeService.drain(batch_size)
+            total += processed
+            if processed < batch_size:
+                break
+        IntakeService.purge()
+        return total
+
+    def write_metrics(self):
+        metrics = IntakeService.get_metrics()
+        self.stdout.write(
+            f"depth={metrics['depth']} lag_seconds={metrics['lag_seconds']:.1f} failed={metrics['failed']}"
+        )
@@ -0,0 +1,43 @@
+"""
+조회수 버퍼 flush 커맨드
+
+python manage.py flush_view_counts
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.invitations.models import Invitation
+from apps.invitations.services.view_count_service import (
+    ViewCountService,
+    get_buffer_settings,
+)
+
+
+class Command(BaseCommand):
+    help = "버퍼에 쌓인 청첩장 조회수를 DB에 즉시 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all-published",
+            action="store_true",
+            help="공유 캐시 버퍼 사용 시, 발행된 모든 청첩장의 카운터를 확인하여 반영합니다.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=1000, help="--all-published 사용 시 처리 단위")
+
+    def handle(self, *args, **options):
+        total = ViewCountService.flush()
+
+        # 공유 캐시 버퍼는 다른 프로세스가 기록한 카운터도 남아 있을 수 있음
+        if options["all_published"] and get_buffer_settings()["BACKEND"] == "cache":
+            chunk_size = options["chunk_size"]
+            ids = Invitation.objects.filter(status="PUBLISHED").values_list("id", flat=True)
+            chunk = []
+            for invitation_id in ids.iterator(chunk_size=chunk_size):
+                chunk.append(invitation_id)
+                if len(chunk) >= chunk_size:
+                    total += ViewCountService.flush(chunk)
+                    chunk = []
+            if chunk:
+                total += ViewCountService.flush(chunk)
+
+        self.stdout.write(self.style.SUCCESS(f"조회수 {total}건을 반영했습니다."))
@@ -0,0 +1,423 @@
+"""
+대용량 합성 데이터 생성 커맨드 (벤치마크용)
+
+python manage.py generate_synthetic_data --users 100000 --invitations 300000 --rsvps 8000000 --guestbooks 2000000 \\
+    --workers 8 --seed 42
+
+- 한국식 이름/휴대폰 번호, 주말 낮 시간에 몰린 예식 일시(봄/가을 성수기), 로그정규 분포의 인기도
+  (소수의 청첩장에 RSVP/방명록이 몰림)로 데이터를 만듭니다.
+- 모든 값은 (seed, 청첩장 번호)로 정해지므로 --workers/--chunk-size와 관계없이 같은 seed면 같은 데이터가 생성됩니다.
+  (날짜는 실행한 날 0시 기준)
+- 사용자/청첩장은 bulk_create, 행 수 대부분인 RSVP/방명록은 모델 인스턴스 없이 executemany로 --batch-size 단위 INSERT합니다.
+  RSVP/방명록의 created_at은 발행 일시부터 예식(또는 현재)까지 사이에 분포합니다.
+- --workers > 1이면 청첩장 번호 구간을 프로세스(fork)별로 나눠 생성합니다.
+  SQLite는 동시 쓰기를 지원하지 않으므로 항상 1개 프로세스로 실행합니다.
+- RSVP 통계(RSVPStatistics)는 생성한 RSVP로 함께 계산해 저장합니다.
+
+생성된 데이터는 --prefix로 구분합니다. (slug: <prefix>-<번호>, 이메일: <prefix><번호>@synthetic.ourhour.test)
+"""
+
+import math
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from decimal import Decimal
+from itertools import accumulate
+from typing import List, Tuple
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+from apps.invitations.models import RSVP, Guestbook, Invitation, RSVPStatistics
+from apps.templates.models import Template
+
+User = get_user_model()
+
+EMAIL_DOMAIN = "synthetic.ourhour.test"
+
+# 성씨 (대략적인 인구 비율)
+SURNAMES = "김이박최정강조윤장임한오서신권황안송전홍"
+SURNAME_CUM_WEIGHTS = list(
+    accumulate([21.5, 14.7, 8.4, 4.7, 4.3, 2.4, 2.1, 2.1, 2.0, 1.7, 1.5, 1.5, 1.4, 1.4, 1.4, 1.4, 1.3, 1.3, 1.1, 1.1])
+)
+GIVEN_SYLLABLES = "민서지현준우예하도윤수진영은연재유성주승혜원경태동소다나선정"
+VENUES = [
+    ("더채플앳청담", "서울 강남구 선릉로 757", "37.5240000", "127.0440000"),
+    ("루벨 강남", "서울 강남구 테헤란로 406", "37.5060000", "127.0560000"),
+    ("아펠가모 광화문", "서울 종로구 새문안로 58", "37.5700000", "126.9720000"),
+    ("더베뉴지 서울", "서울 강서구 강서로 388", "37.5580000", "126.8370000"),
+    ("노블발렌티 대치", "서울 강남구 영동대로 325", "37.5000000", "127.0660000"),
+    ("웨스턴 조선 부산", "부산 해운대구 동백로 67", "35.1560000", "129.1530000"),
+    ("대구 인터불고", "대구 수성구 팔현길 212", "35.8470000", "128.6540000"),
+    ("라마다 대전", "대전 유성구 온천로 87", "36.3530000", "127.3440000"),
+]
+RSVP_MESSAGES = ["축하합니다!", "꼭 참석할게요.", "행복하세요~", "일정 확인 후 연락드릴게요.", "", "", ""]
+GUESTBOOK_MESSAGES = [
+    "결혼 축하해! 행복하게 잘 살아~",
+    "두 분의 앞날에 축복이 가득하길 바랍니다.",
+    "드디어 가는구나! 진심으로 축하해.",
+    "예쁜 사랑 오래오래 하세요.",
+    "직접 못 가서 미안해, 마음으로 축하할게!",
+]
+# 월별 예식 비중 (봄/가을 성수기)
+MONTH_WEIGHTS = [3, 3, 6, 10, 11, 6, 3, 3, 9, 12, 11, 5]
+ATTENDANCE = ["ATTENDING", "NOT_ATTENDING", "PENDING"]
+ATTENDANCE_CUM_WEIGHTS = list(accumulate([70, 15, 15]))
+GUEST_COUNTS = [1, 2, 3, 4]
+GUEST_COUNT_CUM_WEIGHTS = list(accumulate([55, 30, 10, 5]))
+PLANS = ["FREE", "PREMIUM", "PREMIUM_PLUS"]
+PLAN_CUM_WEIGHTS = list(accumulate([80, 15, 5]))
+
+# 원시 INSERT로 넣는 컬럼 (RowInserter.add 인자 순서)
+RSVP_COLUMNS = [
+    "invitation_id",
+    "guest_name",
+    "guest_count",
+    "attendance_status",
+    "phone",
+    "message",
+    "dietary_restrictions",
+    "created_at",
+    "updated_at",
+]
+GUESTBOOK_COLUMNS = ["invitation_id", "author_name", "message", "is_public", "phone", "created_at", "updated_at"]
+
+# fork된 워커가 물려받는 생성 계획 (generate_range 참고)
+_plan: dict = {}
+
+
+class RowInserter:
+    """
+    모델 인스턴스 없이 값 튜플을 batch_size 단위 executemany로 INSERT
+
+    수백만 행에서는 모델 생성과 bulk_create의 필드별 값 변환이 생성 시간의 대부분을 차지하므로,
+    RSVPService._upsert_native처럼 모델 메타데이터로 INSERT 문을 만들고 datetime만 DB 형식으로 변환합니다.
+    (auto_now_add를 거치지 않으므로 created_at도 지정한 값으로 저장됨)
+    """
+
+    def __init__(self, model, field_names: List[str], batch_size: int):
+        fields = [model._meta.get_field(name) for name in field_names]
+        table = connection.ops.quote_name(model._meta.db_table)
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        placeholders = ", ".join(["%s"] * len(fields))
+        self.sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        self.datetime_positions = [
+            position for position, field in enumerate(fields) if field.get_internal_type() == "DateTimeField"
+        ]
+        self.batch_size = batch_size
+        self.rows: List[list] = []
+        self.count = 0
+
+    def add(self, *values) -> None:
+        row = list(values)
+        for position in self.datetime_positions:
+            row[position] = connection.ops.adapt_datetimefield_value(row[position])
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.rows:
+            return
+        with connection.cursor() as cursor:
+            cursor.executemany(self.sql, self.rows)
+        self.count += len(self.rows)
+        self.rows = []
+
+
+def korean_name(rng: random.Random) -> str:
+    surname = rng.choices(SURNAMES, cum_weights=SURNAME_CUM_WEIGHTS)[0]
+    return surname + rng.choice(GIVEN_SYLLABLES) + rng.choice(GIVEN_SYLLABLES)
+
+
+def phone_number(value: int) -> str:
+    """0 <= value < 10^8 을 010-XXXX-XXXX 형식으로"""
+    return f"010-{value // 10000:04d}-{value % 10000:04d}"
+
+
+def wedding_datetime(rng: random.Random, base: datetime) -> datetime:
+    """base 기준 -1년 ~ +1년의 예식 일시 (성수기 월, 주말 낮 시간 위주)"""
+    while True:
+        day = base + timedelta(days=rng.randrange(-365, 366))
+        weekday_weight = {5: 1.0, 6: 0.7}.get(day.weekday(), 0.08)
+        if rng.random() < weekday_weight * MONTH_WEIGHTS[day.month - 1] / max(MONTH_WEIGHTS):
+            break
+    hour, minute = rng.choice([(11, 0), (11, 30), (12, 0), (12, 30), (13, 0), (14, 0), (15, 0), (16, 30), (17, 0)])
+    return day.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+
+def allocate(total: int, weights: List[float]) -> List[int]:
+    """total을 weights 비율로 나눈 정수 목록 (합이 정확히 total)"""
+    weight_sum = sum(weights)
+    if not weight_sum:
+        return [0] * len(weights)
+    counts = [int(total * weight / weight_sum) for weight in weights]
+    remainder = total - sum(counts)
+    for index in sorted(range(len(weights)), key=lambda i: -weights[i])[:remainder]:
+        counts[index] += 1
+    return counts
+
+
+def build_plan(options: dict) -> dict:
+    """청첩장별 발행 여부와 RSVP/방명록 수 (seed로 결정)"""
+    rng = random.Random(options["seed"])
+    count = options["invitations"]
+    published = [rng.random() < options["published_ratio"] for _ in range(count)]
+    # 로그정규 분포 인기도: sigma(--skew)가 클수록 소수의 청첩장에 몰림
+    popularity = [rng.lognormvariate(0, options["skew"]) if published[index] else 0.0 for index in range(count)]
+    return {
+        "published": published,
+        "popularity": popularity,
+        "rsvps": allocate(options["rsvps"], popularity),
+        "guestbooks": allocate(options["guestbooks"], popularity),
+    }
+
+
+def generate_range(start: int, end: int) -> Tuple[int, int, int]:
+    """
+    청첩장 번호 [start, end) 구간의 청첩장/RSVP/방명록 생성
+
+    Returns:
+        tuple: (청첩장 수, RSVP 수, 방명록 수)
+    """
+    options = _plan["options"]
+    prefix, batch_size = options["prefix"], options["batch_size"]
+    user_ids, template_ids, base = _plan["user_ids"], _plan["template_ids"], _plan["base"]
+    rngs = {index: random.Random(options["seed"] * 1_000_003 + index) for index in range(start, end)}
+
+    invitations = []
+    for index in range(start, end):
+        rng = rngs[index]
+        published = _plan["published"][index]
+        venue = rng.choice(VENUES)
+        wedding_date = wedding_datetime(rng, base)
+        # 예식 20~90일 전에 발행 (먼 미래의 예식은 최근 2주 안에 발행)
+        published_at = min(
+            wedding_date - timedelta(days=rng.randint(20, 90)), base - timedelta(minutes=rng.randrange(1, 20160))
+        )
+        invitations.append(
+            Invitation(
+                user_id=user_ids[index % len(user_ids)],
+                template_id=rng.choice(template_ids),
+                title=f"{korean_name(rng)} ♥ {korean_name(rng)} 결혼합니다",
+                url_slug=f"{prefix}-{index}",
+                status="PUBLISHED" if published else "DRAFT",
+                groom_name=korean_name(rng),
+                bride_name=korean_name(rng),
+                groom_phone=phone_number(rng.randrange(10**8)),
+                bride_phone=phone_number(rng.randrange(10**8)),
+                wedding_date=wedding_date,
+                wedding_location_name=venue[0],
+                wedding_location_address=venue[1],
+                wedding_location_lat=Decimal(venue[2]),
+                wedding_location_lng=Decimal(venue[3]),
+                invitation_message="서로가 마주 보며 다져온 사랑을 이제 함께 한곳을 바라보며 걸어가려 합니다.",
+                is_public=published,
+                view_count=int(_plan["popularity"][index] * rng.randint(50, 150)),
+                plan_type=rng.choices(PLANS, cum_weights=PLAN_CUM_WEIGHTS)[0],
+                published_at=published_at if published else None,
+            )
+        )
+
+    with transaction.atomic():
+        Invitation.objects.bulk_create(invitations, batch_size=batch_size)
+        ids = dict(
+            Invitation.objects.filter(url_slug__in=[item.url_slug for item in invitations]).values_list(
+                "url_slug", "id"
+            )
+        )
+
+        rsvps = RowInserter(RSVP, RSVP_COLUMNS, batch_size)
+        guestbooks = RowInserter(Guestbook, GUESTBOOK_COLUMNS, batch_size)
+        statistics = []
+        for item in invitations:
+            index = int(item.url_slug.rsplit("-", 1)[1])
+            rng = rngs[index]
+            invitation_id = ids[item.url_slug]
+            if item.published_at is not None:
+                # 응답/방명록은 발행 후 예식(또는 기준일)까지 사이에 작성
+                # 같은 날 실행하면 같은 값이 나오도록 현재 시각 대신 기준일(오늘 0시) 사용
+                opened = item.published_at
+                window = max(int((min(item.wedding_date, base) - opened).total_seconds()), 1)
+
+            rsvp_count = _plan["rsvps"][index]
+            if rsvp_count:
+                counts = dict.fromkeys(ATTENDANCE, 0)
+                total_guests = 0
+                # (청첩장, 이름, 연락처) 중복이 없도록 연락처를 서로 다른 값으로 생성 (7919는 10^8과 서로소)
+                phone_base = rng.randrange(10**8)
+                for n in range(rsvp_count):
+                    status = rng.choices(ATTENDANCE, cum_weights=ATTENDANCE_CUM_WEIGHTS)[0]
+                    guest_count = rng.choices(GUEST_COUNTS, cum_weights=GUEST_COUNT_CUM_WEIGHTS)[0]
+                    counts[status] += 1
+                    if status == "ATTENDING":
+                        total_guests += guest_count
+                    created_at = opened + timedelta(seconds=rng.randrange(window))
+                    rsvps.add(
+                        invitation_id,
+                        korean_name(rng),
+                        guest_count,
+                        status,
+                        phone_number((phone_base + n * 7919) % 10**8),
+                        rng.choice(RSVP_MESSAGES),
+                        "",
+                        created_at,
+                        created_at,
+                    )
+                statistics.append(
+                    RSVPStatistics(
+                        invitation_id=invitation_id,
+                        total_count=rsvp_count,
+                        attending_count=counts["ATTENDING"],
+                        not_attending_count=counts["NOT_ATTENDING"],
+                        pending_count=counts["PENDING"],
+                        total_guests=total_guests,
+                    )
+                )
+            for _ in range(_plan["guestbooks"][index]):
+                created_at = opened + timedelta(seconds=rng.randrange(window))
+                guestbooks.add(
+                    invitation_id,
+                    korean_name(rng),
+                    rng.choice(GUESTBOOK_MESSAGES),
+                    rng.random() < 0.95,
+                    "",
+                    created_at,
+                    created_at,
+                )
+
+        rsvps.flush()
+        guestbooks.flush()
+        RSVPStatistics.objects.bulk_create(statistics, batch_size=batch_size)
+    return len(invitations), rsvps.count, guestbooks.count
+
+
+class Command(BaseCommand):
+    help = "벤치마크용 대량 합성 데이터(사용자/청첩장/RSVP/방명록)를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000, help="생성할 사용자 수")
+        parser.add_argument("--invitations", type=int, default=5000, help="생성할 청첩장 수")
+        parser.add_argument("--rsvps", type=int, default=100000, help="생성할 RSVP 수 (발행된 청첩장에 분배)")
+        parser.add_argument("--guestbooks", type=int, default=50000, help="생성할 방명록 수 (발행된 청첩장에 분배)")
+        parser.add_argument("--templates", type=int, default=30, help="활성 템플릿이 없을 때 생성할 템플릿 수")
+        parser.add_argument("--published-ratio", type=float, default=0.85, help="발행된 청첩장 비율")
+        parser.add_argument("--skew", type=float, default=1.5, help="인기도 분포의 치우침 (로그정규 sigma)")
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed (같으면 같은 데이터)")
+        parser.add_argument("--batch-size", type=int, default=5000, help="bulk_create 단위")
+        parser.add_argument("--chunk-size", type=int, default=2000, help="한 작업(트랜잭션)에서 생성할 청첩장 수")
+        parser.add_argument("--workers", type=int, default=1, help="생성 프로세스 수")
+        parser.add_argument("--prefix", default="syn", help="slug/이메일 접두사")
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+        if (
+            Invitation.objects.filter(url_slug__startswith=f"{prefix}-").exists()
+            or User.objects.filter(email=f"{prefix}0@{EMAIL_DOMAIN}").exists()
+        ):
+            raise CommandError(f"'{prefix}' 접두사의 합성 데이터가 이미 있습니다. --prefix로 다른 접두사를 지정하세요.")
+        if options["users"] < 1 or options["invitations"] < 0:
+            raise CommandError("--users는 1 이상, --invitations는 0 이상이어야 합니다.")
+
+        workers = options["workers"]
+        if workers > 1 and connection.vendor == "sqlite":
+            self.stdout.write(self.style.WARNING("SQLite는 동시 쓰기를 지원하지 않아 1개 프로세스로 생성합니다."))
+            workers = 1
+        if workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            self.stdout.write(self.style.WARNING("fork를 지원하지 않는 환경이라 1개 프로세스로 생성합니다."))
+            workers = 1
+
+        started = time.monotonic()
+        _plan.clear()
+        _plan.update(build_plan(options))
+        _plan["options"] = options
+        _plan["base"] = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        _plan["template_ids"] = self.get_template_ids(options)
+        _plan["user_ids"] = self.create_users(options)
+        self.stdout.write(f"사용자 {len(_plan['user_ids'])}명 생성 ({time.monotonic() - started:.1f}초)")
+
+        chunk_size = options["chunk_size"]
+        ranges = [
+            (start, min(start + chunk_size, options["invitations"]))
+            for start in range(0, options["invitations"], chunk_size)
+        ]
+        totals = [0, 0, 0]
+        if workers > 1:
+            # fork된 워커가 부모의 DB 연결을 물려받지 않도록 닫고 시작 (워커는 각자 새로 연결)
+            connections.close_all()
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(workers, mp_context=context) as executor:
+                futures = [executor.submit(generate_range, start, end) for start, end in ranges]
+                for future in as_completed(futures):
+                    self.report(totals, future.result(), started)
+        else:
+            for start, end in ranges:
+                self.report(totals, generate_range(start, end), started)
+
+        elapsed = time.monotonic() - started
+        rows = sum(totals) + len(_plan["user_ids"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"청첩장 {totals[0]}개, RSVP {totals[1]}건, 방명록 {totals[2]}건을 생성했습니다. "
+                f"({elapsed:.1f}초, 초당 {rows / max(elapsed, 1e-6):,.0f}행)"
+            )
+        )
+
+    @staticmethod
+    def get_template_ids(options: dict) -> List[int]:
+        template_ids = list(Template.objects.filter(is_active=True).values_list("id", flat=True))
+        if template_ids:
+            return template_ids
+        categories = [value for value, _ in Template._meta.get_field("category").choices]
+        Template.objects.bulk_create(
+            Template(
+                name=f"합성 템플릿 {index}",
+                thumbnail_url=f"https://example.com/templates/{index}.jpg",
+                category=categories[index % len(categories)],
+                is_premium=index % 5 == 0,
+            )
+            for index in range(options["templates"])
+        )
+        return list(Template.objects.filter(is_active=True).values_list("id", flat=True))
+
+    @staticmethod
+    def create_users(options: dict) -> List[int]:
+        prefix, batch_size = options["prefix"], options["batch_size"]
+        rng = random.Random(options["seed"] - 1)
+        # 모든 합성 사용자는 같은 비밀번호 해시 사용 (사용자마다 해시하면 수 시간이 걸림)
+        password = make_password(f"{prefix}-synthetic")
+        emails = [f"{prefix}{index}@{EMAIL_DOMAIN}" for index in range(options["users"])]
+        for offset in range(0, len(emails), batch_size):
+            User.objects.bulk_create(
+                (
+                    User(
+                        username=email,
+                        email=email,
+                        name=korean_name(rng),
+                        phone=phone_number(rng.randrange(10**8)),
+                        password=password,
+                    )
+                    for email in emails[offset : offset + batch_size]
+                ),
+                batch_size=batch_size,
+            )
+        ids = dict(
+            User.objects.filter(email__startswith=prefix, email__endswith=f"@{EMAIL_DOMAIN}").values_list("email", "id")
+        )
+        return [ids[email] for email in emails]
+
+    def report(self, totals: List[int], result: Tuple[int, int, int], started: float) -> None:
+        for index, value in enumerate(result):
+            totals[index] += value
+        done = totals[0]
+        total = max(len(_plan["published"]), 1)
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            f"  {done}/{total} 청첩장 ({math.floor(done * 100 / total)}%), "
+            f"RSVP {totals[1]}건, 방명록 {totals[2]}건, {elapsed:.1f}초"
+        )
@@ -0,0 +1,25 @@
+"""
+공개 청첩장 스냅샷 일괄 재생성 커맨드
+
+python manage.py rebuild_invitation_snapshots
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.invitations.services.snapshot_service import SnapshotService
+
+
+class Command(BaseCommand):
+    help = "발행된 모든 청첩장의 정적 스냅샷을 다시 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500, help="한 번에 가져올 청첩장 수")
+        parser.add_argument("--no-prune", action="store_true", help="공개 대상이 아닌 스냅샷 파일을 남겨 둡니다.")
+
+    def handle(self, *args, **options):
+        written, removed = SnapshotService.rebuild_all(chunk_size=options["chunk_size"], prune=not options["no_prune"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"스냅샷 {written}개를 생성하고 {removed}개를 삭제했습니다. ({SnapshotService.get_directory()})"
+            )
+        )
@@ -0,0 +1,33 @@
+"""
+RSVP 통계 재계산/검증 커맨드
+
+python manage.py rebuild_rsvp_statistics [--verify] [--invitation ID ...]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.invitations.services.rsvp_service import RSVPService
+
+
+class Command(BaseCommand):
+    help = "저장된 RSVP 통계를 RSVP 테이블 집계와 비교하여 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verify", action="store_true", help="수정하지 않고 불일치 여부만 확인합니다.")
+        parser.add_argument("--invitation", type=int, nargs="+", dest="invitation_ids", help="대상 청첩장 ID")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="한 번에 처리할 청첩장 수")
+
+    def handle(self, *args, **options):
+        mismatched = RSVPService.rebuild_statistics(
+            invitation_ids=options["invitation_ids"],
+            chunk_size=options["chunk_size"],
+            verify_only=options["verify"],
+        )
+
+        if options["verify"]:
+            if mismatched:
+                raise CommandError(f"통계가 맞지 않는 청첩장 {len(mismatched)}개: {mismatched[:20]}")
+            self.stdout.write(self.style.SUCCESS("모든 RSVP 통계가 일치합니다."))
+            return
+
+        self.stdout.write(self.style.SUCCESS(f"RSVP 통계 {len(mismatched)}개를 다시 계산했습니다."))
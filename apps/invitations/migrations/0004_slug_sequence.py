@@ -0,0 +1,26 @@
+# Generated by Django 6.1.2 on 2026-10-18 16:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("invitations", "0003_guestbook_rsvp"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlugSequence",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=50, unique=True, verbose_name="시퀀스 이름")),
+                ("next_value", models.BigIntegerField(default=1, verbose_name="다음 값")),
+            ],
+            options={
+                "verbose_name": "슬러그 시퀀스",
+                "verbose_name_plural": "슬러그 시퀀스",
+                "db_table": "invitations_slug_sequence",
+            },
+        ),
+    ]
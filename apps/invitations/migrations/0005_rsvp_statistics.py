@@ -0,0 +1,41 @@
+# Generated by Django 6.1.2 on 2026-10-18 16:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("invitations", "0004_slug_sequence"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RSVPStatistics",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성일시")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정일시")),
+                ("total_count", models.IntegerField(default=0, verbose_name="전체 응답 수")),
+                ("attending_count", models.IntegerField(default=0, verbose_name="참석 응답 수")),
+                ("not_attending_count", models.IntegerField(default=0, verbose_name="불참석 응답 수")),
+                ("pending_count", models.IntegerField(default=0, verbose_name="미정 응답 수")),
+                ("total_guests", models.IntegerField(default=0, verbose_name="총 참석 인원")),
+                (
+                    "invitation",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rsvp_statistics",
+                        to="invitations.invitation",
+                        verbose_name="청첩장",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "RSVP 통계",
+                "verbose_name_plural": "RSVP 통계",
+                "db_table": "invitations_rsvp_statistics",
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 6.1.2 on 2026-10-18 16:08
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import Coalesce
+
+
+def remove_duplicate_rsvps(apps, schema_editor):
+    """
+    unique 제약 추가 전, 같은 이름/연락처의 중복 응답은 가장 최근 것만 남김
+
+    중복을 지운 청첩장의 저장된 RSVPStatistics는 남은 응답으로 다시 집계합니다.
+    """
+    RSVP = apps.get_model("invitations", "RSVP")
+    RSVPStatistics = apps.get_model("invitations", "RSVPStatistics")
+    duplicates = (
+        RSVP.objects.order_by()
+        .values("invitation_id", "guest_name", "phone")
+        .annotate(latest_id=Max("id"), rows=Count("id"))
+        .filter(rows__gt=1)
+    )
+    affected = set()
+    for group in duplicates.iterator():
+        RSVP.objects.filter(
+            invitation_id=group["invitation_id"], guest_name=group["guest_name"], phone=group["phone"]
+        ).exclude(id=group["latest_id"]).delete()
+        affected.add(group["invitation_id"])
+
+    for statistics in RSVPStatistics.objects.filter(invitation_id__in=affected).iterator():
+        values = RSVP.objects.filter(invitation_id=statistics.invitation_id).aggregate(
+            total_count=Count("id"),
+            attending_count=Count("id", filter=Q(attendance_status="ATTENDING")),
+            not_attending_count=Count("id", filter=Q(attendance_status="NOT_ATTENDING")),
+            pending_count=Count("id", filter=Q(attendance_status="PENDING")),
+            total_guests=Coalesce(Sum("guest_count", filter=Q(attendance_status="ATTENDING")), 0),
+        )
+        RSVPStatistics.objects.filter(pk=statistics.pk).update(**values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("invitations", "0005_rsvp_statistics"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_rsvps, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="rsvp",
+            constraint=models.UniqueConstraint(
+                fields=("invitation", "guest_name", "phone"), name="uniq_rsvp_invitation_guest"
+            ),
+        ),
+    ]
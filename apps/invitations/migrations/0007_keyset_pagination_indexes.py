@@ -0,0 +1,27 @@
+# Generated by Django 6.1.2 on 2026-10-18 16:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("invitations", "0006_rsvp_unique_guest"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="guestbook",
+            name="invitations_invitat_130c77_idx",
+        ),
+        migrations.AddIndex(
+            model_name="guestbook",
+            index=models.Index(
+                fields=["invitation", "is_public", "created_at", "id"], name="guestbook_public_keyset_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rsvp",
+            index=models.Index(fields=["invitation", "created_at", "id"], name="rsvp_invitation_keyset_idx"),
+        ),
+    ]
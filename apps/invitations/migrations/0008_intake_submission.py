@@ -0,0 +1,57 @@
+# Generated by Django 6.1.2 on 2026-10-18 16:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("invitations", "0007_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IntakeSubmission",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성일시")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정일시")),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("RSVP", "RSVP"), ("GUESTBOOK", "방명록")], max_length=20, verbose_name="종류"
+                    ),
+                ),
+                ("payload", models.JSONField(verbose_name="제출 내용")),
+                ("idempotency_key", models.CharField(max_length=64, unique=True, verbose_name="멱등성 키")),
+                ("attempts", models.PositiveSmallIntegerField(default=0, verbose_name="처리 시도 횟수")),
+                ("last_error", models.TextField(blank=True, verbose_name="마지막 오류")),
+                ("processed_at", models.DateTimeField(blank=True, null=True, verbose_name="처리일시")),
+                ("failed_at", models.DateTimeField(blank=True, null=True, verbose_name="실패일시")),
+                (
+                    "invitation",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="intake_submissions",
+                        to="invitations.invitation",
+                        verbose_name="청첩장",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "접수 대기열",
+                "verbose_name_plural": "접수 대기열",
+                "db_table": "invitations_intake_submission",
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("failed_at__isnull", True), ("processed_at__isnull", True)),
+                        fields=["id"],
+                        name="intake_pending_idx",
+                    ),
+                    models.Index(fields=["processed_at"], name="intake_processed_idx"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 6.1.2 on 2026-10-18 16:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("invitations", "0008_intake_submission"),
+        ("templates", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # 새 인덱스를 먼저 만든 뒤 대체되는 인덱스를 삭제 (외래 키가 쓸 인덱스가 비는 구간이 없도록)
+        migrations.AddIndex(
+            model_name="guestbook",
+            index=models.Index(fields=["invitation", "created_at", "id"], name="guestbook_keyset_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="invitation",
+            index=models.Index(fields=["user", "-created_at"], name="invitation_user_recent_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="rsvp",
+            index=models.Index(
+                fields=["invitation", "attendance_status", "guest_count"], name="rsvp_invitation_status_idx"
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="invitation",
+            name="invitations_url_slu_148646_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="invitation",
+            name="invitations_user_id_768526_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="rsvp",
+            name="invitations_invitat_1c6bb5_idx",
+        ),
+    ]
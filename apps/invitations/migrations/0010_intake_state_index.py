@@ -0,0 +1,25 @@
+# Generated by Django 6.1.2 on 2026-10-18 17:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("invitations", "0009_query_shape_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="intakesubmission",
+            name="intake_pending_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="intakesubmission",
+            name="intake_processed_idx",
+        ),
+        migrations.AddIndex(
+            model_name="intakesubmission",
+            index=models.Index(fields=["processed_at", "failed_at", "id"], name="intake_state_idx"),
+        ),
+    ]
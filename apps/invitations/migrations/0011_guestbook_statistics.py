@@ -0,0 +1,37 @@
+# Generated by Django 6.1.2 on 2026-10-18 17:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("invitations", "0010_intake_state_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GuestbookStatistics",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성일시")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정일시")),
+                ("public_count", models.IntegerField(default=0, verbose_name="공개 방명록 수")),
+                (
+                    "invitation",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="guestbook_statistics",
+                        to="invitations.invitation",
+                        verbose_name="청첩장",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "방명록 통계",
+                "verbose_name_plural": "방명록 통계",
+                "db_table": "invitations_guestbook_statistics",
+            },
+        ),
+    ]
@@ -96,9 +96,10 @@ class Invitation(BaseModel):
         db_table = "invitations_invitation"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["url_slug"]),
+            # url_slug 조회(공개 청첩장)는 unique 인덱스를 사용
             models.Index(fields=["status"]),
-            models.Index(fields=["user", "status"]),
+            # 소유자 청첩장 목록/대시보드 (user 필터 + 최신순)
+            models.Index(fields=["user", "-created_at"], name="invitation_user_recent_idx"),
         ]
 
     def __str__(self):
@@ -133,13 +134,45 @@ class RSVP(BaseModel):
         db_table = "invitations_rsvp"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["invitation", "attendance_status"]),
+            # 참석 여부별 집계/대시보드 서브쿼리 (guest_count까지 포함하여 인덱스만으로 계산)
+            models.Index(fields=["invitation", "attendance_status", "guest_count"], name="rsvp_invitation_status_idx"),
+            # 키셋 페이지네이션 ((created_at, id) 순서)
+            models.Index(fields=["invitation", "created_at", "id"], name="rsvp_invitation_keyset_idx"),
+        ]
+        constraints = [
+            # 같은 청첩장에 같은 이름/연락처로는 하나의 응답만 (upsert 충돌 대상)
+            models.UniqueConstraint(fields=["invitation", "guest_name", "phone"], name="uniq_rsvp_invitation_guest"),
         ]
 
     def __str__(self):
         return f"{self.guest_name} - {self.invitation.title} ({self.get_attendance_status_display()})"
 
 
+class RSVPStatistics(BaseModel):
+    """
+    청첩장별 RSVP 통계 (집계 결과를 저장해 두는 테이블)
+
+    RSVPService.upsert_rsvp와 RSVP 모델 저장/삭제 시그널이 변경분을 반영합니다. (QuerySet.update()/bulk_create() 제외)
+    """
+
+    invitation = models.OneToOneField(
+        Invitation, on_delete=models.CASCADE, related_name="rsvp_statistics", verbose_name="청첩장"
+    )
+    total_count = models.IntegerField(default=0, verbose_name="전체 응답 수")
+    attending_count = models.IntegerField(default=0, verbose_name="참석 응답 수")
+    not_attending_count = models.IntegerField(default=0, verbose_name="불참석 응답 수")
+    pending_count = models.IntegerField(default=0, verbose_name="미정 응답 수")
+    total_guests = models.IntegerField(default=0, verbose_name="총 참석 인원")
+
+    class Meta:
+        verbose_name = "RSVP 통계"
+        verbose_name_plural = "RSVP 통계"
+        db_table = "invitations_rsvp_statistics"
+
+    def __str__(self):
+        return f"{self.invitation_id} - {self.total_count}건"
+
+
 class Guestbook(BaseModel):
     """
     방명록 모델
@@ -159,8 +192,93 @@ class Guestbook(BaseModel):
         db_table = "invitations_guestbook"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["invitation", "is_public"]),
+            # 공개 방명록 키셋 페이지네이션 ((created_at, id) 순서), (invitation, is_public) 조회도 포함
+            models.Index(fields=["invitation", "is_public", "created_at", "id"], name="guestbook_public_keyset_idx"),
+            # 소유자 방명록 목록 (공개 여부와 관계없이 (created_at, id) 순서)
+            models.Index(fields=["invitation", "created_at", "id"], name="guestbook_keyset_idx"),
         ]
 
     def __str__(self):
         return f"{self.author_name} - {self.invitation.title}"
+
+
+class GuestbookStatistics(BaseModel):
+    """
+    청첩장별 공개 방명록 통계 (공개 방명록 조회의 ETag/Last-Modified 검증자)
+
+    Guestbook 모델 저장/삭제 시그널과 접수 대기열이 공개 방명록 수 변경분과 updated_at을 반영합니다.
+    (QuerySet.update()/bulk_create() 제외)
+    """
+
+    invitation = models.OneToOneField(
+        Invitation, on_delete=models.CASCADE, related_name="guestbook_statistics", verbose_name="청첩장"
+    )
+    public_count = models.IntegerField(default=0, verbose_name="공개 방명록 수")
+
+    class Meta:
+        verbose_name = "방명록 통계"
+        verbose_name_plural = "방명록 통계"
+        db_table = "invitations_guestbook_statistics"
+
+    def __str__(self):
+        return f"{self.invitation_id} - {self.public_count}건"
+
+
+class SlugSequence(models.Model):
+    """
+    url_slug 발급용 시퀀스
+
+    프로세스가 값 블록을 예약해 가며, 예약된 값은 키 기반 순열을 거쳐 slug로 인코딩됩니다.
+    """
+
+    name = models.CharField(max_length=50, unique=True, verbose_name="시퀀스 이름")
+    next_value = models.BigIntegerField(default=1, verbose_name="다음 값")
+
+    class Meta:
+        verbose_name = "슬러그 시퀀스"
+        verbose_name_plural = "슬러그 시퀀스"
+        db_table = "invitations_slug_sequence"
+
+    def __str__(self):
+        return f"{self.name} ({self.next_value})"
+
+
+class IntakeSubmission(BaseModel):
+    """
+    RSVP/방명록 접수 대기열 (write-behind)
+
+    INTAKE_QUEUE가 활성화되면 제출 내용을 이 테이블에 먼저 적재하고 202로 응답합니다.
+    drain_intake_queue 워커가 배치로 RSVP/Guestbook 테이블에 반영하며,
+    처리된 행은 멱등성 확인을 위해 RETENTION 동안 남겨 둡니다.
+    """
+
+    KIND_CHOICES = [
+        ("RSVP", "RSVP"),
+        ("GUESTBOOK", "방명록"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, verbose_name="종류")
+    invitation = models.ForeignKey(
+        Invitation, on_delete=models.CASCADE, related_name="intake_submissions", verbose_name="청첩장"
+    )
+    payload = models.JSONField(verbose_name="제출 내용")
+    idempotency_key = models.CharField(max_length=64, unique=True, verbose_name="멱등성 키")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="처리 시도 횟수")
+    last_error = models.TextField(blank=True, verbose_name="마지막 오류")
+    processed_at = models.DateTimeField(null=True, blank=True, verbose_name="처리일시")
+    failed_at = models.DateTimeField(null=True, blank=True, verbose_name="실패일시")
+
+    class Meta:
+        verbose_name = "접수 대기열"
+        verbose_name_plural = "접수 대기열"
+        db_table = "invitations_intake_submission"
+        ordering = ["id"]
+        indexes = [
+            # 대기 중인 행(processed_at, failed_at 모두 NULL)을 id 순서로 (drain 조회, 대기열 길이/지연 측정)
+            # processed_at이 앞이므로 보관 기간이 지난 행 삭제(purge)도 이 인덱스를 사용
+            # MySQL은 부분 인덱스(condition)를 지원하지 않아 일반 복합 인덱스로 둠
+            models.Index(fields=["processed_at", "failed_at", "id"], name="intake_state_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} - {self.invitation_id} ({self.idempotency_key[:8]})"
@@ -5,6 +5,7 @@ Invitations 앱 시리얼라이저
 from rest_framework import serializers
 
 from apps.invitations.models import RSVP, Guestbook, Invitation
+from apps.shared.serializers import BaseSerializer
 from apps.templates.serializers import TemplateListSerializer
 
 
@@ -48,12 +49,14 @@ class InvitationCreateSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         validated_data["user"] = self.context["request"].user
-        # url_slug는 서비스 레이어에서 생성
-        if not validated_data.get("url_slug"):
-            from apps.invitations.services.invitation_service import InvitationService
+        if validated_data.get("url_slug"):
+            return super().create(validated_data)
 
-            validated_data["url_slug"] = InvitationService.generate_unique_slug()
-        return super().create(validated_data)
+        # url_slug는 서비스 레이어에서 생성 (충돌 시 새 slug로 다시 저장)
+        from apps.invitations.services.invitation_service import InvitationService
+
+        create = super().create
+        return InvitationService.save_with_unique_slug(lambda slug: create({**validated_data, "url_slug": slug}))
 
 
 class InvitationUpdateSerializer(serializers.ModelSerializer):
@@ -94,7 +97,7 @@ class InvitationUpdateSerializer(serializers.ModelSerializer):
         read_only_fields = ["url_slug"]
 
 
-class InvitationSerializer(serializers.ModelSerializer):
+class InvitationSerializer(BaseSerializer):
     """청첩장 상세용 시리얼라이저"""
 
     template = TemplateListSerializer(read_only=True)
@@ -105,7 +108,41 @@ class InvitationSerializer(serializers.ModelSerializer):
         read_only_fields = ["user", "url_slug", "view_count", "created_at", "updated_at", "published_at", "status"]
 
 
-class PublicInvitationSerializer(serializers.ModelSerializer):
+class InvitationDashboardSerializer(BaseSerializer):
+    """소유자 대시보드 목록용 시리얼라이저 (본문 메시지 제외, RSVP/방명록 집계 포함)"""
+
+    template = TemplateListSerializer(read_only=True)
+    attending_count = serializers.IntegerField(read_only=True)
+    total_guests = serializers.IntegerField(read_only=True)
+    guestbook_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Invitation
+        fields = [
+            "id",
+            "title",
+            "url_slug",
+            "template",
+            "status",
+            "groom_name",
+            "bride_name",
+            "wedding_date",
+            "wedding_location_name",
+            "is_public",
+            "enable_rsvp",
+            "enable_guestbook",
+            "view_count",
+            "attending_count",
+            "total_guests",
+            "guestbook_count",
+            "published_at",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
+class PublicInvitationSerializer(BaseSerializer):
     """공개 조회용 시리얼라이저 (민감 정보 제외)"""
 
     template = TemplateListSerializer(read_only=True)
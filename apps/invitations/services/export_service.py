@@ -0,0 +1,155 @@
+"""
+RSVP/방명록 내보내기 서비스
+
+행을 청크 단위 iterator()와 values_list() 투영으로 읽어 바로 파일 형식으로 흘려보내므로
+목록 크기와 관계없이 메모리 사용량이 일정합니다.
+"""
+
+import csv
+import tempfile
+from datetime import datetime
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.invitations.models import RSVP, Guestbook, Invitation
+
+EXPORT_CHUNK_SIZE = 2000
+# 엑셀에서 한글이 깨지지 않도록 CSV 앞에 붙이는 UTF-8 BOM
+CSV_BOM = "\ufeff"
+# 스프레드시트가 수식으로 해석하는 첫 글자 (하객이 입력한 값이 수식으로 실행되지 않도록 앞에 '를 붙임)
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+EXPORT_TARGETS = {
+    "rsvps": {
+        "model": RSVP,
+        "columns": [
+            ("guest_name", "이름"),
+            ("phone", "연락처"),
+            ("attendance_status", "참석 여부"),
+            ("guest_count", "참석 인원수"),
+            ("message", "메시지"),
+            ("dietary_restrictions", "식이 제한사항"),
+            ("created_at", "응답일시"),
+            ("updated_at", "수정일시"),
+        ],
+    },
+    "guestbooks": {
+        "model": Guestbook,
+        "columns": [
+            ("author_name", "작성자"),
+            ("phone", "연락처"),
+            ("message", "내용"),
+            ("is_public", "공개 여부"),
+            ("created_at", "작성일시"),
+        ],
+    },
+}
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 반환하는 버퍼"""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class ExportService:
+    """RSVP/방명록 내보내기 관련 비즈니스 로직 처리"""
+
+    @staticmethod
+    def get_headers(target: str) -> List[str]:
+        return [header for _, header in EXPORT_TARGETS[target]["columns"]]
+
+    @staticmethod
+    def get_queryset(invitation: Invitation, target: str) -> QuerySet:
+        """내보내기 대상 전체 (소유자용이므로 비공개 방명록 포함, 오래된 순)"""
+        model = EXPORT_TARGETS[target]["model"]
+        return model.objects.filter(invitation=invitation).order_by("created_at", "id")
+
+    @staticmethod
+    def iter_rows(queryset: QuerySet, target: str, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Tuple]:
+        """
+        필요한 컬럼만 청크 단위로 읽어 행 튜플로 반환
+
+        Args:
+            queryset: 필터가 적용된 RSVP/Guestbook 쿼리셋
+            target: "rsvps" 또는 "guestbooks"
+            chunk_size: 한 번에 가져올 행 수
+
+        Yields:
+            tuple: 표시용 값으로 변환된 행
+        """
+        columns = EXPORT_TARGETS[target]["columns"]
+        fields = [field for field, _ in columns]
+        model = EXPORT_TARGETS[target]["model"]
+        # choices 필드는 표시 이름으로 변환
+        choices = {
+            index: dict(model._meta.get_field(field).choices)
+            for index, field in enumerate(fields)
+            if model._meta.get_field(field).choices
+        }
+
+        for row in queryset.values_list(*fields).iterator(chunk_size=chunk_size):
+            yield tuple(
+                ExportService._format_value(choices[i].get(v, v) if i in choices else v) for i, v in enumerate(row)
+            )
+
+    @staticmethod
+    def _format_value(value):
+        if isinstance(value, datetime):
+            return timezone.localtime(value).strftime("%Y-%m-%d %H:%M:%S")
+        if isinstance(value, bool):
+            return "Y" if value else "N"
+        if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+            return f"'{value}"
+        return value
+
+    @staticmethod
+    def stream_csv(headers: List[str], rows: Iterable[Tuple]) -> Iterator[str]:
+        """CSV 한 줄씩 생성 (StreamingHttpResponse용)"""
+        writer = csv.writer(_Echo())
+        yield CSV_BOM + writer.writerow(headers)
+        for row in rows:
+            yield writer.writerow(row)
+
+    @staticmethod
+    def build_xlsx(headers: List[str], rows: Iterable[Tuple], sheet_title: Optional[str] = None) -> IO[bytes]:
+        """
+        XLSX 파일 생성
+
+        openpyxl write-only 모드로 행을 임시 파일에 바로 기록합니다.
+        xlsx는 zip 형식이라 끝까지 쓴 뒤에야 전송할 수 있으므로, 완성된 임시 파일을 반환합니다.
+
+        Raises:
+            ImportError: openpyxl이 설치되지 않은 경우
+        """
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title=sheet_title)
+        sheet.append(headers)
+        for row in rows:
+            sheet.append(row)
+
+        output = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+        workbook.save(output)
+        output.seek(0)
+        return output
+
+    @staticmethod
+    def is_xlsx_available() -> bool:
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    @staticmethod
+    def get_filename(invitation: Invitation, target: str, file_format: str) -> str:
+        return f"invitation-{invitation.pk}-{target}-{timezone.localdate():%Y%m%d}.{file_format}"
@@ -2,7 +2,13 @@
 Guestbook 서비스 레이어
 """
 
-from apps.invitations.models import Guestbook, Invitation
+from typing import Dict, Iterable, List
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from apps.invitations.models import Guestbook, GuestbookStatistics, Invitation
 
 
 class GuestbookService:
@@ -37,3 +43,58 @@ class GuestbookService:
         )
 
         return guestbook
+
+    @staticmethod
+    def apply_statistics_changes(deltas: Dict[int, int], create_missing: bool = True) -> None:
+        """
+        청첩장별 공개 방명록 수 변경분을 통계 행에 F() 연산으로 반영
+
+        공개 방명록의 내용만 바뀐 경우(변경분 0)에도 updated_at을 갱신하여 검증자가 바뀌도록 합니다.
+        통계 행이 아직 없으면 (이미 반영된 방명록을 포함한) 집계 결과로 새로 만듭니다.
+
+        Args:
+            deltas: {청첩장 ID: 공개 방명록 수 변경분}
+            create_missing: False면 통계 행이 없는 청첩장은 건너뜀 (다음 조회 때 집계로 만들어짐)
+        """
+        for invitation_id, delta in deltas.items():
+            updated = GuestbookStatistics.objects.filter(invitation_id=invitation_id).update(
+                public_count=F("public_count") + delta, updated_at=timezone.now()
+            )
+            if updated or not create_missing:
+                continue
+            try:
+                with transaction.atomic():
+                    GuestbookStatistics.objects.create(
+                        invitation_id=invitation_id,
+                        public_count=GuestbookService._count_public([invitation_id])[invitation_id],
+                    )
+            except IntegrityError:
+                # 다른 요청이 먼저 만든 통계 행에는 이번 변경(아직 커밋 전)이 포함되지 않으므로 변경분만 반영
+                GuestbookStatistics.objects.filter(invitation_id=invitation_id).update(
+                    public_count=F("public_count") + delta, updated_at=timezone.now()
+                )
+
+    @staticmethod
+    def create_missing_statistics(invitation_ids: List[int]) -> None:
+        """통계 행이 없는 청첩장의 공개 방명록 수를 집계하여 생성 (이미 있으면 덮어쓰지 않음)"""
+        GuestbookStatistics.objects.bulk_create(
+            [
+                GuestbookStatistics(invitation_id=invitation_id, public_count=count)
+                for invitation_id, count in GuestbookService._count_public(invitation_ids).items()
+            ],
+            ignore_conflicts=True,
+        )
+
+    @staticmethod
+    def _count_public(invitation_ids: Iterable[int]) -> Dict[int, int]:
+        """청첩장별 공개 방명록 수를 한 번의 GROUP BY 쿼리로 집계 (없는 청첩장은 0)"""
+        counts = dict.fromkeys(invitation_ids, 0)
+        rows = (
+            Guestbook.objects.filter(invitation_id__in=list(counts), is_public=True)
+            .order_by()
+            .values("invitation_id")
+            .annotate(count=Count("id"))
+        )
+        for row in rows:
+            counts[row["invitation_id"]] = row["count"]
+        return counts
@@ -0,0 +1,251 @@
+"""
+RSVP/방명록 접수 대기열 서비스 (write-behind)
+
+제출 폭주 시 RSVP/Guestbook 테이블과 통계 행에 동시에 몰리는 쓰기를 줄이기 위해,
+검증된 제출을 IntakeSubmission 테이블에 한 번의 INSERT로 적재하고 바로 202로 응답합니다.
+drain_intake_queue 워커가 배치 단위로 bulk_create(upsert)하고 청첩장별 통계에 변경분을 한 번에 반영합니다.
+
+- 멱등성: 같은 Idempotency-Key(헤더)로 재전송된 제출은 한 번만 적재됩니다.
+  키가 없으면 임의 키를 쓰므로 중복 제거하지 않습니다. (RSVP는 upsert 자체가 멱등)
+- 배압: 대기 중인 제출이 MAX_PENDING 이상이면 IntakeQueueFull을 발생시킵니다. (뷰에서 503 + Retry-After)
+- 지표: get_metrics()로 대기열 길이, 가장 오래된 대기 제출의 지연(초), 실패 건수를 확인합니다.
+"""
+
+import hashlib
+import logging
+import uuid
+from collections import Counter
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+
+from apps.invitations.models import RSVP, Guestbook, IntakeSubmission, Invitation
+from apps.invitations.services.guestbook_service import GuestbookService
+from apps.invitations.services.rsvp_service import RSVPService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTAKE_QUEUE = {
+    "ENABLED": False,
+    "MAX_PENDING": 10000,
+    "BATCH_SIZE": 500,
+    "MAX_ATTEMPTS": 5,
+    "RETENTION": 86400,
+    "RETRY_AFTER": 5,
+}
+DEPTH_CACHE_KEY = "invitation:intake:depth"
+DEPTH_CACHE_TIMEOUT = 1
+RSVP_UPDATE_FIELDS = ["guest_count", "attendance_status", "message", "dietary_restrictions", "updated_at"]
+PENDING = Q(processed_at__isnull=True, failed_at__isnull=True)
+
+
+def get_intake_settings() -> dict:
+    """INTAKE_QUEUE 설정을 기본값과 병합하여 반환"""
+    return {**DEFAULT_INTAKE_QUEUE, **getattr(settings, "INTAKE_QUEUE", {})}
+
+
+class IntakeQueueFull(Exception):
+    """대기열이 가득 차 제출을 받을 수 없는 경우"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("제출이 많아 잠시 후 다시 시도해 주세요.")
+        self.retry_after = retry_after
+
+
+class IntakeService:
+    """접수 대기열 관련 비즈니스 로직 처리"""
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return get_intake_settings()["ENABLED"]
+
+    @staticmethod
+    def build_idempotency_key(kind: str, invitation_id: int, client_key: Optional[str] = None) -> str:
+        """
+        멱등성 키 생성
+
+        클라이언트 키는 청첩장/종류별로 구분되도록 해시합니다.
+        키가 없으면 임의 키를 사용합니다. (같은 이름/내용이라도 다른 하객의 제출일 수 있으므로 중복 제거하지 않음)
+        """
+        if not client_key:
+            return uuid.uuid4().hex
+        return hashlib.sha256(f"{kind}:{invitation_id}:key:{client_key}".encode()).hexdigest()
+
+    @staticmethod
+    def get_depth(use_cache: bool = True) -> int:
+        """대기 중인 제출 수 (배압 판단용으로 짧게 캐시)"""
+        if use_cache:
+            depth = cache.get(DEPTH_CACHE_KEY)
+            if depth is not None:
+                return depth
+        depth = IntakeSubmission.objects.filter(PENDING).count()
+        cache.set(DEPTH_CACHE_KEY, depth, DEPTH_CACHE_TIMEOUT)
+        return depth
+
+    @staticmethod
+    def enqueue(kind: str, invitation: Invitation, payload: dict, client_key: Optional[str] = None) -> str:
+        """
+        제출을 대기열에 적재
+
+        Args:
+            kind: "RSVP" 또는 "GUESTBOOK"
+            invitation: Invitation 객체
+            payload: 시리얼라이저로 검증된 제출 내용
+            client_key: Idempotency-Key 헤더 값
+
+        Returns:
+            str: 멱등성 키
+
+        Raises:
+            ValueError: 해당 기능이 비활성화된 경우
+            IntakeQueueFull: 대기열이 가득 찬 경우
+        """
+        if kind == "RSVP" and not invitation.enable_rsvp:
+            raise ValueError("이 청첩장은 RSVP 기능이 비활성화되어 있습니다.")
+        if kind == "GUESTBOOK" and not invitation.enable_guestbook:
+            raise ValueError("이 청첩장은 방명록 기능이 비활성화되어 있습니다.")
+
+        config = get_intake_settings()
+        if IntakeService.get_depth() >= config["MAX_PENDING"]:
+            raise IntakeQueueFull(config["RETRY_AFTER"])
+
+        key = IntakeService.build_idempotency_key(kind, invitation.pk, client_key)
+        # 이미 같은 키가 있으면 무시 (조회 없이 INSERT 한 번)
+        IntakeSubmission.objects.bulk_create(
+            [IntakeSubmission(kind=kind, invitation=invitation, payload=payload, idempotency_key=key)],
+            ignore_conflicts=True,
+        )
+        return key
+
+    @staticmethod
+    def drain(batch_size: Optional[int] = None) -> int:
+        """
+        대기 중인 제출을 한 배치 반영
+
+        Args:
+            batch_size: 한 번에 처리할 제출 수 (기본값: BATCH_SIZE 설정)
+
+        Returns:
+            int: 처리(또는 실패 처리)한 제출 수
+        """
+        batch_size = batch_size or get_intake_settings()["BATCH_SIZE"]
+
+        try:
+            with transaction.atomic():
+                # 여러 워커가 동시에 돌아도 같은 행을 가져가지 않도록 잠긴 행은 건너뜀
+                batch = list(
+                    IntakeSubmission.objects.select_for_update(skip_locked=True)
+                    .filter(PENDING)
+                    .order_by("id")[:batch_size]
+                )
+                if not batch:
+                    return 0
+                IntakeService._apply(batch)
+        except Exception:
+            logger.exception("접수 대기열 배치 반영에 실패하여 한 건씩 다시 처리합니다.")
+            return IntakeService._drain_one_by_one(batch_size)
+
+        return len(batch)
+
+    @staticmethod
+    def _drain_one_by_one(batch_size: int) -> int:
+        """배치 반영 실패 시 한 건씩 처리하여 실패한 제출만 재시도/실패 처리"""
+        config = get_intake_settings()
+        ids = list(IntakeSubmission.objects.filter(PENDING).order_by("id").values_list("id", flat=True)[:batch_size])
+        for submission_id in ids:
+            try:
+                with transaction.atomic():
+                    submission = IntakeSubmission.objects.select_for_update().filter(PENDING, pk=submission_id).first()
+                    if submission is not None:
+                        IntakeService._apply([submission])
+            except Exception as e:
+                logger.exception("접수 대기열 제출 반영에 실패했습니다. (id=%s)", submission_id)
+                submissions = IntakeSubmission.objects.filter(pk=submission_id)
+                submissions.update(attempts=F("attempts") + 1, last_error=str(e))
+                # 재시도 횟수를 넘기면 더 이상 가져가지 않음
+                submissions.filter(attempts__gte=config["MAX_ATTEMPTS"]).update(failed_at=timezone.now())
+        return len(ids)
+
+    @staticmethod
+    def _apply(batch: List[IntakeSubmission]) -> None:
+        """배치를 RSVP/Guestbook 테이블에 반영하고 처리 완료로 표시 (트랜잭션 안에서 호출)"""
+        now = timezone.now()
+        invitations = {
+            row["id"]: row
+            for row in Invitation.objects.filter(pk__in={submission.invitation_id for submission in batch}).values(
+                "id", "status", "enable_rsvp", "enable_guestbook"
+            )
+        }
+
+        rsvps: Dict[tuple, RSVP] = {}
+        guestbooks: List[Guestbook] = []
+        rejected: Dict[int, str] = {}
+
+        for submission in batch:
+            invitation = invitations.get(submission.invitation_id)
+            error = IntakeService._get_rejection(submission, invitation)
+            if error:
+                rejected[submission.pk] = error
+                continue
+
+            if submission.kind == "RSVP":
+                rsvp = RSVP(invitation_id=submission.invitation_id, **submission.payload)
+                # 배치 안에서 같은 응답자는 마지막 제출만 반영 (id 순서, 정렬 규칙상 같은 이름은 upsert에서 합쳐짐)
+                rsvps[(rsvp.invitation_id, rsvp.guest_name, rsvp.phone)] = rsvp
+            else:
+                guestbooks.append(Guestbook(invitation_id=submission.invitation_id, **submission.payload))
+
+        if rsvps:
+            RSVPService.bulk_upsert_rsvps(list(rsvps.values()), RSVP_UPDATE_FIELDS)
+        if guestbooks:
+            Guestbook.objects.bulk_create(guestbooks)
+            # bulk_create는 시그널이 없으므로 공개 방명록 통계에 직접 반영
+            GuestbookService.apply_statistics_changes(
+                Counter(guestbook.invitation_id for guestbook in guestbooks if guestbook.is_public)
+            )
+
+        accepted = [submission.pk for submission in batch if submission.pk not in rejected]
+        IntakeSubmission.objects.filter(pk__in=accepted).update(processed_at=now, updated_at=now)
+        for submission_id, error in rejected.items():
+            # 청첩장 상태 때문에 반영할 수 없는 제출은 재시도하지 않음
+            IntakeSubmission.objects.filter(pk=submission_id).update(last_error=error, failed_at=now, updated_at=now)
+
+    @staticmethod
+    def _get_rejection(submission: IntakeSubmission, invitation: Optional[dict]) -> Optional[str]:
+        if invitation is None or invitation["status"] != "PUBLISHED":
+            return "발행된 청첩장이 아닙니다."
+        if submission.kind == "RSVP" and not invitation["enable_rsvp"]:
+            return "이 청첩장은 RSVP 기능이 비활성화되어 있습니다."
+        if submission.kind == "GUESTBOOK" and not invitation["enable_guestbook"]:
+            return "이 청첩장은 방명록 기능이 비활성화되어 있습니다."
+        return None
+
+    @staticmethod
+    def purge(retention: Optional[int] = None) -> int:
+        """보관 기간이 지난 처리 완료 행 삭제"""
+        retention = get_intake_settings()["RETENTION"] if retention is None else retention
+        cutoff = timezone.now() - timedelta(seconds=retention)
+        deleted, _ = IntakeSubmission.objects.filter(processed_at__lt=cutoff).delete()
+        return deleted
+
+    @staticmethod
+    def get_metrics() -> dict:
+        """
+        대기열 지표
+
+        Returns:
+            dict: depth(대기 중), failed(실패), lag_seconds(가장 오래된 대기 제출의 경과 시간)
+        """
+        result = IntakeSubmission.objects.aggregate(
+            depth=Count("id", filter=PENDING),
+            failed=Count("id", filter=Q(failed_at__isnull=False)),
+            oldest=Min("created_at", filter=PENDING),
+        )
+        oldest = result.pop("oldest")
+        result["lag_seconds"] = (timezone.now() - oldest).total_seconds() if oldest else 0.0
+        return result
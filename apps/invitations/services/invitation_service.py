@@ -3,12 +3,37 @@ Invitations 앱 서비스 레이어
 비즈니스 로직을 처리하는 레이어
 """
 
-import uuid
 from datetime import datetime
+from typing import Callable, List, TypeVar
 
+from django.db import IntegrityError, transaction
+from django.db.models import Count, IntegerField, OuterRef, QuerySet, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
-from apps.invitations.models import Invitation
+from apps.invitations.models import RSVP, Guestbook, Invitation
+from apps.invitations.services.slug_allocator import get_slug_allocator
+from apps.invitations.services.view_count_service import ViewCountService
+
+# url_slug unique 충돌 시 새 slug로 다시 시도하는 횟수
+SLUG_SAVE_ATTEMPTS = 3
+
+T = TypeVar("T")
+
+# 대시보드 목록에서 읽지 않는 큰 본문 필드
+DASHBOARD_DEFERRED_FIELDS = ["invitation_message", "greeting_message", "ending_message"]
+
+
+def _per_invitation(queryset: QuerySet, aggregate) -> Coalesce:
+    """청첩장별 집계 상관 서브쿼리 (행이 없으면 0)"""
+    subquery = (
+        queryset.filter(invitation=OuterRef("pk"))
+        .order_by()
+        .values("invitation")
+        .annotate(value=aggregate)
+        .values("value")
+    )
+    return Coalesce(Subquery(subquery, output_field=IntegerField()), 0)
 
 
 class InvitationService:
@@ -19,18 +44,48 @@ class InvitationService:
         """
         고유한 url_slug 생성
 
+        중복 확인 쿼리 없이 SlugAllocator가 충돌 없는 값을 발급합니다.
+
         Returns:
             str: 고유한 slug 문자열
         """
-        max_attempts = 10
-        for _ in range(max_attempts):
-            slug = uuid.uuid4().hex[:12]
+        return get_slug_allocator().allocate()
 
-            # 중복 체크
-            if not Invitation.objects.filter(url_slug=slug).exists():
-                return slug
+    @staticmethod
+    def generate_unique_slugs(count: int) -> List[str]:
+        """
+        고유한 url_slug 여러 개 생성 (일괄 생성용)
 
-        return f"inv-{int(timezone.now().timestamp())}"
+        Args:
+            count: 생성할 개수
+
+        Returns:
+            list: 서로 다른 slug 목록
+        """
+        return get_slug_allocator().allocate_many(count)
+
+    @staticmethod
+    def save_with_unique_slug(save: Callable[[str], T]) -> T:
+        """
+        새로 발급한 slug로 저장
+
+        발급기 키가 바뀌는 등으로 새 slug가 이미 쓰인 slug와 겹치면(url_slug unique 위반)
+        다른 slug를 발급해 다시 저장합니다.
+
+        Args:
+            save: slug를 받아 저장하는 함수 (저장 결과 반환)
+
+        Raises:
+            IntegrityError: url_slug 외의 제약 위반이거나 재시도 횟수를 넘긴 경우
+        """
+        for attempt in range(SLUG_SAVE_ATTEMPTS):
+            slug = InvitationService.generate_unique_slug()
+            try:
+                with transaction.atomic():
+                    return save(slug)
+            except IntegrityError:
+                if attempt + 1 == SLUG_SAVE_ATTEMPTS or not Invitation.objects.filter(url_slug=slug).exists():
+                    raise
 
     @staticmethod
     def publish_invitation(invitation: Invitation) -> Invitation:
@@ -46,22 +101,55 @@ class InvitationService:
         Raises:
             ValueError: url_slug가 없는 경우
         """
-        if not invitation.url_slug:
-            invitation.url_slug = InvitationService.generate_unique_slug()
-
         invitation.status = "PUBLISHED"
         invitation.published_at = timezone.now()
-        invitation.save()
+        if invitation.url_slug:
+            invitation.save()
+            return invitation
+
+        def save(slug: str) -> Invitation:
+            invitation.url_slug = slug
+            invitation.save()
+            return invitation
 
-        return invitation
+        return InvitationService.save_with_unique_slug(save)
 
     @staticmethod
     def increment_view_count(invitation: Invitation):
         """
         조회수 증가
 
+        증가분은 ViewCountService 버퍼에 기록되어 주기적으로 DB에 일괄 반영됩니다.
+        응답에 바로 보이도록 메모리 상의 값만 함께 올려 둡니다.
+
         Args:
             invitation: Invitation 객체
         """
+        ViewCountService.record(invitation.pk)
         invitation.view_count += 1
-        invitation.save(update_fields=["view_count"])
+
+    @staticmethod
+    def get_dashboard_queryset(user) -> QuerySet:
+        """
+        소유자 대시보드 목록 쿼리셋
+
+        RSVP/방명록 집계를 상관 서브쿼리로 함께 가져오므로 목록 길이와 관계없이 쿼리 한 번으로 조회됩니다.
+
+        Args:
+            user: 청첩장 소유자
+
+        Returns:
+            QuerySet: attending_count, total_guests, guestbook_count가 annotate된 쿼리셋
+        """
+        attending = RSVP.objects.filter(attendance_status="ATTENDING")
+        return (
+            Invitation.objects.filter(user=user)
+            .select_related("template")
+            .defer(*DASHBOARD_DEFERRED_FIELDS)
+            .annotate(
+                attending_count=_per_invitation(attending, Count("id")),
+                total_guests=_per_invitation(attending, Sum("guest_count")),
+                guestbook_count=_per_invitation(Guestbook.objects.all(), Count("id")),
+            )
+            .order_by("-created_at")
+        )
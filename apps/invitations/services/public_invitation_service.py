@@ -0,0 +1,327 @@
+"""
+공개 청첩장 조회 서비스 레이어
+
+게스트가 slug로 조회하는 공개 청첩장 응답을 캐시합니다.
+직렬화된 본문은 slug 단위로 캐시하고, 조회수는 별도 카운터 키로 관리하여
+조회수가 올라가도 본문 캐시는 무효화되지 않습니다.
+
+본문/검증자 캐시 미스는 single-flight로 처리하여, 인기 청첩장의 캐시가 만료되거나 발행 직후
+동시에 몰린 요청 중 한 요청만 DB를 조회합니다. 나머지는 만료 직전 값(stale)을 받거나 잠시 기다립니다.
+(수정 시에는 invalidate()가 키를 삭제하므로 이전 본문이 stale로 반환되지 않음)
+
+a로 시작하는 메서드는 비동기 공개 뷰(ASGI)용으로, 캐시는 비동기 캐시 API로, 조회는 비동기 ORM으로 처리합니다.
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.invitations.models import Invitation
+from apps.invitations.serializers import PublicInvitationSerializer
+from apps.invitations.services.guestbook_service import GuestbookService
+from apps.invitations.services.rsvp_service import RSVPService
+from apps.invitations.services.view_count_service import ViewCountService
+from apps.shared.cache import single_flight
+from common.db_router import use_primary
+from common.utils import build_etag
+
+PAYLOAD_KEY_PREFIX = "invitation:public:payload"
+VIEWS_KEY_PREFIX = "invitation:public:views"
+META_KEY_PREFIX = "invitation:public:meta"
+
+
+class PublicInvitationService:
+    """공개 청첩장 조회 관련 비즈니스 로직 처리"""
+
+    @staticmethod
+    def payload_key(slug: str) -> str:
+        return f"{PAYLOAD_KEY_PREFIX}:{slug}"
+
+    @staticmethod
+    def views_key(invitation_id: int) -> str:
+        return f"{VIEWS_KEY_PREFIX}:{invitation_id}"
+
+    @staticmethod
+    def meta_key(slug: str) -> str:
+        return f"{META_KEY_PREFIX}:{slug}"
+
+    @staticmethod
+    def get_timeout() -> int:
+        return getattr(settings, "PUBLIC_INVITATION_CACHE_TIMEOUT", 300)
+
+    @staticmethod
+    def get_public_queryset():
+        """공개 조회 가능한 청첩장 QuerySet (템플릿을 함께 조회)"""
+        return Invitation.objects.select_related("template").filter(is_public=True, status="PUBLISHED")
+
+    @staticmethod
+    def serialize(invitation: Invitation) -> dict:
+        """공개 응답 본문 생성"""
+        return dict(PublicInvitationSerializer(invitation).data)
+
+    @classmethod
+    def get_payload(cls, slug: str) -> Optional[dict]:
+        """
+        공개 청첩장 본문 조회 (캐시 우선)
+
+        Args:
+            slug: 청첩장 url_slug
+
+        Returns:
+            dict: 직렬화된 공개 청첩장, 공개 대상이 아니면 None
+        """
+        return single_flight.get_or_compute(cls.payload_key(slug), lambda: cls._load_payload(slug), cls.get_timeout())
+
+    @classmethod
+    async def aget_payload(cls, slug: str) -> Optional[dict]:
+        """get_payload()의 비동기 버전 (캐시 미스일 때 본문 직렬화는 스레드에서 실행)"""
+        return await single_flight.aget_or_compute(
+            cls.payload_key(slug), lambda: sync_to_async(cls._load_payload)(slug), cls.get_timeout()
+        )
+
+    @classmethod
+    @use_primary()
+    def _load_payload(cls, slug: str) -> Optional[dict]:
+        """
+        DB에서 본문을 만들고 검증자/조회수 카운터를 함께 채움 (single-flight로 키당 한 요청만 실행)
+
+        캐시에 오래 남는 값이므로 복제본이 아닌 primary에서 읽습니다.
+        """
+        invitation = cls.get_public_queryset().filter(url_slug=slug).first()
+        if invitation is None:
+            return None
+
+        payload = cls.serialize(invitation)
+        template_updated_at = invitation.template.updated_at if invitation.template else None
+        timeout = cls.get_timeout()
+        single_flight.set(
+            cls.meta_key(slug), cls.build_meta(invitation.pk, invitation.updated_at, template_updated_at), timeout
+        )
+        # 살아 있는 조회수 카운터는 DB 값보다 최신이므로 덮어쓰지 않음
+        cache.add(cls.views_key(invitation.pk), invitation.view_count, timeout)
+        return payload
+
+    @staticmethod
+    def build_meta(invitation_id: int, updated_at: datetime, template_updated_at: Optional[datetime]) -> dict:
+        """
+        조건부 GET 검증자 생성
+
+        조회수는 본문에 포함되지만 검증자에서는 제외하므로 약한(W/) ETag를 사용합니다.
+        """
+        last_modified = max(filter(None, [updated_at, template_updated_at]))
+        return {
+            "id": invitation_id,
+            "etag": build_etag(
+                invitation_id, updated_at.isoformat(), template_updated_at and template_updated_at.isoformat()
+            ),
+            "last_modified": last_modified,
+        }
+
+    @classmethod
+    def get_validators(cls, slug: str) -> Optional[dict]:
+        """
+        공개 청첩장 검증자 조회 (캐시 우선, 없으면 메타데이터 컬럼만 조회)
+
+        Args:
+            slug: 청첩장 url_slug
+
+        Returns:
+            dict: {"id", "etag", "last_modified"}, 공개 대상이 아니면 None
+        """
+        return single_flight.get_or_compute(cls.meta_key(slug), lambda: cls._load_validators(slug), cls.get_timeout())
+
+    @staticmethod
+    def _validators_queryset(slug: str):
+        return Invitation.objects.filter(url_slug=slug, is_public=True, status="PUBLISHED").values_list(
+            "id", "updated_at", "template__updated_at"
+        )
+
+    @classmethod
+    @use_primary()
+    def _load_validators(cls, slug: str) -> Optional[dict]:
+        row = cls._validators_queryset(slug).first()
+        return cls.build_meta(*row) if row is not None else None
+
+    @classmethod
+    async def aget_validators(cls, slug: str) -> Optional[dict]:
+        """get_validators()의 비동기 버전"""
+        return await single_flight.aget_or_compute(
+            cls.meta_key(slug), lambda: cls._aload_validators(slug), cls.get_timeout()
+        )
+
+    @classmethod
+    async def _aload_validators(cls, slug: str) -> Optional[dict]:
+        with use_primary():
+            row = await cls._validators_queryset(slug).afirst()
+        return cls.build_meta(*row) if row is not None else None
+
+    @staticmethod
+    def _rsvp_validators_queryset(slug: str):
+        # 통계 행(청첩장당 한 행)의 응답 수/수정일시를 검증자로 사용 (RSVP 테이블은 읽지 않음)
+        return Invitation.objects.filter(url_slug=slug, is_public=True, status="PUBLISHED").select_related(
+            "rsvp_statistics"
+        )
+
+    @staticmethod
+    def _has_statistics(invitation: Optional[Invitation], related_name: str) -> bool:
+        return invitation is None or hasattr(invitation, related_name)
+
+    @staticmethod
+    def _with_rsvp_validators(invitation: Optional[Invitation]) -> Optional[Tuple[Invitation, str, Optional[datetime]]]:
+        if invitation is None:
+            return None
+
+        statistics = invitation.rsvp_statistics
+        last_modified = statistics.updated_at
+        etag = build_etag("rsvps", invitation.pk, statistics.total_count, last_modified.isoformat())
+        return invitation, etag, last_modified
+
+    @classmethod
+    def get_with_rsvp_validators(cls, slug: str) -> Optional[Tuple[Invitation, str, Optional[datetime]]]:
+        """
+        공개 청첩장과 RSVP 통계(검증자 포함)를 한 번의 쿼리로 조회
+
+        통계 행이 아직 없으면 집계로 만든 뒤 다시 조회합니다. (청첩장마다 한 번)
+        반환된 Invitation의 rsvp_statistics에 통계 행이 채워져 있습니다.
+
+        Returns:
+            tuple: (Invitation, ETag, Last-Modified), 공개 대상이 아니면 None
+        """
+        invitation = cls._rsvp_validators_queryset(slug).first()
+        if not cls._has_statistics(invitation, "rsvp_statistics"):
+            RSVPService.create_missing_statistics([invitation.pk])
+            with use_primary():
+                invitation = cls._rsvp_validators_queryset(slug).first()
+        return cls._with_rsvp_validators(invitation)
+
+    @classmethod
+    async def aget_with_rsvp_validators(cls, slug: str) -> Optional[Tuple[Invitation, str, Optional[datetime]]]:
+        """get_with_rsvp_validators()의 비동기 버전 (통계 행이 없을 때의 계산/저장은 스레드에서 실행)"""
+        invitation = await cls._rsvp_validators_queryset(slug).afirst()
+        if not cls._has_statistics(invitation, "rsvp_statistics"):
+            await sync_to_async(RSVPService.create_missing_statistics)([invitation.pk])
+            with use_primary():
+                invitation = await cls._rsvp_validators_queryset(slug).afirst()
+        return cls._with_rsvp_validators(invitation)
+
+    @staticmethod
+    def _guestbook_validators_queryset(slug: str):
+        # 통계 행(청첩장당 한 행)의 공개 방명록 수/수정일시를 검증자로 사용 (방명록 테이블은 읽지 않음)
+        return Invitation.objects.filter(url_slug=slug, is_public=True, status="PUBLISHED").select_related(
+            "guestbook_statistics"
+        )
+
+    @classmethod
+    def get_with_guestbook_validators(
+        cls, slug: str, query_string: str = ""
+    ) -> Optional[Tuple[Invitation, str, Optional[datetime]]]:
+        """
+        공개 청첩장과 공개 방명록 검증자를 한 번의 쿼리로 조회
+
+        통계 행이 아직 없으면 집계로 만든 뒤 다시 조회합니다. (청첩장마다 한 번)
+
+        Args:
+            slug: 청첩장 url_slug
+            query_string: 페이지 등 쿼리 파라미터 (ETag 구분용)
+
+        Returns:
+            tuple: (Invitation, ETag, Last-Modified), 공개 대상이 아니면 None
+        """
+        invitation = cls._guestbook_validators_queryset(slug).first()
+        if not cls._has_statistics(invitation, "guestbook_statistics"):
+            GuestbookService.create_missing_statistics([invitation.pk])
+            with use_primary():
+                invitation = cls._guestbook_validators_queryset(slug).first()
+        return cls._with_guestbook_validators(invitation, query_string)
+
+    @classmethod
+    async def aget_with_guestbook_validators(
+        cls, slug: str, query_string: str = ""
+    ) -> Optional[Tuple[Invitation, str, Optional[datetime]]]:
+        """get_with_guestbook_validators()의 비동기 버전 (통계 행이 없을 때의 계산/저장은 스레드에서 실행)"""
+        invitation = await cls._guestbook_validators_queryset(slug).afirst()
+        if not cls._has_statistics(invitation, "guestbook_statistics"):
+            await sync_to_async(GuestbookService.create_missing_statistics)([invitation.pk])
+            with use_primary():
+                invitation = await cls._guestbook_validators_queryset(slug).afirst()
+        return cls._with_guestbook_validators(invitation, query_string)
+
+    @staticmethod
+    def _with_guestbook_validators(
+        invitation: Optional[Invitation], query_string: str
+    ) -> Optional[Tuple[Invitation, str, Optional[datetime]]]:
+        if invitation is None:
+            return None
+
+        statistics = invitation.guestbook_statistics
+        last_modified = statistics.updated_at
+        etag = build_etag("guestbooks", invitation.pk, statistics.public_count, last_modified.isoformat(), query_string)
+        return invitation, etag, last_modified
+
+    @classmethod
+    def record_view(cls, invitation_id: int, fallback_count: int = 0) -> int:
+        """
+        조회수 증가 후 응답에 사용할 현재 조회수 반환
+
+        DB 반영은 ViewCountService 버퍼가 담당하고, 응답용 조회수는 캐시 카운터로 계산합니다.
+
+        Args:
+            invitation_id: 청첩장 ID
+            fallback_count: 카운터가 만료된 경우 시작값 (본문 캐시 시점의 조회수)
+
+        Returns:
+            int: 현재 조회수
+        """
+        ViewCountService.record(invitation_id)
+
+        key = cls.views_key(invitation_id)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            cache.add(key, fallback_count, cls.get_timeout())
+            try:
+                return cache.incr(key)
+            except ValueError:
+                return fallback_count + 1
+
+    @classmethod
+    async def arecord_view(cls, invitation_id: int, fallback_count: int = 0) -> int:
+        """record_view()의 비동기 버전"""
+        await ViewCountService.arecord(invitation_id)
+
+        key = cls.views_key(invitation_id)
+        try:
+            return await cache.aincr(key)
+        except ValueError:
+            await cache.aadd(key, fallback_count, cls.get_timeout())
+            try:
+                return await cache.aincr(key)
+            except ValueError:
+                return fallback_count + 1
+
+    @classmethod
+    def invalidate(cls, slugs: Iterable[str]) -> None:
+        """
+        공개 청첩장 본문 캐시 무효화
+
+        트랜잭션 안에서 호출되면 커밋 직후에도 한 번 더 삭제하여
+        커밋 전 데이터로 캐시가 다시 채워지는 경우를 막습니다.
+
+        Args:
+            slugs: 무효화할 url_slug 목록
+        """
+        keys = [key for slug in slugs if slug for key in (cls.payload_key(slug), cls.meta_key(slug))]
+        if not keys:
+            return
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+    @classmethod
+    def invalidate_for_template(cls, template_id: int) -> None:
+        """템플릿을 사용하는 모든 청첩장의 본문 캐시 무효화"""
+        slugs = Invitation.objects.filter(template_id=template_id).values_list("url_slug", flat=True)
+        cls.invalidate(list(slugs))
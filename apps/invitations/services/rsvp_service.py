@@ -2,16 +2,45 @@
 RSVP 서비스 레이어
 """
 
-from django.db import transaction
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
-from apps.invitations.models import RSVP, Invitation
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.invitations.models import RSVP, Invitation, RSVPStatistics
+
+STATISTICS_FIELDS = ["total_count", "attending_count", "not_attending_count", "pending_count", "total_guests"]
+UPSERT_VENDORS = {"sqlite", "postgresql", "mysql"}
+UPSERT_CONFLICT_FIELDS = ["invitation", "guest_name", "phone"]
+UPSERT_INSERT_FIELDS = [
+    "created_at",
+    "updated_at",
+    "invitation",
+    "guest_name",
+    "guest_count",
+    "attendance_status",
+    "phone",
+    "message",
+    "dietary_restrictions",
+]
+STATUS_COUNT_FIELDS = {
+    "ATTENDING": "attending_count",
+    "NOT_ATTENDING": "not_attending_count",
+    "PENDING": "pending_count",
+}
+
+
+def _invitation_id(invitation: Union[Invitation, int]) -> int:
+    return invitation.pk if isinstance(invitation, Invitation) else invitation
 
 
 class RSVPService:
     """RSVP 관련 비즈니스 로직 처리"""
 
     @staticmethod
-    @transaction.atomic
     def create_or_update_rsvp(invitation: Invitation, guest_name: str, **kwargs) -> RSVP:
         """
         RSVP 생성 또는 업데이트
@@ -26,50 +55,458 @@ class RSVPService:
         Returns:
             RSVP: 생성되거나 업데이트된 RSVP 객체
 
+        Raises:
+            ValueError: enable_rsvp가 False인 경우
+        """
+        rsvp, _ = RSVPService.upsert_rsvp(invitation, guest_name, **kwargs)
+        return rsvp
+
+    @staticmethod
+    @transaction.atomic
+    def upsert_rsvp(invitation: Invitation, guest_name: str, **kwargs) -> Tuple[RSVP, bool]:
+        """
+        RSVP upsert (생성 여부 반환)
+
+        (invitation, guest_name, phone) unique 제약을 충돌 대상으로 하는 단일 INSERT 문으로
+        생성/업데이트를 처리하여 동시 제출에도 중복 행이 생기지 않습니다.
+        통계 행을 잠근 뒤 기존 응답을 읽어, 같은 트랜잭션 안에서 변경분만 RSVPStatistics에 반영합니다.
+
+        Args:
+            invitation: Invitation 객체
+            guest_name: 참석자 이름
+            **kwargs: 기타 RSVP 필드들
+
+        Returns:
+            tuple: (RSVP 객체, 새로 생성되었는지 여부)
+
         Raises:
             ValueError: enable_rsvp가 False인 경우
         """
         if not invitation.enable_rsvp:
             raise ValueError("이 청첩장은 RSVP 기능이 비활성화되어 있습니다.")
 
-        phone = kwargs.get("phone", "")
+        kwargs.setdefault("phone", "")
+        RSVPService.lock_statistics([invitation.pk])
+        previous = RSVPService.get_previous_state(invitation.pk, guest_name, kwargs["phone"])
+        if connection.vendor not in UPSERT_VENDORS:
+            # ORM 저장은 RSVP 시그널(apps.invitations.signals)이 통계에 변경분을 반영
+            return RSVPService._upsert_orm(invitation, guest_name, kwargs)
+
+        rsvp, created = RSVPService._upsert_native(invitation, guest_name, kwargs, previous)
+        RSVPService.apply_statistics_change(
+            invitation,
+            None if previous is None else (previous["attendance_status"], previous["guest_count"]),
+            (rsvp.attendance_status, rsvp.guest_count),
+        )
+        return rsvp, created
+
+    @staticmethod
+    def get_previous_state(invitation_id: int, guest_name: str, phone: str) -> Optional[dict]:
+        """
+        upsert가 충돌할 기존 응답을 잠그고 변경 전 값 조회 (트랜잭션 안에서 호출)
 
-        # 같은 이름과 연락처로 기존 RSVP 찾기
-        rsvp, created = RSVP.objects.get_or_create(
-            invitation=invitation, guest_name=guest_name, phone=phone, defaults=kwargs
+        같은 응답자인지는 unique 제약과 같은 정렬 규칙(collation)으로 DB가 비교하도록 WHERE 조건으로 찾습니다.
+        (MySQL 기본 정렬 규칙은 대소문자/악센트를 구분하지 않으므로 Python에서 값을 비교하면 안 됨)
+        lock_statistics()로 통계 행을 먼저 잠근 뒤 호출하면, 조회 이후 쓰기 전까지 같은 청첩장에
+        다른 RSVP 쓰기가 끼어들지 않으므로 조회 결과로 생성/업데이트와 통계 변경분을 정할 수 있습니다.
+
+        Returns:
+            dict: {"pk", "attendance_status", "guest_count", "created_at"}, 기존 응답이 없으면 None
+        """
+        return (
+            RSVP.objects.select_for_update()
+            .filter(invitation_id=invitation_id, guest_name=guest_name, phone=phone)
+            .values("pk", "attendance_status", "guest_count", "created_at")
+            .first()
         )
 
+    @staticmethod
+    def bulk_upsert_rsvps(rsvps: List[RSVP], update_fields: List[str]) -> None:
+        """
+        여러 RSVP를 INSERT 한 번으로 upsert하고 통계에 변경분 반영 (트랜잭션 안에서 호출)
+
+        어떤 응답끼리 같은 응답자인지는 DB 정렬 규칙(collation)이 정하므로 (MySQL은 대소문자/악센트 무시)
+        Python에서 키를 비교하지 않고, 통계 행을 잠근 뒤 대상 이름의 응답을 upsert 전후로 청첩장별 집계하여
+        그 차이를 변경분으로 반영합니다. (건드리지 않은 응답은 전후 집계가 같아 상쇄됨)
+
+        Args:
+            rsvps: 저장할 RSVP 객체 목록 (같은 응답자는 뒤의 것이 반영됨)
+            update_fields: 기존 응답이 있을 때 갱신할 필드
+        """
+        if not rsvps:
+            return
+        invitation_ids = sorted({rsvp.invitation_id for rsvp in rsvps})
+        RSVPService.lock_statistics(invitation_ids)
+        candidates = RSVP.objects.filter(
+            invitation_id__in=invitation_ids, guest_name__in={rsvp.guest_name for rsvp in rsvps}
+        )
+        before = RSVPService._aggregate_by_invitation(invitation_ids, candidates)
+        RSVP.objects.bulk_create(
+            rsvps, update_conflicts=True, unique_fields=UPSERT_CONFLICT_FIELDS, update_fields=update_fields
+        )
+        after = RSVPService._aggregate_by_invitation(invitation_ids, candidates)
+        RSVPService.apply_statistics_deltas(
+            {
+                invitation_id: {
+                    field: after[invitation_id][field] - before[invitation_id][field] for field in STATISTICS_FIELDS
+                }
+                for invitation_id in invitation_ids
+            }
+        )
+
+    @staticmethod
+    def _upsert_native(
+        invitation: Invitation, guest_name: str, values: dict, previous: Optional[dict]
+    ) -> Tuple[RSVP, bool]:
+        """
+        DB 고유 upsert 구문(ON CONFLICT / ON DUPLICATE KEY UPDATE)으로 처리
+
+        생성 여부는 DB가 알려준 값을 사용합니다. (PostgreSQL: xmax = 0, MySQL: 영향받은 행 수)
+        SQLite는 쓰기가 직렬화되므로 잠금 후 읽은 기존 응답(previous) 유무로 판단합니다.
+        """
+        now = timezone.now()
+        rsvp = RSVP(invitation=invitation, guest_name=guest_name, created_at=now, updated_at=now, **values)
+        update_fields = ["updated_at"] + [field for field in values if field != "phone"]
+
+        fields = [RSVP._meta.get_field(name) for name in UPSERT_INSERT_FIELDS]
+        table = connection.ops.quote_name(RSVP._meta.db_table)
+        columns = [connection.ops.quote_name(field.column) for field in fields]
+        params = [field.get_db_prep_save(getattr(rsvp, field.attname), connection) for field in fields]
+        placeholders = ", ".join(["%s"] * len(fields))
+        insert = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+        with connection.cursor() as cursor:
+            if connection.vendor == "mysql":
+                # LAST_INSERT_ID(id)로 기존 행의 id도 lastrowid로 받고, 영향받은 행 수(1: 생성, 2: 갱신)로 구분
+                assignments = ", ".join(
+                    f"{column} = VALUES({column})"
+                    for column in (
+                        connection.ops.quote_name(RSVP._meta.get_field(name).column) for name in update_fields
+                    )
+                )
+                id_column = connection.ops.quote_name("id")
+                cursor.execute(
+                    f"{insert} ON DUPLICATE KEY UPDATE {id_column} = LAST_INSERT_ID({id_column}), {assignments}",
+                    params,
+                )
+                rsvp.pk = cursor.lastrowid
+                created = cursor.rowcount == 1
+                if not created:
+                    # previous는 같은 정렬 규칙으로 잠근 뒤 읽었으므로 보통 있지만, 없으면 저장된 값을 다시 읽음
+                    rsvp.created_at = (
+                        previous["created_at"]
+                        if previous is not None
+                        else RSVP.objects.filter(pk=rsvp.pk).values_list("created_at", flat=True).get()
+                    )
+            else:
+                conflict = ", ".join(
+                    connection.ops.quote_name(RSVP._meta.get_field(name).column) for name in UPSERT_CONFLICT_FIELDS
+                )
+                assignments = ", ".join(
+                    f"{column} = excluded.{column}"
+                    for column in (
+                        connection.ops.quote_name(RSVP._meta.get_field(name).column) for name in update_fields
+                    )
+                )
+                returning = f"{connection.ops.quote_name('id')}, {connection.ops.quote_name('created_at')}"
+                if connection.vendor == "postgresql":
+                    # 새로 삽입된 행은 xmax가 0
+                    returning += ", (xmax = 0)"
+                cursor.execute(
+                    f"{insert} ON CONFLICT ({conflict}) DO UPDATE SET {assignments} RETURNING {returning}", params
+                )
+                row = cursor.fetchone()
+                rsvp.pk = row[0]
+                rsvp.created_at = RSVPService._convert_datetime(row[1])
+                created = row[2] if connection.vendor == "postgresql" else previous is None
+
+        rsvp._state.adding = False
+        return rsvp, created
+
+    @staticmethod
+    def _convert_datetime(value):
+        """원시 SQL로 받은 created_at 값을 ORM과 같은 aware datetime으로 변환"""
+        expression = RSVP._meta.get_field("created_at").get_col(RSVP._meta.db_table)
+        for converter in connection.ops.get_db_converters(expression) + expression.get_db_converters(connection):
+            value = converter(value, expression, connection)
+        return value
+
+    @staticmethod
+    def _upsert_orm(invitation: Invitation, guest_name: str, values: dict) -> Tuple[RSVP, bool]:
+        """고유 upsert 구문을 지원하지 않는 DB용 (get_or_create 후 갱신)"""
+        rsvp, created = RSVP.objects.select_for_update().get_or_create(
+            invitation=invitation, guest_name=guest_name, phone=values["phone"], defaults=values
+        )
         if not created:
-            # 기존 RSVP 업데이트
-            for key, value in kwargs.items():
+            for key, value in values.items():
                 setattr(rsvp, key, value)
             rsvp.save()
+        return rsvp, created
 
-        return rsvp
+    @staticmethod
+    def get_statistics_delta(previous: Optional[Tuple[str, int]], current: Optional[Tuple[str, int]]) -> Dict[str, int]:
+        """
+        RSVP 한 건의 변경이 통계에 주는 변경분 계산
+
+        Args:
+            previous: 변경 전 (참석 여부, 인원수), 새로 생성된 경우 None
+            current: 변경 후 (참석 여부, 인원수), 삭제된 경우 None
+
+        Returns:
+            dict: {통계 필드: 변경분} (0인 항목 제외)
+        """
+        delta = dict.fromkeys(STATISTICS_FIELDS, 0)
+        for sign, state in ((-1, previous), (1, current)):
+            if state is None:
+                continue
+            attendance_status, guest_count = state
+            delta["total_count"] += sign
+            if attendance_status in STATUS_COUNT_FIELDS:
+                delta[STATUS_COUNT_FIELDS[attendance_status]] += sign
+            if attendance_status == "ATTENDING":
+                delta["total_guests"] += sign * guest_count
+        return {field: value for field, value in delta.items() if value}
+
+    @staticmethod
+    def apply_statistics_change(
+        invitation: Union[Invitation, int],
+        previous: Optional[Tuple[str, int]],
+        current: Optional[Tuple[str, int]],
+    ) -> None:
+        """
+        RSVP 변경분을 통계 행에 F() 연산으로 반영
+
+        통계 행이 아직 없으면 (이미 반영된 RSVP를 포함한) 집계 결과로 새로 만듭니다.
+        """
+        RSVPService.apply_statistics_changes([(_invitation_id(invitation), previous, current)])
 
     @staticmethod
-    def get_rsvp_statistics(invitation: Invitation) -> dict:
+    def apply_statistics_changes(
+        changes: Iterable[Tuple[int, Optional[Tuple[str, int]], Optional[Tuple[str, int]]]],
+        create_missing: bool = True,
+    ) -> None:
+        """
+        여러 RSVP 변경분을 청첩장별로 합쳐 통계 행마다 UPDATE 한 번으로 반영
+
+        Args:
+            changes: (청첩장 ID, 변경 전 (참석 여부, 인원수), 변경 후 (참석 여부, 인원수)) 목록
+            create_missing: False면 통계 행이 없는 청첩장은 건너뜀 (다음 조회 때 집계로 만들어짐)
+        """
+        deltas: Dict[int, Counter] = {}
+        for invitation_id, previous, current in changes:
+            deltas.setdefault(invitation_id, Counter()).update(RSVPService.get_statistics_delta(previous, current))
+        RSVPService.apply_statistics_deltas(deltas, create_missing)
+
+    @staticmethod
+    def apply_statistics_deltas(deltas: Dict[int, Dict[str, int]], create_missing: bool = True) -> None:
+        """
+        청첩장별 통계 변경분을 통계 행마다 UPDATE 한 번으로 반영
+
+        Args:
+            deltas: {청첩장 ID: {통계 필드: 변경분}}
+            create_missing: False면 통계 행이 없는 청첩장은 건너뜀 (다음 조회 때 집계로 만들어짐)
+        """
+        for invitation_id, delta in deltas.items():
+            delta = {field: value for field, value in delta.items() if value}
+            if not delta:
+                continue
+            # updated_at은 공개 RSVP 통계 조회의 검증자(ETag/Last-Modified)로 쓰이므로 함께 갱신
+            updated = RSVPStatistics.objects.filter(invitation_id=invitation_id).update(
+                updated_at=timezone.now(), **{field: F(field) + value for field, value in delta.items()}
+            )
+            if updated or not create_missing:
+                continue
+            try:
+                with transaction.atomic():
+                    RSVPStatistics.objects.create(
+                        invitation_id=invitation_id, **RSVPService.aggregate_rsvp_statistics(invitation_id)
+                    )
+            except IntegrityError:
+                # 다른 요청이 먼저 만든 통계 행에는 이번 변경(아직 커밋 전)이 포함되지 않으므로 변경분만 반영
+                RSVPStatistics.objects.filter(invitation_id=invitation_id).update(
+                    updated_at=timezone.now(), **{field: F(field) + value for field, value in delta.items()}
+                )
+
+    @staticmethod
+    def lock_statistics(invitation_ids: Iterable[int]) -> None:
+        """
+        청첩장별 통계 행 잠금 (없으면 현재 집계로 만든 뒤 잠금, 트랜잭션 안에서 호출)
+
+        RSVP를 쓰는 쪽은 변경 전 값을 읽기 전에 통계 행부터 잠가, 같은 청첩장의 RSVP 쓰기를 직렬화합니다.
+        """
+        invitation_ids = sorted(set(invitation_ids))
+        locked = set(
+            RSVPStatistics.objects.select_for_update()
+            .filter(invitation_id__in=invitation_ids)
+            .order_by("invitation_id")
+            .values_list("invitation_id", flat=True)
+        )
+        missing = [invitation_id for invitation_id in invitation_ids if invitation_id not in locked]
+        if missing:
+            RSVPService.create_missing_statistics(missing)
+            list(
+                RSVPStatistics.objects.select_for_update()
+                .filter(invitation_id__in=missing)
+                .order_by("invitation_id")
+                .values_list("invitation_id", flat=True)
+            )
+
+    @staticmethod
+    def create_missing_statistics(invitation_ids: List[int]) -> Dict[int, dict]:
+        """
+        통계 행이 없는 청첩장의 통계를 집계하여 생성 (이미 있으면 덮어쓰지 않음)
+
+        Returns:
+            dict: {청첩장 ID: 집계한 통계}
+        """
+        statistics = RSVPService._aggregate_by_invitation(invitation_ids)
+        RSVPStatistics.objects.bulk_create(
+            [RSVPStatistics(invitation_id=invitation_id, **values) for invitation_id, values in statistics.items()],
+            ignore_conflicts=True,
+        )
+        return statistics
+
+    @staticmethod
+    def aggregate_rsvp_statistics(invitation: Union[Invitation, int]) -> dict:
+        """
+        RSVP 테이블에서 통계를 한 번의 쿼리로 집계
+
+        Args:
+            invitation: Invitation 객체 또는 ID
+
+        Returns:
+            dict: 통계 정보
+        """
+        return RSVP.objects.filter(invitation_id=_invitation_id(invitation)).aggregate(
+            total_count=Count("id"),
+            attending_count=Count("id", filter=Q(attendance_status="ATTENDING")),
+            not_attending_count=Count("id", filter=Q(attendance_status="NOT_ATTENDING")),
+            pending_count=Count("id", filter=Q(attendance_status="PENDING")),
+            total_guests=Coalesce(Sum("guest_count", filter=Q(attendance_status="ATTENDING")), 0),
+        )
+
+    @staticmethod
+    def refresh_statistics(invitation: Union[Invitation, int]) -> dict:
+        """
+        집계 결과로 통계 행을 다시 계산하여 저장
+
+        Args:
+            invitation: Invitation 객체 또는 ID
+
+        Returns:
+            dict: 통계 정보
+        """
+        invitation_id = _invitation_id(invitation)
+        statistics = RSVPService.aggregate_rsvp_statistics(invitation_id)
+        try:
+            with transaction.atomic():
+                RSVPStatistics.objects.update_or_create(invitation_id=invitation_id, defaults=statistics)
+        except IntegrityError:
+            # 다른 요청이 동시에 통계 행을 만든 경우 갱신만 수행
+            RSVPStatistics.objects.filter(invitation_id=invitation_id).update(updated_at=timezone.now(), **statistics)
+        return statistics
+
+    @staticmethod
+    def get_rsvp_statistics(invitation: Union[Invitation, int]) -> dict:
         """
         RSVP 통계 정보 조회
 
+        저장된 통계 행을 읽고, 없으면 한 번의 집계 쿼리로 계산하여 저장합니다.
+
         Args:
-            invitation: Invitation 객체
+            invitation: Invitation 객체 또는 ID
 
         Returns:
             dict: 통계 정보
         """
-        rsvps = RSVP.objects.filter(invitation=invitation)
-
-        total_count = rsvps.count()
-        attending_count = rsvps.filter(attendance_status="ATTENDING").count()
-        not_attending_count = rsvps.filter(attendance_status="NOT_ATTENDING").count()
-        pending_count = rsvps.filter(attendance_status="PENDING").count()
-        total_guests = sum(rsvp.guest_count for rsvp in rsvps.filter(attendance_status="ATTENDING"))
-
-        return {
-            "total_count": total_count,
-            "attending_count": attending_count,
-            "not_attending_count": not_attending_count,
-            "pending_count": pending_count,
-            "total_guests": total_guests,
-        }
+        invitation_id = _invitation_id(invitation)
+        statistics = RSVPStatistics.objects.filter(invitation_id=invitation_id).values(*STATISTICS_FIELDS).first()
+        if statistics is None:
+            statistics = RSVPService.create_missing_statistics([invitation_id])[invitation_id]
+        return statistics
+
+    @staticmethod
+    def rebuild_statistics(
+        invitation_ids: Optional[Iterable[int]] = None, chunk_size: int = 1000, verify_only: bool = False
+    ) -> List[int]:
+        """
+        저장된 통계를 RSVP 테이블 집계와 비교하여 다시 맞춤
+
+        청첩장 ID를 chunk_size 단위로 나눠 청크마다 집계 1회, 통계 조회 1회로 처리합니다.
+
+        Args:
+            invitation_ids: 대상 청첩장 ID 목록 (None이면 전체)
+            chunk_size: 한 번에 처리할 청첩장 수
+            verify_only: True면 수정하지 않고 불일치 목록만 반환
+
+        Returns:
+            list: 통계가 실제 집계와 달랐던 청첩장 ID 목록
+        """
+        if invitation_ids is None:
+            ids_iterator = (
+                Invitation.objects.order_by("pk").values_list("pk", flat=True).iterator(chunk_size=chunk_size)
+            )
+        else:
+            ids_iterator = iter(sorted(invitation_ids))
+
+        mismatched = []
+        chunk = []
+        for invitation_id in ids_iterator:
+            chunk.append(invitation_id)
+            if len(chunk) >= chunk_size:
+                mismatched += RSVPService._rebuild_chunk(chunk, verify_only)
+                chunk = []
+        if chunk:
+            mismatched += RSVPService._rebuild_chunk(chunk, verify_only)
+        return mismatched
+
+    @staticmethod
+    def _aggregate_by_invitation(invitation_ids: List[int], rsvps=None) -> Dict[int, dict]:
+        """청첩장별 통계를 한 번의 GROUP BY 쿼리로 집계 (RSVP가 없는 청첩장은 0, rsvps로 대상 응답 제한)"""
+        expected = {invitation_id: dict.fromkeys(STATISTICS_FIELDS, 0) for invitation_id in invitation_ids}
+        aggregated = (
+            (RSVP.objects.all() if rsvps is None else rsvps)
+            .filter(invitation_id__in=invitation_ids)
+            .order_by()
+            .values("invitation_id")
+            .annotate(
+                total_count=Count("id"),
+                attending_count=Count("id", filter=Q(attendance_status="ATTENDING")),
+                not_attending_count=Count("id", filter=Q(attendance_status="NOT_ATTENDING")),
+                pending_count=Count("id", filter=Q(attendance_status="PENDING")),
+                total_guests=Coalesce(Sum("guest_count", filter=Q(attendance_status="ATTENDING")), 0),
+            )
+        )
+        for row in aggregated:
+            expected[row.pop("invitation_id")] = row
+        return expected
+
+    @staticmethod
+    def _rebuild_chunk(invitation_ids: List[int], verify_only: bool) -> List[int]:
+        empty = dict.fromkeys(STATISTICS_FIELDS, 0)
+        expected = RSVPService._aggregate_by_invitation(invitation_ids)
+
+        stored = {row.invitation_id: row for row in RSVPStatistics.objects.filter(invitation_id__in=invitation_ids)}
+
+        now = timezone.now()
+        to_create, to_update, mismatched = [], [], []
+        for invitation_id, values in expected.items():
+            row = stored.get(invitation_id)
+            if row is None:
+                if values == empty:
+                    # RSVP가 없는 청첩장은 조회 시점에 만들어지므로 비교 대상에서 제외
+                    continue
+                mismatched.append(invitation_id)
+                to_create.append(RSVPStatistics(invitation_id=invitation_id, **values))
+            elif any(getattr(row, field) != value for field, value in values.items()):
+                mismatched.append(invitation_id)
+                for field, value in values.items():
+                    setattr(row, field, value)
+                row.updated_at = now
+                to_update.append(row)
+
+        if not verify_only:
+            with transaction.atomic():
+                RSVPStatistics.objects.bulk_create(to_create, ignore_conflicts=True)
+                RSVPStatistics.objects.bulk_update(to_update, STATISTICS_FIELDS + ["updated_at"])
+        return mismatched
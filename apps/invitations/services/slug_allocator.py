@@ -0,0 +1,163 @@
+"""
+url_slug 발급기
+
+DB 중복 확인 없이 충돌하지 않는 slug를 발급합니다.
+
+- 값은 SlugSequence 행에서 블록 단위로 예약하므로 프로세스 간에 겹치지 않습니다.
+- 예약한 정수는 키 기반 Feistel 순열(48비트 전단사)을 거쳐 36진수 10자리로 인코딩되므로
+  발급 순서가 드러나지 않으면서도 서로 다른 값은 항상 서로 다른 slug가 됩니다.
+- 기존 slug(uuid hex 12자리, "inv-<timestamp>")와는 길이/문자 구성이 달라 겹치지 않으며,
+  url_slug의 unique 제약이 최종 안전장치입니다. (InvitationService.save_with_unique_slug가 충돌 시 다시 발급)
+- 순열 키는 SECRET_KEY와 별도의 필수 설정(SLUG_ALLOCATOR["KEY"])입니다.
+  키가 바뀌면 순열이 달라져 새 slug가 이미 발급된 slug와 겹칠 수 있으므로 운영 중에는 바꾸지 않습니다.
+"""
+
+import hashlib
+import hmac
+import os
+import threading
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+
+from apps.invitations.models import SlugSequence
+
+ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+SLUG_LENGTH = 10
+HALF_BITS = 24
+HALF_MASK = (1 << HALF_BITS) - 1
+ROUNDS = 4
+SEQUENCE_NAME = "invitation_slug"
+
+DEFAULT_SLUG_ALLOCATOR = {
+    "BLOCK_SIZE": 1000,
+    "KEY": None,
+}
+
+
+def get_allocator_settings() -> dict:
+    """SLUG_ALLOCATOR 설정을 기본값과 병합하여 반환"""
+    return {**DEFAULT_SLUG_ALLOCATOR, **getattr(settings, "SLUG_ALLOCATOR", {})}
+
+
+def encode_base36(value: int, length: int = SLUG_LENGTH) -> str:
+    """정수를 고정 길이 36진수 문자열로 변환"""
+    chars = []
+    for _ in range(length):
+        value, remainder = divmod(value, 36)
+        chars.append(ALPHABET[remainder])
+    return "".join(reversed(chars))
+
+
+class SlugAllocator:
+    """
+    충돌 없는 url_slug 발급기
+
+    autocommit 상태에서는 BLOCK_SIZE 만큼 값을 한 번에 예약해 두고 메모리에서 꺼내 쓰므로
+    대부분의 발급은 쿼리가 없습니다. 트랜잭션 안에서 호출되면 롤백 시 예약도 함께 취소될 수 있으므로
+    필요한 개수만 예약하고 남는 블록을 프로세스에 보관하지 않습니다.
+    """
+
+    def __init__(self, key: bytes, block_size: int):
+        self.key = key
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._next = 0
+        self._end = 0
+        self._pid: Optional[int] = None
+
+    def permute(self, value: int) -> int:
+        """48비트 정수를 키 기반 Feistel 네트워크로 섞음 (전단사)"""
+        left, right = value >> HALF_BITS, value & HALF_MASK
+        for round_index in range(ROUNDS):
+            digest = hmac.new(self.key, f"{round_index}:{right}".encode(), hashlib.sha256).digest()
+            left, right = right, left ^ (int.from_bytes(digest[:3], "big") & HALF_MASK)
+        return (left << HALF_BITS) | right
+
+    def encode(self, value: int) -> str:
+        return encode_base36(self.permute(value))
+
+    @staticmethod
+    def reserve(count: int) -> Tuple[int, int]:
+        """
+        시퀀스에서 count개의 값을 예약
+
+        Returns:
+            tuple: [start, end) 범위
+        """
+        for _ in range(2):
+            try:
+                with transaction.atomic():
+                    updated = SlugSequence.objects.filter(name=SEQUENCE_NAME).update(next_value=F("next_value") + count)
+                    if not updated:
+                        SlugSequence.objects.create(name=SEQUENCE_NAME, next_value=1 + count)
+                    end = SlugSequence.objects.filter(name=SEQUENCE_NAME).values_list("next_value", flat=True).get()
+                return end - count, end
+            except IntegrityError:
+                # 다른 프로세스가 동시에 시퀀스 행을 만든 경우 다시 예약
+                continue
+        raise RuntimeError("url_slug 시퀀스를 예약하지 못했습니다.")
+
+    def allocate_many(self, count: int) -> List[str]:
+        """
+        slug를 count개 발급
+
+        Args:
+            count: 발급할 개수
+
+        Returns:
+            list: 서로 다른 slug 목록
+        """
+        if count <= 0:
+            return []
+
+        if connection.in_atomic_block:
+            start, end = self.reserve(count)
+            return [self.encode(value) for value in range(start, end)]
+
+        values: List[int] = []
+        with self._lock:
+            if self._pid != os.getpid():
+                # fork 이후 부모 프로세스의 블록을 그대로 쓰지 않도록 버림
+                self._next = self._end = 0
+                self._pid = os.getpid()
+
+            while len(values) < count:
+                if self._next >= self._end:
+                    self._next, self._end = self.reserve(max(self.block_size, count - len(values)))
+                take = min(count - len(values), self._end - self._next)
+                values.extend(range(self._next, self._next + take))
+                self._next += take
+
+        return [self.encode(value) for value in values]
+
+    def allocate(self) -> str:
+        """slug 하나 발급"""
+        return self.allocate_many(1)[0]
+
+
+_allocator: Optional[SlugAllocator] = None
+_allocator_lock = threading.Lock()
+
+
+def get_slug_allocator() -> SlugAllocator:
+    """
+    설정 기반 SlugAllocator 싱글턴 반환
+
+    Raises:
+        ImproperlyConfigured: SLUG_ALLOCATOR["KEY"]가 없는 경우
+    """
+    global _allocator
+    if _allocator is None:
+        with _allocator_lock:
+            if _allocator is None:
+                config = get_allocator_settings()
+                key = config["KEY"]
+                if not key:
+                    raise ImproperlyConfigured("SLUG_ALLOCATOR['KEY'](SLUG_ALLOCATOR_KEY)를 설정해야 합니다.")
+                derived_key = hashlib.sha256(f"invitation-slug:{key}".encode()).digest()
+                _allocator = SlugAllocator(derived_key, config["BLOCK_SIZE"])
+    return _allocator
@@ -0,0 +1,191 @@
+"""
+공개 청첩장 정적 스냅샷 서비스 레이어
+
+발행된 청첩장의 공개 JSON(과 선택적으로 최소 HTML 셸)을 파일로 내보내
+nginx가 Django를 거치지 않고 바로 서빙할 수 있게 합니다.
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Tuple
+
+from django.conf import settings
+from django.utils.html import escape, json_script
+
+from apps.invitations.models import Invitation
+from apps.invitations.services.public_invitation_service import PublicInvitationService
+from common.renderers import ORJSONRenderer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INVITATION_SNAPSHOT = {
+    "ENABLED": False,
+    "ROOT": None,
+    "HTML": False,
+}
+
+HTML_SHELL = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<meta property="og:title" content="{title}">
+<meta property="og:description" content="{description}">
+</head>
+<body>
+<div id="app"></div>
+{data}
+</body>
+</html>
+"""
+
+
+class SnapshotService:
+    """공개 청첩장 스냅샷 생성/삭제 처리"""
+
+    @staticmethod
+    def get_settings() -> dict:
+        config = {**DEFAULT_INVITATION_SNAPSHOT, **getattr(settings, "INVITATION_SNAPSHOT", {})}
+        if config["ROOT"] is None:
+            config["ROOT"] = Path(settings.BASE_DIR) / "snapshots"
+        return config
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return bool(cls.get_settings()["ENABLED"])
+
+    @classmethod
+    def get_directory(cls) -> Path:
+        return Path(cls.get_settings()["ROOT"]) / "invitations"
+
+    @classmethod
+    def json_path(cls, slug: str) -> Path:
+        return cls.get_directory() / f"{slug}.json"
+
+    @classmethod
+    def html_path(cls, slug: str) -> Path:
+        return cls.get_directory() / f"{slug}.html"
+
+    @staticmethod
+    def is_snapshot_target(invitation: Invitation) -> bool:
+        """공개 조회 가능한 청첩장인지 확인"""
+        return bool(invitation.url_slug) and invitation.status == "PUBLISHED" and invitation.is_public
+
+    @staticmethod
+    def _write_atomic(path: Path, content: bytes) -> None:
+        """임시 파일에 쓴 뒤 rename하여 nginx가 쓰다 만 파일을 읽지 않도록 함"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(content)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def render_html(payload: dict) -> str:
+        """스냅샷 데이터를 포함한 최소 HTML 셸 생성"""
+        description = f"{payload['groom_name']} ♥ {payload['bride_name']}"
+        return HTML_SHELL.format(
+            title=escape(payload["title"]),
+            description=escape(description),
+            data=json_script(payload, "invitation-data"),
+        )
+
+    @classmethod
+    def write(cls, invitation: Invitation) -> None:
+        """
+        청첩장 스냅샷 파일 생성
+
+        Args:
+            invitation: 발행된 Invitation 객체 (template을 select_related 해두면 추가 쿼리가 없음)
+        """
+        payload = PublicInvitationService.serialize(invitation)
+        cls._write_atomic(cls.json_path(invitation.url_slug), ORJSONRenderer().render(payload))
+
+        if cls.get_settings()["HTML"]:
+            cls._write_atomic(cls.html_path(invitation.url_slug), cls.render_html(payload).encode("utf-8"))
+        else:
+            cls.html_path(invitation.url_slug).unlink(missing_ok=True)
+
+    @classmethod
+    def remove(cls, slugs: Iterable[str]) -> None:
+        """청첩장 스냅샷 파일 삭제"""
+        for slug in slugs:
+            if not slug:
+                continue
+            cls.json_path(slug).unlink(missing_ok=True)
+            cls.html_path(slug).unlink(missing_ok=True)
+
+    @classmethod
+    def sync(cls, invitation: Invitation) -> None:
+        """
+        청첩장 상태에 맞춰 스냅샷 생성 또는 삭제
+
+        발행/수정 시에는 다시 생성하고, 보관/비공개 전환 시에는 삭제합니다.
+        """
+        if not cls.is_enabled():
+            return
+        try:
+            if cls.is_snapshot_target(invitation):
+                cls.write(invitation)
+            else:
+                cls.remove([invitation.url_slug])
+        except OSError:
+            # 스냅샷은 캐시 성격이므로 실패해도 요청은 성공시키고 rebuild 커맨드로 복구
+            logger.exception("청첩장 스냅샷 동기화에 실패했습니다. (slug=%s)", invitation.url_slug)
+
+    @classmethod
+    def sync_many(cls, invitation_ids: Iterable[int]) -> None:
+        """여러 청첩장 스냅샷을 현재 상태에 맞춰 동기화"""
+        if not cls.is_enabled():
+            return
+        invitations = Invitation.objects.select_related("template").filter(pk__in=list(invitation_ids))
+        for invitation in invitations.iterator(chunk_size=500):
+            cls.sync(invitation)
+
+    @classmethod
+    def sync_template(cls, template_id: int) -> None:
+        """템플릿을 사용하는 발행된 청첩장 스냅샷 재생성"""
+        if not cls.is_enabled():
+            return
+        invitations = PublicInvitationService.get_public_queryset().filter(template_id=template_id)
+        for invitation in invitations.iterator(chunk_size=500):
+            cls.sync(invitation)
+
+    @classmethod
+    def rebuild_all(cls, chunk_size: int = 500, prune: bool = True) -> Tuple[int, int]:
+        """
+        발행된 모든 청첩장 스냅샷 재생성
+
+        Args:
+            chunk_size: iterator() 청크 크기
+            prune: 더 이상 공개 대상이 아닌 스냅샷 파일 삭제 여부
+
+        Returns:
+            tuple: (생성한 수, 삭제한 수)
+        """
+        written = 0
+        published_slugs = set()
+        invitations = PublicInvitationService.get_public_queryset().order_by("pk")
+        for invitation in invitations.iterator(chunk_size=chunk_size):
+            cls.write(invitation)
+            published_slugs.add(invitation.url_slug)
+            written += 1
+
+        removed = 0
+        directory = cls.get_directory()
+        if prune and directory.exists():
+            stale = {path.stem for path in directory.glob("*.json")} | {path.stem for path in directory.glob("*.html")}
+            stale -= published_slugs
+            cls.remove(stale)
+            removed = len(stale)
+
+        return written, removed
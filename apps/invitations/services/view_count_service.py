@@ -0,0 +1,285 @@
+"""
+조회수 버퍼 서비스 레이어
+
+공개 청첩장 조회 시마다 Invitation 행을 갱신하지 않고,
+증가분을 버퍼에 모아 두었다가 주기적으로 F("view_count") + n 일괄 UPDATE로 반영합니다.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+from apps.invitations.models import Invitation
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VIEW_COUNT_BUFFER = {
+    "BACKEND": "local",
+    "FLUSH_INTERVAL": 5,
+    "CACHE_KEY_PREFIX": "invitation:views:pending",
+}
+
+
+def get_buffer_settings() -> dict:
+    """VIEW_COUNT_BUFFER 설정을 기본값과 병합하여 반환"""
+    return {**DEFAULT_VIEW_COUNT_BUFFER, **getattr(settings, "VIEW_COUNT_BUFFER", {})}
+
+
+class LocalViewCountBuffer:
+    """
+    프로세스 로컬 조회수 버퍼
+
+    gunicorn 워커별로 증가분을 메모리에 모읍니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[int, int] = defaultdict(int)
+
+    def add(self, invitation_id: int, amount: int = 1) -> None:
+        with self._lock:
+            self._pending[invitation_id] += amount
+
+    async def aadd(self, invitation_id: int, amount: int = 1) -> None:
+        self.add(invitation_id, amount)
+
+    def drain(self, invitation_ids: Optional[Iterable[int]] = None) -> Dict[int, int]:
+        """
+        버퍼에 쌓인 증가분을 꺼내고 비움
+
+        Args:
+            invitation_ids: 꺼낼 청첩장 ID 목록 (None이면 전체)
+
+        Returns:
+            dict: {invitation_id: 증가분}
+        """
+        with self._lock:
+            if invitation_ids is None:
+                drained = dict(self._pending)
+                self._pending.clear()
+            else:
+                drained = {pk: self._pending.pop(pk) for pk in invitation_ids if pk in self._pending}
+        return drained
+
+    def pending(self) -> Dict[int, int]:
+        with self._lock:
+            return dict(self._pending)
+
+
+class CacheViewCountBuffer:
+    """
+    공유 캐시 기반 조회수 버퍼
+
+    증가분은 캐시의 원자적 incr로 누적되므로 여러 워커가 같은 카운터를 공유합니다.
+    flush 시에는 읽은 값만큼만 decr하므로 그 사이에 들어온 증가분은 유실되지 않습니다.
+    """
+
+    def __init__(self, key_prefix: str):
+        self.key_prefix = key_prefix
+        self._lock = threading.Lock()
+        self._dirty: set = set()
+
+    def _key(self, invitation_id: int) -> str:
+        return f"{self.key_prefix}:{invitation_id}"
+
+    def add(self, invitation_id: int, amount: int = 1) -> None:
+        key = self._key(invitation_id)
+        cache.add(key, 0, timeout=None)
+        try:
+            cache.incr(key, amount)
+        except ValueError:
+            # add와 incr 사이에 다른 워커가 flush하며 키가 사라진 경우
+            cache.set(key, amount, timeout=None)
+        with self._lock:
+            self._dirty.add(invitation_id)
+
+    async def aadd(self, invitation_id: int, amount: int = 1) -> None:
+        """add()의 비동기 버전"""
+        key = self._key(invitation_id)
+        await cache.aadd(key, 0, timeout=None)
+        try:
+            await cache.aincr(key, amount)
+        except ValueError:
+            await cache.aset(key, amount, timeout=None)
+        with self._lock:
+            self._dirty.add(invitation_id)
+
+    def drain(self, invitation_ids: Optional[Iterable[int]] = None) -> Dict[int, int]:
+        """
+        캐시에 쌓인 증가분을 꺼냄
+
+        Args:
+            invitation_ids: 꺼낼 청첩장 ID 목록 (None이면 이 프로세스가 기록한 ID 전체)
+
+        Returns:
+            dict: {invitation_id: 증가분}
+        """
+        with self._lock:
+            if invitation_ids is None:
+                ids = list(self._dirty)
+                self._dirty.clear()
+            else:
+                ids = list(invitation_ids)
+                self._dirty.difference_update(ids)
+
+        if not ids:
+            return {}
+
+        keys = {self._key(pk): pk for pk in ids}
+        drained = {}
+        for key, amount in cache.get_many(list(keys)).items():
+            if not amount:
+                continue
+            try:
+                cache.decr(key, amount)
+            except ValueError:
+                continue
+            drained[keys[key]] = amount
+        return drained
+
+    def pending(self) -> Dict[int, int]:
+        with self._lock:
+            ids = list(self._dirty)
+        keys = {self._key(pk): pk for pk in ids}
+        return {keys[key]: amount for key, amount in cache.get_many(list(keys)).items() if amount}
+
+
+class ViewCountService:
+    """조회수 버퍼링 및 일괄 반영 처리"""
+
+    _buffer = None
+    _buffer_backend: Optional[str] = None
+    _flusher: Optional[threading.Thread] = None
+    _flusher_pid: Optional[int] = None
+    _stop_event = threading.Event()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_buffer(cls):
+        """설정된 백엔드의 버퍼 인스턴스 반환"""
+        config = get_buffer_settings()
+        backend = config["BACKEND"]
+        if cls._buffer is None or cls._buffer_backend != backend:
+            with cls._lock:
+                if cls._buffer is None or cls._buffer_backend != backend:
+                    if backend == "cache":
+                        cls._buffer = CacheViewCountBuffer(config["CACHE_KEY_PREFIX"])
+                    elif backend == "local":
+                        cls._buffer = LocalViewCountBuffer()
+                    else:
+                        raise ValueError(f"지원하지 않는 VIEW_COUNT_BUFFER BACKEND입니다: {backend}")
+                    cls._buffer_backend = backend
+        return cls._buffer
+
+    @classmethod
+    def record(cls, invitation_id: int, amount: int = 1) -> None:
+        """
+        조회수 증가 기록
+
+        FLUSH_INTERVAL이 0 이하이면 버퍼 없이 즉시 F() UPDATE로 반영합니다.
+
+        Args:
+            invitation_id: 청첩장 ID
+            amount: 증가분
+        """
+        if get_buffer_settings()["FLUSH_INTERVAL"] <= 0:
+            Invitation.objects.filter(pk=invitation_id).update(view_count=F("view_count") + amount)
+            return
+
+        cls.get_buffer().add(invitation_id, amount)
+        cls._ensure_flusher()
+
+    @classmethod
+    async def arecord(cls, invitation_id: int, amount: int = 1) -> None:
+        """record()의 비동기 버전"""
+        if get_buffer_settings()["FLUSH_INTERVAL"] <= 0:
+            await Invitation.objects.filter(pk=invitation_id).aupdate(view_count=F("view_count") + amount)
+            return
+
+        await cls.get_buffer().aadd(invitation_id, amount)
+        cls._ensure_flusher()
+
+    @classmethod
+    def flush(cls, invitation_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        버퍼에 쌓인 증가분을 DB에 일괄 반영
+
+        같은 증가분을 가진 청첩장끼리 묶어 UPDATE ... WHERE id IN (...) 한 번으로 처리합니다.
+
+        Args:
+            invitation_ids: 반영할 청첩장 ID 목록 (None이면 버퍼 전체)
+
+        Returns:
+            int: 반영된 총 조회수
+        """
+        drained = cls.get_buffer().drain(invitation_ids)
+        if not drained:
+            return 0
+
+        by_amount: Dict[int, list] = defaultdict(list)
+        for invitation_id, amount in drained.items():
+            by_amount[amount].append(invitation_id)
+
+        groups = list(by_amount.items())
+        for index, (amount, ids) in enumerate(groups):
+            try:
+                Invitation.objects.filter(pk__in=ids).update(view_count=F("view_count") + amount)
+            except Exception:
+                # 반영에 실패한 묶음과 아직 반영하지 않은 묶음만 다음 flush에서 다시 시도
+                # (이미 UPDATE가 커밋된 묶음을 되돌려 넣으면 조회수가 두 번 반영됨)
+                buffer = cls.get_buffer()
+                for pending_amount, pending_ids in groups[index:]:
+                    for invitation_id in pending_ids:
+                        buffer.add(invitation_id, pending_amount)
+                raise
+
+        return sum(drained.values())
+
+    @classmethod
+    def pending(cls) -> Dict[int, int]:
+        """아직 반영되지 않은 증가분 조회"""
+        return cls.get_buffer().pending()
+
+    @classmethod
+    def _ensure_flusher(cls) -> None:
+        """주기적으로 flush하는 백그라운드 스레드를 (fork 이후에도) 한 번만 띄움"""
+        pid = os.getpid()
+        if cls._flusher_pid == pid and cls._flusher is not None and cls._flusher.is_alive():
+            return
+        with cls._lock:
+            if cls._flusher_pid == pid and cls._flusher is not None and cls._flusher.is_alive():
+                return
+            cls._stop_event = threading.Event()
+            cls._flusher = threading.Thread(target=cls._run_flusher, name="view-count-flusher", daemon=True)
+            cls._flusher_pid = pid
+            cls._flusher.start()
+
+    @classmethod
+    def _run_flusher(cls) -> None:
+        stop_event = cls._stop_event
+        while not stop_event.wait(get_buffer_settings()["FLUSH_INTERVAL"]):
+            try:
+                cls.flush()
+            except Exception:
+                logger.exception("조회수 버퍼 flush에 실패했습니다.")
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """백그라운드 스레드를 멈추고 남은 증가분을 반영 (프로세스 종료 시 호출)"""
+        cls._stop_event.set()
+        if cls._buffer is None:
+            return
+        try:
+            cls.flush()
+        except Exception:
+            logger.exception("종료 시 조회수 버퍼 flush에 실패했습니다.")
+
+
+atexit.register(ViewCountService.shutdown)
@@ -0,0 +1,132 @@
+"""
+Invitations 앱 시그널
+
+청첩장/템플릿이 변경되면 공개 청첩장 캐시를 무효화하고 정적 스냅샷을 동기화합니다.
+스냅샷 파일은 커밋된 데이터만 반영하도록 on_commit 시점에 씁니다.
+조회수 반영은 QuerySet.update()를 사용하므로 여기에 걸리지 않습니다.
+
+RSVP를 모델 save()/delete()로 바꾸면 RSVPStatistics에 변경분을 반영합니다.
+RSVPService.upsert_rsvp(원시 SQL)와 접수 대기열(bulk_create)은 직접 반영하며,
+QuerySet.update()/bulk_create()로 RSVP를 직접 바꾼 경우에는 rebuild_rsvp_statistics로 다시 맞춥니다.
+
+방명록도 모델 save()/delete()로 바꾸면 GuestbookStatistics(공개 방명록 검증자)에 반영합니다.
+(접수 대기열의 bulk_create는 직접 반영)
+"""
+
+from collections import Counter
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from apps.invitations.models import RSVP, Guestbook, Invitation
+from apps.invitations.services.guestbook_service import GuestbookService
+from apps.invitations.services.public_invitation_service import PublicInvitationService
+from apps.invitations.services.rsvp_service import RSVPService
+from apps.invitations.services.snapshot_service import SnapshotService
+from apps.templates.models import Template
+
+
+@receiver(post_save, sender=Invitation)
+def invalidate_invitation_on_save(sender, instance, **kwargs):
+    """발행/수정 시 공개 캐시 무효화 및 스냅샷 재생성 (보관/비공개 전환 시 삭제)"""
+    PublicInvitationService.invalidate([instance.url_slug])
+    if SnapshotService.is_enabled():
+        transaction.on_commit(lambda: SnapshotService.sync(instance))
+
+
+@receiver(post_delete, sender=Invitation)
+def invalidate_invitation_on_delete(sender, instance, **kwargs):
+    """삭제 시 공개 캐시 무효화 및 스냅샷 삭제"""
+    PublicInvitationService.invalidate([instance.url_slug])
+    if SnapshotService.is_enabled():
+        slug = instance.url_slug
+        transaction.on_commit(lambda: SnapshotService.remove([slug]))
+
+
+@receiver(post_save, sender=Template)
+def invalidate_template_on_save(sender, instance, **kwargs):
+    """템플릿 수정 시 해당 템플릿을 쓰는 청첩장 캐시 무효화"""
+    if kwargs.get("created"):
+        return
+    PublicInvitationService.invalidate_for_template(instance.pk)
+    if SnapshotService.is_enabled():
+        template_id = instance.pk
+        transaction.on_commit(lambda: SnapshotService.sync_template(template_id))
+
+
+@receiver(pre_delete, sender=Template)
+def invalidate_template_on_delete(sender, instance, **kwargs):
+    """템플릿 삭제 시 (SET_NULL 전에) 해당 템플릿을 쓰는 청첩장 캐시 무효화"""
+    PublicInvitationService.invalidate_for_template(instance.pk)
+    if SnapshotService.is_enabled():
+        invitation_ids = list(Invitation.objects.filter(template_id=instance.pk).values_list("pk", flat=True))
+        transaction.on_commit(lambda: SnapshotService.sync_many(invitation_ids))
+
+
+@receiver(pre_save, sender=RSVP)
+def remember_rsvp_before_save(sender, instance, raw=False, **kwargs):
+    """수정 전 (청첩장, 참석 여부, 인원수)를 DB에서 읽어 둠 (새 응답이면 None)"""
+    instance._statistics_previous = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    instance._statistics_previous = (
+        RSVP.objects.filter(pk=instance.pk).values_list("invitation_id", "attendance_status", "guest_count").first()
+    )
+
+
+@receiver(post_save, sender=RSVP)
+def update_statistics_on_rsvp_save(sender, instance, raw=False, **kwargs):
+    """RSVP 생성/수정 시 통계에 변경분 반영"""
+    if raw:
+        return
+    previous = getattr(instance, "_statistics_previous", None)
+    current = (instance.attendance_status, instance.guest_count)
+    if previous is None:
+        changes = [(instance.invitation_id, None, current)]
+    elif previous[0] == instance.invitation_id:
+        changes = [(instance.invitation_id, previous[1:], current)]
+    else:
+        changes = [(previous[0], previous[1:], None), (instance.invitation_id, None, current)]
+    # 통계 행이 없으면 다음 조회 때 이 변경을 포함해 집계되므로 만들지 않음
+    RSVPService.apply_statistics_changes(changes, create_missing=False)
+
+
+@receiver(post_delete, sender=RSVP)
+def update_statistics_on_rsvp_delete(sender, instance, **kwargs):
+    """RSVP 삭제 시 통계에서 제외 (청첩장과 함께 삭제되는 경우 통계 행도 함께 삭제됨)"""
+    RSVPService.apply_statistics_changes(
+        [(instance.invitation_id, (instance.attendance_status, instance.guest_count), None)], create_missing=False
+    )
+
+
+@receiver(pre_save, sender=Guestbook)
+def remember_guestbook_before_save(sender, instance, raw=False, **kwargs):
+    """수정 전 (청첩장, 공개 여부)를 DB에서 읽어 둠 (새 방명록이면 None)"""
+    instance._statistics_previous = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    instance._statistics_previous = (
+        Guestbook.objects.filter(pk=instance.pk).values_list("invitation_id", "is_public").first()
+    )
+
+
+@receiver(post_save, sender=Guestbook)
+def update_statistics_on_guestbook_save(sender, instance, raw=False, **kwargs):
+    """공개 방명록이 생기거나 바뀌면 공개 방명록 수/수정일시 반영 (비공개끼리의 변경은 제외)"""
+    if raw:
+        return
+    deltas = Counter()
+    previous = getattr(instance, "_statistics_previous", None)
+    if previous is not None and previous[1]:
+        deltas[previous[0]] -= 1
+    if instance.is_public:
+        deltas[instance.invitation_id] += 1
+    GuestbookService.apply_statistics_changes(deltas)
+
+
+@receiver(post_delete, sender=Guestbook)
+def update_statistics_on_guestbook_delete(sender, instance, **kwargs):
+    """공개 방명록 삭제 시 반영 (청첩장과 함께 삭제되는 경우 통계 행도 함께 삭제됨)"""
+    if instance.is_public:
+        GuestbookService.apply_statistics_changes({instance.invitation_id: -1}, create_missing=False)
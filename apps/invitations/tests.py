@@ -2,16 +2,59 @@
 Invitations 앱 테스트
 """
 
+import copy
+import csv
+import importlib
+import json
+import sys
+import time
 from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO, StringIO
 
 import pytest
+from asgiref.sync import async_to_sync
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.db.models import Count, F, QuerySet
+from django.test.utils import CaptureQueriesContext
+from django.urls import clear_url_caches, resolve
 from django.utils import timezone
-from rest_framework import status
-
-from apps.invitations.models import RSVP, Guestbook, Invitation
+from rest_framework import serializers, status
+from rest_framework.renderers import JSONRenderer
+
+from apps.invitations.checks import check_slug_allocator_key
+from apps.invitations.models import (
+    RSVP,
+    Guestbook,
+    GuestbookStatistics,
+    IntakeSubmission,
+    Invitation,
+    RSVPStatistics,
+)
+from apps.invitations.serializers import (
+    GuestbookSerializer,
+    InvitationSerializer,
+    PublicInvitationSerializer,
+    RSVPSerializer,
+)
+from apps.invitations.services import slug_allocator
+from apps.invitations.services.intake_service import PENDING, IntakeService
 from apps.invitations.services.invitation_service import InvitationService
+from apps.invitations.services.public_invitation_service import PublicInvitationService
+from apps.invitations.services.rsvp_service import RSVPService
+from apps.invitations.services.slug_allocator import SlugAllocator
+from apps.invitations.services.view_count_service import ViewCountService
+from apps.invitations.views import AsyncPublicInvitationView
+from apps.shared.cache import single_flight
+from apps.shared.serializers import compile_projection
 from apps.templates.models import Template
+from common.pagination import KeysetPagination
+from common.testing import explain_problems, query_budget
 
 User = get_user_model()
 
@@ -183,6 +226,139 @@ class TestInvitationCRUD:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.django_db
+class TestInvitationDashboard:
+    """소유자 대시보드 목록 테스트"""
+
+    def create_invitations(self, user, template, count):
+        for i in range(count):
+            invitation = Invitation.objects.create(
+                user=user,
+                template=template,
+                title=f"청첩장{i}",
+                url_slug=f"dashboard-{i}",
+                groom_name="홍길동",
+                bride_name="김영희",
+                wedding_date=timezone.now() + timedelta(days=30),
+                status="PUBLISHED",
+            )
+            RSVP.objects.create(
+                invitation=invitation, guest_name="김철수", attendance_status="ATTENDING", guest_count=2
+            )
+            RSVP.objects.create(invitation=invitation, guest_name="이영희", attendance_status="NOT_ATTENDING")
+            Guestbook.objects.create(invitation=invitation, author_name="김철수", message="축하합니다!")
+
+    def test_dashboard_counts(self, authenticated_client, published_invitation, other_user, template):
+        """청첩장별 RSVP/방명록 집계가 포함되는지 테스트"""
+        RSVP.objects.create(
+            invitation=published_invitation, guest_name="김철수", attendance_status="ATTENDING", guest_count=3
+        )
+        RSVP.objects.create(
+            invitation=published_invitation, guest_name="이영희", attendance_status="ATTENDING", guest_count=1
+        )
+        RSVP.objects.create(invitation=published_invitation, guest_name="박민수", attendance_status="PENDING")
+        self.create_invitations(other_user, template, 1)
+
+        response = authenticated_client.get("/api/v1/invitations/dashboard/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        item = response.data["results"][0]
+        assert (item["attending_count"], item["total_guests"], item["guestbook_count"]) == (2, 4, 0)
+        assert item["template"]["name"] == "테스트 템플릿"
+        assert "invitation_message" not in item
+
+    def test_dashboard_query_count_is_fixed(self, authenticated_client, user, template, django_assert_num_queries):
+        """청첩장 수와 관계없이 쿼리 수가 일정한지 테스트"""
+        self.create_invitations(user, template, 1)
+        with CaptureQueriesContext(connection) as baseline:
+            authenticated_client.get("/api/v1/invitations/dashboard/")
+
+        Invitation.objects.filter(user=user).delete()
+        self.create_invitations(user, template, 10)
+
+        with django_assert_num_queries(len(baseline)) as context:
+            response = authenticated_client.get("/api/v1/invitations/dashboard/")
+
+        assert len(response.data["results"]) == 10
+        assert all(item["total_guests"] == 2 for item in response.data["results"])
+        assert not any("invitation_message" in query["sql"] for query in context.captured_queries)
+
+    def test_list_selects_template(self, authenticated_client, user, template, django_assert_num_queries):
+        """기본 목록도 템플릿을 함께 조회하는지 테스트"""
+        self.create_invitations(user, template, 1)
+        with CaptureQueriesContext(connection) as baseline:
+            authenticated_client.get("/api/v1/invitations/")
+
+        Invitation.objects.filter(user=user).delete()
+        self.create_invitations(user, template, 5)
+
+        with django_assert_num_queries(len(baseline)):
+            authenticated_client.get("/api/v1/invitations/")
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    """?fields= / ?omit= 필드 선택 테스트"""
+
+    def select_sql(self, context):
+        return [query["sql"] for query in context.captured_queries if "invitations_invitation" in query["sql"]]
+
+    def test_fields_prunes_response_and_columns(self, authenticated_client, invitation):
+        """선택한 필드만 반환하고 다른 컬럼은 조회하지 않는지 테스트"""
+        with CaptureQueriesContext(connection) as context:
+            response = authenticated_client.get("/api/v1/invitations/", {"fields": "title,wedding_date"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data["results"][0]) == {"title", "wedding_date"}
+        sql = self.select_sql(context)[-1]
+        assert '"title"' in sql
+        assert "invitation_message" not in sql
+        assert "templates_template" not in sql
+
+    def test_omit_and_nested_template(self, authenticated_client, invitation):
+        """제외한 필드는 빠지고 중첩 템플릿은 같은 쿼리로 조회되는지 테스트"""
+        omit = "invitation_message,greeting_message,ending_message"
+        with CaptureQueriesContext(connection) as context:
+            response = authenticated_client.get(f"/api/v1/invitations/{invitation.id}/", {"omit": omit})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["template"]["name"] == "테스트 템플릿"
+        assert "invitation_message" not in response.data
+        assert "title" in response.data
+        assert all("invitation_message" not in sql for sql in self.select_sql(context))
+        assert not any(query["sql"].startswith('SELECT "templates_template"') for query in context.captured_queries)
+
+    def test_dashboard_fields(self, authenticated_client, published_invitation):
+        """대시보드 목록에서도 집계 필드와 함께 필드 선택이 되는지 테스트"""
+        response = authenticated_client.get("/api/v1/invitations/dashboard/", {"fields": "title,guestbook_count"})
+
+        assert response.data["results"][0] == {"title": "발행된 청첩장", "guestbook_count": 0}
+
+    def test_unknown_field(self, authenticated_client, invitation):
+        """알 수 없는 필드는 400을 반환하는지 테스트"""
+        response = authenticated_client.get("/api/v1/invitations/", {"fields": "title,password"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_other_user_still_forbidden(self, api_client, other_user, invitation):
+        """필드 선택과 관계없이 소유자 확인이 되는지 테스트"""
+        api_client.force_authenticate(user=other_user)
+
+        response = api_client.get(f"/api/v1/invitations/{invitation.id}/", {"fields": "title"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_public_invitation_fields(self, api_client, published_invitation):
+        """공개 청첩장 조회에서도 필드 선택이 되는지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+        api_client.get(url)
+
+        response = api_client.get(url, {"fields": "title,view_count"})
+
+        assert response.data == {"title": "발행된 청첩장", "view_count": 2}
+
+
 @pytest.mark.django_db
 class TestInvitationPublish:
     """청첩장 발행 테스트"""
@@ -288,6 +464,352 @@ class TestPublicInvitationView:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.django_db
+class TestPublicInvitationCache:
+    """공개 청첩장 캐시 테스트"""
+
+    def test_cache_hit_skips_invitation_queries(self, api_client, published_invitation, django_assert_num_queries):
+        """캐시 적중 시 조회수 반영 쿼리 외에는 DB를 조회하지 않는지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+        api_client.get(url)
+
+        with django_assert_num_queries(1):  # 조회수 UPDATE만 실행
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["title"] == "발행된 청첩장"
+        assert response.data["template"]["name"] == "테스트 템플릿"
+        assert response.data["view_count"] == 2
+
+    def test_update_invalidates_cache(self, authenticated_client, api_client, published_invitation):
+        """수정 시 캐시가 무효화되는지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+        api_client.get(url)
+
+        authenticated_client.patch(
+            f"/api/v1/invitations/{published_invitation.id}/", {"title": "수정된 제목"}, format="json"
+        )
+        response = api_client.get(url)
+
+        assert response.data["title"] == "수정된 제목"
+
+    def test_publish_invalidates_cache(self, api_client, published_invitation):
+        """보관 후 재발행 시 캐시가 무효화되는지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+        api_client.get(url)
+
+        published_invitation.status = "ARCHIVED"
+        published_invitation.save()
+        assert api_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+        InvitationService.publish_invitation(published_invitation)
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+
+    def test_delete_invalidates_cache(self, authenticated_client, api_client, published_invitation):
+        """삭제 시 캐시가 무효화되는지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+        api_client.get(url)
+
+        authenticated_client.delete(f"/api/v1/invitations/{published_invitation.id}/")
+
+        assert api_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_template_update_invalidates_cache(self, api_client, template, published_invitation):
+        """템플릿 수정 시 캐시가 무효화되는지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+        api_client.get(url)
+
+        template.name = "바뀐 템플릿"
+        template.save()
+        response = api_client.get(url)
+
+        assert response.data["template"]["name"] == "바뀐 템플릿"
+
+    def test_expired_payload_served_stale_while_recomputing(
+        self, api_client, published_invitation, monkeypatch, django_assert_num_queries
+    ):
+        """다른 요청이 본문을 다시 계산하는 동안에는 만료된 본문을 DB 조회 없이 반환하는지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+        api_client.get(url)
+        single_flight.reset()
+
+        expired = time.time() + PublicInvitationService.get_timeout() + 1
+        monkeypatch.setattr(time, "time", lambda: expired)
+        for key in (
+            PublicInvitationService.meta_key(published_invitation.url_slug),
+            PublicInvitationService.payload_key(published_invitation.url_slug),
+        ):
+            cache.add(single_flight.lock_key(key), "other-worker", 5)
+
+        with django_assert_num_queries(1):  # 조회수 UPDATE만 실행
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["title"] == "발행된 청첩장"
+        stats = single_flight.get_stats()
+        assert stats["stale"] == 2
+        assert stats["leader"] == 0
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """공개 slug 엔드포인트 조건부 GET 테스트"""
+
+    def test_invitation_not_modified(self, api_client, published_invitation, django_assert_num_queries):
+        """ETag가 같으면 304를 반환하는지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+        response = api_client.get(url)
+        etag = response["ETag"]
+
+        with django_assert_num_queries(1):  # 조회수 UPDATE만 실행
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        published_invitation.refresh_from_db()
+        assert published_invitation.view_count == 2
+
+    def test_invitation_modified_after_update(self, api_client, published_invitation):
+        """수정 후에는 새 본문을 반환하는지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+        etag = api_client.get(url)["ETag"]
+
+        published_invitation.title = "수정된 제목"
+        published_invitation.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["title"] == "수정된 제목"
+        assert response["ETag"] != etag
+
+    def test_invitation_if_modified_since(self, api_client, published_invitation):
+        """If-Modified-Since 처리 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+        last_modified = api_client.get(url)["Last-Modified"]
+
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_rsvp_statistics_not_modified_until_new_rsvp(self, api_client, published_invitation):
+        """RSVP 통계는 새 응답이 생기기 전까지 304인지 테스트"""
+        RSVP.objects.create(
+            invitation=published_invitation, guest_name="김철수", attendance_status="ATTENDING", guest_count=2
+        )
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/rsvps/"
+        etag = api_client.get(url)["ETag"]
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        RSVP.objects.create(
+            invitation=published_invitation, guest_name="이영희", attendance_status="ATTENDING", guest_count=1
+        )
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["total_count"] == 2
+
+    def test_rsvp_statistics_validators_use_statistics_row(
+        self, api_client, published_invitation, django_assert_num_queries
+    ):
+        """RSVP 통계 재검증은 통계 행 조회 한 번으로 처리하고, 응답 수가 같아도 변경되면 새 본문인지 테스트"""
+        RSVPService.upsert_rsvp(invitation=published_invitation, guest_name="김철수", attendance_status="ATTENDING")
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/rsvps/"
+        etag = api_client.get(url)["ETag"]
+
+        with django_assert_num_queries(1) as context:
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert 'invitations_rsvp"' not in context.captured_queries[0]["sql"]
+
+        RSVPService.upsert_rsvp(invitation=published_invitation, guest_name="김철수", attendance_status="NOT_ATTENDING")
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["total_count"] == 1
+        assert response.data["not_attending_count"] == 1
+
+    def test_guestbook_not_modified(self, api_client, published_invitation, django_assert_num_queries):
+        """방명록은 메타데이터 쿼리 한 번으로 304를 반환하는지 테스트"""
+        Guestbook.objects.create(invitation=published_invitation, author_name="김철수", message="축하합니다!")
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/guestbooks/"
+        etag = api_client.get(url)["ETag"]
+
+        with django_assert_num_queries(1):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_guestbook_validators_use_statistics_row(self, api_client, published_invitation, django_assert_num_queries):
+        """방명록 재검증은 통계 행 조회 한 번으로 처리하고, 공개 방명록이 바뀌면 새 본문인지 테스트"""
+        guestbook = Guestbook.objects.create(invitation=published_invitation, author_name="김철수", message="축하!")
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/guestbooks/"
+        etag = api_client.get(url)["ETag"]
+
+        with django_assert_num_queries(1) as context:
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert 'invitations_guestbook"' not in context.captured_queries[0]["sql"]
+
+        # 비공개 방명록 추가는 공개 목록을 바꾸지 않음
+        Guestbook.objects.create(invitation=published_invitation, author_name="이영희", message="비밀", is_public=False)
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        def refetch(previous_etag):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=previous_etag)
+            assert response.status_code == status.HTTP_200_OK
+            return response["ETag"]
+
+        # 공개 방명록 추가 / 공개 방명록 수정 / 공개로 전환 / 삭제 시 새 본문
+        Guestbook.objects.create(invitation=published_invitation, author_name="박민수", message="축하!")
+        etag = refetch(etag)
+        guestbook.message = "결혼 축하해!"
+        guestbook.save()
+        etag = refetch(etag)
+        secret = Guestbook.objects.get(author_name="이영희")
+        secret.is_public = True
+        secret.save()
+        etag = refetch(etag)
+        guestbook.delete()
+        refetch(etag)
+
+        assert GuestbookStatistics.objects.get(invitation=published_invitation).public_count == 2
+
+
+@pytest.mark.django_db
+class TestPublicInvitationPageView:
+    """공개 청첩장 페이지 번들 테스트"""
+
+    def test_bundle_contains_all_sections(self, api_client, published_invitation):
+        """번들 응답에 청첩장, RSVP 통계, 방명록이 모두 포함되는지 테스트"""
+        RSVP.objects.create(
+            invitation=published_invitation, guest_name="김철수", attendance_status="ATTENDING", guest_count=2
+        )
+        Guestbook.objects.create(invitation=published_invitation, author_name="김철수", message="축하합니다!")
+        Guestbook.objects.create(
+            invitation=published_invitation, author_name="이영희", message="비공개", is_public=False
+        )
+
+        response = api_client.get(f"/api/v1/invitations/slug/{published_invitation.url_slug}/page/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["invitation"]["title"] == "발행된 청첩장"
+        assert response.data["invitation"]["view_count"] == 1
+        assert response.data["rsvp_statistics"]["attending_count"] == 1
+        assert response.data["rsvp_statistics"]["total_guests"] == 2
+        assert response.data["guestbooks"]["count"] == 1
+        assert response.data["guestbooks"]["results"][0]["author_name"] == "김철수"
+
+    def test_bundle_query_count_is_fixed(self, api_client, published_invitation, django_assert_num_queries):
+        """방명록/RSVP 수와 관계없이 쿼리 수가 일정한지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/page/"
+        api_client.get(url)
+        with CaptureQueriesContext(connection) as baseline:
+            api_client.get(url)
+
+        for i in range(30):
+            Guestbook.objects.create(invitation=published_invitation, author_name=f"하객{i}", message="축하합니다!")
+            RSVP.objects.create(invitation=published_invitation, guest_name=f"하객{i}", attendance_status="ATTENDING")
+
+        with django_assert_num_queries(len(baseline)):
+            response = api_client.get(url)
+
+        assert response.data["guestbooks"]["count"] == 30
+        assert len(response.data["guestbooks"]["results"]) == 20
+        assert f"/api/v1/invitations/slug/{published_invitation.url_slug}/guestbooks/?cursor=" in (
+            response.data["guestbooks"]["next"]
+        )
+
+    def test_bundle_skips_disabled_sections(self, api_client, published_invitation):
+        """비활성화된 기능은 null로 반환되는지 테스트"""
+        published_invitation.enable_rsvp = False
+        published_invitation.enable_guestbook = False
+        published_invitation.save()
+
+        response = api_client.get(f"/api/v1/invitations/slug/{published_invitation.url_slug}/page/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["rsvp_statistics"] is None
+        assert response.data["guestbooks"] is None
+
+    def test_bundle_draft_invitation(self, api_client, invitation):
+        """초안 청첩장 번들 조회 시 404 테스트"""
+        response = api_client.get(f"/api/v1/invitations/slug/{invitation.url_slug}/page/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.fixture
+def snapshot_root(settings, tmp_path):
+    """정적 스냅샷 활성화 fixture"""
+    settings.INVITATION_SNAPSHOT = {"ENABLED": True, "ROOT": tmp_path, "HTML": True}
+    return tmp_path / "invitations"
+
+
+@pytest.mark.django_db
+class TestInvitationSnapshot:
+    """공개 청첩장 정적 스냅샷 테스트"""
+
+    def test_publish_writes_snapshot(self, snapshot_root, invitation, django_capture_on_commit_callbacks):
+        """발행 시 JSON/HTML 스냅샷이 생성되는지 테스트"""
+        with django_capture_on_commit_callbacks(execute=True):
+            InvitationService.publish_invitation(invitation)
+
+        data = json.loads((snapshot_root / f"{invitation.url_slug}.json").read_text(encoding="utf-8"))
+        assert data["title"] == "테스트 청첩장"
+        assert data["template"]["name"] == "테스트 템플릿"
+        html = (snapshot_root / f"{invitation.url_slug}.html").read_text(encoding="utf-8")
+        assert "<title>테스트 청첩장</title>" in html
+
+    def test_update_regenerates_snapshot(
+        self, snapshot_root, authenticated_client, published_invitation, django_capture_on_commit_callbacks
+    ):
+        """수정 시 스냅샷이 다시 생성되는지 테스트"""
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_client.patch(
+                f"/api/v1/invitations/{published_invitation.id}/", {"title": "수정된 제목"}, format="json"
+            )
+
+        data = json.loads((snapshot_root / f"{published_invitation.url_slug}.json").read_text(encoding="utf-8"))
+        assert data["title"] == "수정된 제목"
+
+    def test_archive_and_delete_remove_snapshot(
+        self, snapshot_root, published_invitation, django_capture_on_commit_callbacks
+    ):
+        """보관/삭제 시 스냅샷이 삭제되는지 테스트"""
+        path = snapshot_root / f"{published_invitation.url_slug}.json"
+        with django_capture_on_commit_callbacks(execute=True):
+            published_invitation.save()
+        assert path.exists()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            published_invitation.status = "ARCHIVED"
+            published_invitation.save()
+        assert not path.exists()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            published_invitation.status = "PUBLISHED"
+            published_invitation.save()
+        assert path.exists()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            published_invitation.delete()
+        assert not path.exists()
+
+    def test_rebuild_command(self, snapshot_root, published_invitation, invitation):
+        """일괄 재생성 커맨드가 발행된 청첩장만 남기는지 테스트"""
+        snapshot_root.mkdir(parents=True)
+        (snapshot_root / "stale-slug.json").write_text("{}", encoding="utf-8")
+
+        call_command("rebuild_invitation_snapshots", "--chunk-size", "1", stdout=StringIO())
+
+        assert (snapshot_root / f"{published_invitation.url_slug}.json").exists()
+        assert not (snapshot_root / f"{invitation.url_slug}.json").exists()
+        assert not (snapshot_root / "stale-slug.json").exists()
+
+
 @pytest.mark.django_db
 class TestInvitationService:
     """InvitationService 테스트"""
@@ -301,6 +823,52 @@ class TestInvitationService:
         assert len(slug1) > 0
         assert len(slug2) > 0
 
+    def test_generate_unique_slugs_bulk(self):
+        """일괄 slug 생성 시 모두 서로 다른지 테스트"""
+        slugs = InvitationService.generate_unique_slugs(2000)
+
+        assert len(set(slugs)) == 2000
+        assert all(len(slug) == 10 for slug in slugs)
+        assert InvitationService.generate_unique_slug() not in slugs
+
+    @pytest.mark.django_db(transaction=True)
+    def test_slug_allocator_reserves_blocks(self, django_assert_num_queries):
+        """autocommit 상태에서는 블록 단위로 예약하고 이후 발급은 쿼리가 없는지 테스트"""
+        allocator = SlugAllocator(b"test-key", block_size=100)
+        allocator.allocate()
+
+        with django_assert_num_queries(0):
+            slugs = [allocator.allocate() for _ in range(99)]
+
+        other = SlugAllocator(b"test-key", block_size=100)
+        assert not set(slugs) & set(other.allocate_many(100))
+
+    def test_slug_allocator_requires_key(self, settings, monkeypatch):
+        """순열 키가 없으면 SECRET_KEY로 대신하지 않고 설정 오류로 알리는지 테스트"""
+        settings.SLUG_ALLOCATOR = {**settings.SLUG_ALLOCATOR, "KEY": None}
+        monkeypatch.setattr(slug_allocator, "_allocator", None)
+
+        assert [error.id for error in check_slug_allocator_key(None)] == ["invitations.E001"]
+        with pytest.raises(ImproperlyConfigured):
+            InvitationService.generate_unique_slug()
+
+    def test_create_retries_on_slug_collision(self, authenticated_client, invitation, template, monkeypatch):
+        """새 slug가 이미 쓰인 slug와 겹치면 다른 slug로 다시 저장하는지 테스트"""
+        slugs = iter([invitation.url_slug, "fresh-slug"])
+        monkeypatch.setattr(InvitationService, "generate_unique_slug", staticmethod(lambda: next(slugs)))
+        data = {
+            "template": template.id,
+            "title": "새로운 청첩장",
+            "groom_name": "홍길동",
+            "bride_name": "김영희",
+            "wedding_date": (timezone.now() + timedelta(days=30)).isoformat(),
+        }
+
+        response = authenticated_client.post("/api/v1/invitations/", data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["url_slug"] == "fresh-slug"
+
     def test_publish_invitation_service(self, invitation):
         """Service를 통한 청첩장 발행 테스트"""
         assert invitation.status == "DRAFT"
@@ -340,6 +908,126 @@ class TestInvitationService:
         assert published_invitation.view_count == initial_count + 1
 
 
+@pytest.fixture
+def buffered_view_counts(settings):
+    """조회수 버퍼링 활성화 fixture (백그라운드 flush가 끼어들지 않도록 주기를 길게)"""
+    settings.VIEW_COUNT_BUFFER = {"BACKEND": "local", "FLUSH_INTERVAL": 3600}
+    ViewCountService.get_buffer().drain()
+    yield
+    ViewCountService.get_buffer().drain()
+
+
+@pytest.mark.django_db
+class TestViewCountService:
+    """조회수 버퍼 테스트"""
+
+    def test_record_is_buffered_until_flush(self, buffered_view_counts, published_invitation):
+        """flush 전에는 DB에 반영되지 않는지 테스트"""
+        for _ in range(3):
+            ViewCountService.record(published_invitation.id)
+
+        published_invitation.refresh_from_db()
+        assert published_invitation.view_count == 0
+        assert ViewCountService.pending() == {published_invitation.id: 3}
+
+        assert ViewCountService.flush() == 3
+
+        published_invitation.refresh_from_db()
+        assert published_invitation.view_count == 3
+        assert ViewCountService.pending() == {}
+
+    def test_flush_batches_updates(self, buffered_view_counts, user, template, published_invitation):
+        """같은 증가분끼리 묶어 UPDATE하는지 테스트"""
+        other = Invitation.objects.create(
+            user=user,
+            template=template,
+            title="다른 청첩장",
+            url_slug="other-published",
+            groom_name="홍길동",
+            bride_name="김영희",
+            wedding_date=timezone.now() + timedelta(days=30),
+            status="PUBLISHED",
+        )
+        ViewCountService.record(published_invitation.id)
+        ViewCountService.record(other.id)
+
+        with CaptureQueriesContext(connection) as queries:
+            ViewCountService.flush()
+
+        assert len(queries) == 1
+        published_invitation.refresh_from_db()
+        other.refresh_from_db()
+        assert published_invitation.view_count == 1
+        assert other.view_count == 1
+
+    def test_failed_flush_keeps_only_unapplied_counts(
+        self, buffered_view_counts, user, template, published_invitation, monkeypatch
+    ):
+        """두 번째 UPDATE가 실패하면 반영되지 않은 증가분만 버퍼에 남아 다음 flush에서 한 번만 반영되는지 테스트"""
+        other = Invitation.objects.create(
+            user=user,
+            template=template,
+            title="다른 청첩장",
+            url_slug="other-published",
+            groom_name="홍길동",
+            bride_name="김영희",
+            wedding_date=timezone.now() + timedelta(days=30),
+            status="PUBLISHED",
+        )
+        ViewCountService.record(published_invitation.id)
+        ViewCountService.record(other.id)
+        ViewCountService.record(other.id)
+
+        calls = []
+        update = QuerySet.update
+
+        def fail_second_update(queryset, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise DatabaseError("connection lost")
+            return update(queryset, **kwargs)
+
+        monkeypatch.setattr(QuerySet, "update", fail_second_update)
+        with pytest.raises(DatabaseError):
+            ViewCountService.flush()
+        monkeypatch.undo()
+
+        assert len(ViewCountService.pending()) == 1
+        ViewCountService.flush()
+
+        published_invitation.refresh_from_db()
+        other.refresh_from_db()
+        assert published_invitation.view_count == 1
+        assert other.view_count == 2
+
+    def test_cache_backend(self, settings, published_invitation):
+        """공유 캐시 버퍼 테스트"""
+        settings.VIEW_COUNT_BUFFER = {"BACKEND": "cache", "FLUSH_INTERVAL": 3600}
+
+        ViewCountService.record(published_invitation.id)
+        ViewCountService.record(published_invitation.id)
+
+        assert ViewCountService.pending() == {published_invitation.id: 2}
+        assert ViewCountService.flush() == 2
+        published_invitation.refresh_from_db()
+        assert published_invitation.view_count == 2
+        assert ViewCountService.pending() == {}
+
+    def test_public_view_buffers_view_count(self, buffered_view_counts, api_client, published_invitation):
+        """공개 조회 시 응답에는 증가된 조회수가 보이고 DB 반영은 flush 시점인지 테스트"""
+        response = api_client.get(f"/api/v1/invitations/slug/{published_invitation.url_slug}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["view_count"] == 1
+        published_invitation.refresh_from_db()
+        assert published_invitation.view_count == 0
+
+        call_command("flush_view_counts", stdout=StringIO())
+
+        published_invitation.refresh_from_db()
+        assert published_invitation.view_count == 1
+
+
 @pytest.mark.django_db
 class TestRSVPAPI:
     """RSVP API 테스트"""
@@ -431,6 +1119,493 @@ class TestRSVPAPI:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.django_db
+class TestRSVPStatistics:
+    """RSVP 통계 테스트"""
+
+    def test_statistics_follow_status_changes(self, published_invitation, django_assert_num_queries):
+        """응답 생성/변경 시 통계가 함께 갱신되는지 테스트"""
+        RSVPService.create_or_update_rsvp(
+            invitation=published_invitation,
+            guest_name="김철수",
+            phone="010-1111-2222",
+            attendance_status="ATTENDING",
+            guest_count=3,
+        )
+        RSVPService.create_or_update_rsvp(
+            invitation=published_invitation, guest_name="이영희", attendance_status="PENDING", guest_count=1
+        )
+        RSVPService.create_or_update_rsvp(
+            invitation=published_invitation,
+            guest_name="김철수",
+            phone="010-1111-2222",
+            attendance_status="NOT_ATTENDING",
+            guest_count=0,
+        )
+
+        with django_assert_num_queries(1):
+            statistics = RSVPService.get_rsvp_statistics(published_invitation)
+
+        assert statistics == {
+            "total_count": 2,
+            "attending_count": 0,
+            "not_attending_count": 1,
+            "pending_count": 1,
+            "total_guests": 0,
+        }
+        assert statistics == RSVPService.aggregate_rsvp_statistics(published_invitation)
+
+    def test_aggregate_is_single_query(self, published_invitation, django_assert_num_queries):
+        """통계 집계가 한 번의 쿼리로 수행되는지 테스트"""
+        for i in range(5):
+            RSVP.objects.create(
+                invitation=published_invitation, guest_name=f"하객{i}", attendance_status="ATTENDING", guest_count=2
+            )
+
+        with django_assert_num_queries(1):
+            statistics = RSVPService.aggregate_rsvp_statistics(published_invitation)
+
+        assert statistics["attending_count"] == 5
+        assert statistics["total_guests"] == 10
+
+    def test_model_writes_update_statistics(self, published_invitation):
+        """서비스를 거치지 않은 모델 저장/삭제도 통계에 반영되는지 테스트"""
+        RSVPService.get_rsvp_statistics(published_invitation)
+        rsvp = RSVP.objects.create(
+            invitation=published_invitation, guest_name="김철수", attendance_status="ATTENDING", guest_count=2
+        )
+        RSVP.objects.create(invitation=published_invitation, guest_name="이영희", attendance_status="PENDING")
+        rsvp.attendance_status = "NOT_ATTENDING"
+        rsvp.save()
+        assert RSVPService.get_rsvp_statistics(published_invitation) == RSVPService.aggregate_rsvp_statistics(
+            published_invitation
+        )
+
+        RSVP.objects.filter(guest_name="이영희").delete()
+        rsvp.delete()
+
+        statistics = RSVPService.get_rsvp_statistics(published_invitation)
+        assert statistics == RSVPService.aggregate_rsvp_statistics(published_invitation)
+        assert statistics["total_count"] == 0
+
+    def test_invitation_delete_with_statistics(self, published_invitation):
+        """청첩장 삭제 시 RSVP 삭제 시그널이 통계 행을 다시 만들지 않는지 테스트"""
+        RSVPService.upsert_rsvp(invitation=published_invitation, guest_name="김철수", attendance_status="ATTENDING")
+
+        published_invitation.delete()
+
+        assert not RSVPStatistics.objects.exists()
+
+    def test_rebuild_command(self, published_invitation):
+        """재계산 커맨드가 어긋난 통계를 바로잡는지 테스트"""
+        RSVPService.create_or_update_rsvp(
+            invitation=published_invitation, guest_name="김철수", attendance_status="ATTENDING"
+        )
+        # bulk_create는 시그널이 없어 통계에 반영되지 않음
+        RSVP.objects.bulk_create(
+            [RSVP(invitation=published_invitation, guest_name="이영희", attendance_status="ATTENDING", guest_count=2)]
+        )
+
+        with pytest.raises(CommandError):
+            call_command("rebuild_rsvp_statistics", "--verify", stdout=StringIO())
+
+        call_command("rebuild_rsvp_statistics", stdout=StringIO())
+        call_command("rebuild_rsvp_statistics", "--verify", stdout=StringIO())
+
+        statistics = RSVPService.get_rsvp_statistics(published_invitation)
+        assert statistics["attending_count"] == 2
+        assert statistics["total_guests"] == 3
+
+
+CASE_INSENSITIVE_COLLATIONS = {"sqlite": "NOCASE", "mysql": "utf8mb4_0900_ai_ci"}
+
+
+@pytest.fixture
+def case_insensitive_guest_name(transactional_db):
+    """RSVP.guest_name을 대소문자를 구분하지 않는 정렬 규칙으로 변경 (MySQL 기본 정렬 규칙과 같은 비교)"""
+    if connection.vendor not in CASE_INSENSITIVE_COLLATIONS:
+        pytest.skip(f"{connection.vendor}에서는 대소문자를 구분하지 않는 정렬 규칙을 지정하지 않습니다.")
+    old_field = RSVP._meta.get_field("guest_name")
+    new_field = copy.copy(old_field)
+    new_field.db_collation = CASE_INSENSITIVE_COLLATIONS[connection.vendor]
+    with connection.schema_editor() as editor:
+        editor.alter_field(RSVP, old_field, new_field)
+    yield
+    with connection.schema_editor() as editor:
+        editor.alter_field(RSVP, new_field, old_field)
+
+
+@pytest.mark.django_db
+class TestRSVPUpsert:
+    """RSVP upsert 테스트"""
+
+    def test_upsert_matches_rows_like_database(self, case_insensitive_guest_name, published_invitation):
+        """DB 정렬 규칙상 같은 이름(대소문자만 다름)은 기존 응답 갱신으로 처리하는지 테스트"""
+        rsvp, _ = RSVPService.upsert_rsvp(
+            invitation=published_invitation, guest_name="kim", attendance_status="PENDING"
+        )
+
+        updated, created = RSVPService.upsert_rsvp(
+            invitation=published_invitation, guest_name="Kim", attendance_status="ATTENDING", guest_count=2
+        )
+
+        assert created is False
+        assert updated.pk == rsvp.pk
+        assert updated.created_at == rsvp.created_at
+        assert RSVP.objects.filter(invitation=published_invitation).count() == 1
+        statistics = RSVPService.get_rsvp_statistics(published_invitation)
+        assert statistics == RSVPService.aggregate_rsvp_statistics(published_invitation)
+        assert statistics["total_count"] == 1
+        assert statistics["total_guests"] == 2
+
+    def test_upsert_creates_then_updates_same_row(self, published_invitation):
+        """같은 이름/연락처의 두 번째 응답이 기존 행을 갱신하는지 테스트"""
+        rsvp, created = RSVPService.upsert_rsvp(
+            invitation=published_invitation,
+            guest_name="김철수",
+            phone="010-1111-2222",
+            attendance_status="ATTENDING",
+            guest_count=2,
+            message="축하해요",
+        )
+        assert created is True
+        assert rsvp.pk is not None
+
+        updated, created = RSVPService.upsert_rsvp(
+            invitation=published_invitation,
+            guest_name="김철수",
+            phone="010-1111-2222",
+            attendance_status="NOT_ATTENDING",
+            guest_count=0,
+        )
+        assert created is False
+        assert updated.pk == rsvp.pk
+        assert updated.created_at == rsvp.created_at
+
+        stored = RSVP.objects.get(pk=rsvp.pk)
+        assert stored.attendance_status == "NOT_ATTENDING"
+        assert stored.guest_count == 0
+        assert stored.message == "축하해요"  # 전달하지 않은 필드는 유지
+        assert RSVP.objects.filter(invitation=published_invitation).count() == 1
+
+        statistics = RSVPService.get_rsvp_statistics(published_invitation)
+        assert statistics == RSVPService.aggregate_rsvp_statistics(published_invitation)
+        assert statistics["not_attending_count"] == 1
+        assert statistics["attending_count"] == 0
+
+    def test_upsert_distinguishes_phone(self, published_invitation):
+        """연락처가 다르면 별도 응답으로 생성되는지 테스트"""
+        RSVPService.upsert_rsvp(invitation=published_invitation, guest_name="김철수", phone="010-1111-2222")
+        _, created = RSVPService.upsert_rsvp(invitation=published_invitation, guest_name="김철수")
+
+        assert created is True
+        assert RSVP.objects.filter(invitation=published_invitation).count() == 2
+
+    def test_unique_constraint(self, published_invitation):
+        """DB 제약이 중복 응답을 막는지 테스트"""
+        RSVP.objects.create(invitation=published_invitation, guest_name="김철수", phone="010-1111-2222")
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            RSVP.objects.create(invitation=published_invitation, guest_name="김철수", phone="010-1111-2222")
+
+    def test_write_applies_delta_without_aggregate(self, published_invitation):
+        """생성/갱신 모두 upsert 한 번과 통계 변경분 UPDATE로 끝나는지 테스트 (전체 집계 없음)"""
+        RSVPService.refresh_statistics(published_invitation)
+
+        for attendance_status in ("ATTENDING", "NOT_ATTENDING"):
+            with CaptureQueriesContext(connection) as context:
+                RSVPService.upsert_rsvp(
+                    invitation=published_invitation, guest_name="김철수", attendance_status=attendance_status
+                )
+
+            statements = [query["sql"].lstrip().upper() for query in context.captured_queries]
+            assert sum(sql.startswith("INSERT") for sql in statements) == 1
+            assert sum(sql.startswith("UPDATE") for sql in statements) == 1
+            assert not any("COUNT(" in sql for sql in statements)
+
+        assert RSVPService.get_rsvp_statistics(published_invitation) == RSVPService.aggregate_rsvp_statistics(
+            published_invitation
+        )
+
+    def test_update_keeps_concurrent_changes(self, published_invitation):
+        """갱신이 통계를 집계 값으로 덮어쓰지 않고 변경분만 반영하는지 테스트"""
+        RSVPService.upsert_rsvp(invitation=published_invitation, guest_name="김철수", attendance_status="PENDING")
+        # 다른 트랜잭션이 이미 반영한 변경분 (집계로 덮어쓰면 사라짐)
+        RSVPStatistics.objects.filter(invitation=published_invitation).update(total_guests=F("total_guests") + 5)
+
+        RSVPService.upsert_rsvp(
+            invitation=published_invitation, guest_name="김철수", attendance_status="ATTENDING", guest_count=2
+        )
+
+        assert RSVPService.get_rsvp_statistics(published_invitation)["total_guests"] == 7
+
+    def test_api_status_codes(self, api_client, published_invitation):
+        """API가 생성 시 201, 갱신 시 200을 반환하는지 테스트"""
+        url = f"/api/v1/invitations/{published_invitation.id}/rsvps/"
+        data = {"guest_name": "김철수", "phone": "010-1111-2222", "attendance_status": "ATTENDING"}
+
+        assert api_client.post(url, data, format="json").status_code == status.HTTP_201_CREATED
+        data["attendance_status"] = "NOT_ATTENDING"
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["attendance_status"] == "NOT_ATTENDING"
+
+
+@pytest.fixture
+def intake_queue(settings):
+    """접수 대기열 활성화 fixture"""
+    settings.INTAKE_QUEUE = {**settings.INTAKE_QUEUE, "ENABLED": True, "MAX_PENDING": 100, "BATCH_SIZE": 10}
+    return settings.INTAKE_QUEUE
+
+
+@pytest.mark.django_db
+class TestIntakeQueue:
+    """RSVP/방명록 접수 대기열 테스트"""
+
+    def test_submissions_are_queued_then_drained(self, intake_queue, api_client, published_invitation):
+        """제출은 202로 접수되고 drain 후에 반영되는지 테스트"""
+        rsvp_url = f"/api/v1/invitations/{published_invitation.id}/rsvps/"
+        guestbook_url = f"/api/v1/invitations/{published_invitation.id}/guestbooks/"
+
+        response = api_client.post(rsvp_url, {"guest_name": "김철수", "attendance_status": "PENDING"}, format="json")
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        api_client.post(rsvp_url, {"guest_name": "김철수", "attendance_status": "ATTENDING"}, format="json")
+        api_client.post(rsvp_url, {"guest_name": "이영희", "attendance_status": "ATTENDING"}, format="json")
+        api_client.post(guestbook_url, {"author_name": "김철수", "message": "축하합니다!"}, format="json")
+
+        assert not RSVP.objects.exists()
+        assert IntakeService.get_metrics()["depth"] == 4
+
+        call_command("drain_intake_queue", stdout=StringIO())
+
+        assert RSVP.objects.get(guest_name="김철수").attendance_status == "ATTENDING"
+        assert Guestbook.objects.filter(invitation=published_invitation).count() == 1
+        assert RSVPService.get_rsvp_statistics(published_invitation)["attending_count"] == 2
+        assert IntakeService.get_metrics() == {"depth": 0, "failed": 0, "lag_seconds": 0.0}
+
+    def test_drain_updates_guestbook_statistics(self, intake_queue, api_client, published_invitation):
+        """drain으로 반영된 공개 방명록이 통계 행과 방명록 ETag에 반영되는지 테스트"""
+        Guestbook.objects.create(invitation=published_invitation, author_name="김철수", message="축하합니다!")
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/guestbooks/"
+        etag = api_client.get(url)["ETag"]
+        IntakeService.enqueue("GUESTBOOK", published_invitation, {"author_name": "이영희", "message": "축하해!"})
+        IntakeService.enqueue(
+            "GUESTBOOK", published_invitation, {"author_name": "박민수", "message": "비밀", "is_public": False}
+        )
+
+        IntakeService.drain()
+
+        assert GuestbookStatistics.objects.get(invitation=published_invitation).public_count == 2
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 2
+
+    def test_drain_applies_statistics_delta(self, intake_queue, published_invitation):
+        """drain이 통계를 집계 값으로 덮어쓰지 않고 변경분만 반영하는지 테스트"""
+        RSVPService.upsert_rsvp(invitation=published_invitation, guest_name="김철수", attendance_status="PENDING")
+        RSVPStatistics.objects.filter(invitation=published_invitation).update(total_guests=F("total_guests") + 5)
+        IntakeService.enqueue(
+            "RSVP", published_invitation, {"guest_name": "김철수", "attendance_status": "ATTENDING", "guest_count": 2}
+        )
+        IntakeService.enqueue("RSVP", published_invitation, {"guest_name": "이영희", "attendance_status": "ATTENDING"})
+
+        IntakeService.drain()
+
+        statistics = RSVPService.get_rsvp_statistics(published_invitation)
+        assert (statistics["total_count"], statistics["attending_count"], statistics["pending_count"]) == (2, 2, 0)
+        assert statistics["total_guests"] == 8
+
+    def test_drain_matches_rows_like_database(self, case_insensitive_guest_name, intake_queue, published_invitation):
+        """DB 정렬 규칙상 같은 이름(대소문자만 다름)은 배치 안팎에서 한 응답으로 세는지 테스트"""
+        RSVPService.upsert_rsvp(invitation=published_invitation, guest_name="kim", attendance_status="PENDING")
+        for guest_name, guest_count in (("Kim", 2), ("KIM", 3), ("lee", 1), ("Lee", 1)):
+            IntakeService.enqueue(
+                "RSVP",
+                published_invitation,
+                {"guest_name": guest_name, "attendance_status": "ATTENDING", "guest_count": guest_count},
+            )
+
+        IntakeService.drain()
+
+        assert RSVP.objects.filter(invitation=published_invitation).count() == 2
+        statistics = RSVPService.get_rsvp_statistics(published_invitation)
+        assert statistics == RSVPService.aggregate_rsvp_statistics(published_invitation)
+        assert statistics["total_count"] == 2
+        assert statistics["total_guests"] == 4
+
+    def test_idempotency_key(self, intake_queue, api_client, published_invitation):
+        """같은 멱등성 키는 한 번만, 키가 없는 같은 내용의 제출은 각각 반영되는지 테스트"""
+        url = f"/api/v1/invitations/{published_invitation.id}/guestbooks/"
+        data = {"author_name": "김철수", "message": "축하합니다!"}
+
+        first = api_client.post(url, data, format="json", HTTP_IDEMPOTENCY_KEY="abc")
+        second = api_client.post(url, {**data, "message": "수정"}, format="json", HTTP_IDEMPOTENCY_KEY="abc")
+        # 키가 없으면 이름/내용이 같아도 다른 하객의 제출일 수 있음
+        api_client.post(url, {**data, "author_name": "이영희"}, format="json")
+        api_client.post(url, {**data, "author_name": "이영희"}, format="json")
+
+        assert first.data["idempotency_key"] == second.data["idempotency_key"]
+        IntakeService.drain()
+        # 처리된 뒤 재전송해도 보관 기간 동안은 다시 반영되지 않음
+        api_client.post(url, data, format="json", HTTP_IDEMPOTENCY_KEY="abc")
+        IntakeService.drain()
+
+        assert sorted(Guestbook.objects.values_list("author_name", "message")) == [
+            ("김철수", "축하합니다!"),
+            ("이영희", "축하합니다!"),
+            ("이영희", "축하합니다!"),
+        ]
+
+    def test_back_pressure(self, intake_queue, settings, api_client, published_invitation):
+        """대기열이 가득 차면 503과 Retry-After를 반환하는지 테스트"""
+        settings.INTAKE_QUEUE = {**intake_queue, "MAX_PENDING": 1}
+        url = f"/api/v1/invitations/{published_invitation.id}/rsvps/"
+
+        assert api_client.post(url, {"guest_name": "김철수"}, format="json").status_code == status.HTTP_202_ACCEPTED
+        cache.clear()
+        response = api_client.post(url, {"guest_name": "이영희"}, format="json")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response["Retry-After"] == str(intake_queue["RETRY_AFTER"])
+
+    def test_rejected_when_feature_disabled_before_drain(self, intake_queue, published_invitation):
+        """적재 후 기능이 꺼진 제출은 실패로 남고 나머지는 반영되는지 테스트"""
+        IntakeService.enqueue("GUESTBOOK", published_invitation, {"author_name": "김철수", "message": "축하"})
+        IntakeService.enqueue("RSVP", published_invitation, {"guest_name": "김철수"})
+        published_invitation.enable_guestbook = False
+        published_invitation.save()
+
+        IntakeService.drain()
+
+        metrics = IntakeService.get_metrics()
+        assert (metrics["depth"], metrics["failed"]) == (0, 1)
+        assert RSVP.objects.count() == 1
+        assert not Guestbook.objects.exists()
+
+    def test_purge_processed(self, intake_queue, published_invitation):
+        """보관 기간이 지난 처리 완료 행이 삭제되는지 테스트"""
+        IntakeService.enqueue("RSVP", published_invitation, {"guest_name": "김철수"})
+        IntakeService.drain()
+
+        assert IntakeService.purge(retention=3600) == 0
+        assert IntakeService.purge(retention=0) == 1
+
+
+@pytest.mark.django_db
+class TestInvitationExport:
+    """RSVP/방명록 내보내기 테스트"""
+
+    @pytest.fixture
+    def rsvps(self, published_invitation):
+        RSVPService.upsert_rsvp(
+            invitation=published_invitation, guest_name="김철수", attendance_status="ATTENDING", guest_count=2
+        )
+        RSVPService.upsert_rsvp(invitation=published_invitation, guest_name="이영희", attendance_status="NOT_ATTENDING")
+        old = RSVP.objects.create(invitation=published_invitation, guest_name="박민수", attendance_status="ATTENDING")
+        RSVP.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=10))
+
+    def read_csv(self, response):
+        content = b"".join(response.streaming_content).decode("utf-8-sig")
+        return list(csv.reader(StringIO(content)))
+
+    def test_export_rsvps_csv(self, authenticated_client, published_invitation, rsvps):
+        """RSVP 전체가 CSV로 스트리밍되는지 테스트"""
+        response = authenticated_client.get(f"/api/v1/invitations/{published_invitation.id}/export/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"].startswith("text/csv")
+        assert "attachment;" in response["Content-Disposition"]
+
+        rows = self.read_csv(response)
+        assert rows[0][:3] == ["이름", "연락처", "참석 여부"]
+        assert [row[0] for row in rows[1:]] == ["박민수", "김철수", "이영희"]
+        assert rows[2][2] == "참석"
+        assert rows[2][3] == "2"
+
+    def test_export_filters(self, authenticated_client, published_invitation, rsvps):
+        """참석 여부/날짜 범위 필터 테스트"""
+        url = f"/api/v1/invitations/{published_invitation.id}/export/"
+        today = timezone.localdate().isoformat()
+
+        response = authenticated_client.get(url, {"attendance_status": "ATTENDING", "start_date": today})
+        assert [row[0] for row in self.read_csv(response)[1:]] == ["김철수"]
+
+        response = authenticated_client.get(url, {"end_date": today})
+        assert len(self.read_csv(response)) == 4
+
+        response = authenticated_client.get(url, {"start_date": "not-a-date"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_guestbooks_includes_private(self, authenticated_client, published_invitation):
+        """소유자 내보내기에는 비공개 방명록도 포함되는지 테스트"""
+        Guestbook.objects.create(invitation=published_invitation, author_name="김철수", message="공개", is_public=True)
+        Guestbook.objects.create(
+            invitation=published_invitation, author_name="이영희", message="비공개", is_public=False
+        )
+
+        response = authenticated_client.get(
+            f"/api/v1/invitations/{published_invitation.id}/export/", {"target": "guestbooks"}
+        )
+
+        rows = self.read_csv(response)
+        assert [(row[0], row[3]) for row in rows[1:]] == [("김철수", "Y"), ("이영희", "N")]
+
+    def test_export_escapes_formulas(self, authenticated_client, published_invitation):
+        """하객이 입력한 수식이 그대로 내보내지지 않는지 테스트 (CSV/XLSX)"""
+        formula = '=HYPERLINK("https://example.com","축하")'
+        Guestbook.objects.create(invitation=published_invitation, author_name="@김철수", message=formula)
+        url = f"/api/v1/invitations/{published_invitation.id}/export/"
+
+        rows = self.read_csv(authenticated_client.get(url, {"target": "guestbooks"}))
+        assert (rows[1][0], rows[1][2]) == ("'@김철수", f"'{formula}")
+
+        openpyxl = pytest.importorskip("openpyxl")
+        response = authenticated_client.get(url, {"target": "guestbooks", "file_format": "xlsx"})
+        sheet = openpyxl.load_workbook(BytesIO(b"".join(response.streaming_content))).active
+        assert sheet.cell(row=2, column=3).value == f"'{formula}"
+        assert sheet.cell(row=2, column=3).data_type == "s"
+
+    def test_export_streams_with_chunked_iterator(self, authenticated_client, published_invitation, rsvps):
+        """행을 투영된 컬럼만 조회하는지 테스트"""
+        url = f"/api/v1/invitations/{published_invitation.id}/export/"
+        response = authenticated_client.get(url)
+
+        with CaptureQueriesContext(connection) as context:
+            self.read_csv(response)
+
+        assert len(context.captured_queries) == 1
+        assert '"invitations_rsvp"."id"' not in context.captured_queries[0]["sql"].split("FROM")[0]
+
+    def test_export_invalid_params(self, authenticated_client, published_invitation):
+        """지원하지 않는 대상/형식은 400을 반환하는지 테스트"""
+        url = f"/api/v1/invitations/{published_invitation.id}/export/"
+
+        assert authenticated_client.get(url, {"target": "users"}).status_code == status.HTTP_400_BAD_REQUEST
+        assert authenticated_client.get(url, {"file_format": "pdf"}).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_xlsx(self, authenticated_client, published_invitation, rsvps):
+        """XLSX 내보내기 테스트 (openpyxl 설치 시)"""
+        openpyxl = pytest.importorskip("openpyxl")
+
+        response = authenticated_client.get(
+            f"/api/v1/invitations/{published_invitation.id}/export/", {"file_format": "xlsx"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        workbook = openpyxl.load_workbook(BytesIO(b"".join(response.streaming_content)))
+        assert workbook.active.max_row == 4
+
+    def test_export_other_user_invitation(self, api_client, other_user, published_invitation):
+        """다른 사용자는 내보낼 수 없는지 테스트"""
+        api_client.force_authenticate(user=other_user)
+
+        response = api_client.get(f"/api/v1/invitations/{published_invitation.id}/export/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.django_db
 class TestGuestbookAPI:
     """방명록 API 테스트"""
@@ -524,3 +1699,400 @@ class TestGuestbookAPI:
         response = api_client.post(f"/api/v1/invitations/{invitation.id}/guestbooks/", data, format="json")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestSerializerProjection:
+    """목록용 고속 직렬화가 기존 시리얼라이저와 같은 출력을 내는지 테스트"""
+
+    def render(self, data):
+        return JSONRenderer().render(data)
+
+    def assert_identical(self, serializer_class, queryset):
+        projection = compile_projection(serializer_class)
+        expected = self.render(serializer_class(queryset, many=True).data)
+        assert self.render(projection.many(queryset.values(*projection.fields))) == expected
+
+    def test_rsvp_and_guestbook(self, published_invitation):
+        RSVP.objects.create(invitation=published_invitation, guest_name="김철수", attendance_status="ATTENDING")
+        RSVP.objects.create(invitation=published_invitation, guest_name="이영희", phone="010", message='축하 "해요"')
+        Guestbook.objects.create(
+            invitation=published_invitation, author_name="김철수", message="축하!", is_public=False
+        )
+        RSVP.objects.update(created_at=datetime(2026, 5, 1, 3, 0, tzinfo=dt_timezone.utc))
+
+        self.assert_identical(RSVPSerializer, RSVP.objects.order_by("id"))
+        self.assert_identical(GuestbookSerializer, Guestbook.objects.order_by("id"))
+
+    def test_invitation_with_decimal_and_nested_template(self, published_invitation, invitation):
+        """위도/경도 Decimal, 중첩 템플릿, FK PK, UTC 시간대 출력이 같은지 테스트"""
+        Invitation.objects.filter(pk=published_invitation.pk).update(
+            wedding_location_lat=Decimal("37.5665"), wedding_location_lng=Decimal("126.978")
+        )
+        queryset = Invitation.objects.select_related("template").order_by("id")
+
+        self.assert_identical(InvitationSerializer, queryset)
+        self.assert_identical(PublicInvitationSerializer, queryset)
+        with timezone.override(dt_timezone.utc):
+            self.assert_identical(InvitationSerializer, queryset)
+
+    def test_unsupported_field(self):
+        """모델 필드가 아닌 필드가 있으면 컴파일하지 않는지 테스트"""
+
+        class CustomSerializer(RSVPSerializer):
+            label = serializers.SerializerMethodField()
+
+            class Meta(RSVPSerializer.Meta):
+                fields = ["id", "label"]
+
+            def get_label(self, obj):
+                return obj.guest_name
+
+        with pytest.raises(ImproperlyConfigured):
+            compile_projection(CustomSerializer)
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """방명록/RSVP 키셋 페이지네이션 테스트"""
+
+    @pytest.fixture
+    def guestbooks(self, published_invitation):
+        """created_at이 같은 항목을 포함한 방명록 5개"""
+        created_at = timezone.now()
+        entries = Guestbook.objects.bulk_create(
+            [
+                Guestbook(invitation=published_invitation, author_name=f"하객{i}", message="축하합니다!")
+                for i in range(5)
+            ]
+        )
+        Guestbook.objects.filter(pk__in=[entry.pk for entry in entries[:3]]).update(created_at=created_at)
+        return entries
+
+    def walk(self, api_client, url):
+        names, pages = [], 0
+        while url:
+            response = api_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            names.extend(item["author_name"] for item in response.data["results"])
+            url, pages = response.data["next"], pages + 1
+        return names, pages
+
+    def test_walks_all_pages_in_order(self, api_client, published_invitation, guestbooks):
+        """동일 created_at이 있어도 누락/중복 없이 (created_at, id) 내림차순으로 조회되는지 테스트"""
+        names, pages = self.walk(api_client, f"/api/v1/invitations/{published_invitation.id}/guestbooks/?page_size=2")
+
+        expected = list(
+            Guestbook.objects.filter(invitation=published_invitation)
+            .order_by("-created_at", "-id")
+            .values_list("author_name", flat=True)
+        )
+        assert names == expected
+        assert pages == 3
+
+    def test_stable_under_concurrent_inserts(self, api_client, published_invitation, guestbooks):
+        """조회 도중 새 항목이 추가되어도 다음 페이지가 밀리지 않는지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/guestbooks/?page_size=2"
+        first = api_client.get(url)
+        Guestbook.objects.create(invitation=published_invitation, author_name="새하객", message="늦었어요!")
+
+        names, _ = self.walk(api_client, first.data["next"])
+        seen = [item["author_name"] for item in first.data["results"]] + names
+
+        assert "새하객" not in seen
+        assert sorted(seen) == sorted(entry.author_name for entry in guestbooks)
+
+    def test_previous_link(self, api_client, published_invitation, guestbooks):
+        """이전 페이지 링크가 직전 페이지를 반환하는지 테스트"""
+        first = api_client.get(f"/api/v1/invitations/{published_invitation.id}/guestbooks/?page_size=2")
+        second = api_client.get(first.data["next"])
+        previous = api_client.get(second.data["previous"])
+
+        assert first.data["previous"] is None
+        assert previous.data["results"] == first.data["results"]
+        assert previous.data["previous"] is None
+
+    def test_count_is_optional_and_capped(self, api_client, published_invitation, guestbooks, monkeypatch):
+        """전체 개수는 요청 시에만, 상한까지만 세는지 테스트"""
+        url = f"/api/v1/invitations/{published_invitation.id}/guestbooks/"
+        assert "count" not in api_client.get(url).data
+
+        monkeypatch.setattr(KeysetPagination, "max_count", 3)
+        response = api_client.get(f"{url}?include_count=true")
+
+        assert response.data["count"] == 3
+        assert response.data["count_capped"] is True
+
+    def test_no_count_or_offset_query(self, authenticated_client, published_invitation):
+        """페이지 조회에 COUNT/OFFSET이 없는지 테스트"""
+        for i in range(3):
+            RSVPService.upsert_rsvp(invitation=published_invitation, guest_name=f"하객{i}")
+        first = authenticated_client.get(f"/api/v1/invitations/{published_invitation.id}/rsvps/?page_size=2")
+
+        with CaptureQueriesContext(connection) as context:
+            response = authenticated_client.get(first.data["next"])
+
+        assert [item["guest_name"] for item in response.data["results"]] == ["하객0"]
+        assert not any("COUNT(" in query["sql"].upper() for query in context.captured_queries)
+        assert not any("OFFSET" in query["sql"].upper() for query in context.captured_queries)
+
+    def test_invalid_cursor(self, api_client, published_invitation):
+        """잘못된 커서는 404를 반환하는지 테스트"""
+        response = api_client.get(f"/api/v1/invitations/{published_invitation.id}/guestbooks/?cursor=invalid")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestSyntheticData:
+    """합성 데이터 생성 커맨드 테스트"""
+
+    @staticmethod
+    def generate(prefix, *extra):
+        args = ["--users", "20", "--invitations", "60", "--rsvps", "900", "--guestbooks", "300", "--seed", "3"]
+        call_command("generate_synthetic_data", *args, "--prefix", prefix, *extra, stdout=StringIO())
+
+    @staticmethod
+    def rows(prefix):
+        return sorted(
+            (slug.split("-", 1)[1], *values)
+            for slug, *values in RSVP.objects.filter(invitation__url_slug__startswith=f"{prefix}-").values_list(
+                "invitation__url_slug", "guest_name", "phone", "attendance_status", "guest_count", "created_at"
+            )
+        )
+
+    def test_generates_rows_with_consistent_statistics(self):
+        self.generate("syn", "--batch-size", "100", "--chunk-size", "25")
+
+        invitations = Invitation.objects.filter(url_slug__startswith="syn-")
+        assert invitations.count() == 60
+        assert RSVP.objects.filter(invitation__in=invitations).count() == 900
+        assert Guestbook.objects.filter(invitation__in=invitations).count() == 300
+        assert not RSVP.objects.filter(invitation__status="DRAFT").exists()
+        assert RSVPService.rebuild_statistics(verify_only=True) == []
+        # 인기도가 치우쳐 있음 (가장 많은 청첩장이 평균보다 훨씬 많음)
+        counts = sorted(invitations.annotate(n=Count("rsvps")).values_list("n", flat=True), reverse=True)
+        assert counts[0] > 3 * 900 / 60
+        rsvp = RSVP.objects.filter(invitation__in=invitations).select_related("invitation").first()
+        assert rsvp.phone.startswith("010-")
+        assert rsvp.invitation.published_at <= rsvp.created_at
+
+    def test_same_seed_same_data_regardless_of_chunking(self):
+        self.generate("a", "--chunk-size", "7")
+        self.generate("b", "--chunk-size", "60")
+
+        assert self.rows("a") == self.rows("b")
+
+    def test_existing_prefix_rejected(self):
+        self.generate("syn")
+
+        with pytest.raises(CommandError):
+            self.generate("syn")
+
+
+@pytest.mark.django_db
+class TestQueryPlans:
+    """주요 조회 경로가 인덱스를 타는지 실행 계획으로 확인 (전체 스캔/추가 정렬이면 실패)"""
+
+    @pytest.mark.parametrize(
+        "build_queryset",
+        [
+            pytest.param(
+                lambda: Invitation.objects.filter(url_slug="slug", is_public=True, status="PUBLISHED"),
+                id="public-invitation",
+            ),
+            pytest.param(
+                lambda: RSVP.objects.filter(invitation_id=1, guest_name="김철수", phone="010-1234-5678"),
+                id="rsvp-dedupe",
+            ),
+            pytest.param(
+                lambda: RSVP.objects.filter(invitation_id=1).order_by("-created_at", "-id")[:21],
+                id="rsvp-list",
+            ),
+            pytest.param(
+                lambda: Guestbook.objects.filter(invitation_id=1, is_public=True).order_by("-created_at", "-id")[:21],
+                id="public-guestbook-list",
+            ),
+            pytest.param(
+                lambda: Guestbook.objects.filter(invitation_id=1).order_by("-created_at", "-id")[:21],
+                id="owner-guestbook-list",
+            ),
+            pytest.param(lambda: Invitation.objects.filter(user_id=1).order_by("-created_at"), id="owner-list"),
+            pytest.param(lambda: InvitationService.get_dashboard_queryset(User(pk=1)), id="owner-dashboard"),
+            pytest.param(
+                lambda: IntakeSubmission.objects.filter(PENDING).order_by("id")[:500], id="intake-pending-batch"
+            ),
+            pytest.param(
+                # purge()의 DELETE (정렬 없음)
+                lambda: IntakeSubmission.objects.filter(processed_at__lt=timezone.now()).order_by(),
+                id="intake-purge",
+            ),
+        ],
+    )
+    def test_access_path_uses_index(self, build_queryset):
+        assert explain_problems(build_queryset()) == []
+
+    def test_detects_full_scan_and_sort(self):
+        """검사 자체가 동작하는지 확인 (인덱스 없는 컬럼으로 필터/정렬)"""
+        assert explain_problems(Guestbook.objects.filter(author_name="김철수").order_by("message"))
+
+
+@pytest.mark.django_db
+class TestQueryBudgets:
+    """주요 엔드포인트의 쿼리 예산 (행 수와 관계없이 일정해야 함, 반복 SQL이 있으면 N+1로 실패)"""
+
+    @pytest.fixture
+    def invitations(self, user, other_user, template):
+        invitations = []
+        for i, owner in enumerate([user, other_user] * 3):
+            invitation = Invitation.objects.create(
+                user=owner,
+                template=template,
+                title=f"청첩장{i}",
+                url_slug=f"budget-{i}",
+                groom_name="홍길동",
+                bride_name="김영희",
+                wedding_date=timezone.now() + timedelta(days=30),
+                status="PUBLISHED",
+                is_public=True,
+            )
+            for j in range(3):
+                RSVPService.create_or_update_rsvp(
+                    invitation=invitation, guest_name=f"참석자{j}", attendance_status="ATTENDING"
+                )
+                Guestbook.objects.create(invitation=invitation, author_name=f"작성자{j}", message="축하합니다!")
+            invitations.append(invitation)
+        return invitations
+
+    @pytest.mark.parametrize(
+        "path, budget",
+        [
+            ("/api/v1/invitations/", 2),
+            ("/api/v1/invitations/dashboard/", 2),
+            ("/api/v1/invitations/{id}/", 1),
+            ("/api/v1/invitations/{id}/rsvps/", 2),
+            ("/api/v1/invitations/{id}/guestbooks/", 2),
+        ],
+    )
+    def test_owner_endpoints(self, authenticated_client, invitations, path, budget):
+        url = path.format(id=invitations[0].id)
+        with query_budget(budget):
+            response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.parametrize(
+        "path, budget",
+        [
+            ("/api/v1/invitations/slug/{slug}/", 3),
+            ("/api/v1/invitations/slug/{slug}/rsvps/", 2),
+            ("/api/v1/invitations/slug/{slug}/guestbooks/", 2),
+            ("/api/v1/invitations/slug/{slug}/page/", 5),
+        ],
+    )
+    def test_public_endpoints(self, api_client, invitations, path, budget):
+        url = path.format(slug=invitations[0].url_slug)
+        with query_budget(budget):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_admin_changelist(self, client, invitations):
+        """관리자 목록의 __str__/FK 표시가 행마다 쿼리하지 않는지 테스트"""
+        admin = User.objects.create_superuser(username="admin@example.com", email="admin@example.com", password="pw")
+        client.force_login(admin)
+
+        with query_budget(8):
+            response = client.get("/admin/invitations/invitation/")
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_budget_detects_n_plus_one(self, invitations):
+        """__str__이 소유자를 행마다 조회하는 경우를 잡아내는지 테스트"""
+        with pytest.raises(AssertionError, match="N\\+1"):
+            with query_budget(20):
+                [str(invitation) for invitation in Invitation.objects.all()]
+
+
+@pytest.fixture
+def async_public_views(settings):
+    """ASYNC_PUBLIC_VIEWS=True로 URL 설정을 다시 불러옴 (테스트가 끝나면 원래 뷰로 되돌림)"""
+    original = settings.ASYNC_PUBLIC_VIEWS
+
+    def reload_urls():
+        for module in ("apps.invitations.urls", "apps.templates.urls", "config.urls"):
+            importlib.reload(sys.modules[module])
+        clear_url_caches()
+
+    settings.ASYNC_PUBLIC_VIEWS = True
+    reload_urls()
+    yield
+    settings.ASYNC_PUBLIC_VIEWS = original
+    reload_urls()
+
+
+@pytest.mark.django_db
+class TestAsyncPublicViews:
+    """비동기 공개 조회 뷰 (ASGI) 테스트"""
+
+    def test_responses_match_sync_views(self, request, api_client, async_client, published_invitation, template):
+        """동기 뷰와 같은 상태 코드/본문을 반환하는지 테스트 (오류 응답 포함)"""
+        for index in range(5):
+            Guestbook.objects.create(invitation=published_invitation, author_name=f"하객{index}", message="축하해요")
+        RSVP.objects.create(invitation=published_invitation, guest_name="김철수", attendance_status="ATTENDING")
+
+        slug = published_invitation.url_slug
+        urls = [
+            f"/api/v1/invitations/slug/{slug}/?fields=title,groom_name,view_count",
+            f"/api/v1/invitations/slug/{slug}/rsvps/",
+            f"/api/v1/invitations/slug/{slug}/guestbooks/?page_size=2&include_count=true",
+            f"/api/v1/invitations/slug/{slug}/guestbooks/?cursor=invalid",
+            "/api/v1/invitations/slug/nonexistent-slug/",
+            "/api/v1/templates/?category=MODERN&ordering=created_at",
+            "/api/v1/templates/?page=9",
+            f"/api/v1/templates/{template.id}/",
+            "/api/v1/templates/abc/",
+        ]
+        expected = [api_client.get(url) for url in urls]
+
+        request.getfixturevalue("async_public_views")
+        assert resolve(f"/api/v1/invitations/slug/{slug}/").func.view_class is AsyncPublicInvitationView
+
+        for url, sync_response in zip(urls, expected):
+            response = async_to_sync(async_client.get)(url)
+            assert response.status_code == sync_response.status_code, url
+            assert response["Content-Type"] == "application/json", url
+            data = response.json()
+            if "view_count" in data:
+                # 조회할 때마다 증가
+                assert data.pop("view_count") == sync_response.json().pop("view_count") + 1
+                assert data == {key: value for key, value in sync_response.json().items() if key != "view_count"}
+            else:
+                assert data == sync_response.json(), url
+
+    def test_conditional_get_and_view_count(self, async_client, published_invitation, async_public_views):
+        """ETag 재검증(304)과 조회수 반영 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+
+        response = async_to_sync(async_client.get)(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"]
+
+        response = async_to_sync(async_client.get)(url, headers={"if-none-match": response["ETag"]})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        published_invitation.refresh_from_db()
+        assert published_invitation.view_count == 2
+
+    def test_cache_hit_skips_invitation_queries(
+        self, async_client, published_invitation, async_public_views, django_assert_num_queries
+    ):
+        """캐시 적중 시 조회수 반영 쿼리 외에는 DB를 조회하지 않는지 테스트"""
+        url = f"/api/v1/invitations/slug/{published_invitation.url_slug}/"
+        async_to_sync(async_client.get)(url)
+
+        with django_assert_num_queries(1):
+            response = async_to_sync(async_client.get)(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["view_count"] == 2
@@ -2,12 +2,17 @@
 Invitations 앱 URL 설정
 """
 
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from apps.invitations.views import (
+    AsyncPublicGuestbookView,
+    AsyncPublicInvitationView,
+    AsyncPublicRSVPView,
     InvitationViewSet,
     PublicGuestbookView,
+    PublicInvitationPageView,
     PublicInvitationView,
     PublicRSVPView,
 )
@@ -15,8 +20,19 @@ from apps.invitations.views import (
 router = DefaultRouter()
 router.register(r"", InvitationViewSet, basename="invitation")
 
+# ASGI 배포에서는 공개 조회를 비동기 뷰로 제공
+if settings.ASYNC_PUBLIC_VIEWS:
+    invitation_view, rsvp_view, guestbook_view = (
+        AsyncPublicInvitationView,
+        AsyncPublicRSVPView,
+        AsyncPublicGuestbookView,
+    )
+else:
+    invitation_view, rsvp_view, guestbook_view = PublicInvitationView, PublicRSVPView, PublicGuestbookView
+
 urlpatterns = [
-    path("slug/<str:slug>/", PublicInvitationView.as_view(), name="public-invitation"),
-    path("slug/<str:slug>/rsvps/", PublicRSVPView.as_view(), name="public-rsvp-statistics"),
-    path("slug/<str:slug>/guestbooks/", PublicGuestbookView.as_view(), name="public-guestbooks"),
+    path("slug/<str:slug>/", invitation_view.as_view(), name="public-invitation"),
+    path("slug/<str:slug>/rsvps/", rsvp_view.as_view(), name="public-rsvp-statistics"),
+    path("slug/<str:slug>/guestbooks/", guestbook_view.as_view(), name="public-guestbooks"),
+    path("slug/<str:slug>/page/", PublicInvitationPageView.as_view(), name="public-invitation-page"),
 ] + router.urls
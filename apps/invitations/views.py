@@ -2,28 +2,46 @@
 Invitations 앱 뷰
 """
 
+from django.http import FileResponse, Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.invitations.filters import EXPORT_FILTERS
 from apps.invitations.models import RSVP, Guestbook, Invitation
 from apps.invitations.serializers import (
     GuestbookSerializer,
     InvitationCreateSerializer,
+    InvitationDashboardSerializer,
     InvitationSerializer,
     InvitationUpdateSerializer,
     PublicInvitationSerializer,
     RSVPSerializer,
     RSVPStatisticsSerializer,
 )
+from apps.invitations.services.export_service import (
+    EXPORT_FORMATS,
+    EXPORT_TARGETS,
+    ExportService,
+)
 from apps.invitations.services.guestbook_service import GuestbookService
+from apps.invitations.services.intake_service import IntakeQueueFull, IntakeService
 from apps.invitations.services.invitation_service import InvitationService
+from apps.invitations.services.public_invitation_service import PublicInvitationService
 from apps.invitations.services.rsvp_service import RSVPService
+from apps.shared.serializers import compile_projection
+from common.mixins import ConditionalGetMixin
+from common.pagination import KeysetPagination
 from common.permissions import IsInvitationOwner, IsPublicOrOwner
+from common.views import AsyncAPIView
+
+# 목록 응답용 고속 직렬화 (기존 시리얼라이저와 같은 출력)
+RSVP_PROJECTION = compile_projection(RSVPSerializer)
+GUESTBOOK_PROJECTION = compile_projection(GuestbookSerializer)
 
 
 class InvitationViewSet(viewsets.ModelViewSet):
@@ -36,21 +54,45 @@ class InvitationViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """현재 사용자의 청첩장만 조회"""
-        return Invitation.objects.filter(user=self.request.user)
+        if self.action == "dashboard":
+            queryset = InvitationService.get_dashboard_queryset(self.request.user)
+        else:
+            queryset = Invitation.objects.filter(user=self.request.user).select_related("template")
+
+        if self.action in ["list", "retrieve", "dashboard"]:
+            # ?fields= / ?omit= 으로 고른 필드만 DB에서 읽음 (user는 소유자 권한 확인용)
+            only = self.get_serializer_class().get_only_fields(self.request, required=["user"])
+            if only is not None:
+                if "template" not in only:
+                    queryset = queryset.select_related(None)
+                queryset = queryset.only(*only)
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "create":
             return InvitationCreateSerializer
         elif self.action in ["update", "partial_update"]:
             return InvitationUpdateSerializer
+        elif self.action == "dashboard":
+            return InvitationDashboardSerializer
         return InvitationSerializer
 
     def get_permissions(self):
         """retrieve, update, destroy는 소유자만"""
-        if self.action in ["retrieve", "update", "partial_update", "destroy", "publish"]:
+        if self.action in ["retrieve", "update", "partial_update", "destroy", "publish", "export"]:
             return [IsAuthenticated(), IsInvitationOwner()]
         return super().get_permissions()
 
+    @action(detail=False, methods=["get"])
+    def dashboard(self, request):
+        """
+        소유자 대시보드 목록
+
+        GET /invitations/dashboard/
+        청첩장별 참석 응답 수, 총 참석 인원, 방명록 수를 함께 반환 (목록 길이와 관계없이 쿼리 수 일정)
+        """
+        return self.list(request)
+
     @action(detail=True, methods=["patch"])
     def publish(self, request, pk=None):
         """
@@ -82,28 +124,24 @@ class InvitationViewSet(viewsets.ModelViewSet):
 
             serializer = RSVPSerializer(data=request.data)
             if serializer.is_valid():
+                data = {
+                    "guest_name": serializer.validated_data["guest_name"],
+                    "guest_count": serializer.validated_data.get("guest_count", 1),
+                    "attendance_status": serializer.validated_data.get("attendance_status", "PENDING"),
+                    "phone": serializer.validated_data.get("phone", ""),
+                    "message": serializer.validated_data.get("message", ""),
+                    "dietary_restrictions": serializer.validated_data.get("dietary_restrictions", ""),
+                }
+                if IntakeService.is_enabled():
+                    return self._enqueue_submission(request, "RSVP", invitation, data)
                 try:
-                    # 기존 RSVP가 있는지 확인
-                    guest_name = serializer.validated_data["guest_name"]
-                    phone = serializer.validated_data.get("phone", "")
-                    existing_rsvp = RSVP.objects.filter(
-                        invitation=invitation, guest_name=guest_name, phone=phone
-                    ).first()
-
-                    rsvp = RSVPService.create_or_update_rsvp(
-                        invitation=invitation,
-                        guest_name=guest_name,
-                        guest_count=serializer.validated_data.get("guest_count", 1),
-                        attendance_status=serializer.validated_data.get("attendance_status", "PENDING"),
-                        phone=phone,
-                        message=serializer.validated_data.get("message", ""),
-                        dietary_restrictions=serializer.validated_data.get("dietary_restrictions", ""),
-                    )
+                    # 단일 upsert로 생성/업데이트 (통계에는 변경분만 반영)
+                    rsvp, created = RSVPService.upsert_rsvp(invitation=invitation, **data)
                     response_serializer = RSVPSerializer(rsvp)
                     # 기존 RSVP가 있었으면 200, 없었으면 201
                     return Response(
                         response_serializer.data,
-                        status=status.HTTP_200_OK if existing_rsvp else status.HTTP_201_CREATED,
+                        status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
                     )
                 except ValueError as e:
                     return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -111,20 +149,13 @@ class InvitationViewSet(viewsets.ModelViewSet):
 
         else:  # GET
             # RSVP 목록 조회 (소유자만)
-            if not request.user.is_authenticated or invitation.user != request.user:
+            if not request.user.is_authenticated or invitation.user_id != request.user.pk:
                 return Response({"error": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
             rsvps = RSVP.objects.filter(invitation=invitation)
-            paginator = PageNumberPagination()
-            paginator.page_size = 20
-            page = paginator.paginate_queryset(rsvps, request)
-
-            if page is not None:
-                serializer = RSVPSerializer(page, many=True)
-                return paginator.get_paginated_response(serializer.data)
-
-            serializer = RSVPSerializer(rsvps, many=True)
-            return Response(serializer.data)
+            paginator = KeysetPagination()
+            page = paginator.paginate_queryset(rsvps.values(*RSVP_PROJECTION.fields), request)
+            return paginator.get_paginated_response(RSVP_PROJECTION.many(page))
 
     @action(detail=True, methods=["post", "get"], url_path="guestbooks", permission_classes=[AllowAny])
     def guestbooks(self, request, pk=None):
@@ -145,14 +176,16 @@ class InvitationViewSet(viewsets.ModelViewSet):
 
             serializer = GuestbookSerializer(data=request.data)
             if serializer.is_valid():
+                data = {
+                    "author_name": serializer.validated_data["author_name"],
+                    "message": serializer.validated_data["message"],
+                    "phone": serializer.validated_data.get("phone", ""),
+                    "is_public": serializer.validated_data.get("is_public", True),
+                }
+                if IntakeService.is_enabled():
+                    return self._enqueue_submission(request, "GUESTBOOK", invitation, data)
                 try:
-                    guestbook = GuestbookService.create_guestbook(
-                        invitation=invitation,
-                        author_name=serializer.validated_data["author_name"],
-                        message=serializer.validated_data["message"],
-                        phone=serializer.validated_data.get("phone", ""),
-                        is_public=serializer.validated_data.get("is_public", True),
-                    )
+                    guestbook = GuestbookService.create_guestbook(invitation=invitation, **data)
                     response_serializer = GuestbookSerializer(guestbook)
                     return Response(response_serializer.data, status=status.HTTP_201_CREATED)
                 except ValueError as e:
@@ -162,16 +195,26 @@ class InvitationViewSet(viewsets.ModelViewSet):
         else:  # GET
             # 방명록 목록 조회 (공개만)
             guestbooks = Guestbook.objects.filter(invitation=invitation, is_public=True)
-            paginator = PageNumberPagination()
-            paginator.page_size = 20
-            page = paginator.paginate_queryset(guestbooks, request)
+            paginator = KeysetPagination()
+            page = paginator.paginate_queryset(guestbooks.values(*GUESTBOOK_PROJECTION.fields), request)
+            return paginator.get_paginated_response(GUESTBOOK_PROJECTION.many(page))
 
-            if page is not None:
-                serializer = GuestbookSerializer(page, many=True)
-                return paginator.get_paginated_response(serializer.data)
+    def _enqueue_submission(self, request, kind, invitation, data):
+        """
+        제출을 접수 대기열에 적재하고 202로 응답 (INTAKE_QUEUE 활성화 시)
 
-            serializer = GuestbookSerializer(guestbooks, many=True)
-            return Response(serializer.data)
+        Idempotency-Key 헤더로 같은 제출의 재전송을 구분합니다.
+        대기열이 가득 차면 503과 Retry-After를 반환합니다.
+        """
+        try:
+            key = IntakeService.enqueue(kind, invitation, data, client_key=request.headers.get("Idempotency-Key"))
+        except IntakeQueueFull as e:
+            response = Response({"error": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            response["Retry-After"] = str(e.retry_after)
+            return response
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"status": "queued", "idempotency_key": key}, status=status.HTTP_202_ACCEPTED)
 
     @action(detail=True, methods=["delete"], url_path="guestbooks/(?P<guestbook_id>[^/.]+)")
     def delete_guestbook(self, request, pk=None, guestbook_id=None):
@@ -186,66 +229,240 @@ class InvitationViewSet(viewsets.ModelViewSet):
         guestbook.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(detail=True, methods=["get"], url_path="export")
+    def export(self, request, pk=None):
+        """
+        RSVP/방명록 내보내기 (소유자만)
 
-class PublicInvitationView(APIView):
+        GET /invitations/{id}/export/?target=rsvps|guestbooks&file_format=csv|xlsx
+        필터: attendance_status (RSVP만), start_date, end_date (YYYY-MM-DD)
+        """
+        invitation = self.get_object()
+        target = request.query_params.get("target", "rsvps")
+        file_format = request.query_params.get("file_format", "csv")
+
+        if target not in EXPORT_TARGETS:
+            return Response({"error": "target은 rsvps 또는 guestbooks여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        if file_format not in EXPORT_FORMATS:
+            return Response({"error": "file_format은 csv 또는 xlsx여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        if file_format == "xlsx" and not ExportService.is_xlsx_available():
+            return Response({"error": "XLSX 내보내기를 사용할 수 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        filterset = EXPORT_FILTERS[target](
+            request.query_params, queryset=ExportService.get_queryset(invitation, target), request=request
+        )
+        if not filterset.is_valid():
+            return Response(filterset.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        headers = ExportService.get_headers(target)
+        rows = ExportService.iter_rows(filterset.qs, target)
+        filename = ExportService.get_filename(invitation, target, file_format)
+
+        if file_format == "csv":
+            response = StreamingHttpResponse(
+                ExportService.stream_csv(headers, rows), content_type=EXPORT_FORMATS["csv"]
+            )
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            return response
+
+        output = ExportService.build_xlsx(headers, rows, sheet_title=target)
+        return FileResponse(output, as_attachment=True, filename=filename, content_type=EXPORT_FORMATS["xlsx"])
+
+
+class PublicInvitationView(ConditionalGetMixin, APIView):
     """
     공개 청첩장 조회
 
     GET /invitations/slug/{slug}
-    인증 불필요
+    인증 불필요, If-None-Match / If-Modified-Since 지원
     """
 
     permission_classes = [AllowAny]
 
     def get(self, request, slug):
-        invitation = get_object_or_404(Invitation, url_slug=slug, is_public=True, status="PUBLISHED")
+        meta = PublicInvitationService.get_validators(slug)
+        if meta is None:
+            raise Http404
 
-        # 조회수 증가
-        InvitationService.increment_view_count(invitation)
+        # 변경이 없으면 본문 없이 304 (재방문도 조회수에 포함)
+        not_modified = self.not_modified(request, meta["etag"], meta["last_modified"])
+        if not_modified is not None:
+            PublicInvitationService.record_view(meta["id"])
+            return not_modified
 
-        serializer = PublicInvitationSerializer(invitation)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 본문은 캐시에서, 조회수는 별도 카운터에서 가져와 합침
+        payload = PublicInvitationService.get_payload(slug)
+        if payload is None:
+            raise Http404
 
+        data = {**payload, "view_count": PublicInvitationService.record_view(payload["id"], payload["view_count"])}
+        # 캐시된 전체 응답에서 ?fields= / ?omit= 으로 고른 필드만 반환
+        data = PublicInvitationSerializer.filter_data(data, request)
+        response = Response(data, status=status.HTTP_200_OK)
+        return self.apply_validators(response, meta["etag"], meta["last_modified"])
 
-class PublicRSVPView(APIView):
+
+class PublicRSVPView(ConditionalGetMixin, APIView):
     """
     공개 RSVP 통계 조회
 
     GET /invitations/slug/{slug}/rsvps/
-    인증 불필요
+    인증 불필요, If-None-Match / If-Modified-Since 지원
     """
 
     permission_classes = [AllowAny]
 
     def get(self, request, slug):
-        invitation = get_object_or_404(Invitation, url_slug=slug, is_public=True, status="PUBLISHED")
+        result = PublicInvitationService.get_with_rsvp_validators(slug)
+        if result is None:
+            raise Http404
+        invitation, etag, last_modified = result
 
-        statistics = RSVPService.get_rsvp_statistics(invitation)
-        serializer = RSVPStatisticsSerializer(statistics)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        not_modified = self.not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
 
+        serializer = RSVPStatisticsSerializer(invitation.rsvp_statistics)
+        return self.apply_validators(Response(serializer.data, status=status.HTTP_200_OK), etag, last_modified)
 
-class PublicGuestbookView(APIView):
+
+class PublicGuestbookView(ConditionalGetMixin, APIView):
     """
     공개 방명록 조회
 
     GET /invitations/slug/{slug}/guestbooks/
-    인증 불필요
+    인증 불필요, If-None-Match / If-Modified-Since 지원
     """
 
     permission_classes = [AllowAny]
 
     def get(self, request, slug):
-        invitation = get_object_or_404(Invitation, url_slug=slug, is_public=True, status="PUBLISHED")
+        result = PublicInvitationService.get_with_guestbook_validators(slug, request.GET.urlencode())
+        if result is None:
+            raise Http404
+        invitation, etag, last_modified = result
+
+        not_modified = self.not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        guestbooks = Guestbook.objects.filter(invitation=invitation, is_public=True)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(guestbooks.values(*GUESTBOOK_PROJECTION.fields), request)
+        response = paginator.get_paginated_response(GUESTBOOK_PROJECTION.many(page))
+        return self.apply_validators(response, etag, last_modified)
+
+
+class AsyncPublicInvitationView(ConditionalGetMixin, AsyncAPIView):
+    """
+    공개 청첩장 조회 (비동기, settings.ASYNC_PUBLIC_VIEWS일 때 PublicInvitationView 대신 사용)
+
+    GET /invitations/slug/{slug}
+    캐시 적중 시 스레드를 쓰지 않고 이벤트 루프에서 바로 응답합니다.
+    """
+
+    async def get(self, request, slug):
+        meta = await PublicInvitationService.aget_validators(slug)
+        if meta is None:
+            raise Http404
+
+        not_modified = self.not_modified(request, meta["etag"], meta["last_modified"])
+        if not_modified is not None:
+            await PublicInvitationService.arecord_view(meta["id"])
+            return not_modified
+
+        payload = await PublicInvitationService.aget_payload(slug)
+        if payload is None:
+            raise Http404
+
+        view_count = await PublicInvitationService.arecord_view(payload["id"], payload["view_count"])
+        data = PublicInvitationSerializer.filter_data({**payload, "view_count": view_count}, request)
+        response = Response(data, status=status.HTTP_200_OK)
+        return self.apply_validators(response, meta["etag"], meta["last_modified"])
+
+
+class AsyncPublicRSVPView(ConditionalGetMixin, AsyncAPIView):
+    """
+    공개 RSVP 통계 조회 (비동기, settings.ASYNC_PUBLIC_VIEWS일 때 PublicRSVPView 대신 사용)
+
+    GET /invitations/slug/{slug}/rsvps/
+    """
+
+    async def get(self, request, slug):
+        result = await PublicInvitationService.aget_with_rsvp_validators(slug)
+        if result is None:
+            raise Http404
+        invitation, etag, last_modified = result
+
+        not_modified = self.not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = RSVPStatisticsSerializer(invitation.rsvp_statistics)
+        return self.apply_validators(Response(serializer.data, status=status.HTTP_200_OK), etag, last_modified)
+
+
+class AsyncPublicGuestbookView(ConditionalGetMixin, AsyncAPIView):
+    """
+    공개 방명록 조회 (비동기, settings.ASYNC_PUBLIC_VIEWS일 때 PublicGuestbookView 대신 사용)
+
+    GET /invitations/slug/{slug}/guestbooks/
+    """
+
+    async def get(self, request, slug):
+        result = await PublicInvitationService.aget_with_guestbook_validators(slug, request.GET.urlencode())
+        if result is None:
+            raise Http404
+        invitation, etag, last_modified = result
+
+        not_modified = self.not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
 
         guestbooks = Guestbook.objects.filter(invitation=invitation, is_public=True)
-        paginator = PageNumberPagination()
-        paginator.page_size = 20
-        page = paginator.paginate_queryset(guestbooks, request)
+        paginator = KeysetPagination()
+        page = await paginator.apaginate_queryset(guestbooks.values(*GUESTBOOK_PROJECTION.fields), request)
+        response = paginator.get_paginated_response(GUESTBOOK_PROJECTION.many(page))
+        return self.apply_validators(response, etag, last_modified)
 
-        if page is not None:
-            serializer = GuestbookSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
 
-        serializer = GuestbookSerializer(guestbooks, many=True)
-        return Response(serializer.data)
+class PublicInvitationPageView(APIView):
+    """
+    공개 청첩장 페이지 번들 조회
+
+    GET /invitations/slug/{slug}/page/
+    청첩장 본문, RSVP 통계, 방명록 첫 페이지를 한 번에 반환 (인증 불필요)
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request, slug):
+        # 청첩장은 한 번만 조회하고 (캐시 적중 시 DB 조회 없음) 이후에는 ID로만 필터링
+        payload = PublicInvitationService.get_payload(slug)
+        if payload is None:
+            raise Http404
+        invitation_id = payload["id"]
+
+        data = {
+            "invitation": {
+                **payload,
+                "view_count": PublicInvitationService.record_view(invitation_id, payload["view_count"]),
+            },
+            "rsvp_statistics": None,
+            "guestbooks": None,
+        }
+
+        if payload["enable_rsvp"]:
+            statistics = RSVPService.get_rsvp_statistics(invitation_id)
+            data["rsvp_statistics"] = RSVPStatisticsSerializer(statistics).data
+
+        if payload["enable_guestbook"]:
+            # 첫 페이지만 포함하고, 다음 페이지 링크는 공개 방명록 API의 커서로 연결
+            guestbooks = Guestbook.objects.filter(invitation_id=invitation_id, is_public=True)
+            paginator = KeysetPagination()
+            paginator.include_count = True
+            page = paginator.paginate_queryset(guestbooks.values(*GUESTBOOK_PROJECTION.fields), request)
+            paginator.base_url = request.build_absolute_uri(reverse("public-guestbooks", kwargs={"slug": slug}))
+            data["guestbooks"] = paginator.get_paginated_data(GUESTBOOK_PROJECTION.many(page))
+
+        return Response(data, status=status.HTTP_200_OK)
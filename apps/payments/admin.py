@@ -9,3 +9,6 @@ class PaymentAdmin(admin.ModelAdmin):
     list_filter = ["status", "plan_type", "created_at"]
     search_fields = ["order_id", "payment_key", "user__email"]
     readonly_fields = ["created_at", "updated_at"]
+    # invitation 표시(Invitation.__str__)가 소유자 이메일을 읽으므로 함께 조회
+    list_select_related = ["user", "invitation__user"]
+    show_full_result_count = False
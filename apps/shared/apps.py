@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class SharedConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.shared"
+
+    def ready(self):
+        # 이후 열리는 모든 DB 연결에 쿼리 기록 래퍼 설치 (common.queries.QueryRecorder)
+        import common.queries  # noqa: F401
+        from apps.shared import checks  # noqa: F401
@@ -0,0 +1,26 @@
+"""
+서비스 캐시 (워커 내부 LRU + 공유 캐시)
+"""
+
+from .decorators import cached_service
+from .local import LocalLRUCache
+from .single_flight import (
+    SingleFlight,
+    get_or_compute,
+    get_single_flight_stats,
+    single_flight,
+)
+from .tiered import TieredCache, get_service_cache_settings, get_stats, service_cache
+
+__all__ = [
+    "LocalLRUCache",
+    "SingleFlight",
+    "TieredCache",
+    "cached_service",
+    "get_or_compute",
+    "get_service_cache_settings",
+    "get_single_flight_stats",
+    "get_stats",
+    "service_cache",
+    "single_flight",
+]
@@ -0,0 +1,63 @@
+"""
+서비스 메서드 캐시 데코레이터
+"""
+
+import functools
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+
+from apps.shared.cache.tiered import service_cache
+
+
+def cached_service(namespace: str, timeout: Optional[int] = None, local_timeout: Optional[float] = None):
+    """
+    서비스 함수 결과를 2단 캐시에 저장하는 데코레이터
+
+    키는 네임스페이스, 세대 번호, 호출 인자(모델 객체는 app_label.model:pk)로 만듭니다.
+    캐시된 값은 여러 호출이 같은 객체를 공유하므로 수정하지 말아야 합니다.
+
+        class TemplateService:
+            @staticmethod
+            @cached_service("templates")
+            def get_template_data(template_id): ...
+
+        TemplateService.get_template_data.invalidate()  # 모든 워커의 templates 항목 무효화
+        TemplateService.get_template_data.forget(1)  # 인자 하나에 해당하는 항목만 삭제
+        await TemplateService.get_template_data.acall(1)  # 비동기 뷰용 (캐시 미스일 때만 스레드에서 함수 실행)
+
+    Args:
+        namespace: 무효화 단위가 되는 네임스페이스
+        timeout: 공유 캐시 유지 시간 (기본값: SERVICE_CACHE["TIMEOUT"])
+        local_timeout: 워커 LRU 유지 시간 (기본값: SERVICE_CACHE["LOCAL_TIMEOUT"])
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return service_cache.get_or_call(
+                namespace,
+                lambda: func(*args, **kwargs),
+                args,
+                kwargs,
+                timeout=timeout,
+                local_timeout=local_timeout,
+            )
+
+        async def acall(*args, **kwargs):
+            return await service_cache.aget_or_call(
+                namespace,
+                lambda: sync_to_async(func)(*args, **kwargs),
+                args,
+                kwargs,
+                timeout=timeout,
+                local_timeout=local_timeout,
+            )
+
+        wrapper.namespace = namespace
+        wrapper.acall = acall
+        wrapper.invalidate = lambda: service_cache.invalidate(namespace)
+        wrapper.forget = lambda *args, **kwargs: service_cache.forget(namespace, args, kwargs)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,212 @@
+"""
+캐시 미스 단일 실행 (single-flight)
+
+인기 있는 키가 만료되거나 무효화된 직후 동시에 들어온 요청이 모두 원본을 다시 계산하지 않도록,
+공유 캐시의 add()로 짧은 임대(lease) 잠금을 잡은 요청 하나만 계산합니다. (여러 워커/프로세스 공통)
+나머지 요청은
+- 만료됐지만 보관 중인 이전 값이 있으면 바로 그 값을 반환하고 (stale-while-revalidate)
+- 없으면 LOCK_WAIT 초 동안 새 값이 채워지기를 기다린 뒤, 그래도 없으면 직접 계산합니다.
+
+값은 (신선 기한, 값) 형태로 TIMEOUT + STALE_TIMEOUT 동안 보관합니다.
+비동기 뷰에서는 같은 규칙을 비동기 캐시 API로 처리하는 aget_or_compute()를 사용합니다. (대기 중에도 이벤트 루프를 막지 않음)
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+DEFAULT_SINGLE_FLIGHT = {
+    "LOCK_LEASE": 5,
+    "LOCK_WAIT": 2,
+    "POLL_INTERVAL": 0.05,
+    "STALE_TIMEOUT": 60,
+    "NEGATIVE_TIMEOUT": 5,
+}
+LOCK_SUFFIX = "lock"
+
+
+def get_single_flight_settings() -> dict:
+    """SINGLE_FLIGHT 설정을 기본값과 병합하여 반환"""
+    return {**DEFAULT_SINGLE_FLIGHT, **getattr(settings, "SINGLE_FLIGHT", {})}
+
+
+class SingleFlight:
+    """
+    공유 캐시 잠금 기반 단일 실행 캐시
+
+    통계(현재 워커):
+        hits: 신선한 값 적중
+        leader: 잠금을 잡고 직접 계산
+        stale: 계산 중인 동안 이전 값 반환
+        waited: 기다렸다가 다른 요청이 채운 값 반환
+        fallback: 기다려도 값이 없어 직접 계산
+        coalesced: stale + waited (계산을 건너뛴 미스 요청 수)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = Counter()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    @staticmethod
+    def lock_key(key: str) -> str:
+        return f"{key}:{LOCK_SUFFIX}"
+
+    @staticmethod
+    def set(key: str, value: Any, timeout: int) -> None:
+        """get_or_compute()가 읽는 형식으로 값 저장 (다른 경로에서 함께 계산한 값을 채울 때)"""
+        config = get_single_flight_settings()
+        # 원본이 없는 경우(None)는 짧게만 보관하여 같은 미스가 몰려도 한 번만 조회
+        fresh_for = timeout if value is not None else min(timeout, config["NEGATIVE_TIMEOUT"])
+        cache.set(key, (time.time() + fresh_for, value), fresh_for + config["STALE_TIMEOUT"])
+
+    @staticmethod
+    async def aset(key: str, value: Any, timeout: int) -> None:
+        """set()의 비동기 버전"""
+        config = get_single_flight_settings()
+        fresh_for = timeout if value is not None else min(timeout, config["NEGATIVE_TIMEOUT"])
+        await cache.aset(key, (time.time() + fresh_for, value), fresh_for + config["STALE_TIMEOUT"])
+
+    @staticmethod
+    def _envelope(envelope: Any) -> Optional[Tuple[float, Any]]:
+        # 형식이 다른 값(배포 직후 남아 있는 이전 형식 등)은 없는 것으로 취급
+        return envelope if isinstance(envelope, tuple) and len(envelope) == 2 else None
+
+    @classmethod
+    def _load(cls, key: str) -> Optional[Tuple[float, Any]]:
+        return cls._envelope(cache.get(key))
+
+    @classmethod
+    async def _aload(cls, key: str) -> Optional[Tuple[float, Any]]:
+        return cls._envelope(await cache.aget(key))
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], timeout: int) -> Any:
+        """
+        캐시된 값을 반환하고, 없거나 만료됐으면 한 요청만 compute()를 호출
+
+        Args:
+            key: 캐시 키
+            compute: 원본 값을 계산하는 함수 (None이면 원본 없음으로 짧게 보관)
+            timeout: 값이 신선한 시간 (초)
+
+        Returns:
+            compute()의 결과 또는 캐시된 값
+        """
+        config = get_single_flight_settings()
+        envelope = self._load(key)
+        if envelope is not None and envelope[0] > time.time():
+            self._count("hits")
+            return envelope[1]
+
+        lock_key = self.lock_key(key)
+        token = uuid.uuid4().hex
+        if cache.add(lock_key, token, config["LOCK_LEASE"]):
+            self._count("leader")
+            try:
+                value = compute()
+                self.set(key, value, timeout)
+                return value
+            finally:
+                # 임대가 만료되어 다른 요청이 잡은 잠금은 풀지 않음
+                if cache.get(lock_key) == token:
+                    cache.delete(lock_key)
+
+        if envelope is not None:
+            self._count("stale")
+            return envelope[1]
+
+        deadline = time.monotonic() + config["LOCK_WAIT"]
+        while time.monotonic() < deadline:
+            time.sleep(config["POLL_INTERVAL"])
+            envelope = self._load(key)
+            if envelope is not None:
+                self._count("waited")
+                return envelope[1]
+            if cache.get(lock_key) is None:
+                # 계산하던 요청이 실패했거나 값이 바로 무효화됨
+                break
+
+        self._count("fallback")
+        value = compute()
+        self.set(key, value, timeout)
+        return value
+
+    async def aget_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]], timeout: int) -> Any:
+        """
+        get_or_compute()의 비동기 버전
+
+        Args:
+            key: 캐시 키
+            compute: 원본 값을 계산하는 코루틴 함수
+            timeout: 값이 신선한 시간 (초)
+        """
+        config = get_single_flight_settings()
+        envelope = await self._aload(key)
+        if envelope is not None and envelope[0] > time.time():
+            self._count("hits")
+            return envelope[1]
+
+        lock_key = self.lock_key(key)
+        token = uuid.uuid4().hex
+        if await cache.aadd(lock_key, token, config["LOCK_LEASE"]):
+            self._count("leader")
+            try:
+                value = await compute()
+                await self.aset(key, value, timeout)
+                return value
+            finally:
+                if await cache.aget(lock_key) == token:
+                    await cache.adelete(lock_key)
+
+        if envelope is not None:
+            self._count("stale")
+            return envelope[1]
+
+        deadline = time.monotonic() + config["LOCK_WAIT"]
+        while time.monotonic() < deadline:
+            await asyncio.sleep(config["POLL_INTERVAL"])
+            envelope = await self._aload(key)
+            if envelope is not None:
+                self._count("waited")
+                return envelope[1]
+            if await cache.aget(lock_key) is None:
+                break
+
+        self._count("fallback")
+        value = await compute()
+        await self.aset(key, value, timeout)
+        return value
+
+    def get_stats(self) -> dict:
+        """현재 워커의 단일 실행 통계"""
+        with self._lock:
+            stats = {name: self._stats[name] for name in ("hits", "leader", "stale", "waited", "fallback")}
+        stats["coalesced"] = stats["stale"] + stats["waited"]
+        return stats
+
+    def reset(self) -> None:
+        """통계 초기화 (테스트용)"""
+        with self._lock:
+            self._stats.clear()
+
+
+single_flight = SingleFlight()
+
+
+def get_or_compute(key: str, compute: Callable[[], Any], timeout: int) -> Any:
+    """기본 SingleFlight 인스턴스로 get_or_compute() 호출"""
+    return single_flight.get_or_compute(key, compute, timeout)
+
+
+def get_single_flight_stats() -> dict:
+    """현재 워커의 단일 실행 통계"""
+    return single_flight.get_stats()
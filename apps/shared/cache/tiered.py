@@ -0,0 +1,254 @@
+"""
+2단 캐시 (워커 내부 LRU + 공유 캐시)
+
+조회 순서는 워커 LRU → 공유 캐시(CACHES["default"]) → 원본 함수입니다.
+
+네임스페이스마다 세대 번호를 공유 캐시에 두고 키에 포함합니다.
+invalidate(namespace)는 세대 번호만 올리므로, 모든 워커가 다음 세대 확인 시점에 이전 항목을 함께 버립니다.
+(이전 세대 항목은 더 이상 조회되지 않고 TTL/LRU로 자연히 사라짐)
+워커는 세대 번호를 GENERATION_CHECK_INTERVAL 초 동안 재사용하므로, 다른 워커의 무효화는 최대 그 시간만큼 늦게 보입니다.
+비동기 뷰에서는 공유 캐시를 비동기 API로 읽는 aget_or_call()을 사용합니다. (워커 LRU는 같은 것을 공유)
+"""
+
+import hashlib
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model
+
+from apps.shared.cache.local import MISSING, LocalLRUCache
+
+DEFAULT_SERVICE_CACHE = {
+    "ENABLED": True,
+    "TIMEOUT": 300,
+    "LOCAL_MAX_ENTRIES": 1000,
+    "LOCAL_TIMEOUT": 30,
+    "GENERATION_CHECK_INTERVAL": 1,
+}
+KEY_PREFIX = "service"
+
+
+def get_service_cache_settings() -> dict:
+    """SERVICE_CACHE 설정을 기본값과 병합하여 반환"""
+    return {**DEFAULT_SERVICE_CACHE, **getattr(settings, "SERVICE_CACHE", {})}
+
+
+def _normalize(value: Any) -> Any:
+    """캐시 키용 인자 정규화 (모델 객체는 app_label.model:pk)"""
+    if isinstance(value, Model):
+        return f"{value._meta.label_lower}:{value.pk}"
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _normalize(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_normalize(item) for item in value))
+    return value
+
+
+class TieredCache:
+    """워커 내부 LRU와 공유 캐시를 묶은 2단 캐시"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local: Optional[LocalLRUCache] = None
+        self._generations: Dict[str, Tuple[int, float]] = {}
+        self._stats: Dict[str, Counter] = defaultdict(Counter)
+
+    @property
+    def local(self) -> LocalLRUCache:
+        if self._local is None:
+            config = get_service_cache_settings()
+            self._local = LocalLRUCache(config["LOCAL_MAX_ENTRIES"], config["LOCAL_TIMEOUT"])
+        return self._local
+
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        return f"{KEY_PREFIX}:gen:{namespace}"
+
+    def get_generation(self, namespace: str) -> int:
+        """네임스페이스의 현재 세대 번호 (GENERATION_CHECK_INTERVAL 동안 워커 내부에서 재사용)"""
+        now = time.monotonic()
+        cached = self._generations.get(namespace)
+        if cached is not None and now - cached[1] < get_service_cache_settings()["GENERATION_CHECK_INTERVAL"]:
+            return cached[0]
+
+        key = self._generation_key(namespace)
+        generation = cache.get(key)
+        if generation is None:
+            # 세대 키가 축출된 뒤 다시 만들 때 이전 번호를 재사용하지 않도록 현재 시각(ms)에서 시작
+            cache.add(key, time.time_ns() // 1_000_000, None)
+            generation = cache.get(key)
+        self._generations[namespace] = (generation, now)
+        return generation
+
+    async def aget_generation(self, namespace: str) -> int:
+        """get_generation()의 비동기 버전"""
+        now = time.monotonic()
+        cached = self._generations.get(namespace)
+        if cached is not None and now - cached[1] < get_service_cache_settings()["GENERATION_CHECK_INTERVAL"]:
+            return cached[0]
+
+        key = self._generation_key(namespace)
+        generation = await cache.aget(key)
+        if generation is None:
+            await cache.aadd(key, time.time_ns() // 1_000_000, None)
+            generation = await cache.aget(key)
+        self._generations[namespace] = (generation, now)
+        return generation
+
+    def make_key(self, namespace: str, generation: int, args: tuple = (), kwargs: Optional[dict] = None) -> str:
+        """인자로 캐시 키 생성"""
+        source = repr((_normalize(args), _normalize(kwargs or {})))
+        digest = hashlib.sha1(source.encode()).hexdigest()
+        return f"{KEY_PREFIX}:{namespace}:{generation}:{digest}"
+
+    def get_or_call(
+        self,
+        namespace: str,
+        loader: Callable[[], Any],
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+        timeout: Optional[int] = None,
+        local_timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        캐시된 값을 반환하고, 없으면 loader()를 호출하여 두 계층에 저장
+
+        Args:
+            namespace: 캐시 네임스페이스 (무효화 단위)
+            loader: 원본 값을 계산하는 함수
+            args, kwargs: 키를 만들 인자
+            timeout: 공유 캐시 유지 시간 (기본값: TIMEOUT 설정)
+            local_timeout: 워커 LRU 유지 시간 (기본값: LOCAL_TIMEOUT 설정)
+        """
+        config = get_service_cache_settings()
+        if not config["ENABLED"]:
+            return loader()
+
+        stats = self._stats[namespace]
+        key = self.make_key(namespace, self.get_generation(namespace), args, kwargs)
+
+        value = self.local.get(key)
+        if value is not MISSING:
+            stats["local_hits"] += 1
+            return value
+
+        value = cache.get(key, MISSING)
+        if value is not MISSING:
+            stats["shared_hits"] += 1
+            self.local.set(key, value, local_timeout)
+            return value
+
+        stats["misses"] += 1
+        # 계산 중 무효화되면 이전 세대 키에 저장되므로 오래된 값이 새 세대에 섞이지 않음
+        value = loader()
+        cache.set(key, value, config["TIMEOUT"] if timeout is None else timeout)
+        self.local.set(key, value, local_timeout)
+        return value
+
+    async def aget_or_call(
+        self,
+        namespace: str,
+        loader: Callable[[], Awaitable[Any]],
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+        timeout: Optional[int] = None,
+        local_timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        get_or_call()의 비동기 버전
+
+        Args:
+            loader: 원본 값을 계산하는 코루틴 함수
+            (나머지는 get_or_call()과 같음)
+        """
+        config = get_service_cache_settings()
+        if not config["ENABLED"]:
+            return await loader()
+
+        stats = self._stats[namespace]
+        key = self.make_key(namespace, await self.aget_generation(namespace), args, kwargs)
+
+        value = self.local.get(key)
+        if value is not MISSING:
+            stats["local_hits"] += 1
+            return value
+
+        value = await cache.aget(key, MISSING)
+        if value is not MISSING:
+            stats["shared_hits"] += 1
+            self.local.set(key, value, local_timeout)
+            return value
+
+        stats["misses"] += 1
+        value = await loader()
+        await cache.aset(key, value, config["TIMEOUT"] if timeout is None else timeout)
+        self.local.set(key, value, local_timeout)
+        return value
+
+    def forget(self, namespace: str, args: tuple = (), kwargs: Optional[dict] = None) -> None:
+        """
+        인자 하나에 해당하는 항목 삭제
+
+        공유 캐시와 현재 워커의 LRU에서만 지우므로, 다른 워커의 LRU 사본은 LOCAL_TIMEOUT 후에 사라집니다.
+        모든 워커에서 바로 버려야 하면 invalidate()를 사용하세요.
+        """
+        key = self.make_key(namespace, self.get_generation(namespace), args, kwargs)
+        cache.delete(key)
+        self.local.delete(key)
+        self._stats[namespace]["forgets"] += 1
+
+    def invalidate(self, namespace: str) -> int:
+        """
+        네임스페이스 세대 번호를 올려 모든 워커의 기존 항목을 무효화
+
+        Returns:
+            int: 새 세대 번호
+        """
+        key = self._generation_key(namespace)
+        try:
+            generation = cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns() // 1_000_000, None)
+            generation = cache.get(key)
+        self._generations[namespace] = (generation, time.monotonic())
+        self._stats[namespace]["invalidations"] += 1
+        return generation
+
+    def get_stats(self) -> dict:
+        """
+        현재 워커의 캐시 통계
+
+        Returns:
+            dict: local_hits, shared_hits, misses, forgets, invalidations, evictions, expirations,
+                  local_entries, namespaces(네임스페이스별 카운터)
+        """
+        totals = Counter()
+        for counter in self._stats.values():
+            totals.update(counter)
+        result = {name: totals[name] for name in ("local_hits", "shared_hits", "misses", "forgets", "invalidations")}
+        result["evictions"] = self.local.evictions
+        result["expirations"] = self.local.expirations
+        result["local_entries"] = len(self.local)
+        result["namespaces"] = {namespace: dict(counter) for namespace, counter in self._stats.items()}
+        return result
+
+    def reset(self) -> None:
+        """워커 LRU, 세대 번호, 통계 초기화 (설정 변경 반영, 테스트용)"""
+        with self._lock:
+            self._local = None
+            self._generations.clear()
+            self._stats.clear()
+
+
+service_cache = TieredCache()
+
+
+def get_stats() -> dict:
+    """현재 워커의 서비스 캐시 통계"""
+    return service_cache.get_stats()
@@ -0,0 +1,33 @@
+"""
+Shared 앱 시스템 체크
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Warning, register
+
+
+@register()
+def check_shared_cache_backend(app_configs, **kwargs):
+    """
+    워커 간 공유가 필요한 기능이 워커별 메모리 캐시(LocMem)에서 동작하는지 확인 (DEBUG 제외)
+
+    서비스 캐시의 공유 계층/세대 무효화, SingleFlight 잠금, 조회수 cache 버퍼는
+    LocMem에서는 워커 하나 안에서만 동작합니다.
+    """
+    if settings.DEBUG or not isinstance(caches["default"], LocMemCache):
+        return []
+
+    features = ["SINGLE_FLIGHT"]
+    if getattr(settings, "SERVICE_CACHE", {}).get("ENABLED", True):
+        features.insert(0, "SERVICE_CACHE")
+    if getattr(settings, "VIEW_COUNT_BUFFER", {}).get("BACKEND") == "cache":
+        features.append("VIEW_COUNT_BUFFER")
+    return [
+        Warning(
+            f"기본 캐시가 워커별 메모리(LocMemCache)라서 {', '.join(features)}이(가) 워커 간에 공유되지 않습니다.",
+            hint="CACHE_BACKEND/CACHE_LOCATION으로 Redis 등 공유 캐시를 지정하세요.",
+            id="shared.W001",
+        )
+    ]
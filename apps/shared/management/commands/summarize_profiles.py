@@ -0,0 +1,48 @@
+"""
+표본 요청 프로파일 요약 커맨드
+
+python manage.py summarize_profiles [--limit 30] [--sort cumulative] [--view invitation-rsvps]
+"""
+
+import io
+import pstats
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.profiling import get_profiling_settings, load_profile_records
+
+SORT_KEYS = ["cumulative", "tottime", "ncalls", "filename"]
+
+
+class Command(BaseCommand):
+    help = "ProfilingMiddleware가 저장한 느린 요청 목록과 함수별 누적 시간을 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--directory", help="프로파일 디렉터리 (기본값: PROFILING['DIRECTORY'])")
+        parser.add_argument("--limit", type=int, default=30, help="출력할 함수 수")
+        parser.add_argument("--sort", choices=SORT_KEYS, default="cumulative", help="함수 정렬 기준")
+        parser.add_argument("--view", help="이 뷰(URL 이름)의 요청만 요약")
+
+    def handle(self, *args, **options):
+        directory = options["directory"] or get_profiling_settings()["DIRECTORY"]
+        records = load_profile_records(directory)
+        if options["view"]:
+            records = [record for record in records if record["view"] == options["view"]]
+        if not records:
+            raise CommandError(f"{directory}에 저장된 프로파일이 없습니다.")
+
+        self.stdout.write(f"느린 요청 {len(records)}건 ({directory})")
+        for record in records:
+            captured_at = datetime.fromtimestamp(record["captured_at"]).strftime("%Y-%m-%d %H:%M:%S")
+            action = f" [{record['action']}]" if record["action"] else ""
+            self.stdout.write(
+                f"  {record['duration'] * 1000:9.1f}ms  {record['status_code']}  "
+                f"{record['method']} {record['path']}  ({record['view']}{action}, {captured_at})"
+            )
+
+        # 모든 요청의 통계를 합쳐 함수별로 출력
+        stream = io.StringIO()
+        stats = pstats.Stats(*[record["profile"] for record in records], stream=stream)
+        stats.strip_dirs().sort_stats(options["sort"]).print_stats(options["limit"])
+        self.stdout.write(stream.getvalue())
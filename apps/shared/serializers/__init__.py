@@ -1,3 +1,4 @@
-from .base import BaseSerializer
+from .base import BaseSerializer, SparseFieldsetMixin
+from .projection import Projection, compile_projection
 
-__all__ = ["BaseSerializer"]
+__all__ = ["BaseSerializer", "SparseFieldsetMixin", "Projection", "compile_projection"]
@@ -2,13 +2,130 @@
 공통 시리얼라이저 베이스 클래스
 """
 
-from rest_framework import serializers
+from typing import Iterable, List, Optional, Tuple
 
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import permissions, serializers
 
-class BaseSerializer(serializers.ModelSerializer):
+
+class SparseFieldsetMixin:
+    """
+    ?fields= / ?omit= 쿼리 파라미터로 응답 필드를 고르는 믹스인
+
+    - fields=title,wedding_date: 지정한 필드만 반환
+    - omit=invitation_message: 지정한 필드를 제외하고 반환
+    - 조회(GET/HEAD) 요청에서만 적용되며, 생성자에 fields/omit을 직접 넘길 수도 있습니다.
+    - 같은 선택으로 get_only_fields()가 .only()에 넘길 모델 필드 목록을 만들어,
+      선택하지 않은 컬럼은 DB에서 읽지도 않습니다.
+    """
+
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        omit = kwargs.pop("omit", None)
+        super().__init__(*args, **kwargs)
+
+        if fields is None and omit is None:
+            fields, omit = self.get_requested_fields(self.context.get("request"))
+        if fields is None and omit is None:
+            return
+
+        keep = self.select_field_names(list(self.fields), fields, omit)
+        for name in list(self.fields):
+            if name not in keep:
+                self.fields.pop(name)
+
+    @classmethod
+    def get_requested_fields(cls, request) -> Tuple[Optional[List[str]], Optional[List[str]]]:
+        """요청 쿼리 파라미터에서 (fields, omit) 목록을 읽음 (조회 요청이 아니면 (None, None))"""
+        if request is None or request.method not in permissions.SAFE_METHODS:
+            return None, None
+        params = getattr(request, "query_params", request.GET)
+
+        def parse(name: str) -> Optional[List[str]]:
+            value = params.get(name)
+            if not value:
+                return None
+            return [item.strip() for item in value.split(",") if item.strip()]
+
+        return parse(cls.fields_query_param), parse(cls.omit_query_param)
+
+    @classmethod
+    def select_field_names(
+        cls, available: List[str], fields: Optional[Iterable[str]], omit: Optional[Iterable[str]]
+    ) -> List[str]:
+        """
+        사용 가능한 필드 중 선택된 필드 목록 반환
+
+        Raises:
+            ValidationError: 알 수 없는 필드를 지정한 경우
+        """
+        unknown = [name for name in list(fields or []) + list(omit or []) if name not in available]
+        if unknown:
+            raise serializers.ValidationError({"fields": f"알 수 없는 필드입니다: {', '.join(unknown)}"})
+
+        selected = [name for name in available if fields is None or name in fields]
+        return [name for name in selected if not omit or name not in omit]
+
+    @classmethod
+    def get_only_fields(cls, request, required: Iterable[str] = ()) -> Optional[List[str]]:
+        """
+        선택된 필드를 읽는 데 필요한 모델 필드 경로 (.only()용)
+
+        중첩 시리얼라이저로 표현되는 관계 필드는 "template__name"처럼 관계 모델의 필드까지 포함합니다.
+
+        Args:
+            request: 현재 요청
+            required: 권한 확인 등 시리얼라이저 외에 필요한 필드 (예: "user")
+
+        Returns:
+            list: 필드 경로 목록, 필드 선택이 없으면 None
+        """
+        fields, omit = cls.get_requested_fields(request)
+        if fields is None and omit is None:
+            return None
+
+        serializer = cls(fields=fields, omit=omit)
+        return [*required, *_model_field_paths(serializer.fields, cls.Meta.model)]
+
+    @classmethod
+    def filter_data(cls, data: dict, request) -> dict:
+        """이미 직렬화된 데이터(캐시된 응답 등)에 같은 필드 선택을 적용"""
+        fields, omit = cls.get_requested_fields(request)
+        if fields is None and omit is None:
+            return data
+        keep = cls.select_field_names(list(data), fields, omit)
+        return {name: data[name] for name in keep}
+
+
+def _model_field_paths(fields, model, prefix: str = "") -> List[str]:
+    """시리얼라이저 필드들이 읽는 모델 필드 경로 목록"""
+    paths = []
+    for field in fields.values():
+        if field.source == "*":
+            continue
+        name = field.source.split(".")[0]
+        try:
+            model_field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # annotate 값이나 SerializerMethodField 등 모델 컬럼이 아닌 필드
+            continue
+        if model_field.many_to_many or model_field.one_to_many:
+            continue
+        paths.append(f"{prefix}{name}")
+        if model_field.is_relation and isinstance(field, serializers.Serializer):
+            paths.extend(_model_field_paths(field.fields, model_field.related_model, f"{prefix}{name}__"))
+    return paths
+
+
+class BaseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     모든 시리얼라이저가 상속받을 기본 시리얼라이저
     공통 필드나 메서드를 정의할 수 있음
+
+    ?fields= / ?omit= 필드 선택을 지원합니다. (SparseFieldsetMixin)
     """
 
     pass
@@ -0,0 +1,174 @@
+"""
+읽기 전용 목록 응답용 고속 직렬화
+
+ModelSerializer(many=True)는 행마다 필드 복사/속성 조회/to_representation 호출을 반복합니다.
+compile_projection()은 시리얼라이저의 필드 구성을 한 번만 분석하여 .values() 행(dict)을
+같은 출력으로 바꾸는 평면 함수로 만들어 둡니다. (응답 본문이 기존 시리얼라이저와 바이트 단위로 같음)
+
+    RSVP_PROJECTION = compile_projection(RSVPSerializer)
+    rows = queryset.values(*RSVP_PROJECTION.fields)
+    data = RSVP_PROJECTION.many(rows)
+
+지원하지 않는 필드(SerializerMethodField, source="*", 점 표기 source, 역참조/다대다 중첩 등)가 있으면
+ImproperlyConfigured를 발생시키므로 해당 시리얼라이저는 기존 경로를 사용해야 합니다.
+"""
+
+import decimal
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+
+def _identity(value):
+    return value
+
+
+class Projection:
+    """
+    컴파일된 시리얼라이저 투영
+
+    Attributes:
+        serializer_class: 원본 시리얼라이저 클래스
+        fields: .values()에 넘길 필드 경로 목록
+    """
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self.fields: List[str] = []
+        self._plan = self._compile(serializer_class().fields, serializer_class.Meta.model, "")
+
+    def _compile(self, fields, model, prefix: str) -> list:
+        plan = []
+        for name, field in fields.items():
+            if field.write_only:
+                continue
+            source = field.source
+            if source == "*" or "." in source:
+                raise ImproperlyConfigured(f"{self.serializer_class.__name__}.{name}: 투영할 수 없는 source입니다.")
+            try:
+                model_field = model._meta.get_field(source)
+            except FieldDoesNotExist:
+                raise ImproperlyConfigured(f"{self.serializer_class.__name__}.{name}: 모델 필드가 아닙니다.")
+            path = f"{prefix}{source}"
+
+            if isinstance(field, serializers.BaseSerializer):
+                if isinstance(field, serializers.ListSerializer) or not model_field.many_to_one:
+                    raise ImproperlyConfigured(f"{self.serializer_class.__name__}.{name}: 정방향 FK 중첩만 지원합니다.")
+                # FK 값으로 null 여부를 판단하고, 관계 모델 필드는 JOIN으로 함께 읽음
+                self.fields.append(path)
+                nested = self._compile(field.fields, model_field.related_model, f"{path}__")
+                plan.append((name, path, None, nested))
+                continue
+
+            if isinstance(field, serializers.RelatedField) and not isinstance(
+                field, serializers.PrimaryKeyRelatedField
+            ):
+                raise ImproperlyConfigured(f"{self.serializer_class.__name__}.{name}: 지원하지 않는 관계 필드입니다.")
+            if model_field.many_to_many or model_field.one_to_many:
+                raise ImproperlyConfigured(
+                    f"{self.serializer_class.__name__}.{name}: 다대다/역참조는 지원하지 않습니다."
+                )
+
+            self.fields.append(path)
+            plan.append((name, path, field, None))
+        return plan
+
+    def _bind(self, plan) -> List[Tuple[str, str, Optional[Callable], Optional[list]]]:
+        """필드별 변환 함수를 응답 하나에 대해 한 번 결정 (현재 시간대 등)"""
+        bound = []
+        for name, path, field, nested in plan:
+            if nested is not None:
+                bound.append((name, path, None, self._bind(nested)))
+            else:
+                bound.append((name, path, _get_converter(field), None))
+        return bound
+
+    @staticmethod
+    def _project(plan, row: Dict) -> Dict:
+        data = {}
+        for name, path, convert, nested in plan:
+            value = row[path]
+            if value is None:
+                data[name] = None
+            elif nested is not None:
+                data[name] = Projection._project(nested, row)
+            else:
+                data[name] = convert(value)
+        return data
+
+    def __call__(self, row: Dict) -> Dict:
+        return self._project(self._bind(self._plan), row)
+
+    def many(self, rows: Iterable[Dict]) -> List[Dict]:
+        """.values() 행 목록을 시리얼라이저 출력 목록으로 변환"""
+        plan = self._bind(self._plan)
+        return [self._project(plan, row) for row in rows]
+
+
+def _get_converter(field) -> Callable:
+    """DRF 필드의 to_representation과 같은 결과를 내는 변환 함수"""
+    if isinstance(field, serializers.DateTimeField):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if output_format is None or output_format.lower() != ISO_8601:
+            return field.to_representation
+        field_timezone = getattr(field, "timezone", field.default_timezone())
+        if field_timezone is None or not settings.USE_TZ:
+            return field.to_representation
+
+        def convert_datetime(value):
+            if timezone.is_naive(value):
+                return field.to_representation(value)
+            value = value.astimezone(field_timezone).isoformat()
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+        return convert_datetime
+
+    if isinstance(field, serializers.DecimalField):
+        coerce_to_string = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+        if field.decimal_places is None or field.normalize_output or field.localize or not coerce_to_string:
+            return field.to_representation
+        # 위도/경도 등: 양자화 단위와 정밀도 컨텍스트를 미리 만들어 둠
+        exponent = decimal.Decimal(".1") ** field.decimal_places
+        context = decimal.getcontext().copy()
+        if field.max_digits is not None:
+            context.prec = field.max_digits
+        rounding = field.rounding
+
+        def convert_decimal(value):
+            if not isinstance(value, decimal.Decimal):
+                value = decimal.Decimal(str(value).strip())
+            return f"{value.quantize(exponent, rounding=rounding, context=context):f}"
+
+        return convert_decimal
+
+    if isinstance(field, serializers.ChoiceField):
+        choices = field.choice_strings_to_values
+        return lambda value: choices.get(str(value), value) if value != "" else value
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        # .values()의 FK 값이 이미 PK
+        return _identity
+    if isinstance(field, serializers.CharField):
+        return str
+    if isinstance(field, serializers.BooleanField):
+        return bool
+    if isinstance(field, serializers.IntegerField):
+        return int
+    if isinstance(field, serializers.FloatField):
+        return float
+    # 그 밖의 필드(JSONField 등)는 필드 자체 변환 사용
+    return field.to_representation
+
+
+_projections: Dict[type, Projection] = {}
+
+
+def compile_projection(serializer_class) -> Projection:
+    """시리얼라이저 클래스별 Projection (한 번만 컴파일)"""
+    projection = _projections.get(serializer_class)
+    if projection is None:
+        projection = _projections[serializer_class] = Projection(serializer_class)
+    return projection
@@ -1 +1,824 @@
-from django.test import TestCase
+"""
+Shared 앱 및 공통 모듈 테스트
+"""
+
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO, StringIO
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import OperationalError, connections, transaction
+from django.http import HttpResponse
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.tokens import RefreshToken
+
+import common.db_router
+import common.parsers
+import common.renderers
+from apps.invitations.models import Invitation
+from apps.invitations.services.guestbook_service import GuestbookService
+from apps.shared.cache import (
+    LocalLRUCache,
+    SingleFlight,
+    TieredCache,
+    cached_service,
+    get_stats,
+    service_cache,
+)
+from apps.shared.cache.local import MISSING
+from apps.shared.checks import check_shared_cache_backend
+from common.db_router import (
+    ReadReplicaRouter,
+    allow_replica_reads,
+    replica_health,
+    reset_replica_reads,
+    use_primary,
+)
+from common.logging import (
+    JSONFormatter,
+    QueueStreamHandler,
+    RequestContextFilter,
+    reset_request_id,
+    set_request_id,
+)
+from common.metrics import (
+    LatencyHistogram,
+    archive_worker_snapshot,
+    clear_snapshots,
+    registry,
+    render_prometheus,
+)
+from common.middleware import ProfilingMiddleware, QueryInstrumentationMiddleware
+from common.parsers import ORJSONParser
+from common.profiling import load_profile_records
+from common.renderers import ORJSONRenderer
+
+User = get_user_model()
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """orjson 사용/미설치 두 경우 모두 테스트"""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(common.renderers, "orjson", None)
+        monkeypatch.setattr(common.parsers, "orjson", None)
+    return request.param
+
+
+@pytest.fixture
+def payload():
+    return {
+        "id": 1,
+        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "title": "홍길동 ♥ 김영희 결혼합니다",
+        "wedding_location_lat": Decimal("37.5665000"),
+        "wedding_location_lng": Decimal("126.9780000"),
+        "wedding_date": datetime(2026, 5, 23, 12, 30, tzinfo=ZoneInfo("Asia/Seoul")),
+        "published_at": datetime(2026, 4, 1, 3, 0, 0, 123456, tzinfo=dt_timezone.utc),
+        "label": gettext_lazy("참석"),
+        "separator": "줄\u2028바꿈",
+        "nested": [{"count": 3, "ok": True, "none": None}],
+    }
+
+
+class TestORJSONRenderer:
+    """orjson 렌더러 테스트"""
+
+    def test_matches_drf_renderer(self, json_backend, payload):
+        """DRF JSONRenderer와 바이트 단위로 같은지 테스트"""
+        assert ORJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+    def test_types(self, json_backend, payload):
+        rendered = ORJSONRenderer().render(payload).decode()
+
+        assert '"title":"홍길동 ♥ 김영희 결혼합니다"' in rendered
+        assert '"wedding_date":"2026-05-23T12:30:00+09:00"' in rendered
+        assert '"published_at":"2026-04-01T03:00:00.123456Z"' in rendered
+        assert '"wedding_location_lat":37.5665' in rendered
+        assert '"uuid":"12345678-1234-5678-1234-567812345678"' in rendered
+        assert "\\u2028" in rendered
+
+    def test_indent_and_empty(self, json_backend, payload):
+        """들여쓰기 요청과 None 데이터가 DRF와 같은지 테스트"""
+        media_type = "application/json; indent=4"
+
+        assert ORJSONRenderer().render(payload, media_type) == JSONRenderer().render(payload, media_type)
+        assert ORJSONRenderer().render(None) == b""
+
+    def test_large_integer_falls_back(self, json_backend):
+        data = {"value": 2**70}
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+class TestORJSONParser:
+    """orjson 파서 테스트"""
+
+    def parse(self, body: bytes, encoding: str = "utf-8"):
+        return ORJSONParser().parse(BytesIO(body), parser_context={"encoding": encoding})
+
+    def test_parse(self, json_backend):
+        body = '{"guest_name": "김철수", "guest_count": 2, "lat": 37.5665}'.encode()
+
+        assert self.parse(body) == JSONParser().parse(BytesIO(body), parser_context={"encoding": "utf-8"})
+        assert self.parse(body)["guest_name"] == "김철수"
+
+    def test_other_encoding(self, json_backend):
+        assert self.parse('{"name": "김철수"}'.encode("euc-kr"), encoding="euc-kr") == {"name": "김철수"}
+
+    @pytest.mark.parametrize("body", [b'{"a": NaN}', b'{"a": 1', b"\xff"])
+    def test_invalid(self, json_backend, body):
+        with pytest.raises(ParseError):
+            self.parse(body)
+
+
+class TestLocalLRUCache:
+    """워커 내부 LRU 캐시 테스트"""
+
+    def test_evicts_least_recently_used(self):
+        lru = LocalLRUCache(max_entries=2, timeout=60)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+
+        assert lru.get("b") is MISSING
+        assert lru.get("a") == 1
+        assert lru.get("c") == 3
+        assert lru.evictions == 1
+
+    def test_expires_after_timeout(self, monkeypatch):
+        lru = LocalLRUCache(max_entries=10, timeout=5)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        lru.set("a", 1)
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+        assert lru.get("a") is MISSING
+        assert lru.expirations == 1
+        assert len(lru) == 0
+
+    def test_zero_entries_stores_nothing(self):
+        lru = LocalLRUCache(max_entries=0, timeout=60)
+        lru.set("a", 1)
+
+        assert lru.get("a") is MISSING
+
+
+class TestCachedService:
+    """2단 서비스 캐시 데코레이터 테스트"""
+
+    @pytest.fixture
+    def calls(self):
+        return []
+
+    @pytest.fixture
+    def lookup(self, calls):
+        @cached_service("test-lookup")
+        def lookup(value, scale=1):
+            calls.append((value, scale))
+            return {"value": value * scale}
+
+        return lookup
+
+    def test_caches_by_arguments(self, lookup, calls):
+        assert lookup(2) == {"value": 2}
+        assert lookup(2) == {"value": 2}
+        assert lookup(2, scale=3) == {"value": 6}
+
+        assert calls == [(2, 1), (2, 3)]
+        stats = get_stats()
+        assert stats["local_hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["namespaces"]["test-lookup"]["misses"] == 2
+
+    def test_caches_none_result(self, calls):
+        @cached_service("test-none")
+        def find(value):
+            calls.append(value)
+            return None
+
+        assert find(1) is None
+        assert find(1) is None
+        assert calls == [1]
+
+    def test_falls_back_to_shared_cache(self, lookup, calls):
+        """다른 워커(LRU가 비어 있는 경우)는 공유 캐시에서 읽음"""
+        lookup(2)
+        service_cache.local.clear()
+
+        assert lookup(2) == {"value": 2}
+        assert calls == [(2, 1)]
+        assert get_stats()["shared_hits"] == 1
+
+    def test_invalidate_reaches_other_workers(self, lookup, calls, settings):
+        """세대 번호가 오르면 다른 워커도 다음 확인 시점에 이전 항목을 버림"""
+        settings.SERVICE_CACHE = {**settings.SERVICE_CACHE, "GENERATION_CHECK_INTERVAL": 0}
+        lookup(2)
+        other_worker = TieredCache()
+        other_worker.get_or_call("test-lookup", lambda: {"value": "stale"}, (2,), {})
+
+        other_worker.invalidate("test-lookup")
+        assert lookup(2) == {"value": 2}
+
+        assert calls == [(2, 1), (2, 1)]
+
+    def test_forget_removes_single_entry(self, lookup, calls):
+        lookup(2)
+        lookup(3)
+        lookup.forget(2)
+        lookup(2)
+        lookup(3)
+
+        assert calls == [(2, 1), (3, 1), (2, 1)]
+
+    def test_model_arguments_use_primary_key(self, user):
+        @cached_service("test-model")
+        def describe(instance):
+            return instance.email
+
+        assert service_cache.make_key("test-model", 1, (user,)) == service_cache.make_key(
+            "test-model", 1, (type(user).objects.get(pk=user.pk),)
+        )
+        assert describe(user) == user.email
+
+    def test_disabled_calls_through(self, lookup, calls, settings):
+        settings.SERVICE_CACHE = {**settings.SERVICE_CACHE, "ENABLED": False}
+        lookup(2)
+        lookup(2)
+
+        assert calls == [(2, 1), (2, 1)]
+
+
+class TestSharedCacheCheck:
+    """워커별 메모리 캐시 경고 테스트"""
+
+    def test_warns_on_locmem_outside_debug(self, settings, tmp_path):
+        settings.DEBUG = False
+        settings.VIEW_COUNT_BUFFER = {**settings.VIEW_COUNT_BUFFER, "BACKEND": "cache"}
+        [warning] = check_shared_cache_backend(None)
+        assert warning.id == "shared.W001"
+        assert "SERVICE_CACHE, SINGLE_FLIGHT, VIEW_COUNT_BUFFER" in warning.msg
+
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": str(tmp_path)}
+        }
+        assert check_shared_cache_backend(None) == []
+
+    def test_allows_locmem_in_debug(self, settings):
+        settings.DEBUG = True
+        assert check_shared_cache_backend(None) == []
+
+
+class TestSingleFlight:
+    """캐시 미스 단일 실행 테스트"""
+
+    @pytest.fixture
+    def flight(self):
+        return SingleFlight()
+
+    def test_concurrent_misses_compute_once(self, flight):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"value": 1}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: flight.get_or_compute("sf:concurrent", compute, 60), range(8)))
+
+        assert calls == [1]
+        assert results == [{"value": 1}] * 8
+        stats = flight.get_stats()
+        assert stats["leader"] == 1
+        assert stats["waited"] == 7
+        assert stats["coalesced"] == 7
+
+    def test_serves_stale_while_another_worker_recomputes(self, flight, monkeypatch):
+        flight.get_or_compute("sf:stale", lambda: "old", 10)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+        cache.add(flight.lock_key("sf:stale"), "other-worker", 5)
+
+        assert flight.get_or_compute("sf:stale", lambda: "new", 10) == "old"
+        assert flight.get_stats()["stale"] == 1
+
+    def test_leader_refreshes_expired_value(self, flight, monkeypatch):
+        flight.get_or_compute("sf:refresh", lambda: "old", 10)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+
+        assert flight.get_or_compute("sf:refresh", lambda: "new", 10) == "new"
+        assert flight.get_or_compute("sf:refresh", lambda: "newer", 10) == "new"
+
+    def test_falls_back_when_lock_holder_never_fills(self, flight, settings):
+        settings.SINGLE_FLIGHT = {**settings.SINGLE_FLIGHT, "LOCK_WAIT": 0.1, "POLL_INTERVAL": 0.01}
+        cache.add(flight.lock_key("sf:fallback"), "other-worker", 5)
+
+        assert flight.get_or_compute("sf:fallback", lambda: "computed", 10) == "computed"
+        assert flight.get_stats()["fallback"] == 1
+
+    def test_missing_value_cached_briefly(self, flight):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return None
+
+        assert flight.get_or_compute("sf:none", compute, 60) is None
+        assert flight.get_or_compute("sf:none", compute, 60) is None
+        assert calls == [1]
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+class TestReadReplicaRouter:
+    """읽기 복제본 라우터 테스트 (replica는 default를 미러링하는 SQLite)"""
+
+    @pytest.fixture(autouse=True)
+    def replicas(self, settings):
+        settings.READ_REPLICAS = {**settings.READ_REPLICAS, "ALIASES": ["replica"], "CHECK_INTERVAL": 60}
+        replica_health.reset()
+        yield
+        replica_health.reset()
+
+    @pytest.fixture
+    def invitation(self, user):
+        invitation = Invitation.objects.create(
+            user=user,
+            title="복제본 청첩장",
+            url_slug="replica-invitation",
+            groom_name="홍길동",
+            bride_name="김영희",
+            wedding_date=timezone.now() + timedelta(days=30),
+            status="PUBLISHED",
+            is_public=True,
+        )
+        # 방명록 통계 행이 없으면 첫 조회가 primary에서 만들므로 미리 생성
+        GuestbookService.create_missing_statistics([invitation.pk])
+        return invitation
+
+    @pytest.fixture
+    def guestbook_url(self, invitation):
+        return f"/api/v1/invitations/slug/{invitation.url_slug}/guestbooks/"
+
+    def count_queries(self, client_method, *args, **kwargs):
+        with CaptureQueriesContext(connections["default"]) as primary:
+            with CaptureQueriesContext(connections["replica"]) as replica:
+                response = client_method(*args, **kwargs)
+        return response, len(primary), len(replica)
+
+    def test_anonymous_reads_use_replica(self, api_client, guestbook_url):
+        response, primary, replica = self.count_queries(api_client.get, guestbook_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert primary == 0
+        assert replica > 0
+
+    def test_authenticated_reads_use_primary(self, api_client, user):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+        response, primary, replica = self.count_queries(api_client.get, "/api/v1/invitations/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert primary > 0
+        assert replica == 0
+
+    def test_write_pins_client_to_primary(self, api_client, invitation, guestbook_url, settings):
+        """방명록 작성 직후 같은 클라이언트의 조회는 primary에서 읽어 자신의 글이 보이는지 테스트"""
+        response = api_client.post(
+            f"/api/v1/invitations/{invitation.id}/guestbooks/",
+            {"author_name": "김철수", "message": "축하합니다!"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.cookies[settings.READ_REPLICAS["COOKIE_NAME"]]["max-age"] == 10
+
+        response, primary, replica = self.count_queries(api_client.get, guestbook_url)
+        assert response.data["results"][0]["author_name"] == "김철수"
+        assert primary > 0
+        assert replica == 0
+
+    def test_async_requests_check_session_user(self, async_client, user, guestbook_url):
+        """ASGI 요청에서도 익명 조회는 복제본, 로그인 세션이 있으면 primary에서 읽는지 테스트"""
+        response, primary, replica = self.count_queries(async_to_sync(async_client.get), guestbook_url)
+        assert response.status_code == status.HTTP_200_OK
+        assert primary == 0
+        assert replica > 0
+
+        async_client.force_login(user)
+        response, _, replica = self.count_queries(async_to_sync(async_client.get), guestbook_url)
+        assert response.status_code == status.HTTP_200_OK
+        assert replica == 0
+
+    def test_unhealthy_replica_is_skipped(self, api_client, guestbook_url, monkeypatch):
+        monkeypatch.setattr(common.db_router, "_measure_lag", lambda alias: 30.0)
+
+        _, primary, replica = self.count_queries(api_client.get, guestbook_url)
+
+        assert primary > 0
+        assert replica == 0
+
+    def test_failing_replica_is_skipped(self, monkeypatch):
+        def fail(alias):
+            raise OperationalError("connection refused")
+
+        monkeypatch.setattr(common.db_router, "_measure_lag", fail)
+        token = allow_replica_reads()
+        try:
+            assert ReadReplicaRouter().db_for_read(User) == "default"
+        finally:
+            reset_replica_reads(token)
+
+    @staticmethod
+    def fail_queries(execute, sql, params, many, context):
+        raise OperationalError("server has gone away")
+
+    def test_failed_replica_read_retries_on_primary(self, api_client, guestbook_url):
+        """복제본 읽기가 실패하면 복제본을 제외하고 primary에서 다시 읽는지 테스트"""
+        # 상태 확인은 통과한 뒤 요청 처리 중에 실패하는 경우
+        assert replica_health.is_healthy("replica")
+        with connections["replica"].execute_wrapper(self.fail_queries):
+            response, primary, _ = self.count_queries(api_client.get, guestbook_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert primary > 0
+        assert not replica_health.is_healthy("replica")
+
+    def test_failed_replica_read_retries_on_primary_async(self, async_client, guestbook_url):
+        # 상태 확인은 통과한 뒤 요청 처리 중에 실패하는 경우
+        assert replica_health.is_healthy("replica")
+        with connections["replica"].execute_wrapper(self.fail_queries):
+            response, primary, _ = self.count_queries(async_to_sync(async_client.get), guestbook_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert primary > 0
+        assert not replica_health.is_healthy("replica")
+
+    def test_primary_errors_are_not_retried(self, api_client, guestbook_url):
+        """primary에서만 읽은 요청의 오류는 복제본을 제외하지 않는지 테스트"""
+        api_client.cookies[common.db_router.get_replica_settings()["COOKIE_NAME"]] = "1"
+        with connections["default"].execute_wrapper(self.fail_queries):
+            with pytest.raises(OperationalError):
+                api_client.get(guestbook_url)
+
+        assert replica_health.is_healthy("replica")
+
+    def test_reads_outside_requests_and_transactions_use_primary(self):
+        router = ReadReplicaRouter()
+        assert router.db_for_read(User) == "default"
+
+        token = allow_replica_reads()
+        try:
+            assert router.db_for_read(User) == "replica"
+            with use_primary():
+                assert router.db_for_read(User) == "default"
+            with transaction.atomic():
+                assert router.db_for_read(User) == "default"
+        finally:
+            reset_replica_reads(token)
+
+
+@pytest.mark.django_db
+class TestQueryInstrumentationMiddleware:
+    """요청별 쿼리 계측 미들웨어 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def enabled(self, settings):
+        settings.QUERY_INSTRUMENTATION = {**settings.QUERY_INSTRUMENTATION, "ENABLED": True}
+
+    def test_server_timing_and_log_fields(self, api_client, caplog):
+        with caplog.at_level(logging.INFO, logger="ourhour.queries"):
+            response = api_client.get("/api/v1/templates/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Server-Timing"].startswith("db;dur=")
+        assert 'desc="queries=1 duplicates=0"' in response["Server-Timing"]
+        record = caplog.records[-1]
+        assert record.levelno == logging.INFO
+        assert record.query_count == 1
+        assert record.path == "/api/v1/templates/"
+        assert record.duplicate_queries == []
+
+    def test_repeated_queries_logged_as_warning(self, caplog, rf):
+        def view(request):
+            for _ in range(3):
+                User.objects.filter(pk=1).exists()
+            return HttpResponse()
+
+        with caplog.at_level(logging.INFO, logger="ourhour.queries"):
+            response = QueryInstrumentationMiddleware(view)(rf.get("/"))
+
+        assert 'duplicates=1"' in response["Server-Timing"]
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        assert record.duplicate_queries[0]["count"] == 3
+
+    def test_disabled_by_default(self, api_client, settings):
+        settings.QUERY_INSTRUMENTATION = {**settings.QUERY_INSTRUMENTATION, "ENABLED": False}
+
+        assert "Server-Timing" not in api_client.get("/api/v1/templates/")
+
+
+class TestLatencyHistogram:
+    """지연 시간 히스토그램 테스트"""
+
+    def test_quantiles_interpolated_within_bucket(self):
+        histogram = LatencyHistogram([0.1, 0.2, 0.4])
+        for value in [0.05] * 50 + [0.15] * 45 + [0.3] * 5:
+            histogram.observe(value)
+
+        assert histogram.count == 100
+        assert histogram.quantile(0.5) == pytest.approx(0.1)
+        assert histogram.quantile(0.95) == pytest.approx(0.2)
+        assert histogram.quantile(0.99) == pytest.approx(0.36)
+
+    def test_overflow_reported_as_last_bound(self):
+        histogram = LatencyHistogram([0.1, 0.2])
+        histogram.observe(5.0)
+
+        assert histogram.counts == [0, 0, 1]
+        assert histogram.quantile(0.99) == 0.2
+
+    def test_prometheus_exposition(self):
+        histogram = LatencyHistogram([0.1, 0.5])
+        histogram.observe(0.05)
+        histogram.observe(0.3)
+
+        text = render_prometheus({("invitation-rsvps", "rsvps", "POST", "2xx"): histogram})
+
+        labels = 'view="invitation-rsvps",action="rsvps",method="POST",status="2xx"'
+        assert "# TYPE ourhour_request_duration_seconds histogram" in text
+        assert f'ourhour_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+        assert f'ourhour_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"ourhour_request_duration_seconds_count{{{labels}}} 2" in text
+        assert f'ourhour_request_duration_seconds_quantile{{{labels},quantile="0.95"}}' in text
+
+
+@pytest.mark.django_db
+class TestRequestMetrics:
+    """요청 지표 미들웨어/엔드포인트 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def enabled(self, settings):
+        settings.METRICS = {**settings.METRICS, "ENABLED": True, "DIRECTORY": None, "TOKEN": None}
+        registry.reset()
+        yield
+        registry.reset()
+
+    def test_records_view_and_action(self, authenticated_client):
+        authenticated_client.get("/api/v1/invitations/")
+        authenticated_client.get("/api/v1/invitations/999999/rsvps/")
+
+        histograms = registry.snapshot()
+        assert histograms[("invitation-list", "list", "GET", "2xx")].count == 1
+        assert histograms[("invitation-rsvps", "rsvps", "GET", "4xx")].count == 1
+
+    def test_metrics_endpoint(self, api_client, settings):
+        settings.METRICS = {**settings.METRICS, "TOKEN": "secret"}
+        api_client.get("/api/v1/templates/")
+
+        response = api_client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert 'view="template-list",action="list",method="GET",status="2xx"' in response.content.decode()
+        # /metrics 요청 자체는 기록하지 않음
+        assert all(labels[0] != "metrics" for labels in registry.snapshot())
+
+    def test_metrics_endpoint_access(self, api_client, settings):
+        # 토큰이 없으면 DEBUG가 아닐 때 내부 주소(프록시 경유 요청 포함)도 거부
+        assert api_client.get("/metrics").status_code == status.HTTP_403_FORBIDDEN
+        settings.DEBUG = True
+        assert api_client.get("/metrics").status_code == status.HTTP_200_OK
+        assert api_client.get("/metrics", REMOTE_ADDR="8.8.8.8").status_code == status.HTTP_403_FORBIDDEN
+
+        settings.METRICS = {**settings.METRICS, "TOKEN": "secret"}
+        assert api_client.get("/metrics").status_code == status.HTTP_403_FORBIDDEN
+        response = api_client.get("/metrics", REMOTE_ADDR="8.8.8.8", HTTP_AUTHORIZATION="Bearer secret")
+        assert response.status_code == status.HTTP_200_OK
+
+        settings.METRICS = {**settings.METRICS, "ENABLED": False}
+        assert api_client.get("/metrics").status_code == status.HTTP_404_NOT_FOUND
+
+    def test_worker_snapshots_merged(self, api_client, settings, tmp_path):
+        settings.METRICS = {**settings.METRICS, "DIRECTORY": str(tmp_path)}
+        labels = ("template-list", "list", "GET", "2xx")
+        other = LatencyHistogram(settings.METRICS["BUCKETS"])
+        other.observe(0.02)
+        # 다른 워커가 저장한 스냅샷
+        (tmp_path / "1.json").write_text(json.dumps([{"labels": list(labels), **other.to_dict()}]))
+
+        api_client.get("/api/v1/templates/")
+        registry.flush()
+
+        assert registry.collect()[labels].count == 2
+        assert (tmp_path / f"{os.getpid()}.json").exists()
+
+    def test_exited_worker_snapshot_archived(self, settings, tmp_path):
+        """종료된 워커의 값은 archived.json에 누적되고, 같은 pid의 새 워커가 덮어써도 줄어들지 않는지 테스트"""
+        settings.METRICS = {**settings.METRICS, "DIRECTORY": str(tmp_path)}
+        labels = ("template-list", "list", "GET", "2xx")
+        histogram = LatencyHistogram(settings.METRICS["BUCKETS"])
+        histogram.observe(0.02)
+        snapshot = json.dumps([{"labels": list(labels), **histogram.to_dict()}])
+        (tmp_path / "1.json").write_text(snapshot)
+        (tmp_path / "2.json").write_text(snapshot)
+
+        archive_worker_snapshot(1)
+        archive_worker_snapshot(1)
+
+        assert not (tmp_path / "1.json").exists()
+        assert registry.collect()[labels].count == 2
+
+        # 종료된 워커와 같은 pid로 시작한 워커의 첫 저장
+        (tmp_path / f"{os.getpid()}.json").write_text(snapshot)
+        registry._owner_pid = None
+        registry.observe(labels, 0.03)
+        registry.flush()
+
+        assert registry.collect()[labels].count == 4
+
+        clear_snapshots()
+        assert list(tmp_path.glob("*.json")) == []
+
+
+@pytest.mark.django_db
+class TestProfilingMiddleware:
+    """표본 요청 프로파일링 테스트"""
+
+    @pytest.fixture
+    def config(self, settings, tmp_path):
+        settings.PROFILING = {
+            **settings.PROFILING,
+            "ENABLED": True,
+            "SAMPLE_RATE": 1.0,
+            "KEEP": 2,
+            "MIN_DURATION": 0,
+            "DIRECTORY": str(tmp_path),
+        }
+        return settings.PROFILING
+
+    def test_keeps_slowest_requests(self, config, rf):
+        for delay in (0.03, 0.01, 0.05, 0.02):
+
+            def view(request, delay=delay):
+                time.sleep(delay)
+                return HttpResponse()
+
+            ProfilingMiddleware(view)(rf.get("/slow/"))
+
+        records = load_profile_records(config["DIRECTORY"])
+        assert [round(record["duration"], 2) for record in records] == [0.05, 0.03]
+        assert records[0]["path"] == "/slow/"
+        assert len(list(Path(config["DIRECTORY"]).iterdir())) == 4
+        assert pstats.Stats(records[0]["profile"]).total_calls > 0
+
+    def test_not_sampled(self, config, rf, settings):
+        settings.PROFILING = {**config, "SAMPLE_RATE": 0}
+
+        ProfilingMiddleware(lambda request: HttpResponse())(rf.get("/"))
+
+        assert load_profile_records(config["DIRECTORY"]) == []
+
+    def test_summarize_profiles_command(self, config, api_client):
+        api_client.get("/api/v1/templates/")
+
+        out = StringIO()
+        call_command("summarize_profiles", "--limit", "5", stdout=out)
+
+        output = out.getvalue()
+        assert "느린 요청 1건" in output
+        assert "GET /api/v1/templates/  (template-list [list]" in output
+        assert "function calls" in output
+
+        with pytest.raises(CommandError):
+            call_command("summarize_profiles", "--view", "invitation-rsvps", stdout=StringIO())
+
+
+class TestLoggingPipeline:
+    """요청 로그/비동기 로깅 테스트"""
+
+    @pytest.mark.django_db
+    def test_request_log_fields(self, api_client, caplog):
+        with caplog.at_level(logging.INFO, logger="ourhour.requests"):
+            response = api_client.get("/api/v1/templates/", HTTP_X_REQUEST_ID="req-123")
+
+        assert response["X-Request-ID"] == "req-123"
+        record = caplog.records[-1]
+        assert record.view == "template-list"
+        assert record.action == "list"
+        assert record.status_code == 200
+        assert record.query_count == 1
+        assert record.duration_ms >= 0
+
+    @pytest.mark.django_db
+    def test_invalid_request_id_replaced(self, api_client):
+        response = api_client.get("/api/v1/templates/", HTTP_X_REQUEST_ID="bad id\n")
+
+        assert len(response["X-Request-ID"]) == 32
+
+    def test_json_formatter_with_request_id(self):
+        record = logging.LogRecord("ourhour.requests", logging.INFO, __file__, 1, "%s건", (3,), None)
+        record.query_count = 3
+        token = set_request_id("req-1")
+        try:
+            RequestContextFilter().filter(record)
+        finally:
+            reset_request_id(token)
+
+        data = json.loads(JSONFormatter().format(record))
+
+        assert data["message"] == "3건"
+        assert data["request_id"] == "req-1"
+        assert data["query_count"] == 3
+        assert data["level"] == "INFO"
+
+    def test_queue_full_drops_without_blocking(self):
+        release = threading.Event()
+        output = StringIO()
+
+        class BlockingStream:
+            def write(self, text):
+                release.wait(5)
+                output.write(text)
+
+            def flush(self):
+                pass
+
+        handler = QueueStreamHandler(maxsize=2, stream=BlockingStream())
+        handler.setFormatter(JSONFormatter())
+        logger = logging.getLogger("ourhour.tests.queue")
+        logger.addHandler(handler)
+        logger.propagate = False
+        try:
+            start = time.monotonic()
+            for index in range(10):
+                logger.warning("record %d", index)
+            # 출력이 막혀 있어도 요청 스레드는 기다리지 않음
+            assert time.monotonic() - start < 1
+            assert 5 <= handler.dropped <= 8
+
+            release.set()
+            handler.flush()
+            logger.warning("after")
+            handler.flush()
+        finally:
+            logger.removeHandler(handler)
+            logger.propagate = True
+            handler.close()
+
+        messages = [json.loads(line)["message"] for line in output.getvalue().splitlines()]
+        assert messages[0] == "record 0"
+        assert messages[-2:] == ["after", f"로그 큐가 가득 차서 {handler.dropped}건을 버렸습니다."]
+
+
+@pytest.mark.django_db
+class TestAsyncMiddleware:
+    """ASGI(비동기) 요청 처리 테스트"""
+
+    def test_all_middleware_supports_async(self, settings):
+        """동기 전용 미들웨어가 있으면 ASGI에서 요청 전체가 스레드로 넘어가므로 모두 비동기를 지원해야 함"""
+        for path in settings.MIDDLEWARE:
+            assert import_string(path).async_capable, path
+
+    def test_request_log_metrics_and_query_timing(self, async_client, settings, caplog):
+        settings.METRICS = {**settings.METRICS, "ENABLED": True, "DIRECTORY": None, "TOKEN": None}
+        settings.QUERY_INSTRUMENTATION = {**settings.QUERY_INSTRUMENTATION, "ENABLED": True}
+        registry.reset()
+        try:
+            with caplog.at_level(logging.INFO, logger="ourhour.requests"):
+                response = async_to_sync(async_client.get)("/api/v1/templates/", headers={"X-Request-ID": "req-async"})
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response["X-Request-ID"] == "req-async"
+            assert 'desc="queries=1 duplicates=0"' in response["Server-Timing"]
+            record = [record for record in caplog.records if record.name == "ourhour.requests"][-1]
+            assert record.view == "template-list"
+            assert record.query_count == 1
+            assert registry.snapshot()[("template-list", "list", "GET", "2xx")].count == 1
+        finally:
+            registry.reset()
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TemplatesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.templates"
+
+    def ready(self):
+        from apps.templates import signals  # noqa: F401
@@ -0,0 +1,46 @@
+"""
+Template 서비스 레이어
+"""
+
+from typing import Optional
+
+from apps.shared.cache import cached_service
+from apps.templates.models import Template
+from apps.templates.serializers import TemplateSerializer
+from common.db_router import use_primary
+
+
+class TemplateService:
+    """Template 관련 비즈니스 로직 처리"""
+
+    @staticmethod
+    @cached_service("templates")
+    @use_primary()
+    def get_template_data(template_id: int) -> Optional[dict]:
+        """
+        사용 가능한 템플릿 상세 응답 데이터 조회 (서비스 캐시 사용)
+
+        템플릿은 거의 바뀌지 않고 모든 청첩장 편집 화면에서 읽히므로 워커 LRU와 공유 캐시에 둡니다.
+        템플릿이 저장/삭제되면 시그널에서 invalidate()로 모든 워커의 항목을 무효화합니다.
+        캐시를 채우는 조회이므로 복제본이 아닌 primary에서 읽습니다.
+
+        Args:
+            template_id: 템플릿 ID
+
+        Returns:
+            dict: TemplateSerializer 출력, 없거나 비활성화된 템플릿이면 None
+        """
+        template = Template.objects.filter(pk=template_id, is_active=True).first()
+        if template is None:
+            return None
+        return dict(TemplateSerializer(template).data)
+
+    @staticmethod
+    async def aget_template_data(template_id: int) -> Optional[dict]:
+        """get_template_data()의 비동기 버전 (캐시는 비동기 API로 읽고, 미스일 때만 스레드에서 조회)"""
+        return await TemplateService.get_template_data.acall(template_id)
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """템플릿 서비스 캐시 무효화"""
+        TemplateService.get_template_data.invalidate()
@@ -0,0 +1,21 @@
+"""
+Templates 앱 시그널
+
+템플릿이 변경되면 서비스 캐시를 무효화합니다.
+트랜잭션 중 다른 요청이 이전 값을 다시 채울 수 있으므로 커밋 후에도 한 번 더 무효화합니다.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.templates.models import Template
+from apps.templates.services.template_service import TemplateService
+
+
+@receiver(post_save, sender=Template)
+@receiver(post_delete, sender=Template)
+def invalidate_template_cache(sender, instance, **kwargs):
+    """템플릿 생성/수정/삭제 시 서비스 캐시 무효화"""
+    TemplateService.invalidate_cache()
+    transaction.on_commit(TemplateService.invalidate_cache)
@@ -4,8 +4,11 @@ Templates 앱 테스트
 
 import pytest
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 
 from apps.templates.models import Template
+from apps.templates.serializers import TemplateListSerializer
+from common.testing import query_budget
 
 
 @pytest.fixture
@@ -152,6 +155,13 @@ class TestTemplateList:
         assert response.data["results"][0]["id"] == high_usage.id
         assert response.data["results"][0]["usage_count"] == 100
 
+    def test_list_matches_serializer_output(self, api_client, template, premium_template):
+        """목록 응답이 TemplateListSerializer 출력과 바이트 단위로 같은지 테스트"""
+        response = api_client.get("/api/v1/templates/")
+
+        expected = TemplateListSerializer(Template.objects.filter(is_active=True).order_by("-created_at"), many=True)
+        assert JSONRenderer().render(response.data["results"]) == JSONRenderer().render(expected.data)
+
 
 @pytest.mark.django_db
 class TestTemplateRetrieve:
@@ -181,3 +191,43 @@ class TestTemplateRetrieve:
         response = api_client.get("/api/v1/templates/99999/")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_retrieve_uses_service_cache(self, api_client, template, django_assert_num_queries):
+        """두 번째 상세 조회는 쿼리 없이 서비스 캐시에서 응답하는지 테스트"""
+        url = f"/api/v1/templates/{template.id}/"
+        first = api_client.get(url)
+
+        with django_assert_num_queries(0):
+            second = api_client.get(url)
+
+        assert second.data == first.data
+
+    def test_retrieve_reflects_template_update(self, api_client, template):
+        """템플릿 수정/비활성화 시 캐시가 무효화되는지 테스트"""
+        url = f"/api/v1/templates/{template.id}/"
+        api_client.get(url)
+
+        template.name = "수정된 템플릿"
+        template.save()
+        assert api_client.get(url).data["name"] == "수정된 템플릿"
+
+        template.is_active = False
+        template.save()
+        assert api_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestQueryBudgets:
+    """템플릿 API 쿼리 예산 (목록 길이와 관계없이 일정)"""
+
+    def test_list(self, api_client, template, premium_template):
+        with query_budget(2):
+            response = api_client.get("/api/v1/templates/?category=MODERN&ordering=-usage_count")
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_retrieve(self, api_client, template):
+        with query_budget(1):
+            response = api_client.get(f"/api/v1/templates/{template.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
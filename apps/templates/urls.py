@@ -2,12 +2,24 @@
 Templates 앱 URL 설정
 """
 
-from django.urls import include, path
+from django.conf import settings
+from django.urls import include, path, re_path
 from rest_framework.routers import DefaultRouter
 
-from apps.templates.views import TemplateViewSet
+from apps.templates.views import (
+    AsyncTemplateDetailView,
+    AsyncTemplateListView,
+    TemplateViewSet,
+)
 
 router = DefaultRouter()
 router.register(r"", TemplateViewSet, basename="template")
 
 urlpatterns = router.urls
+
+# ASGI 배포에서는 목록/상세를 비동기 뷰로 제공 (라우터의 같은 URL보다 먼저 매칭)
+if settings.ASYNC_PUBLIC_VIEWS:
+    urlpatterns = [
+        path("", AsyncTemplateListView.as_view(), name="template-list"),
+        re_path(r"^(?P<pk>[^/.]+)/$", AsyncTemplateDetailView.as_view(), name="template-detail"),
+    ] + urlpatterns
@@ -2,12 +2,21 @@
 Templates 앱 뷰
 """
 
+from django.http import Http404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, viewsets
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
+from apps.shared.serializers import compile_projection
 from apps.templates.models import Template
 from apps.templates.serializers import TemplateListSerializer, TemplateSerializer
+from apps.templates.services.template_service import TemplateService
+from common.views import AsyncAPIView
+
+# 목록 응답용 고속 직렬화 (TemplateListSerializer와 같은 출력)
+TEMPLATE_LIST_PROJECTION = compile_projection(TemplateListSerializer)
 
 
 class TemplateViewSet(viewsets.ReadOnlyModelViewSet):
@@ -28,3 +37,70 @@ class TemplateViewSet(viewsets.ReadOnlyModelViewSet):
         if self.action == "list":
             return TemplateListSerializer
         return TemplateSerializer
+
+    def list(self, request, *args, **kwargs):
+        """템플릿 목록 (필요한 컬럼만 .values()로 읽어 직렬화)"""
+        queryset = self.filter_queryset(self.get_queryset()).values(*TEMPLATE_LIST_PROJECTION.fields)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(TEMPLATE_LIST_PROJECTION.many(page))
+        return Response(TEMPLATE_LIST_PROJECTION.many(queryset))
+
+    def retrieve(self, request, *args, **kwargs):
+        """템플릿 상세 (서비스 캐시 사용)"""
+        try:
+            template_id = int(kwargs[self.lookup_field])
+        except ValueError:
+            raise Http404
+        data = TemplateService.get_template_data(template_id)
+        if data is None:
+            raise Http404
+        return Response(data)
+
+
+class AsyncTemplateListView(AsyncAPIView):
+    """
+    템플릿 목록 (비동기, settings.ASYNC_PUBLIC_VIEWS일 때 TemplateViewSet.list 대신 사용)
+
+    필터/검색/정렬/페이지네이션 설정은 TemplateViewSet과 같고, COUNT와 목록은 비동기 ORM으로 조회합니다.
+    """
+
+    actions = {"get": "list"}
+    queryset = TemplateViewSet.queryset
+    filter_backends = TemplateViewSet.filter_backends
+    filterset_fields = TemplateViewSet.filterset_fields
+    search_fields = TemplateViewSet.search_fields
+    ordering_fields = TemplateViewSet.ordering_fields
+    ordering = TemplateViewSet.ordering
+    pagination_class = api_settings.DEFAULT_PAGINATION_CLASS
+
+    def get_queryset(self):
+        return self.queryset.all()
+
+    def filter_queryset(self, queryset):
+        for backend in self.filter_backends:
+            queryset = backend().filter_queryset(self.request, queryset, self)
+        return queryset
+
+    async def get(self, request):
+        queryset = self.filter_queryset(self.get_queryset()).values(*TEMPLATE_LIST_PROJECTION.fields)
+        paginator = self.pagination_class()
+        page = await paginator.apaginate_queryset(queryset, request, view=self)
+        return paginator.get_paginated_response(TEMPLATE_LIST_PROJECTION.many(page))
+
+
+class AsyncTemplateDetailView(AsyncAPIView):
+    """템플릿 상세 (비동기, settings.ASYNC_PUBLIC_VIEWS일 때 TemplateViewSet.retrieve 대신 사용)"""
+
+    actions = {"get": "retrieve"}
+
+    async def get(self, request, pk):
+        try:
+            template_id = int(pk)
+        except ValueError:
+            raise Http404
+        data = await TemplateService.aget_template_data(template_id)
+        if data is None:
+            raise Http404
+        return Response(data)
@@ -5,6 +5,9 @@ Users 앱 테스트
 import pytest
 from django.contrib.auth import get_user_model
 from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from common.testing import query_budget
 
 User = get_user_model()
 
@@ -127,3 +130,23 @@ class TestMeAPI:
         response = api_client.get("/api/v1/auth/me/")
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestQueryBudgets:
+    """인증 API 쿼리 예산"""
+
+    def test_login(self, api_client, user):
+        with query_budget(3):
+            response = api_client.post(
+                "/api/v1/auth/login/", {"email": "test@example.com", "password": "testpass123"}, format="json"
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_me_with_token(self, api_client, user):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+        with query_budget(1):
+            response = api_client.get("/api/v1/auth/me/")
+
+        assert response.status_code == status.HTTP_200_OK
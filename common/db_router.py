@@ -0,0 +1,208 @@
+"""
+읽기 복제본 데이터베이스 라우터
+
+쓰기는 항상 default(primary)로 보내고, ReadReplicaMiddleware가 허용한 요청
+(인증 정보가 없는 조회 요청)의 읽기만 정상 상태의 복제본으로 보냅니다.
+
+- 요청 밖(관리 명령, drain 워커 등)과 트랜잭션 안의 읽기는 primary를 사용합니다.
+- 방금 쓰기를 한 클라이언트는 STICKY_SECONDS 동안 primary에 고정됩니다. (read-your-writes, 쿠키)
+- 복제본은 CHECK_INTERVAL마다 상태를 확인하여 연결 실패 또는 지연이 MAX_LAG를 넘으면 제외합니다.
+- 요청 처리 중 복제본 읽기가 OperationalError로 실패하면 ReadReplicaMiddleware가 그 복제본을
+  다음 확인 시점까지 제외하고 뷰를 primary에서 다시 실행합니다.
+- 캐시를 채우는 조회는 use_primary()로 감싸 지연된 데이터가 캐시에 오래 남지 않도록 합니다.
+
+로컬에서는 SQLite 두 개로 확인할 수 있습니다. (config/settings/test.py 참고)
+"""
+
+import contextvars
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READ_REPLICAS = {
+    "ALIASES": [],
+    "STICKY_SECONDS": 10,
+    "COOKIE_NAME": "ourhour_primary",
+    "MAX_LAG": 5,
+    "CHECK_INTERVAL": 5,
+}
+
+# 현재 요청(컨텍스트)에서 복제본 읽기를 허용하는지 여부
+_replica_allowed: contextvars.ContextVar[bool] = contextvars.ContextVar("replica_allowed", default=False)
+# 현재 요청(컨텍스트)에서 읽기를 보낸 복제본 (track_replica_reads()로 기록 시작)
+_replicas_used: contextvars.ContextVar[Optional[Set[str]]] = contextvars.ContextVar("replicas_used", default=None)
+
+
+def get_replica_settings() -> dict:
+    """READ_REPLICAS 설정을 기본값과 병합하여 반환"""
+    return {**DEFAULT_READ_REPLICAS, **getattr(settings, "READ_REPLICAS", {})}
+
+
+def allow_replica_reads(allowed: bool = True) -> contextvars.Token:
+    """현재 컨텍스트의 복제본 읽기 허용 여부 설정 (reset_replica_reads()로 되돌림)"""
+    return _replica_allowed.set(allowed)
+
+
+def reset_replica_reads(token: contextvars.Token) -> None:
+    _replica_allowed.reset(token)
+
+
+def track_replica_reads() -> contextvars.Token:
+    """현재 컨텍스트에서 읽기를 보낸 복제본 기록 시작 (reset_replica_tracking()으로 되돌림)"""
+    return _replicas_used.set(set())
+
+
+def reset_replica_tracking(token: contextvars.Token) -> None:
+    _replicas_used.reset(token)
+
+
+def get_replicas_used() -> Set[str]:
+    """track_replica_reads() 이후 읽기를 보낸 복제본 목록"""
+    return set(_replicas_used.get() or ())
+
+
+@contextmanager
+def use_primary():
+    """블록 안의 읽기를 primary로 고정"""
+    token = _replica_allowed.set(False)
+    try:
+        yield
+    finally:
+        _replica_allowed.reset(token)
+
+
+def _measure_lag(alias: str) -> Optional[float]:
+    """
+    복제본 지연(초) 측정
+
+    Returns:
+        float: 지연 시간, 측정할 수 없는 DB(SQLite 등)는 연결만 확인하고 0
+
+    Raises:
+        Exception: 연결/조회 실패
+    """
+    connection = connections[alias]
+    with connection.cursor() as cursor:
+        if connection.vendor == "mysql":
+            cursor.execute("SHOW REPLICA STATUS")
+            row = cursor.fetchone()
+            if row is None:
+                return 0.0
+            columns = [column[0] for column in cursor.description]
+            lag = dict(zip(columns, row)).get("Seconds_Behind_Source")
+            # 복제가 멈춘 경우 NULL
+            return None if lag is None else float(lag)
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+            )
+            lag = cursor.fetchone()[0]
+            return 0.0 if lag is None else float(lag)
+        cursor.execute("SELECT 1")
+        return 0.0
+
+
+class ReplicaHealth:
+    """
+    워커별 복제본 상태 확인 결과
+
+    상태는 CHECK_INTERVAL 동안 재사용하며, 확인은 해당 복제본으로 읽기를 보내려는 시점에 수행합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._status: Dict[str, Tuple[bool, float]] = {}
+
+    def is_healthy(self, alias: str) -> bool:
+        config = get_replica_settings()
+        now = time.monotonic()
+        status = self._status.get(alias)
+        if status is not None and now - status[1] < config["CHECK_INTERVAL"]:
+            return status[0]
+
+        with self._lock:
+            status = self._status.get(alias)
+            if status is not None and now - status[1] < config["CHECK_INTERVAL"]:
+                return status[0]
+            healthy = self.check(alias, config["MAX_LAG"])
+            self._status[alias] = (healthy, now)
+        return healthy
+
+    @staticmethod
+    def check(alias: str, max_lag: float) -> bool:
+        try:
+            lag = _measure_lag(alias)
+        except Exception:
+            logger.warning("읽기 복제본 %s에 연결할 수 없어 제외합니다.", alias, exc_info=True)
+            connections[alias].close()
+            return False
+        if lag is None or lag > max_lag:
+            logger.warning("읽기 복제본 %s의 지연(%s초)이 커서 제외합니다.", alias, lag)
+            return False
+        return True
+
+    def mark_unhealthy(self, alias: str) -> None:
+        """다음 확인 시점까지 복제본 제외 (요청 처리 중 읽기가 실패한 경우)"""
+        logger.warning("읽기 복제본 %s에서 읽기가 실패하여 제외합니다.", alias)
+        with self._lock:
+            self._status[alias] = (False, time.monotonic())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._status.clear()
+
+
+replica_health = ReplicaHealth()
+
+
+def get_healthy_replicas() -> List[str]:
+    """현재 읽기를 보낼 수 있는 복제본 목록"""
+    return [alias for alias in get_replica_settings()["ALIASES"] if replica_health.is_healthy(alias)]
+
+
+class ReadReplicaRouter:
+    """
+    primary/복제본 라우터
+
+    DATABASE_ROUTERS = ["common.db_router.ReadReplicaRouter"]
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _replica_allowed.get():
+            return DEFAULT_DB_ALIAS
+        # 쓰기 트랜잭션 안에서는 방금 쓴 데이터를 읽어야 하므로 primary 사용
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        replicas = get_healthy_replicas()
+        if not replicas:
+            return DEFAULT_DB_ALIAS
+        alias = random.choice(replicas)
+        used = _replicas_used.get()
+        if used is not None:
+            used.add(alias)
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 primary와 같은 데이터이므로 어느 DB에서 읽은 객체끼리도 관계를 허용
+        databases = {DEFAULT_DB_ALIAS, *get_replica_settings()["ALIASES"]}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본 스키마는 복제로 따라오므로 마이그레이션하지 않음
+        if db in get_replica_settings()["ALIASES"]:
+            return False
+        return None
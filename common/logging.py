@@ -0,0 +1,199 @@
+"""
+로깅 도우미
+
+- RequestContextFilter: 현재 요청의 request_id를 로그 레코드에 추가 (common.middleware.RequestLogMiddleware)
+- JSONFormatter: 한 줄짜리 JSON 로그 (extra로 넘긴 필드 포함)
+- QueueStreamHandler: 요청 스레드는 제한된 크기의 큐에 넣기만 하고, 별도 스레드(QueueListener)가 출력
+
+stdout이 밀려도(컨테이너 런타임의 back-pressure) 요청 스레드가 멈추지 않도록,
+큐가 가득 차면 기다리지 않고 레코드를 버린 뒤 개수를 세어 두었다가, 다음에 큐에 여유가 생기면 WARNING으로 남깁니다.
+
+settings의 LOGGING_ASYNC로 동기(StreamHandler)/비동기(QueueStreamHandler)를 전환합니다.
+"""
+
+import atexit
+import contextvars
+import copy
+import datetime
+import json
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_request_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+
+# LogRecord 기본 속성 (이 외의 속성은 extra로 넘긴 필드)
+RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def get_request_id() -> Optional[str]:
+    """현재 요청의 ID (요청 밖에서는 None)"""
+    return _request_id.get()
+
+
+def set_request_id(request_id: Optional[str]) -> contextvars.Token:
+    """현재 컨텍스트의 요청 ID 설정 (reset_request_id()로 되돌림)"""
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token: contextvars.Token) -> None:
+    _request_id.reset(token)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    로그 레코드에 request_id 추가
+
+    QueueStreamHandler에서는 큐에 넣기 전(요청 스레드)에 실행되도록 핸들러의 filters에 지정합니다.
+    """
+
+    def filter(self, record):
+        if not hasattr(record, "request_id"):
+            record.request_id = _request_id.get()
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    JSON 한 줄 로그
+
+    {"timestamp": ..., "level": ..., "logger": ..., "message": ..., "request_id": ..., <extra 필드>}
+    """
+
+    def format(self, record):
+        data = {
+            "timestamp": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RESERVED_ATTRS and not key.startswith("_"):
+                data[key] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _QueueListener(QueueListener):
+    def enqueue_sentinel(self):
+        # 큐가 가득 차 있어도 종료 신호는 버리지 않음 (출력 스레드가 비우는 동안 대기)
+        self.queue.put(self._sentinel)
+
+
+class QueueStreamHandler(QueueHandler):
+    """
+    비동기 스트림 핸들러
+
+    LOGGING의 handlers에 지정하면, formatter는 실제로 출력하는 StreamHandler에 적용됩니다.
+    Python 3.12부터 dictConfig가 "class"로 지정한 QueueHandler에는 자체 큐(크기 제한 없음)를 넘기므로 "()"로 지정합니다.
+
+        "console": {
+            "()": "common.logging.QueueStreamHandler",
+            "formatter": "json",
+            "filters": ["request_context"],
+            "maxsize": 10000,
+        }
+
+    Args:
+        maxsize: 큐 크기 (가득 차면 버림)
+        stream: 출력 스트림 (기본값: sys.stderr, StreamHandler와 같음)
+    """
+
+    def __init__(self, maxsize: int = 10000, stream=None):
+        super().__init__(queue.Queue(maxsize))
+        self.target = logging.StreamHandler(stream)
+        self.dropped = 0
+        self._unreported = 0
+        self._lock = threading.Lock()
+        self._pid = None
+        self._listener: Optional[_QueueListener] = None
+        atexit.register(self.close)
+
+    def setFormatter(self, fmt):
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        """
+        큐에 넣을 레코드
+
+        메시지 인자와 예외는 요청 스레드에서 문자열로 만들어 두고(이후 값이 바뀌거나 pickle할 수 없는 경우 대비),
+        JSON 변환은 출력 스레드에서 합니다.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        self._ensure_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                self._unreported += 1
+            return
+        if self._unreported:
+            self._report_dropped()
+
+    def _report_dropped(self) -> None:
+        with self._lock:
+            count, self._unreported = self._unreported, 0
+        if not count:
+            return
+        record = logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0, "로그 큐가 가득 차서 %d건을 버렸습니다.", (count,), None
+        )
+        record.dropped_records = count
+        try:
+            self.queue.put_nowait(self.prepare(record))
+        except queue.Full:
+            with self._lock:
+                self._unreported += count
+
+    def _ensure_listener(self) -> None:
+        # gunicorn 등에서 fork된 워커에는 부모의 출력 스레드가 없으므로 프로세스마다 새로 시작
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._listener = _QueueListener(self.queue, self.target, respect_handler_level=True)
+            self._listener.start()
+            self._pid = os.getpid()
+
+    def flush(self):
+        """큐에 남은 레코드를 모두 출력 (출력 스레드는 다시 시작)"""
+        if self._pid == os.getpid() and self._listener is not None:
+            self._listener.stop()
+            self._listener.start()
+        self.target.flush()
+
+    def close(self):
+        with self._lock:
+            if self._pid == os.getpid() and self._listener is not None:
+                self._listener.stop()
+            self._listener = None
+            self._pid = None
+        self.target.close()
+        super().close()
+
+
+def get_dropped_log_count() -> int:
+    """현재 프로세스에서 QueueStreamHandler가 버린 로그 수"""
+    handlers = set(logging.getLogger().handlers)
+    for logger in logging.Logger.manager.loggerDict.values():
+        handlers.update(getattr(logger, "handlers", []))
+    return sum(handler.dropped for handler in handlers if isinstance(handler, QueueStreamHandler))
@@ -0,0 +1,293 @@
+"""
+요청 지연 시간 지표
+
+뷰(URL 이름)와 DRF 액션(rsvps, guestbooks, publish 등)별로 지연 시간 히스토그램을 모으고,
+Prometheus 텍스트 형식(0.0.4)으로 내보냅니다. (GET /metrics, common.views.metrics_view)
+
+- 히스토그램은 워커(프로세스)마다 메모리에 누적합니다.
+- METRICS["DIRECTORY"]를 지정하면 워커마다 FLUSH_INTERVAL 초 간격으로 {pid}.json 스냅샷을 쓰고,
+  내보낼 때 디렉터리의 모든 스냅샷을 합칩니다. (gunicorn 워커 여러 개를 한 번의 수집으로 확인)
+  종료된 워커의 스냅샷은 archived.json에 합쳐 누적값이 줄어들지 않게 하고, 서버 시작 시 디렉터리를 비웁니다.
+  (config/gunicorn.conf.py의 on_starting/child_exit 훅, 디렉터리는 서버 프로세스마다 따로 지정)
+- p50/p95/p99는 버킷 경계 사이를 선형 보간한 추정값입니다.
+"""
+
+import fcntl
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+DEFAULT_METRICS = {
+    "ENABLED": False,
+    "DIRECTORY": None,
+    "FLUSH_INTERVAL": 10,
+    "BUCKETS": [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+    "TOKEN": None,
+}
+METRIC_NAME = "ourhour_request_duration_seconds"
+QUANTILES = (0.5, 0.95, 0.99)
+LABEL_NAMES = ("view", "action", "method", "status")
+ARCHIVE_FILE = "archived.json"
+LOCK_FILE = ".lock"
+
+Labels = Tuple[str, str, str, str]
+
+
+def get_metrics_settings() -> dict:
+    """METRICS 설정을 기본값과 병합하여 반환"""
+    return {**DEFAULT_METRICS, **getattr(settings, "METRICS", {})}
+
+
+class LatencyHistogram:
+    """누적되지 않은(버킷별) 개수로 저장하는 히스토그램"""
+
+    def __init__(self, buckets: List[float], counts: Optional[List[int]] = None, total: float = 0.0):
+        self.buckets = list(buckets)
+        # 마지막 칸은 +Inf
+        self.counts = list(counts) if counts is not None else [0] * (len(self.buckets) + 1)
+        self.sum = total
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.sum += other.sum
+
+    def quantile(self, q: float) -> float:
+        """버킷 경계 사이를 선형 보간한 분위수 추정값 (관측값이 없으면 0)"""
+        total = self.count
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(self.buckets):
+                    # +Inf 칸은 마지막 경계값으로 표시
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                return lower + (self.buckets[index] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def to_dict(self) -> dict:
+        return {"counts": self.counts, "sum": self.sum}
+
+
+class MetricsRegistry:
+    """워커별 지연 시간 히스토그램 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[Labels, LatencyHistogram] = {}
+        self._last_flush = time.monotonic()
+        # 스냅샷 파일을 쓴 프로세스 (fork된 워커나 pid를 재사용한 워커는 첫 저장 전에 이전 파일을 보관)
+        self._owner_pid: Optional[int] = None
+
+    def observe(self, labels: Labels, duration: float) -> None:
+        config = get_metrics_settings()
+        with self._lock:
+            histogram = self._histograms.get(labels)
+            if histogram is None:
+                histogram = self._histograms[labels] = LatencyHistogram(config["BUCKETS"])
+            histogram.observe(duration)
+
+        if config["DIRECTORY"] and time.monotonic() - self._last_flush >= config["FLUSH_INTERVAL"]:
+            self.flush()
+
+    def snapshot(self) -> Dict[Labels, LatencyHistogram]:
+        with self._lock:
+            return {
+                labels: LatencyHistogram(histogram.buckets, histogram.counts, histogram.sum)
+                for labels, histogram in self._histograms.items()
+            }
+
+    def flush(self) -> None:
+        """현재 워커의 스냅샷을 METRICS["DIRECTORY"]/{pid}.json으로 저장"""
+        directory = get_metrics_settings()["DIRECTORY"]
+        self._last_flush = time.monotonic()
+        if not directory:
+            return
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        pid = os.getpid()
+        if self._owner_pid != pid:
+            # 같은 pid로 종료된 이전 워커의 파일을 덮어쓰면 누적값이 줄어들므로 먼저 보관
+            archive_worker_snapshot(pid, directory)
+            self._owner_pid = pid
+        _write_snapshot(directory / f"{pid}.json", self.snapshot())
+
+    def collect(self) -> Dict[Labels, LatencyHistogram]:
+        """
+        내보낼 히스토그램
+
+        DIRECTORY가 있으면 모든 워커 스냅샷(현재 워커는 최신 값)과 종료된 워커의 누적값을 합치고,
+        없으면 현재 워커 값만 반환합니다.
+        """
+        config = get_metrics_settings()
+        histograms = self.snapshot()
+        if not config["DIRECTORY"]:
+            return histograms
+
+        directory = Path(config["DIRECTORY"])
+        directory.mkdir(parents=True, exist_ok=True)
+        own_file = f"{os.getpid()}.json"
+        # 보관 도중(archived.json 갱신 후 워커 파일 삭제 전)의 파일을 두 번 세지 않도록 잠금
+        with _locked(directory):
+            for path in directory.glob("*.json"):
+                if path.name != own_file:
+                    _merge_histograms(histograms, _read_snapshot(path, config["BUCKETS"]))
+        return histograms
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+registry = MetricsRegistry()
+
+
+def _read_snapshot(path: Path, buckets: List[float]) -> Dict[Labels, LatencyHistogram]:
+    """스냅샷 파일 읽기 (없거나 읽을 수 없으면 빈 값, 버킷 설정이 바뀌기 전에 쓴 항목은 제외)"""
+    try:
+        rows = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return {
+        tuple(row["labels"]): LatencyHistogram(buckets, row["counts"], row["sum"])
+        for row in rows
+        if len(row["counts"]) == len(buckets) + 1
+    }
+
+
+def _write_snapshot(path: Path, histograms: Dict[Labels, LatencyHistogram]) -> None:
+    data = [{"labels": list(labels), **histogram.to_dict()} for labels, histogram in histograms.items()]
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(data))
+    # 읽는 쪽이 쓰다 만 파일을 보지 않도록 교체
+    temp_path.replace(path)
+
+
+def _merge_histograms(target: Dict[Labels, LatencyHistogram], source: Dict[Labels, LatencyHistogram]) -> None:
+    for labels, histogram in source.items():
+        if labels in target:
+            target[labels].merge(histogram)
+        else:
+            target[labels] = histogram
+
+
+@contextmanager
+def _locked(directory: Path):
+    """스냅샷 보관(archived.json 갱신)을 프로세스 사이에서 직렬화"""
+    with open(directory / LOCK_FILE, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def archive_worker_snapshot(pid: int, directory=None) -> None:
+    """
+    종료된 워커의 스냅샷을 archived.json에 합치고 삭제 (gunicorn child_exit 훅에서 호출)
+
+    Args:
+        pid: 워커 pid
+        directory: 스냅샷 디렉터리 (기본값: METRICS["DIRECTORY"])
+    """
+    directory = directory or get_metrics_settings()["DIRECTORY"]
+    if not directory:
+        return
+    directory = Path(directory)
+    path = directory / f"{pid}.json"
+    if not path.exists():
+        return
+    with _locked(directory):
+        buckets = get_metrics_settings()["BUCKETS"]
+        archived = _read_snapshot(directory / ARCHIVE_FILE, buckets)
+        _merge_histograms(archived, _read_snapshot(path, buckets))
+        _write_snapshot(directory / ARCHIVE_FILE, archived)
+        path.unlink(missing_ok=True)
+
+
+def clear_snapshots(directory=None) -> None:
+    """
+    이전 실행의 스냅샷 삭제 (서버 시작 시, gunicorn on_starting 훅에서 호출)
+
+    Args:
+        directory: 스냅샷 디렉터리 (기본값: METRICS["DIRECTORY"])
+    """
+    directory = directory or get_metrics_settings()["DIRECTORY"]
+    if not directory or not Path(directory).is_dir():
+        return
+    for path in Path(directory).iterdir():
+        if path.suffix in (".json", ".tmp"):
+            path.unlink(missing_ok=True)
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    return ",".join(f'{name}="{escape(str(value))}"' for name, value in labels)
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def render_prometheus(histograms: Optional[Dict[Labels, LatencyHistogram]] = None) -> str:
+    """Prometheus 텍스트 형식으로 변환"""
+    histograms = registry.collect() if histograms is None else histograms
+    lines = [
+        f"# HELP {METRIC_NAME} 뷰/액션별 요청 처리 시간",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    quantile_lines = [
+        f"# HELP {METRIC_NAME}_quantile 뷰/액션별 요청 처리 시간 분위수 추정값 (p50/p95/p99)",
+        f"# TYPE {METRIC_NAME}_quantile gauge",
+    ]
+    for labels in sorted(histograms):
+        histogram = histograms[labels]
+        base = list(zip(LABEL_NAMES, labels))
+        cumulative = 0
+        for bound, count in zip([*histogram.buckets, "+Inf"], histogram.counts):
+            cumulative += count
+            le = bound if bound == "+Inf" else _format_number(bound)
+            lines.append(f"{METRIC_NAME}_bucket{{{_format_labels([*base, ('le', le)])}}} {cumulative}")
+        lines.append(f"{METRIC_NAME}_sum{{{_format_labels(base)}}} {histogram.sum:.6f}")
+        lines.append(f"{METRIC_NAME}_count{{{_format_labels(base)}}} {histogram.count}")
+        for q in QUANTILES:
+            value = histogram.quantile(q)
+            quantile_lines.append(
+                f"{METRIC_NAME}_quantile{{{_format_labels([*base, ('quantile', str(q))])}}} {value:.6f}"
+            )
+    return "\n".join(lines + quantile_lines) + "\n"
+
+
+def get_request_labels(request, response) -> Labels:
+    """
+    요청의 지표 라벨 (view, action, method, status)
+
+    view는 URL 이름(예: invitation-rsvps), action은 DRF ViewSet 액션 이름(예: rsvps, publish, list)입니다.
+    URL에 매칭되지 않은 요청은 view="unmatched"로 묶어 라벨 수가 늘어나지 않도록 합니다.
+    """
+    match = getattr(request, "resolver_match", None)
+    view = (match.view_name or match._func_path) if match else "unmatched"
+    actions = getattr(match.func, "actions", None) if match else None
+    action = actions.get(request.method.lower(), "") if actions else ""
+    return view, action, request.method, f"{response.status_code // 100}xx"
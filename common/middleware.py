@@ -0,0 +1,365 @@
+"""
+공통 미들웨어
+"""
+
+import logging
+import re
+import time
+import uuid
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import OperationalError
+
+from common.db_router import (
+    allow_replica_reads,
+    get_replica_settings,
+    get_replicas_used,
+    replica_health,
+    reset_replica_reads,
+    reset_replica_tracking,
+    track_replica_reads,
+    use_primary,
+)
+from common.logging import reset_request_id, set_request_id
+from common.metrics import get_metrics_settings, get_request_labels, registry
+from common.profiling import RequestProfiler, get_profiling_settings
+from common.queries import QueryRecorder, fingerprint
+
+logger = logging.getLogger("ourhour.queries")
+request_logger = logging.getLogger("ourhour.requests")
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+REQUEST_ID_HEADER = "X-Request-ID"
+# 프록시/로드밸런서가 붙인 요청 ID만 그대로 사용 (로그 주입 방지)
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+DEFAULT_QUERY_INSTRUMENTATION = {
+    "ENABLED": False,
+    "DUPLICATE_THRESHOLD": 2,
+    "WARN_QUERY_COUNT": 30,
+}
+
+
+def get_query_instrumentation_settings() -> dict:
+    """QUERY_INSTRUMENTATION 설정을 기본값과 병합하여 반환"""
+    return {**DEFAULT_QUERY_INSTRUMENTATION, **getattr(settings, "QUERY_INSTRUMENTATION", {})}
+
+
+class HybridMiddleware:
+    """
+    WSGI(동기)와 ASGI(비동기) 요청을 모두 처리하는 미들웨어 기반 클래스
+
+    ASGI에서 동기 전용 미들웨어가 하나라도 있으면 Django가 요청 전체를 스레드로 넘겨 처리하므로,
+    비동기 뷰의 이점이 사라집니다. 하위 클래스는 __call__(동기)과 __acall__(비동기)을 함께 구현합니다.
+    (django.utils.deprecation.MiddlewareMixin과 같은 방식)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+
+class RequestLogMiddleware(HybridMiddleware):
+    """
+    요청 ID 부여 및 요청 로그 (ourhour.requests)
+
+    - 요청 ID는 X-Request-ID 헤더(형식이 올바른 경우) 또는 새 UUID를 사용하고, 같은 헤더로 응답합니다.
+      요청 중 남기는 모든 로그에는 common.logging.RequestContextFilter가 request_id를 붙입니다.
+    - ourhour.requests 로거가 INFO를 기록할 때만 요청마다 view, action, status_code, duration_ms,
+      query_count, db_time_ms를 extra로 남깁니다.
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        request_id = self.get_request_id(request)
+        token = set_request_id(request_id)
+        try:
+            if not request_logger.isEnabledFor(logging.INFO):
+                response = self.get_response(request)
+            else:
+                start = time.perf_counter()
+                with QueryRecorder() as recorder:
+                    response = self.get_response(request)
+                self.log(request, response, time.perf_counter() - start, recorder)
+        finally:
+            reset_request_id(token)
+
+        response[REQUEST_ID_HEADER] = request_id
+        return response
+
+    async def __acall__(self, request):
+        request_id = self.get_request_id(request)
+        token = set_request_id(request_id)
+        try:
+            if not request_logger.isEnabledFor(logging.INFO):
+                response = await self.get_response(request)
+            else:
+                start = time.perf_counter()
+                with QueryRecorder() as recorder:
+                    response = await self.get_response(request)
+                self.log(request, response, time.perf_counter() - start, recorder)
+        finally:
+            reset_request_id(token)
+
+        response[REQUEST_ID_HEADER] = request_id
+        return response
+
+    @staticmethod
+    def get_request_id(request) -> str:
+        request_id = request.headers.get(REQUEST_ID_HEADER, "")
+        if not REQUEST_ID_PATTERN.match(request_id):
+            request_id = uuid.uuid4().hex
+        request.request_id = request_id
+        return request_id
+
+    @staticmethod
+    def log(request, response, duration: float, recorder: QueryRecorder) -> None:
+        view, action, method, _ = get_request_labels(request, response)
+        duration_ms = round(duration * 1000, 2)
+        request_logger.info(
+            "%s %s %d %.2fms",
+            method,
+            request.path,
+            response.status_code,
+            duration_ms,
+            extra={
+                "method": method,
+                "path": request.path,
+                "view": view,
+                "action": action,
+                "status_code": response.status_code,
+                "duration_ms": duration_ms,
+                "query_count": recorder.count,
+                "db_time_ms": round(recorder.duration * 1000, 2),
+            },
+        )
+
+
+class RequestMetricsMiddleware(HybridMiddleware):
+    """
+    뷰/액션별 요청 처리 시간 기록 (METRICS["ENABLED"]일 때만, common.metrics)
+
+    /metrics 요청 자체는 기록하지 않습니다.
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not get_metrics_settings()["ENABLED"]:
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        response = self.get_response(request)
+        self.observe(request, response, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        if not get_metrics_settings()["ENABLED"]:
+            return await self.get_response(request)
+
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        self.observe(request, response, time.perf_counter() - start)
+        return response
+
+    @staticmethod
+    def observe(request, response, duration: float) -> None:
+        labels = get_request_labels(request, response)
+        if labels[0] != "metrics":
+            registry.observe(labels, duration)
+
+
+class ProfilingMiddleware(HybridMiddleware):
+    """
+    표본 요청 프로파일링 (PROFILING["ENABLED"]일 때만, common.profiling)
+
+    SAMPLE_RATE 비율의 요청만 cProfile로 측정하므로, 나머지 요청에는 난수 하나 만큼의 비용만 듭니다.
+    ASGI(비동기)에서는 한 이벤트 루프에서 여러 요청이 번갈아 실행되어 요청별 측정이 되지 않으므로 측정하지 않습니다.
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.get_response(request)
+
+        config = get_profiling_settings()
+        if not RequestProfiler.should_sample(config):
+            return self.get_response(request)
+
+        profiler = RequestProfiler.start()
+        if profiler is None:
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+        duration = time.perf_counter() - start
+
+        view, action, method, _ = get_request_labels(request, response)
+        info = {
+            "method": method,
+            "path": request.path,
+            "view": view,
+            "action": action,
+            "status_code": response.status_code,
+        }
+        RequestProfiler.save(profiler, duration, info, config)
+        return response
+
+
+class QueryInstrumentationMiddleware(HybridMiddleware):
+    """
+    요청별 쿼리 수/DB 시간/반복 쿼리 기록 (QUERY_INSTRUMENTATION["ENABLED"]일 때만)
+
+    - 응답 헤더: Server-Timing: db;dur=12.3;desc="queries=5 duplicates=1"
+    - 로그(ourhour.queries): query_count, db_time_ms, duplicate_queries 필드를 extra로 기록합니다.
+      같은 SQL이 DUPLICATE_THRESHOLD번 이상 반복되었거나(N+1 의심) 쿼리 수가 WARN_QUERY_COUNT 이상이면 WARNING.
+    스트리밍 응답 본문을 만드는 동안 실행되는 쿼리는 포함되지 않습니다.
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        config = get_query_instrumentation_settings()
+        if not config["ENABLED"]:
+            return self.get_response(request)
+
+        with QueryRecorder() as recorder:
+            response = self.get_response(request)
+        return self.report(request, response, recorder, config)
+
+    async def __acall__(self, request):
+        config = get_query_instrumentation_settings()
+        if not config["ENABLED"]:
+            return await self.get_response(request)
+
+        with QueryRecorder() as recorder:
+            response = await self.get_response(request)
+        return self.report(request, response, recorder, config)
+
+    @staticmethod
+    def report(request, response, recorder: QueryRecorder, config: dict):
+        duplicates = recorder.get_duplicates(config["DUPLICATE_THRESHOLD"])
+        db_time_ms = round(recorder.duration * 1000, 2)
+        timing = f'db;dur={db_time_ms};desc="queries={recorder.count} duplicates={len(duplicates)}"'
+        existing = response.get("Server-Timing")
+        response["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+
+        level = logging.WARNING if duplicates or recorder.count >= config["WARN_QUERY_COUNT"] else logging.INFO
+        logger.log(
+            level,
+            "%s %s: %d queries, %.2fms",
+            request.method,
+            request.path,
+            recorder.count,
+            db_time_ms,
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "status_code": response.status_code,
+                "query_count": recorder.count,
+                "db_time_ms": db_time_ms,
+                "duplicate_queries": [
+                    {"fingerprint": fingerprint(sql), "count": count, "sql": sql[:200]}
+                    for sql, count in duplicates.items()
+                ],
+            },
+        )
+        return response
+
+
+class ReadReplicaMiddleware(HybridMiddleware):
+    """
+    요청별 읽기 복제본 사용 여부 결정 (common.db_router.ReadReplicaRouter와 함께 사용)
+
+    - 인증 정보(Authorization 헤더, 로그인 세션)가 없는 조회 요청만 복제본에서 읽습니다.
+    - 쓰기 요청(POST/PUT/PATCH/DELETE) 응답에 고정 쿠키를 붙여,
+      STICKY_SECONDS 동안 같은 클라이언트의 조회는 primary에서 읽습니다. (방금 남긴 방명록/RSVP가 보이도록)
+    - 복제본에서 읽은 뷰가 OperationalError로 실패하면 읽은 복제본을 제외하고 뷰를 primary에서 다시 실행합니다.
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        config = get_replica_settings()
+        if not config["ALIASES"]:
+            return self.get_response(request)
+
+        user = getattr(request, "user", None)
+        token = allow_replica_reads(self.can_use_replica(request, config, user))
+        tracking = track_replica_reads()
+        try:
+            response = self.get_response(request)
+        finally:
+            reset_replica_tracking(tracking)
+            reset_replica_reads(token)
+        return self.set_sticky_cookie(request, response, config)
+
+    async def __acall__(self, request):
+        config = get_replica_settings()
+        if not config["ALIASES"]:
+            return await self.get_response(request)
+
+        # 이벤트 루프에서 세션 사용자를 동기 조회하지 않도록 auser() 사용 (사용자 확인이 필요한 경우만)
+        user = None
+        if self.can_use_replica(request, config) and hasattr(request, "auser"):
+            user = await request.auser()
+        token = allow_replica_reads(self.can_use_replica(request, config, user))
+        tracking = track_replica_reads()
+        try:
+            response = await self.get_response(request)
+        finally:
+            reset_replica_tracking(tracking)
+            reset_replica_reads(token)
+        return self.set_sticky_cookie(request, response, config)
+
+    def process_exception(self, request, exception):
+        """
+        복제본 읽기 중 연결 오류가 나면 복제본을 제외하고 같은 뷰를 primary에서 다시 실행
+
+        복제본 읽기는 조회 요청에서만 허용되므로 뷰 전체를 다시 실행합니다. (조회수 같은 조회 중 쓰기는 두 번 반영될 수 있음)
+        ASGI에서는 Django가 이 메서드를 스레드에서 호출하므로 비동기 뷰는 async_to_sync로 실행합니다.
+        """
+        if not isinstance(exception, OperationalError) or request.resolver_match is None:
+            return None
+        failed = get_replicas_used()
+        if not failed:
+            return None
+
+        for alias in failed:
+            replica_health.mark_unhealthy(alias)
+        match = request.resolver_match
+        view = async_to_sync(match.func) if iscoroutinefunction(match.func) else match.func
+        with use_primary():
+            return view(request, *match.args, **match.kwargs)
+
+    @staticmethod
+    def set_sticky_cookie(request, response, config: dict):
+        if request.method not in SAFE_METHODS:
+            response.set_cookie(
+                config["COOKIE_NAME"],
+                "1",
+                max_age=config["STICKY_SECONDS"],
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    @staticmethod
+    def can_use_replica(request, config: dict, user=None) -> bool:
+        if request.method not in SAFE_METHODS:
+            return False
+        if config["COOKIE_NAME"] in request.COOKIES:
+            return False
+        if request.META.get("HTTP_AUTHORIZATION"):
+            return False
+        return not (user is not None and user.is_authenticated)
@@ -2,6 +2,12 @@
 재사용 가능한 ViewSet Mixins
 """
 
+from datetime import datetime
+from typing import Optional
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from rest_framework import mixins, viewsets
 
 
@@ -23,3 +29,39 @@ class ListRetrieveUpdateViewSet(
     """
 
     pass
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified 기반 조건부 GET을 지원하는 APIView Mixin
+
+    뷰에서 가벼운 메타데이터 조회로 검증자(validator)를 만든 뒤
+    not_modified()가 응답을 돌려주면 직렬화 없이 그대로 반환합니다.
+    """
+
+    def apply_validators(self, response, etag: Optional[str] = None, last_modified: Optional[datetime] = None):
+        """
+        응답에 ETag / Last-Modified 헤더 설정
+
+        클라이언트가 매번 재검증하도록 Cache-Control: no-cache를 함께 설정합니다.
+        """
+        if etag:
+            response["ETag"] = etag
+        if last_modified:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    def not_modified(self, request, etag: Optional[str] = None, last_modified: Optional[datetime] = None):
+        """
+        If-None-Match / If-Modified-Since 검사
+
+        Returns:
+            HttpResponse: 304 응답 (변경되지 않은 경우), 그 외에는 None
+        """
+        validators = self.apply_validators(HttpResponse(), etag, last_modified)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp, response=validators)
+        if response is validators:
+            return None
+        return response
@@ -2,7 +2,18 @@
 DRF 커스텀 페이지네이션
 """
 
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import json
+from typing import Optional
+
+from django.core.paginator import AsyncPaginator, InvalidPage, Page
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -18,3 +29,173 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset()의 비동기 버전 (COUNT와 페이지 조회를 비동기 ORM으로 수행)"""
+        self.request = request
+        page_size = self.get_page_size(request)
+        paginator = AsyncPaginator(queryset, page_size)
+        page_number = request.query_params.get(self.page_query_param) or 1
+        if page_number in self.last_page_strings:
+            page_number = await paginator.anum_pages()
+
+        try:
+            page = await paginator.apage(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        results = await page.aget_object_list()
+
+        # 이미 조회한 개수/목록으로 동기 Page를 만들어 get_paginated_response() 등을 그대로 사용
+        sync_paginator = self.django_paginator_class(queryset, page_size)
+        sync_paginator.count = await paginator.acount()
+        self.page = Page(results, page.number, sync_paginator)
+        return results
+
+
+class KeysetPagination(BasePagination):
+    """
+    키셋(커서) 페이지네이션 클래스
+
+    (created_at, id) 내림차순을 기준으로 마지막 항목 이후만 조회하므로 COUNT/OFFSET 없이
+    페이지 깊이와 관계없이 같은 비용으로 조회합니다. 조회 도중 새 항목이 추가되어도
+    이미 본 항목이 다음 페이지에 다시 나오거나 건너뛰어지지 않습니다.
+
+    Attributes:
+        page_size: 기본 페이지 크기
+        page_size_query_param: 페이지 크기를 지정할 수 있는 쿼리 파라미터
+        max_page_size: 최대 페이지 크기
+        cursor_query_param: 커서 쿼리 파라미터
+        count_query_param: 전체 개수 포함 여부 쿼리 파라미터 (true일 때만 COUNT 수행)
+        max_count: 전체 개수 상한 (초과 시 count는 상한값, count_capped는 True)
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    count_query_param = "include_count"
+    max_count = 1000
+    include_count = False
+    invalid_cursor_message = "잘못된 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self._prepare(request)
+        if self._wants_count(request):
+            # 상한 + 1개까지만 세어 큰 목록에서도 비용을 제한
+            self._set_count(queryset.order_by()[: self.max_count + 1].count())
+        return self._set_page(list(self._page_queryset(queryset)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset()의 비동기 버전 (비동기 ORM으로 조회)"""
+        self._prepare(request)
+        if self._wants_count(request):
+            self._set_count(await queryset.order_by()[: self.max_count + 1].acount())
+        return self._set_page([row async for row in self._page_queryset(queryset)])
+
+    def _prepare(self, request) -> None:
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request)
+        self.reverse = bool(self.cursor and self.cursor["r"])
+        self.count = None
+        self.count_capped = False
+
+    def _wants_count(self, request) -> bool:
+        return self.include_count or request.query_params.get(self.count_query_param, "").lower() in ("1", "true")
+
+    def _set_count(self, count: int) -> None:
+        self.count_capped = count > self.max_count
+        self.count = min(count, self.max_count)
+
+    def _page_queryset(self, queryset):
+        if self.cursor:
+            created_at, pk = self.cursor["c"], self.cursor["i"]
+            if self.reverse:
+                queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+            else:
+                queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+        ordering = ("created_at", "id") if self.reverse else ("-created_at", "-id")
+        return queryset.order_by(*ordering)[: self.page_size + 1]
+
+    def _set_page(self, results: list) -> list:
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if self.reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def decode_cursor(self, request) -> Optional[dict]:
+        """쿼리 파라미터의 커서를 {"c": created_at, "i": id, "r": 역방향 여부}로 해석"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            created_at = parse_datetime(data["c"])
+            if created_at is None:
+                raise ValueError
+            return {"c": created_at, "i": int(data["i"]), "r": bool(data.get("r"))}
+        except (TypeError, ValueError, KeyError, UnicodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, item, reverse: bool = False) -> str:
+        # 모델 인스턴스와 .values() 행(dict) 모두 지원
+        if isinstance(item, dict):
+            data = {"c": item["created_at"].isoformat(), "i": item["id"]}
+        else:
+            data = {"c": item.created_at.isoformat(), "i": item.pk}
+        if reverse:
+            data["r"] = 1
+        encoded = base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode()).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_data(self, data) -> dict:
+        """페이지 응답 본문 (다른 응답에 포함할 때 사용)"""
+        paginated = {"next": self.get_next_link(), "previous": self.get_previous_link()}
+        if self.count is not None:
+            paginated["count"] = self.count
+            paginated["count_capped"] = self.count_capped
+        paginated["results"] = data
+        return paginated
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "count": {"type": "integer", "description": f"{self.count_query_param}=true 일 때만 포함"},
+                "count_capped": {"type": "boolean"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,39 @@
+"""
+DRF 커스텀 파서
+"""
+
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from common.renderers import ORJSONRenderer, orjson
+
+
+class ORJSONParser(JSONParser):
+    """
+    orjson 기반 JSON 파서
+
+    UTF-8 본문은 orjson으로 한 번에 파싱하고, 다른 인코딩이거나 orjson이 없으면 DRF JSONParser를 사용합니다.
+    orjson은 NaN/Infinity를 허용하지 않으므로 STRICT_JSON과 같은 동작입니다.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        if orjson is None or not self.strict or not _is_utf8(parser_context.get("encoding", settings.DEFAULT_CHARSET)):
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+def _is_utf8(encoding: str) -> bool:
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
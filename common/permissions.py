@@ -16,8 +16,8 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
 
-        # 쓰기 권한은 객체 소유자에게만 허용
-        return obj.user == request.user
+        # 쓰기 권한은 객체 소유자에게만 허용 (FK 값으로 비교하여 소유자 조회 쿼리 없음)
+        return obj.user_id == request.user.pk
 
 
 class IsInvitationOwner(permissions.BasePermission):
@@ -26,7 +26,7 @@ class IsInvitationOwner(permissions.BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        return obj.user == request.user
+        return obj.user_id == request.user.pk
 
 
 class IsPublicOrOwner(permissions.BasePermission):
@@ -36,7 +36,7 @@ class IsPublicOrOwner(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         # 소유자는 항상 접근 가능
-        if request.user.is_authenticated and obj.user == request.user:
+        if request.user.is_authenticated and obj.user_id == request.user.pk:
             return True
 
         # 공개된 Invitation은 인증 없이도 접근 가능
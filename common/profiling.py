@@ -0,0 +1,121 @@
+"""
+표본 요청 프로파일링
+
+PROFILING["ENABLED"]일 때 SAMPLE_RATE 비율의 요청을 cProfile로 측정하고,
+가장 느린 KEEP개 요청만 PROFILING["DIRECTORY"]에 남깁니다. (요청마다 .prof + 같은 이름의 .json)
+
+- MIN_DURATION(초)보다 빠른 요청은 저장하지 않습니다.
+- 같은 프로세스에서 다른 프로파일러가 이미 동작 중이면(동시 요청 등) 해당 요청은 건너뜁니다.
+- 저장된 결과는 python manage.py summarize_profiles로 요약합니다.
+"""
+
+import cProfile
+import json
+import logging
+import os
+import random
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILING = {
+    "ENABLED": False,
+    "SAMPLE_RATE": 0.01,
+    "KEEP": 20,
+    "MIN_DURATION": 0.2,
+    "DIRECTORY": "/tmp/ourhour-profiles",
+}
+
+
+def get_profiling_settings() -> dict:
+    """PROFILING 설정을 기본값과 병합하여 반환"""
+    return {**DEFAULT_PROFILING, **getattr(settings, "PROFILING", {})}
+
+
+def load_profile_records(directory) -> List[dict]:
+    """
+    저장된 프로파일 목록 (느린 순)
+
+    Returns:
+        list: 요청 정보(method, path, view, action, status_code, duration, captured_at)와
+            .prof 파일 경로("profile")
+    """
+    records = []
+    for meta_path in Path(directory).glob("*.json"):
+        try:
+            record = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            continue
+        profile_path = meta_path.with_suffix(".prof")
+        if profile_path.exists():
+            records.append({**record, "profile": str(profile_path)})
+    return sorted(records, key=lambda record: record["duration"], reverse=True)
+
+
+class RequestProfiler:
+    """표본 요청 측정 및 느린 요청 보관"""
+
+    @staticmethod
+    def should_sample(config: dict) -> bool:
+        return config["ENABLED"] and random.random() < config["SAMPLE_RATE"]
+
+    @staticmethod
+    def start() -> Optional[cProfile.Profile]:
+        """측정 시작 (다른 프로파일러가 동작 중이면 None)"""
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            return None
+        return profiler
+
+    @classmethod
+    def save(cls, profiler: cProfile.Profile, duration: float, info: dict, config: dict) -> Optional[Path]:
+        """
+        측정 결과 저장
+
+        MIN_DURATION보다 빠르거나, 이미 KEEP개가 있고 그중 가장 빠른 요청보다 빠르면 저장하지 않습니다.
+
+        Returns:
+            Path: 저장한 .prof 파일 경로 (저장하지 않으면 None)
+        """
+        if duration < config["MIN_DURATION"]:
+            return None
+
+        directory = Path(config["DIRECTORY"])
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            records = load_profile_records(directory)
+            if len(records) >= config["KEEP"] and duration <= records[-1]["duration"]:
+                return None
+
+            name = f"{int(time.time())}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+            profile_path = directory / f"{name}.prof"
+            profiler.dump_stats(profile_path)
+            # sidecar를 나중에 써서, 목록에는 .prof가 완성된 요청만 나타나도록 함
+            (directory / f"{name}.json").write_text(
+                json.dumps({**info, "duration": round(duration, 6), "captured_at": int(time.time())})
+            )
+            cls.prune(directory, config["KEEP"])
+        except OSError:
+            # 프로파일 저장 실패로 요청이 실패하지 않도록 함
+            logger.warning("프로파일 결과를 %s에 저장하지 못했습니다.", directory, exc_info=True)
+            return None
+        return profile_path
+
+    @staticmethod
+    def prune(directory, keep: int) -> None:
+        """가장 느린 keep개만 남기고 삭제"""
+        for record in load_profile_records(directory)[keep:]:
+            profile_path = Path(record["profile"])
+            for path in (profile_path.with_suffix(".json"), profile_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    # 다른 워커가 먼저 삭제
+                    pass
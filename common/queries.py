@@ -0,0 +1,100 @@
+"""
+쿼리 기록
+
+QueryRecorder는 connection.execute_wrapper로 실행되는 쿼리를 모아
+쿼리 수, DB 시간, 같은 SQL(파라미터 제외)이 반복된 횟수를 계산합니다.
+DEBUG와 관계없이 동작하며, 요청 계측 미들웨어와 테스트의 쿼리 예산 검사에서 함께 사용합니다.
+
+DB 연결은 스레드마다 따로 있고, 비동기 뷰(ASGI)의 ORM 조회는 이벤트 루프가 아닌 다른 스레드의 연결에서 실행됩니다.
+그래서 모든 연결에 같은 실행 래퍼(_dispatch)를 한 번만 걸어 두고, 기록 중인 QueryRecorder는 ContextVar로 찾습니다.
+(sync_to_async로 넘어간 스레드에도 컨텍스트가 전달되므로 요청의 쿼리만 기록)
+"""
+
+import contextvars
+import hashlib
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+# 현재 컨텍스트에서 기록 중인 QueryRecorder (중첩 가능)
+_active: contextvars.ContextVar[Tuple["QueryRecorder", ...]] = contextvars.ContextVar("query_recorders", default=())
+
+
+def fingerprint(sql: str) -> str:
+    """파라미터를 제외한 SQL의 짧은 식별자"""
+    return hashlib.sha1(sql.encode()).hexdigest()[:12]
+
+
+def _dispatch(execute, sql, params, many, context):
+    recorders = _active.get()
+    if not recorders:
+        return execute(sql, params, many, context)
+
+    alias = context["connection"].alias
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - start
+        for recorder in recorders:
+            if recorder.using is None or alias in recorder.using:
+                recorder.record(sql, duration)
+
+
+def install(connection) -> None:
+    """연결에 실행 래퍼 설치 (이미 있으면 무시)"""
+    if _dispatch not in connection.execute_wrappers:
+        # execute_wrapper() 블록 안에서 연결되더라도 블록이 끝날 때 이 래퍼가 빠지지 않도록 맨 앞에 둠
+        connection.execute_wrappers.insert(0, _dispatch)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    install(connection)
+
+
+connection_created.connect(_on_connection_created, dispatch_uid="common.queries.install")
+
+
+class QueryRecorder:
+    """
+    블록 안에서 실행된 쿼리 기록
+
+        with QueryRecorder() as recorder:
+            ...
+        recorder.count, recorder.duration, recorder.get_duplicates()
+
+    Args:
+        using: 기록할 DB 별칭 목록 (기본값: 모든 DB)
+    """
+
+    def __init__(self, using: Optional[List[str]] = None):
+        self.using = using
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+        self.queries: List[str] = []
+        self._token: Optional[contextvars.Token] = None
+
+    def __enter__(self):
+        # 현재 스레드에서 이미 열려 있던 연결 (새 연결은 connection_created에서 설치)
+        for alias in self.using or list(connections):
+            install(connections[alias])
+        self._token = _active.set(_active.get() + (self,))
+        return self
+
+    def __exit__(self, *exc_info):
+        _active.reset(self._token)
+        self._token = None
+
+    def record(self, sql: str, duration: float) -> None:
+        self.duration += duration
+        self.count += 1
+        self.statements[sql] += 1
+        self.queries.append(sql)
+
+    def get_duplicates(self, threshold: int = 2) -> Dict[str, int]:
+        """threshold번 이상 실행된 SQL과 횟수 (N+1 의심)"""
+        return {sql: count for sql, count in self.statements.most_common() if count >= threshold}
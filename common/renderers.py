@@ -0,0 +1,42 @@
+"""
+DRF 커스텀 렌더러
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson이 없는 환경에서는 표준 json 사용
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러
+
+    DRF JSONRenderer(표준 json)와 같은 결과를 내도록 맞춘 렌더러입니다.
+
+    - 한글 등 비 ASCII 문자는 이스케이프하지 않고, U+2028/U+2029는 DRF처럼 이스케이프
+    - aware datetime은 isoformat 그대로(Asia/Seoul은 +09:00, UTC는 Z), UUID는 문자열
+    - Decimal(위도/경도 등)과 lazy 문자열은 DRF JSONEncoder 규칙으로 변환
+    - 들여쓰기 요청(Browsable API, ; indent=4), orjson 미설치, orjson이 처리하지 못하는 값
+      (64비트를 넘는 정수 등)은 표준 json 경로로 처리
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # DRF와 같이 자바스크립트 문자열로도 안전하도록 이스케이프
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
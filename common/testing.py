@@ -0,0 +1,101 @@
+"""
+테스트 도우미
+"""
+
+import json
+from contextlib import ContextDecorator
+from typing import List, Optional
+
+from django.db import connections
+
+from common.queries import QueryRecorder
+
+
+def explain_problems(queryset) -> List[str]:
+    """
+    쿼리 실행 계획에서 전체 스캔/추가 정렬 단계를 찾아 반환
+
+    - SQLite: EXPLAIN QUERY PLAN의 "SCAN <table>"(인덱스 전체 스캔 포함), "USE TEMP B-TREE"
+    - MySQL: EXPLAIN FORMAT=JSON의 access_type "ALL"/"index", using_filesort
+    그 밖의 DB는 확인하지 않습니다. (빈 목록)
+
+    Args:
+        queryset: 확인할 QuerySet
+
+    Returns:
+        list: 문제가 된 계획 단계 설명 (없으면 빈 목록)
+    """
+    vendor = connections[queryset.db].vendor
+    if vendor == "sqlite":
+        problems = []
+        for line in queryset.explain().splitlines():
+            detail = line.split(" ", 3)[-1]
+            if detail.startswith("SCAN ") or "USE TEMP B-TREE" in detail:
+                problems.append(detail)
+        return problems
+    if vendor == "mysql":
+        return _mysql_problems(json.loads(queryset.explain(format="json")))
+    return []
+
+
+def _mysql_problems(node) -> List[str]:
+    problems = []
+    if isinstance(node, dict):
+        if node.get("access_type") in ("ALL", "index"):
+            problems.append(f"{node.get('table_name')}: access_type={node['access_type']}")
+        if node.get("using_filesort"):
+            problems.append("using_filesort")
+        for value in node.values():
+            problems += _mysql_problems(value)
+    elif isinstance(node, list):
+        for value in node:
+            problems += _mysql_problems(value)
+    return problems
+
+
+class query_budget(ContextDecorator):
+    """
+    블록(또는 테스트 함수)의 쿼리 예산 검사
+
+    쿼리 수가 max_queries를 넘거나, 같은 SQL(파라미터 제외)이 반복되면(N+1 의심) AssertionError를 발생시킵니다.
+
+        with query_budget(3):
+            api_client.get(url)
+
+        @query_budget(5, max_duplicates=1)
+        def test_...(...): ...
+
+    Args:
+        max_queries: 허용할 최대 쿼리 수
+        max_duplicates: 허용할 반복 SQL 종류 수 (기본값 0)
+        using: 검사할 DB 별칭 목록 (기본값: 모든 DB)
+    """
+
+    def __init__(self, max_queries: int, max_duplicates: int = 0, using: Optional[List[str]] = None):
+        self.max_queries = max_queries
+        self.max_duplicates = max_duplicates
+        self.using = using
+        self.recorder: Optional[QueryRecorder] = None
+
+    def __enter__(self):
+        self.recorder = QueryRecorder(self.using).__enter__()
+        return self.recorder
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.recorder.__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None:
+            return False
+
+        duplicates = self.recorder.get_duplicates()
+        errors = []
+        if self.recorder.count > self.max_queries:
+            errors.append(f"쿼리 {self.recorder.count}개 실행 (예산 {self.max_queries}개)")
+        if len(duplicates) > self.max_duplicates:
+            errors.append(f"반복 실행된 SQL {len(duplicates)}종 (허용 {self.max_duplicates}종, N+1 의심)")
+        if errors:
+            queries = "\n".join(f"  {index}. {sql}" for index, sql in enumerate(self.recorder.queries, start=1))
+            repeated = "\n".join(f"  {count}회: {sql}" for sql, count in duplicates.items())
+            raise AssertionError(
+                "\n".join([*errors, "실행된 쿼리:", queries, *(["반복:", repeated] if repeated else [])])
+            )
+        return False
@@ -2,6 +2,7 @@
 유틸리티 함수
 """
 
+import hashlib
 from datetime import datetime
 from typing import Any, Dict
 
@@ -36,3 +37,19 @@ def get_client_ip(request) -> str:
     else:
         ip = request.META.get("REMOTE_ADDR")
     return ip
+
+
+def build_etag(*parts: Any, weak: bool = True) -> str:
+    """
+    값들로부터 ETag 문자열 생성
+
+    Args:
+        *parts: ETag를 구성할 값들 (None은 빈 문자열로 취급)
+        weak: 약한 ETag(W/) 여부
+
+    Returns:
+        str: 따옴표로 감싼 ETag 문자열
+    """
+    raw = ":".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.md5(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
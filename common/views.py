@@ -0,0 +1,104 @@
+"""
+공통 뷰
+"""
+
+import ipaddress
+import secrets
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+from django.views import View
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from common.metrics import get_metrics_settings, render_prometheus
+from common.renderers import ORJSONRenderer
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _is_internal_address(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return ip.is_loopback or ip.is_private
+
+
+def metrics_view(request):
+    """
+    Prometheus 지표 (GET /metrics)
+
+    - METRICS["ENABLED"]가 아니면 404
+    - METRICS["TOKEN"]이 있으면 Authorization: Bearer <TOKEN> 헤더가 필요합니다.
+    - TOKEN이 없으면 DEBUG에서 내부 주소(loopback/사설 대역)의 요청만 허용하고, DEBUG가 아니면 모두 거부합니다.
+      리버스 프록시(nginx) 뒤에서는 모든 요청의 REMOTE_ADDR가 프록시 주소이므로 주소로는 외부 요청을 구분할 수 없습니다.
+    """
+    config = get_metrics_settings()
+    if not config["ENABLED"]:
+        raise Http404
+
+    if config["TOKEN"]:
+        header = request.META.get("HTTP_AUTHORIZATION", "")
+        if not secrets.compare_digest(header.encode(), f"Bearer {config['TOKEN']}".encode()):
+            return HttpResponseForbidden()
+    elif not (settings.DEBUG and _is_internal_address(request.META.get("REMOTE_ADDR", ""))):
+        return HttpResponseForbidden()
+
+    return HttpResponse(render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+class AsyncAPIView(View):
+    """
+    비동기 공개 조회 뷰 기반 클래스 (ASGI 배포용, settings.ASYNC_PUBLIC_VIEWS)
+
+    DRF APIView는 동기 뷰이므로, Django 비동기 뷰에서 DRF 뷰와 같은 응답을 만듭니다.
+    - request는 DRF Request로 감싸 query_params와 DRF 필터/페이지네이션을 그대로 사용합니다.
+      인증/권한 검사는 하지 않으므로 인증 없이 공개된 조회에만 사용합니다.
+    - 핸들러는 DRF Response를 반환하고, 본문은 ORJSONRenderer(JSON)로 렌더링합니다.
+      (Browsable API는 지원하지 않음)
+    - 예외(Http404, DRF APIException)는 REST_FRAMEWORK["EXCEPTION_HANDLER"]로 DRF 뷰와 같은 오류 응답을 만듭니다.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    renderer_class = ORJSONRenderer
+    # 대신하는 ViewSet 액션 이름 (예: {"get": "list"}), 지표/요청 로그의 action 라벨로 사용
+    actions = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # ViewSet.as_view()처럼 뷰 함수에 남겨 common.metrics.get_request_labels()가 읽도록 함
+        view.actions = cls.actions
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        request = Request(request)
+        self.request = request
+        try:
+            handler = getattr(self, request.method.lower(), None)
+            if request.method.lower() not in self.http_method_names or handler is None:
+                handler = self.http_method_not_allowed
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc, args, kwargs)
+        return self.finalize_response(response)
+
+    def handle_exception(self, exc, args, kwargs):
+        context = {"view": self, "args": args, "kwargs": kwargs, "request": self.request}
+        response = api_settings.EXCEPTION_HANDLER(exc, context)
+        if response is None:
+            raise exc
+        response.exception = True
+        return response
+
+    def finalize_response(self, response):
+        if isinstance(response, Response):
+            # 이벤트 루프에서 바로 렌더링 (Django가 스레드로 넘겨 렌더링하지 않도록)
+            response.accepted_renderer = self.renderer_class()
+            response.accepted_media_type = self.renderer_class.media_type
+            response.renderer_context = {"view": self, "request": self.request, "response": response}
+            response.render()
+        response["Allow"] = ", ".join(self._allowed_methods())
+        return response
@@ -3,6 +3,9 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+ASGI로 배포할 때는 ASYNC_PUBLIC_VIEWS=True로 공개 조회 API를 비동기 뷰로 제공합니다.
+(예: uvicorn config.asgi:application --workers 4)
+
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 """
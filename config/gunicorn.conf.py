@@ -0,0 +1,22 @@
+"""
+gunicorn 설정
+
+gunicorn -c config/gunicorn.conf.py config.wsgi:application
+
+METRICS_DIRECTORY(워커별 지연 시간 스냅샷)를 쓰는 경우, 시작할 때 이전 실행의 스냅샷을 지우고
+종료/재시작된 워커의 스냅샷은 archived.json에 합칩니다. (common.metrics)
+"""
+
+import os
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+from common.metrics import archive_worker_snapshot, clear_snapshots  # noqa: E402
+
+
+def on_starting(server):
+    clear_snapshots()
+
+
+def child_exit(server, worker):
+    archive_worker_snapshot(worker.pid)
@@ -57,11 +57,16 @@ PROJECT_APPS = [
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + PROJECT_APPS
 
 MIDDLEWARE = [
+    "common.middleware.RequestLogMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "common.middleware.RequestMetricsMiddleware",
+    "common.middleware.ProfilingMiddleware",
+    "common.middleware.QueryInstrumentationMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "common.middleware.ReadReplicaMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -84,6 +89,11 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
+
+# 공개 조회 API(청첩장/RSVP 통계/방명록, 템플릿 목록/상세)를 비동기 뷰로 제공 (config.asgi로 배포할 때만 사용)
+# WSGI에서 켜면 요청마다 이벤트 루프를 거치므로 오히려 느려집니다.
+ASYNC_PUBLIC_VIEWS = os.getenv("ASYNC_PUBLIC_VIEWS", "False").lower() == "true"
 
 # Custom User Model
 AUTH_USER_MODEL = "users.User"
@@ -147,6 +157,16 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    # orjson 기반 JSON 렌더러/파서 (orjson 미설치 시 표준 json으로 동작)
+    "DEFAULT_RENDERER_CLASSES": [
+        "common.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "common.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_PAGINATION_CLASS": "common.pagination.StandardResultsSetPagination",
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
@@ -170,6 +190,118 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
 }
 
+# 요청별 쿼리 계측 (common.middleware.QueryInstrumentationMiddleware, Server-Timing 헤더 + ourhour.queries 로그)
+# DUPLICATE_THRESHOLD: 같은 SQL이 이 횟수 이상 반복되면 N+1 의심으로 기록, WARN_QUERY_COUNT: WARNING으로 기록할 쿼리 수
+QUERY_INSTRUMENTATION = {
+    "ENABLED": os.getenv("QUERY_INSTRUMENTATION_ENABLED", "False").lower() == "true",
+    "DUPLICATE_THRESHOLD": int(os.getenv("QUERY_INSTRUMENTATION_DUPLICATE_THRESHOLD", "2")),
+    "WARN_QUERY_COUNT": int(os.getenv("QUERY_INSTRUMENTATION_WARN_QUERY_COUNT", "30")),
+}
+
+# 요청 처리 시간 지표 (common.metrics, GET /metrics에서 Prometheus 형식으로 제공)
+# DIRECTORY: 워커별 스냅샷을 저장할 디렉터리 (지정하면 모든 워커의 값을 합쳐서 제공), FLUSH_INTERVAL: 스냅샷 저장 주기 (초)
+#   서버마다 따로 지정하고, config/gunicorn.conf.py로 실행하면 시작 시 비우고 종료된 워커의 값은 archived.json에 합침
+# TOKEN: 지정하면 Authorization: Bearer <TOKEN> 헤더로만 조회 가능 (없으면 DEBUG에서 내부 주소만 허용, 운영에서는 필수)
+METRICS = {
+    "ENABLED": os.getenv("METRICS_ENABLED", "False").lower() == "true",
+    "DIRECTORY": os.getenv("METRICS_DIRECTORY") or None,
+    "FLUSH_INTERVAL": int(os.getenv("METRICS_FLUSH_INTERVAL", "10")),
+    "BUCKETS": [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+    "TOKEN": os.getenv("METRICS_TOKEN") or None,
+}
+
+# 표본 요청 프로파일링 (common.profiling, python manage.py summarize_profiles로 요약)
+# SAMPLE_RATE: 측정할 요청 비율, KEEP: 보관할 가장 느린 요청 수, MIN_DURATION: 저장할 최소 처리 시간 (초)
+PROFILING = {
+    "ENABLED": os.getenv("PROFILING_ENABLED", "False").lower() == "true",
+    "SAMPLE_RATE": float(os.getenv("PROFILING_SAMPLE_RATE", "0.01")),
+    "KEEP": int(os.getenv("PROFILING_KEEP", "20")),
+    "MIN_DURATION": float(os.getenv("PROFILING_MIN_DURATION", "0.2")),
+    "DIRECTORY": os.getenv("PROFILING_DIRECTORY", "/tmp/ourhour-profiles"),
+}
+
+# 읽기 복제본 (common.db_router)
+# ALIASES: DATABASES의 복제본 별칭 목록 (비어 있으면 모든 쿼리가 default 사용)
+# STICKY_SECONDS: 쓰기 요청 후 같은 클라이언트를 primary에 고정하는 시간
+# MAX_LAG: 이보다 지연(초)이 큰 복제본은 제외, CHECK_INTERVAL: 복제본 상태 확인 주기 (초)
+DATABASE_ROUTERS = ["common.db_router.ReadReplicaRouter"]
+READ_REPLICAS = {
+    "ALIASES": [],
+    "STICKY_SECONDS": int(os.getenv("DB_REPLICA_STICKY_SECONDS", "10")),
+    "COOKIE_NAME": "ourhour_primary",
+    "MAX_LAG": float(os.getenv("DB_REPLICA_MAX_LAG", "5")),
+    "CHECK_INTERVAL": float(os.getenv("DB_REPLICA_CHECK_INTERVAL", "5")),
+}
+
+# 캐시 (BACKEND/LOCATION으로 Redis 등 워커 간 공유 캐시 지정, 기본값은 워커별 메모리)
+# 워커별 메모리에서는 SERVICE_CACHE 공유 계층/SINGLE_FLIGHT 잠금이 워커 안에서만 동작 (DEBUG가 아니면 shared.W001 경고)
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+        "KEY_PREFIX": os.getenv("CACHE_KEY_PREFIX", "ourhour"),
+    }
+}
+
+# 서비스 캐시 (apps.shared.cache, 공유 캐시 앞에 워커별 LRU를 둠)
+# LOCAL_MAX_ENTRIES: 워커 LRU 최대 항목 수 (0이면 공유 캐시만 사용), LOCAL_TIMEOUT/TIMEOUT: 초 단위
+# GENERATION_CHECK_INTERVAL: 무효화(세대 번호)를 공유 캐시에서 다시 확인하는 주기 (초)
+SERVICE_CACHE = {
+    "ENABLED": os.getenv("SERVICE_CACHE_ENABLED", "True").lower() == "true",
+    "TIMEOUT": int(os.getenv("SERVICE_CACHE_TIMEOUT", "300")),
+    "LOCAL_MAX_ENTRIES": int(os.getenv("SERVICE_CACHE_LOCAL_MAX_ENTRIES", "1000")),
+    "LOCAL_TIMEOUT": int(os.getenv("SERVICE_CACHE_LOCAL_TIMEOUT", "30")),
+    "GENERATION_CHECK_INTERVAL": float(os.getenv("SERVICE_CACHE_GENERATION_CHECK_INTERVAL", "1")),
+}
+
+# 조회수 버퍼 설정
+# BACKEND: local(워커별 메모리) 또는 cache(공유 캐시), FLUSH_INTERVAL: 초 단위 (0이면 즉시 반영)
+VIEW_COUNT_BUFFER = {
+    "BACKEND": os.getenv("VIEW_COUNT_BUFFER_BACKEND", "local"),
+    "FLUSH_INTERVAL": int(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", "5")),
+}
+
+# url_slug 발급기 (apps.invitations.services.slug_allocator)
+# KEY: slug 순열 키 (필수, SECRET_KEY와 별도). 바꾸면 이후 발급되는 slug 순열이 달라지므로 운영 중에는 고정
+# (이전처럼 SECRET_KEY로 발급해 온 환경은 그때의 SECRET_KEY 값을 지정)
+SLUG_ALLOCATOR = {
+    "BLOCK_SIZE": int(os.getenv("SLUG_ALLOCATOR_BLOCK_SIZE", "1000")),
+    "KEY": os.getenv("SLUG_ALLOCATOR_KEY"),
+}
+
+# 공개 청첩장 응답 캐시 유지 시간 (초)
+PUBLIC_INVITATION_CACHE_TIMEOUT = int(os.getenv("PUBLIC_INVITATION_CACHE_TIMEOUT", "300"))
+
+# 캐시 미스 단일 실행 (공개 청첩장 본문/검증자, apps.shared.cache.single_flight)
+# LOCK_LEASE: 재계산 잠금 임대 시간, LOCK_WAIT: 이전 값이 없을 때 기다리는 최대 시간,
+# STALE_TIMEOUT: 만료 후에도 재계산 중 대신 반환할 이전 값을 보관하는 시간 (모두 초 단위)
+SINGLE_FLIGHT = {
+    "LOCK_LEASE": int(os.getenv("SINGLE_FLIGHT_LOCK_LEASE", "5")),
+    "LOCK_WAIT": float(os.getenv("SINGLE_FLIGHT_LOCK_WAIT", "2")),
+    "POLL_INTERVAL": float(os.getenv("SINGLE_FLIGHT_POLL_INTERVAL", "0.05")),
+    "STALE_TIMEOUT": int(os.getenv("SINGLE_FLIGHT_STALE_TIMEOUT", "60")),
+    "NEGATIVE_TIMEOUT": int(os.getenv("SINGLE_FLIGHT_NEGATIVE_TIMEOUT", "5")),
+}
+
+# 공개 청첩장 정적 스냅샷 (nginx가 직접 서빙, resources/nginx/nginx.conf 참고)
+INVITATION_SNAPSHOT = {
+    "ENABLED": os.getenv("INVITATION_SNAPSHOT_ENABLED", "False").lower() == "true",
+    "ROOT": Path(os.getenv("INVITATION_SNAPSHOT_ROOT", BASE_DIR / "snapshots")),
+    "HTML": os.getenv("INVITATION_SNAPSHOT_HTML", "False").lower() == "true",
+}
+
+# RSVP/방명록 접수 대기열 (write-behind)
+# ENABLED: 제출을 대기열에 적재하고 202로 응답 (drain_intake_queue 워커 필요)
+# MAX_PENDING: 대기 중인 제출이 이 수 이상이면 503으로 거절, RETENTION: 처리된 행 보관 시간 (초, 멱등성 확인용)
+INTAKE_QUEUE = {
+    "ENABLED": os.getenv("INTAKE_QUEUE_ENABLED", "False").lower() == "true",
+    "MAX_PENDING": int(os.getenv("INTAKE_QUEUE_MAX_PENDING", "10000")),
+    "BATCH_SIZE": int(os.getenv("INTAKE_QUEUE_BATCH_SIZE", "500")),
+    "MAX_ATTEMPTS": int(os.getenv("INTAKE_QUEUE_MAX_ATTEMPTS", "5")),
+    "RETENTION": int(os.getenv("INTAKE_QUEUE_RETENTION", "86400")),
+    "RETRY_AFTER": int(os.getenv("INTAKE_QUEUE_RETRY_AFTER", "5")),
+}
+
 # drf-spectacular settings
 SPECTACULAR_SETTINGS = {
     "TITLE": "OurHour API",
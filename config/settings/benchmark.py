@@ -0,0 +1,59 @@
+"""
+벤치마크 환경 설정 (tests/benchmarks)
+
+BENCH_DATABASE로 DB를 고릅니다.
+- auto(기본값): 로컬 MySQL(DB_HOST:DB_PORT)에 연결할 수 있으면 mysql, 아니면 sqlite
+- sqlite: 임시 디렉터리의 파일 DB (여러 스레드가 같은 DB를 쓰도록 메모리 DB 대신 파일 사용)
+- mysql: DB_HOST/DB_PORT/DB_USER/DB_PASSWORD의 MySQL에 test_ourhour_bench DB를 만들어 사용
+"""
+
+import socket
+import tempfile
+
+from config.settings.test import *
+
+DEBUG = False
+
+
+def _mysql_available() -> bool:
+    try:
+        import MySQLdb  # noqa: F401
+    except ImportError:
+        return False
+    try:
+        socket.create_connection((os.getenv("DB_HOST", "localhost"), int(os.getenv("DB_PORT", "3306"))), 0.5).close()
+    except OSError:
+        return False
+    return True
+
+
+BENCH_DATABASE = os.getenv("BENCH_DATABASE", "auto")
+if BENCH_DATABASE == "auto":
+    BENCH_DATABASE = "mysql" if _mysql_available() else "sqlite"
+
+if BENCH_DATABASE == "mysql":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.mysql",
+            "NAME": "ourhour_bench",
+            "USER": os.getenv("DB_USER", "root"),
+            "PASSWORD": os.getenv("DB_PASSWORD", ""),
+            "HOST": os.getenv("DB_HOST", "localhost"),
+            "PORT": os.getenv("DB_PORT", "3306"),
+            "OPTIONS": {
+                "charset": "utf8mb4",
+            },
+            "TEST": {"NAME": "test_ourhour_bench", "CHARSET": "utf8mb4"},
+        },
+    }
+else:
+    BENCH_SQLITE_PATH = os.path.join(tempfile.gettempdir(), "ourhour_bench.sqlite3")
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BENCH_SQLITE_PATH,
+            # 동시 쓰기(RSVP 제출)는 잠금이 풀릴 때까지 대기
+            "OPTIONS": {"timeout": 30},
+            "TEST": {"NAME": BENCH_SQLITE_PATH},
+        },
+    }
@@ -24,12 +24,28 @@ DATABASES = {
 CORS_ALLOWED_ORIGINS = os.getenv("CORS_ALLOWED_ORIGINS", "").split(",") if os.getenv("CORS_ALLOWED_ORIGINS") else []
 
 # 로깅 설정 (중간 레벨)
+# LOGGING_ASYNC: 요청 스레드는 큐에 넣기만 하고 별도 스레드에서 출력 (common.logging.QueueStreamHandler, 기본값 False)
+# LOGGING_QUEUE_SIZE: 큐 크기 (가득 차면 기다리지 않고 버린 뒤 버린 수를 WARNING으로 기록)
+LOGGING_ASYNC = os.getenv("LOGGING_ASYNC", "False").lower() == "true"
+LOGGING_QUEUE_SIZE = int(os.getenv("LOGGING_QUEUE_SIZE", "10000"))
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
+    "filters": {
+        "request_context": {"()": "common.logging.RequestContextFilter"},
+    },
+    "formatters": {
+        "json": {"()": "common.logging.JSONFormatter"},
+    },
     "handlers": {
         "console": {
-            "class": "logging.StreamHandler",
+            **(
+                {"()": "common.logging.QueueStreamHandler", "maxsize": LOGGING_QUEUE_SIZE}
+                if LOGGING_ASYNC
+                else {"class": "logging.StreamHandler"}
+            ),
+            "formatter": "json",
+            "filters": ["request_context"],
         },
     },
     "root": {
@@ -42,5 +58,11 @@ LOGGING = {
             "level": "INFO",
             "propagate": False,
         },
+        # 요청 로그 (common.middleware.RequestLogMiddleware)
+        "ourhour.requests": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }
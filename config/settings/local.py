@@ -23,6 +23,9 @@ DATABASES = {
     }
 }
 
+# url_slug 순열 키 (로컬 개발용 기본값)
+SLUG_ALLOCATOR["KEY"] = SLUG_ALLOCATOR["KEY"] or "local-insecure-slug-allocator-key"
+
 # 개발 전용 앱 추가
 INSTALLED_APPS += [
     "django_extensions",
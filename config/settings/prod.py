@@ -23,6 +23,25 @@ DATABASES = {
     }
 }
 
+# 읽기 복제본 (DB_REPLICA_HOSTS=host1,host2, 나머지 접속 정보는 primary와 같음)
+for index, host in enumerate(filter(None, os.getenv("DB_REPLICA_HOSTS", "").split(",")), start=1):
+    DATABASES[f"replica{index}"] = {
+        **DATABASES["default"],
+        "HOST": host.strip(),
+        "PORT": os.getenv("DB_REPLICA_PORT", DATABASES["default"]["PORT"]),
+    }
+READ_REPLICAS["ALIASES"] = [alias for alias in DATABASES if alias != "default"]
+
+# 캐시 (서비스 캐시 공유 계층/세대 무효화, SingleFlight 잠금, 조회수 cache 버퍼는 워커 간 공유 캐시가 필요)
+# CACHE_LOCATION: redis://host:6379/0 형식 (CACHE_BACKEND로 다른 공유 캐시 지정 가능)
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.redis.RedisCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "redis://localhost:6379/0"),
+        "KEY_PREFIX": os.getenv("CACHE_KEY_PREFIX", "ourhour"),
+    }
+}
+
 # 보안 설정 강화
 SECURE_SSL_REDIRECT = True
 SESSION_COOKIE_SECURE = True
@@ -41,12 +60,28 @@ CORS_ALLOWED_ORIGINS = os.getenv("CORS_ALLOWED_ORIGINS", "").split(",") if os.ge
 # STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 # 로깅 설정 (최적화된 레벨)
+# LOGGING_ASYNC: 요청 스레드는 큐에 넣기만 하고 별도 스레드에서 출력 (common.logging.QueueStreamHandler, 기본값 True)
+# LOGGING_QUEUE_SIZE: 큐 크기 (가득 차면 기다리지 않고 버린 뒤 버린 수를 WARNING으로 기록)
+LOGGING_ASYNC = os.getenv("LOGGING_ASYNC", "True").lower() == "true"
+LOGGING_QUEUE_SIZE = int(os.getenv("LOGGING_QUEUE_SIZE", "10000"))
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
+    "filters": {
+        "request_context": {"()": "common.logging.RequestContextFilter"},
+    },
+    "formatters": {
+        "json": {"()": "common.logging.JSONFormatter"},
+    },
     "handlers": {
         "console": {
-            "class": "logging.StreamHandler",
+            **(
+                {"()": "common.logging.QueueStreamHandler", "maxsize": LOGGING_QUEUE_SIZE}
+                if LOGGING_ASYNC
+                else {"class": "logging.StreamHandler"}
+            ),
+            "formatter": "json",
+            "filters": ["request_context"],
         },
     },
     "root": {
@@ -59,5 +94,11 @@ LOGGING = {
             "level": "ERROR",
             "propagate": False,
         },
+        # 요청 로그 (common.middleware.RequestLogMiddleware)
+        "ourhour.requests": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }
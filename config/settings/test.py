@@ -7,11 +7,17 @@ from config.settings.base import *
 DEBUG = os.getenv("DEBUG", "True").lower() == "true"
 
 # 테스트용 데이터베이스
+# replica는 읽기 복제본 라우터 확인용 (default를 미러링, READ_REPLICAS["ALIASES"]에 넣은 테스트에서만 사용)
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
-    }
+    },
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"MIRROR": "default"},
+    },
 }
 
 # 테스트 실행 최적화
@@ -19,6 +25,15 @@ PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]
 
+# 조회수는 테스트에서 즉시 반영
+VIEW_COUNT_BUFFER = {
+    "BACKEND": "local",
+    "FLUSH_INTERVAL": 0,
+}
+
+# url_slug 순열 키 (테스트 전용)
+SLUG_ALLOCATOR = {**SLUG_ALLOCATOR, "KEY": "test-slug-allocator-key"}
+
 # MIDDLEWARE = [m for m in MIDDLEWARE if 'debug_toolbar' not in m]
 
 # 로깅 비활성화
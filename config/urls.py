@@ -6,6 +6,8 @@ from django.contrib import admin
 from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from common.views import metrics_view
+
 urlpatterns = [
     # Admin
     path("admin/", admin.site.urls),
@@ -23,4 +25,6 @@ urlpatterns = [
     # API 문서
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
+    # 지표 (Prometheus)
+    path("metrics", metrics_view, name="metrics"),
 ]
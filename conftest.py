@@ -4,11 +4,26 @@ pytest 설정 및 공통 fixtures
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
+from apps.shared.cache import service_cache, single_flight
+
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """테스트 간 캐시 격리 (서비스 캐시의 워커 LRU 포함)"""
+    cache.clear()
+    service_cache.reset()
+    single_flight.reset()
+    yield
+    cache.clear()
+    service_cache.reset()
+    single_flight.reset()
+
+
 @pytest.fixture
 def api_client():
     """API 클라이언트 fixture"""
@@ -0,0 +1,12 @@
+"""
+성능 벤치마크 (pytest 수집 대상 아님)
+
+python -m tests.benchmarks.<모듈명> 으로 실행합니다. (설정: config/settings/benchmark.py)
+"""
+
+import os
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.benchmark")
+django.setup()
@@ -0,0 +1,418 @@
+"""
+WSGI/ASGI 동시 처리 벤치마크: 공개 조회 API를 같은 메모리(워커 프로세스 1개)에서 동시 접속 수를 늘려 가며 비교
+
+python -m tests.benchmarks.bench_asgi [--concurrency 8 --concurrency 64 ...] [--threads 8] [--requests 600]
+                                     [--cache-latency-ms 1] [--slo-ms 250] [--mode wsgi|asgi]
+
+- wsgi: 동기 공개 뷰를 WSGIHandler로 --threads개 스레드에서 처리 (gunicorn gthread 워커 1개에 해당)
+- asgi: 비동기 공개 뷰(ASYNC_PUBLIC_VIEWS)를 ASGIHandler로 이벤트 루프 하나에서 처리 (uvicorn 워커 1개에 해당)
+
+두 방식은 같은 데이터로 각각 fork한 프로세스 하나에서 실행하고, 실행 중 늘어난 메모리(RSS)와 최대 스레드 수를 함께 보고합니다.
+동시 접속 수마다 --requests개 요청을 클라이언트 --concurrency개가 쉬지 않고 보내며(closed loop),
+지연 시간은 클라이언트 기준(워커 대기 포함)입니다. p95가 --slo-ms 이하이고 오류가 없는 가장 큰 동시 접속 수를 처리 용량으로 봅니다.
+
+공유 캐시(Redis 등)까지의 네트워크 왕복은 --cache-latency-ms만큼 기다리는 메모리 캐시(NetworkLatencyCache)로 흉내 냅니다.
+Django 캐시 백엔드의 비동기 API는 동기 호출을 스레드에서 실행하므로, 이 캐시도 같은 방식으로 동작합니다.
+HTTP 서버(uvicorn/gunicorn)와 네트워크 비용은 포함되지 않습니다. 요청 구성은 build_paths()를 참고하세요.
+오류 응답이 있으면 종료 코드 1로 실패합니다.
+"""
+
+import argparse
+import asyncio
+import itertools
+import multiprocessing
+import os
+import resource
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from importlib import reload
+from io import BytesIO
+from typing import Callable, List, Tuple
+
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connection, connections
+from django.test.utils import (
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.urls import clear_url_caches
+
+from tests.benchmarks.bench_endpoints import percentile, seed
+
+MODES = ("wsgi", "asgi")
+URL_MODULES = ("apps.invitations.urls", "apps.templates.urls", "config.urls")
+WARMUP_REQUESTS = 50
+MISSING = object()
+
+RequestPath = Tuple[str, str]
+
+
+class NetworkLatencyCache(LocMemCache):
+    """
+    네트워크 왕복 시간이 있는 공유 캐시를 흉내 내는 메모리 캐시
+
+    조회/저장 한 번마다 OPTIONS["LATENCY"]초 동안 호출한 스레드를 막습니다. (get_many는 한 번)
+    """
+
+    def __init__(self, name, params):
+        super().__init__(name, params)
+        self.latency = params.get("OPTIONS", {}).get("LATENCY", 0)
+
+    def _round_trip(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    def get(self, key, default=None, version=None):
+        self._round_trip()
+        return super().get(key, default, version)
+
+    def get_many(self, keys, version=None):
+        self._round_trip()
+        values = {key: super(NetworkLatencyCache, self).get(key, MISSING, version) for key in keys}
+        return {key: value for key, value in values.items() if value is not MISSING}
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._round_trip()
+        return super().set(key, value, timeout, version)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._round_trip()
+        return super().add(key, value, timeout, version)
+
+    def incr(self, key, delta=1, version=None):
+        self._round_trip()
+        return super().incr(key, delta, version)
+
+    def delete(self, key, version=None):
+        self._round_trip()
+        return super().delete(key, version)
+
+
+class ResourceSampler:
+    """블록 실행 중 RSS(MB)와 스레드 수의 최댓값을 주기적으로 기록"""
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.start_rss = self.peak_rss = current_rss_mb()
+        self.peak_threads = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_rss = max(self.peak_rss, current_rss_mb())
+            # 샘플러 스레드 자신은 제외
+            self.peak_threads = max(self.peak_threads, threading.active_count() - 1)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+def current_rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except OSError:
+        # /proc이 없는 환경은 최대 RSS로 대신함 (Linux는 KB, macOS는 byte)
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def build_paths(data: dict) -> Callable[[int], RequestPath]:
+    """
+    요청 번호별 (경로, 쿼리 문자열)
+
+    10건 중 청첩장 본문 5, RSVP 통계 2, 방명록 첫 페이지 1, 템플릿 목록 1, 템플릿 상세 1이고,
+    청첩장 요청의 80%는 인기 청첩장 하나, 나머지는 여러 청첩장입니다.
+    """
+    hot = data["hot"].url_slug
+    slugs = data["public_slugs"]
+    template_ids = data["template_ids"]
+
+    def path(index: int) -> RequestPath:
+        kind = index % 10
+        slug = slugs[index % len(slugs)] if (index // 10) % 5 == 0 else hot
+        if kind < 5:
+            return f"/api/v1/invitations/slug/{slug}/", ""
+        if kind < 7:
+            return f"/api/v1/invitations/slug/{slug}/rsvps/", ""
+        if kind < 8:
+            return f"/api/v1/invitations/slug/{slug}/guestbooks/", ""
+        if kind < 9:
+            return "/api/v1/templates/", "category=MODERN"
+        return f"/api/v1/templates/{template_ids[index % len(template_ids)]}/", ""
+
+    return path
+
+
+def wsgi_get(handler: WSGIHandler, path: RequestPath) -> int:
+    """WSGI 서버처럼 GET 요청 하나를 처리하고 상태 코드 반환"""
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path[0],
+        "QUERY_STRING": path[1],
+        "SCRIPT_NAME": "",
+        "SERVER_NAME": "testserver",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": "127.0.0.1",
+        "HTTP_HOST": "testserver",
+        "wsgi.input": BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.url_scheme": "http",
+        "wsgi.version": (1, 0),
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    status = []
+    response = handler(environ, lambda status_line, headers, exc_info=None: status.append(status_line))
+    try:
+        for _ in response:
+            pass
+    finally:
+        # request_finished 신호 (요청 스레드의 DB 연결 정리)
+        response.close()
+    return int(status[0].split()[0])
+
+
+async def asgi_get(handler: ASGIHandler, path: RequestPath) -> int:
+    """ASGI 서버처럼 GET 요청 하나를 처리하고 상태 코드 반환"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path[0],
+        "raw_path": path[0].encode(),
+        "query_string": path[1].encode(),
+        "root_path": "",
+        "headers": [(b"host", b"testserver")],
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 50000),
+    }
+    body_sent = False
+    status = 0
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # 응답이 끝날 때까지 연결 유지 (응답 후 Django가 취소)
+        await asyncio.Future()
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await handler(scope, receive, send)
+    return status
+
+
+def summarize(concurrency: int, duration: float, latencies: List[float], statuses: Counter) -> dict:
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": sum(count for code, count in statuses.items() if code >= 400),
+        "rps": round(len(latencies) / duration, 1),
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+    }
+
+
+def run_wsgi_level(handler, path, concurrency: int, total: int, server: ThreadPoolExecutor) -> dict:
+    """클라이언트 concurrency개가 total개 요청을 server 스레드 풀(WSGI 워커)로 보냄"""
+    counter = itertools.count()
+    latencies, statuses = [], Counter()
+    lock = threading.Lock()
+
+    def client(_):
+        while (index := next(counter)) < total:
+            start = time.perf_counter()
+            try:
+                code = server.submit(wsgi_get, handler, path(index)).result()
+            except Exception:
+                code = 599
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                statuses[code] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as clients:
+        list(clients.map(client, range(concurrency)))
+    return summarize(concurrency, time.perf_counter() - start, latencies, statuses)
+
+
+async def run_asgi_level(handler, path, concurrency: int, total: int) -> dict:
+    """클라이언트 concurrency개(태스크)가 total개 요청을 이벤트 루프 하나(ASGI 워커)로 보냄"""
+    counter = itertools.count()
+    latencies, statuses = [], Counter()
+
+    async def client():
+        while (index := next(counter)) < total:
+            start = time.perf_counter()
+            try:
+                code = await asgi_get(handler, path(index))
+            except Exception:
+                code = 599
+            latencies.append(time.perf_counter() - start)
+            statuses[code] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return summarize(concurrency, time.perf_counter() - start, latencies, statuses)
+
+
+def reload_urls() -> None:
+    """ASYNC_PUBLIC_VIEWS에 맞게 URL 설정을 다시 불러옴"""
+    for module in URL_MODULES:
+        if module in sys.modules:
+            reload(sys.modules[module])
+    clear_url_caches()
+
+
+def run_mode(mode: str, data: dict, args, results) -> None:
+    """fork된 프로세스에서 한 방식의 모든 동시 접속 수를 실행하고 결과를 results 큐로 전달"""
+    try:
+        path = build_paths(data)
+        overrides = {
+            "ASYNC_PUBLIC_VIEWS": mode == "asgi",
+            "CACHES": {
+                "default": {
+                    "BACKEND": "tests.benchmarks.bench_asgi.NetworkLatencyCache",
+                    "LOCATION": f"bench-{mode}",
+                    "OPTIONS": {"LATENCY": args.cache_latency_ms / 1000},
+                }
+            },
+            # 운영과 같이 조회수는 워커 버퍼에 모았다가 반영
+            "VIEW_COUNT_BUFFER": {**settings.VIEW_COUNT_BUFFER, "BACKEND": "local", "FLUSH_INTERVAL": 5},
+        }
+        with override_settings(**overrides):
+            reload_urls()
+            with ResourceSampler() as sampler:
+                if mode == "wsgi":
+                    handler = WSGIHandler()
+                    with ThreadPoolExecutor(max_workers=args.threads) as server:
+                        # 준비 요청 (URL 해석, 캐시 채우기 등 처음 한 번의 비용 제외)
+                        run_wsgi_level(handler, path, 1, WARMUP_REQUESTS, server)
+                        levels = [
+                            run_wsgi_level(handler, path, concurrency, args.requests, server)
+                            for concurrency in args.concurrency
+                        ]
+                else:
+                    handler = ASGIHandler()
+
+                    async def run_levels():
+                        await run_asgi_level(handler, path, 1, WARMUP_REQUESTS)
+                        return [
+                            await run_asgi_level(handler, path, concurrency, args.requests)
+                            for concurrency in args.concurrency
+                        ]
+
+                    levels = asyncio.run(run_levels())
+        results.put(
+            {
+                "levels": levels,
+                "memory_mb": round(sampler.peak_rss - sampler.start_rss, 1),
+                "peak_threads": sampler.peak_threads,
+            }
+        )
+    except Exception:
+        results.put({"error": traceback.format_exc()})
+
+
+def capacity(levels: List[dict], slo_ms: float) -> int:
+    """p95가 slo_ms 이하이고 오류가 없는 가장 큰 동시 접속 수 (없으면 0)"""
+    return max(
+        (level["concurrency"] for level in levels if level["p95_ms"] <= slo_ms and not level["errors"]), default=0
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", action="append", choices=MODES, help="실행할 방식 (기본값: 둘 다)")
+    parser.add_argument(
+        "--concurrency", action="append", type=int, help="동시 접속 수 (여러 번 지정 가능, 기본값: 1 8 32 128)"
+    )
+    parser.add_argument("--threads", type=int, default=8, help="WSGI 워커 스레드 수")
+    parser.add_argument("--requests", type=int, default=600, help="동시 접속 수별 요청 수")
+    parser.add_argument("--cache-latency-ms", type=float, default=1.0, help="공유 캐시 왕복 시간")
+    parser.add_argument("--slo-ms", type=float, default=250.0, help="처리 용량 기준 p95 지연 시간")
+    args = parser.parse_args()
+    args.concurrency = sorted(set(args.concurrency or [1, 8, 32, 128]))
+    if "fork" not in multiprocessing.get_all_start_methods():
+        parser.error("fork를 지원하는 환경(Linux/macOS)에서만 실행할 수 있습니다.")
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    vendor = connection.vendor
+    results = {}
+    try:
+        data = seed()
+        # 부모의 DB 연결을 fork된 프로세스와 공유하지 않도록 닫음
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        for mode in args.mode or MODES:
+            queue = context.Queue()
+            process = context.Process(target=run_mode, args=(mode, data, args, queue))
+            process.start()
+            results[mode] = queue.get()
+            process.join()
+    finally:
+        connections.close_all()
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+    print(
+        f"DB: {vendor}, WSGI 스레드 {args.threads}개, 캐시 왕복 {args.cache_latency_ms}ms, "
+        f"요청 {args.requests}건/동시 접속 수"
+    )
+    print(f"{'mode':<6}{'clients':>9}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>8}")
+    failed = False
+    for mode, result in results.items():
+        if "error" in result:
+            print(f"{mode}: 실행 실패\n{result['error']}", file=sys.stderr)
+            failed = True
+            continue
+        for level in result["levels"]:
+            failed = failed or bool(level["errors"])
+            print(
+                f"{mode:<6}{level['concurrency']:>9}{level['rps']:>9}{level['p50_ms']:>9}{level['p95_ms']:>9}"
+                f"{level['p99_ms']:>9}{level['errors']:>8}"
+            )
+
+    print(f"\n{'mode':<6}{'memory +MB':>12}{'threads':>9}{f'capacity (p95<={args.slo_ms:g}ms)':>26}")
+    for mode, result in results.items():
+        if "error" not in result:
+            print(
+                f"{mode:<6}{result['memory_mb']:>12}{result['peak_threads']:>9}"
+                f"{capacity(result['levels'], args.slo_ms):>26}"
+            )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+엔드포인트 부하 벤치마크: 공개/소유자 API의 처리량, 지연 시간, 요청당 쿼리 수
+
+python -m tests.benchmarks.bench_endpoints [--scenario public_slug_read ...] [--threads 8] [--requests 400]
+                                          [--update-baseline] [--tolerance 0.4]
+
+시나리오
+- public_slug_read: 공개 청첩장 조회 폭주 (80%는 인기 청첩장 하나, 나머지는 여러 청첩장)
+- rsvp_submit: 청첩장 하나에 RSVP 동시 제출
+- guestbook_deep_pagination: 방명록 5000건을 키셋 커서로 끝까지 (모든 깊이의 페이지를 고르게)
+- template_catalog: 템플릿 목록/카테고리 필터/상세 탐색
+- owner_dashboard: 청첩장 50개를 가진 소유자의 목록/대시보드
+
+테스트 DB(config/settings/benchmark.py, 로컬 MySQL이 있으면 MySQL, 없으면 SQLite 파일)를 만들어 실행하고 삭제합니다.
+요청은 Django 테스트 클라이언트로 --threads개 스레드에서 보내므로 네트워크/WSGI 서버 비용은 포함되지 않습니다.
+
+결과는 DB 종류별 기준값(baselines/endpoints.json)과 비교하여, 아래 경우 종료 코드 1로 실패합니다.
+- 오류 응답(4xx/5xx, 예외)
+- 요청당 평균 쿼리 수가 --query-tolerance보다 많이 증가
+- 처리량(rps)이 --tolerance 비율 이상 감소하거나 p95 지연이 --tolerance 비율 이상 증가
+시간 값은 실행 환경에 따라 다르므로, 비교할 환경에서 --update-baseline으로 기준값을 다시 저장합니다.
+요청당 쿼리 수와 시간 값은 --requests/--threads에 따라 달라지므로 기준값에 함께 저장하며,
+기준값과 다른 값으로 실행하면 비교하지 않습니다.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import (
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.invitations.models import RSVP, Guestbook, Invitation
+from apps.invitations.services.rsvp_service import RSVPService
+from apps.shared.cache import service_cache, single_flight
+from apps.templates.models import Template
+from common.queries import QueryRecorder
+
+User = get_user_model()
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "endpoints.json"
+PARAMETERS_KEY = "parameters"
+CATEGORIES = ["MODERN", "CLASSIC", "FLORAL", "MINIMAL", "ROMANTIC"]
+PUBLIC_INVITATIONS = 200
+GUESTBOOK_ENTRIES = 5000
+OWNER_INVITATIONS = 50
+
+
+def seed() -> dict:
+    """시나리오용 데이터 생성"""
+    now = timezone.now()
+    templates = Template.objects.bulk_create(
+        Template(
+            name=f"템플릿 {index}",
+            description="벤치마크용 템플릿",
+            thumbnail_url=f"https://example.com/templates/{index}.jpg",
+            category=CATEGORIES[index % len(CATEGORIES)],
+            is_premium=index % 4 == 0,
+        )
+        for index in range(60)
+    )
+    owner = User.objects.create_user(username="owner@bench.test", email="owner@bench.test", password="bench-pass")
+    host = User.objects.create_user(username="host@bench.test", email="host@bench.test", password="bench-pass")
+
+    def invitation(user, slug, index):
+        return Invitation(
+            user=user,
+            template=templates[index % len(templates)],
+            title=f"청첩장 {index}",
+            url_slug=slug,
+            groom_name="홍길동",
+            bride_name="김영희",
+            wedding_date=now + timedelta(days=30 + index % 90),
+            wedding_location_name="더 채플",
+            invitation_message="저희 두 사람의 새로운 시작을 함께해 주세요.",
+            status="PUBLISHED",
+            is_public=True,
+            published_at=now,
+        )
+
+    Invitation.objects.bulk_create(invitation(host, f"bench-{index}", index) for index in range(PUBLIC_INVITATIONS))
+    Invitation.objects.bulk_create(invitation(owner, f"owner-{index}", index) for index in range(OWNER_INVITATIONS))
+    public = list(Invitation.objects.filter(user=host).order_by("id"))
+    owned = list(Invitation.objects.filter(user=owner).order_by("id"))
+
+    hot = public[0]
+    Guestbook.objects.bulk_create(
+        Guestbook(invitation=hot, author_name=f"하객{index}", message="행복하세요! " * 4)
+        for index in range(GUESTBOOK_ENTRIES)
+    )
+    statuses = ["ATTENDING", "NOT_ATTENDING", "PENDING"]
+    for index, item in enumerate(owned):
+        RSVP.objects.bulk_create(
+            RSVP(invitation=item, guest_name=f"하객{n}", guest_count=n % 3 + 1, attendance_status=statuses[n % 3])
+            for n in range(index % 20)
+        )
+        Guestbook.objects.bulk_create(
+            Guestbook(invitation=item, author_name=f"하객{n}", message="축하합니다!") for n in range(index % 10)
+        )
+    RSVPService.rebuild_statistics([item.id for item in owned])
+
+    return {
+        "hot": hot,
+        "public_slugs": [item.url_slug for item in public],
+        "template_ids": [item.id for item in templates],
+        "owner_token": str(RefreshToken.for_user(owner).access_token),
+    }
+
+
+def collect_guestbook_pages(client: Client, slug: str) -> List[str]:
+    """방명록 첫 페이지부터 next 링크를 따라가며 모든 페이지 URL 수집"""
+    url = f"/api/v1/invitations/slug/{slug}/guestbooks/?page_size=20"
+    pages = []
+    while url:
+        pages.append(url)
+        url = client.get(url).json()["next"]
+    return pages
+
+
+def build_scenarios(data: dict) -> Dict[str, Callable[[Client, int], object]]:
+    """시나리오 이름 -> (클라이언트, 요청 번호) -> 응답"""
+    hot_slug = data["hot"].url_slug
+    public_slugs = data["public_slugs"]
+    template_ids = data["template_ids"]
+    auth = {"HTTP_AUTHORIZATION": f"Bearer {data['owner_token']}"}
+    guestbook_pages = collect_guestbook_pages(Client(), hot_slug)
+    rsvp_url = f"/api/v1/invitations/{data['hot'].id}/rsvps/"
+    run_id = int(time.time())
+
+    def public_slug_read(client, index):
+        slug = hot_slug if index % 5 else public_slugs[index % len(public_slugs)]
+        return client.get(f"/api/v1/invitations/slug/{slug}/")
+
+    def rsvp_submit(client, index):
+        body = {
+            "guest_name": f"동시하객{run_id}-{index}",
+            "guest_count": index % 3 + 1,
+            "attendance_status": "ATTENDING" if index % 4 else "NOT_ATTENDING",
+            "phone": f"010-{index // 10000:04d}-{index % 10000:04d}",
+            "message": "축하합니다!",
+        }
+        return client.post(rsvp_url, body, content_type="application/json")
+
+    def guestbook_deep_pagination(client, index):
+        return client.get(guestbook_pages[index % len(guestbook_pages)])
+
+    def template_catalog(client, index):
+        step = index % 4
+        if step == 0:
+            return client.get("/api/v1/templates/")
+        if step == 1:
+            return client.get(f"/api/v1/templates/?category={CATEGORIES[index % len(CATEGORIES)]}")
+        if step == 2:
+            return client.get("/api/v1/templates/?page=3&ordering=-usage_count")
+        return client.get(f"/api/v1/templates/{template_ids[index % len(template_ids)]}/")
+
+    def owner_dashboard(client, index):
+        if index % 2:
+            return client.get("/api/v1/invitations/dashboard/?page_size=50", **auth)
+        return client.get("/api/v1/invitations/", **auth)
+
+    return {
+        "public_slug_read": public_slug_read,
+        "rsvp_submit": rsvp_submit,
+        "guestbook_deep_pagination": guestbook_deep_pagination,
+        "template_catalog": template_catalog,
+        "owner_dashboard": owner_dashboard,
+    }
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_scenario(request: Callable[[Client, int], object], total: int, threads: int, start_index: int = 0) -> dict:
+    """total개 요청(번호 start_index부터)을 threads개 스레드에서 보내고 처리량/지연 시간/쿼리 수 계산"""
+    # 캐시가 빈 상태에서 시작 (폭주 시 캐시 채우기 비용 포함)
+    cache.clear()
+    service_cache.reset()
+    single_flight.reset()
+
+    local = threading.local()
+    latencies, query_counts, errors = [], [], []
+    lock = threading.Lock()
+
+    def send(index):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = Client()
+        start = time.perf_counter()
+        try:
+            with QueryRecorder() as recorder:
+                response = request(client, index)
+            failed = response.status_code >= 400 and f"{response.status_code}"
+        except Exception as e:
+            failed = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            if failed:
+                errors.append(failed)
+            else:
+                query_counts.append(recorder.count)
+
+    barrier = threading.Barrier(threads)
+
+    def close_connections(_):
+        # 모든 스레드가 하나씩 맡도록 대기
+        barrier.wait()
+        connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(send, range(start_index, start_index + total)))
+        duration = time.perf_counter() - start
+        # 스레드별 DB 연결 정리 (테스트 DB 삭제 전)
+        list(executor.map(close_connections, range(threads)))
+
+    return {
+        "requests": total,
+        "errors": len(errors),
+        "error_samples": sorted(set(errors))[:3],
+        "rps": round(total / duration, 1),
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "queries_per_request": round(sum(query_counts) / len(query_counts), 2) if query_counts else 0,
+    }
+
+
+def compare(name: str, result: dict, baseline: dict, tolerance: float, query_tolerance: float) -> List[str]:
+    """기준값 대비 회귀 목록"""
+    problems = []
+    if result["errors"]:
+        problems.append(f"{name}: 오류 응답 {result['errors']}건 {result['error_samples']}")
+    if not baseline:
+        return problems
+    if result["queries_per_request"] > baseline["queries_per_request"] + query_tolerance:
+        problems.append(f"{name}: 요청당 쿼리 {baseline['queries_per_request']} -> {result['queries_per_request']}")
+    if result["rps"] < baseline["rps"] * (1 - tolerance):
+        problems.append(f"{name}: 처리량 {baseline['rps']} -> {result['rps']} rps")
+    if result["p95_ms"] > baseline["p95_ms"] * (1 + tolerance):
+        problems.append(f"{name}: p95 {baseline['p95_ms']} -> {result['p95_ms']} ms")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", help="실행할 시나리오 (여러 번 지정 가능, 기본값: 전체)")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=400, help="시나리오별 요청 수")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.4, help="처리량/p95 허용 변화 비율")
+    parser.add_argument("--query-tolerance", type=float, default=0.1, help="요청당 쿼리 수 허용 증가량")
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    vendor = connection.vendor
+    try:
+        data = seed()
+        scenarios = build_scenarios(data)
+        names = args.scenario or list(scenarios)
+        unknown = set(names) - set(scenarios)
+        if unknown:
+            parser.error(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+
+        results = {}
+        print(f"DB: {vendor} ({settings.DATABASES['default']['ENGINE']}), threads={args.threads}")
+        print(f"{'scenario':<28}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}{'errors':>8}")
+        for name in names:
+            # 준비 요청 (URL 해석, 시리얼라이저 초기화 등 처음 한 번의 비용 제외)
+            run_scenario(scenarios[name], args.threads, args.threads, start_index=args.requests)
+            result = results[name] = run_scenario(scenarios[name], args.requests, args.threads)
+            print(
+                f"{name:<28}{result['rps']:>9}{result['p50_ms']:>9}{result['p95_ms']:>9}{result['p99_ms']:>9}"
+                f"{result['queries_per_request']:>9}{result['errors']:>8}"
+            )
+    finally:
+        connections.close_all()
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+    baselines = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    parameters = {"requests": args.requests, "threads": args.threads}
+    if args.update_baseline:
+        stored = baselines.setdefault(vendor, {})
+        if stored.get(PARAMETERS_KEY) != parameters:
+            # 실행 조건이 바뀌면 이전 조건의 기준값은 섞지 않음
+            stored.clear()
+            stored[PARAMETERS_KEY] = parameters
+        for name, result in results.items():
+            stored[name] = {key: result[key] for key in ("rps", "p50_ms", "p95_ms", "p99_ms", "queries_per_request")}
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"기준값을 저장했습니다: {args.baseline} ({vendor})")
+        return
+
+    stored = baselines.get(vendor, {})
+    skip_reason = None
+    if not stored:
+        skip_reason = f"{vendor} 기준값이 없어"
+    elif stored.get(PARAMETERS_KEY) != parameters:
+        skip_reason = f"실행 조건({parameters})이 기준값({stored.get(PARAMETERS_KEY)})과 달라"
+    if skip_reason:
+        # 오류 응답은 기준값과 관계없이 확인
+        stored = {}
+
+    problems = []
+    for name, result in results.items():
+        problems += compare(name, result, stored.get(name), args.tolerance, args.query_tolerance)
+    if problems:
+        print("\n회귀:", *problems, sep="\n  ", file=sys.stderr)
+        sys.exit(1)
+    if skip_reason:
+        print(f"{skip_reason} 기준값과 비교하지 않았습니다. (--update-baseline으로 저장)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+JSON 렌더러/파서 벤치마크: DRF(표준 json) vs orjson
+
+python -m tests.benchmarks.bench_json [--rows 1000] [--repeat 5]
+
+공개 청첩장 응답, 방명록 목록 페이지, RSVP 제출 본문 형태의 실제 페이로드로 비교합니다.
+"""
+
+import argparse
+import timeit
+from io import BytesIO
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.invitations.serializers import GuestbookSerializer, PublicInvitationSerializer
+from common.parsers import ORJSONParser
+from common.renderers import ORJSONRenderer, orjson
+from tests.benchmarks.bench_serialization import build_rows
+
+
+def build_payloads(count: int) -> dict:
+    rows = build_rows(count)
+    invitation = PublicInvitationSerializer(rows[PublicInvitationSerializer][0]).data
+    guestbooks = GuestbookSerializer(rows[GuestbookSerializer][:20], many=True).data
+    return {
+        "public invitation": dict(invitation),
+        "guestbook page (20)": {"next": None, "previous": None, "results": guestbooks},
+        f"invitation list ({count})": [invitation] * count,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=200, help="작은 페이로드 반복 횟수")
+    args = parser.parse_args()
+
+    if orjson is None:
+        print("orjson이 설치되어 있지 않아 두 경로가 같은 표준 json을 사용합니다.")
+
+    print(f"{'payload':<28}{'step':<8}{'DRF (us)':>12}{'orjson (us)':>14}{'speedup':>10}")
+    for name, payload in build_payloads(args.rows).items():
+        body = JSONRenderer().render(payload)
+        assert ORJSONRenderer().render(payload) == body
+        number = 1 if isinstance(payload, list) else args.number
+
+        cases = {
+            "render": (lambda: JSONRenderer().render(payload), lambda: ORJSONRenderer().render(payload)),
+            "parse": (
+                lambda: JSONParser().parse(BytesIO(body), parser_context={}),
+                lambda: ORJSONParser().parse(BytesIO(body), parser_context={}),
+            ),
+        }
+        for step, (drf, fast) in cases.items():
+            drf_time = min(timeit.repeat(drf, number=number, repeat=args.repeat)) / number
+            fast_time = min(timeit.repeat(fast, number=number, repeat=args.repeat)) / number
+            print(f"{name:<28}{step:<8}{drf_time * 1e6:>12.1f}{fast_time * 1e6:>14.1f}{drf_time / fast_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
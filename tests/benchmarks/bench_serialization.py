@@ -0,0 +1,112 @@
+"""
+목록 직렬화 벤치마크: DRF 시리얼라이저 vs compile_projection
+
+python -m tests.benchmarks.bench_serialization [--rows 1000] [--repeat 5]
+
+DB 없이 메모리의 행으로 직렬화 비용만 비교합니다.
+(시리얼라이저는 모델 인스턴스, 투영은 같은 값의 .values() 형태 dict를 입력으로 사용)
+두 출력이 JSON 바이트 단위로 같은지도 함께 확인합니다.
+"""
+
+import argparse
+import timeit
+from datetime import timedelta
+from decimal import Decimal
+
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.invitations.models import RSVP, Guestbook, Invitation
+from apps.invitations.serializers import (
+    GuestbookSerializer,
+    PublicInvitationSerializer,
+    RSVPSerializer,
+)
+from apps.shared.serializers import compile_projection
+from apps.templates.models import Template
+from apps.templates.serializers import TemplateListSerializer
+
+
+def build_rows(count: int):
+    now = timezone.now()
+    template = Template(id=1, name="템플릿", thumbnail_url="https://example.com/t.jpg", category="MODERN")
+    invitation = Invitation(
+        id=1,
+        template=template,
+        title="청첩장",
+        url_slug="bench",
+        groom_name="홍길동",
+        bride_name="김영희",
+        wedding_date=now,
+        wedding_location_lat=Decimal("37.5665000"),
+        wedding_location_lng=Decimal("126.9780000"),
+        created_at=now,
+        updated_at=now,
+    )
+    return {
+        RSVPSerializer: [
+            RSVP(
+                id=i,
+                invitation=invitation,
+                guest_name=f"하객{i}",
+                guest_count=i % 4,
+                attendance_status="ATTENDING",
+                phone="010-0000-0000",
+                message="축하합니다!",
+                created_at=now - timedelta(seconds=i),
+                updated_at=now,
+            )
+            for i in range(count)
+        ],
+        GuestbookSerializer: [
+            Guestbook(
+                id=i,
+                invitation=invitation,
+                author_name=f"하객{i}",
+                message="행복하세요!" * 5,
+                created_at=now - timedelta(seconds=i),
+                updated_at=now,
+            )
+            for i in range(count)
+        ],
+        TemplateListSerializer: [
+            Template(id=i, name=f"템플릿{i}", thumbnail_url="https://example.com/t.jpg", category="MODERN")
+            for i in range(count)
+        ],
+        PublicInvitationSerializer: [invitation] * count,
+    }
+
+
+def as_values_row(instance, fields):
+    """모델 인스턴스를 .values(*fields) 결과와 같은 dict로 변환"""
+    row = {}
+    for path in fields:
+        *relations, name = path.split("__")
+        obj = instance
+        for relation in relations:
+            obj = getattr(obj, relation)
+        row[path] = getattr(obj, obj._meta.get_field(name).attname)
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    renderer = JSONRenderer()
+    print(f"{'serializer':<30}{'DRF (ms)':>12}{'projection (ms)':>18}{'speedup':>10}")
+    for serializer_class, instances in build_rows(args.rows).items():
+        projection = compile_projection(serializer_class)
+        rows = [as_values_row(instance, projection.fields) for instance in instances]
+
+        assert renderer.render(serializer_class(instances, many=True).data) == renderer.render(projection.many(rows))
+
+        drf = min(timeit.repeat(lambda: serializer_class(instances, many=True).data, number=1, repeat=args.repeat))
+        fast = min(timeit.repeat(lambda: projection.many(rows), number=1, repeat=args.repeat))
+        print(f"{serializer_class.__name__:<30}{drf * 1000:>12.2f}{fast * 1000:>18.2f}{drf / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()